@@ -1,25 +1,74 @@
 from __future__ import annotations
 
-try:
-    from importlib.metadata import version as _pkg_version
-
-    __version__ = _pkg_version("numbatalib")
-except Exception:  # pragma: no cover
-    __version__ = "0.1.0"
+import importlib
+import os
 
 from ._registry import available_functions, get_function, implemented_functions
 
+# Numba-backed helpers are imported on first access to keep `import numbatalib` cheap.
+_LAZY_ATTRS = {
+    "CDL_SCAN": "numbatalib._cdl_scan",
+    "DMI": "numbatalib._dmi",
+    "HT_ALL": "numbatalib._ht",
+    "input_copies": "numbatalib._core._validation",
+    "lookback": "numbatalib._lookback",
+    "precompile": "numbatalib._precompile",
+    "reset_input_copies": "numbatalib._core._validation",
+    "sweep": "numbatalib._sweep",
+    "trusted_inputs": "numbatalib._core._validation",
+}
+_LAZY_MODULES = ("parallel", "raw")
+
+
+def _version() -> str:
+    # `importlib.metadata` costs more to import than the rest of the package.
+    try:
+        from importlib.metadata import version as _pkg_version
+
+        return _pkg_version("numbatalib")
+    except Exception:  # pragma: no cover
+        return "0.1.0"
+
 
 def __getattr__(name: str):
-    fn = get_function(name)
-    if fn is None:
-        raise AttributeError(name)
-    return fn
+    # Resolved attributes are bound as module globals, so `__getattr__` only runs
+    # on the first access of each name.
+    if name == "__version__":
+        globals()[name] = value = _version()
+        return value
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    module = _LAZY_ATTRS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module), name)
+    else:
+        value = get_function(name)
+        if value is None:
+            raise AttributeError(name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
+    "CDL_SCAN",
+    "DMI",
+    "HT_ALL",
     "available_functions",
     "implemented_functions",
     "get_function",
+    "input_copies",
+    "lookback",
+    "precompile",
+    "reset_input_copies",
+    "sweep",
+    "trusted_inputs",
     # Dynamic TA-Lib function names are exposed via __getattr__.
 ]
+
+# Opt-in eager compilation at import time, e.g. NUMBATALIB_PRECOMPILE=float64,float32.
+_profiles = os.environ.get("NUMBATALIB_PRECOMPILE", "")
+if _profiles:
+    from ._precompile import precompile as _precompile_profiles
+
+    _precompile_profiles(*(p.strip() for p in _profiles.split(",") if p.strip()))
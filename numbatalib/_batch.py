@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+"""
+2-D (panel) evaluation of indicator functions.
+
+Every public function accepts a 2-D input and evaluates the indicator
+independently along `axis` (the time axis) for each series. Functions backed
+by a single kernel run through the generated `prange` kernels in
+`numbatalib._generated.batch_kernels`; composite functions fall back to a
+per-series loop over the 1-D implementation.
+
+Neither the inputs nor the outputs are copied for the layout. Kernels read
+each series in place, as a strided column of the default `(n_bars,
+n_series)` orientation. Outputs are allocated series-major and returned as
+transposed views, so an `axis=0` result is Fortran-ordered. Pass `out=`
+buffers to choose the output layout.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable
+
+import numpy as np
+
+from numbatalib._core._params import (
+    int_output_dtype,
+    output_dtype as output_dtype_of,
+    param_specs,
+    validate_params,
+)
+from numbatalib._core._validation import (
+    _KERNEL_DTYPES,
+    check_no_overlap,
+    count_input_copy,
+    float_dtype,
+    split_outputs,
+)
+from numbatalib._registry import _load_meta, get_function
+
+
+@lru_cache(maxsize=1)
+def _batch_kernels() -> dict[str, Callable[..., None]]:
+    from numbatalib._generated.batch_kernels import BATCH_KERNELS
+
+    return BATCH_KERNELS
+
+
+def _normalize_axis(axis: Any) -> int:
+    try:
+        ax = int(axis)
+    except Exception as e:
+        raise ValueError("axis must be an int") from e
+    if ax not in (-2, -1, 0, 1):
+        raise ValueError("axis out of range")
+    return ax % 2
+
+
+def as_2d_float(x: Any, axis: int) -> np.ndarray:
+    """
+    Return `x` as a `(n_series, n_bars)` array, a view of `x` where possible.
+
+    With `axis=0` a C-order `(n_bars, n_series)` panel becomes its transpose:
+    the kernels read each series as a strided column in place, like the 1-D
+    functions read `ohlcv[:, 3]`. Dtypes follow `as_1d_float`; dtype
+    conversions are recorded in `input_copies()`.
+    """
+    arr = np.asarray(x)
+    if arr.ndim != 2:
+        raise ValueError("input must be 2-D")
+    if axis == 0:
+        arr = arr.T
+    if arr.dtype not in _KERNEL_DTYPES:
+        count_input_copy("dtype")
+        return np.ascontiguousarray(arr, dtype=np.float64)
+    return arr
+
+
+def _new_output(
+    shape: tuple[int, int], dtype: np.dtype, out: Any, axis: int, inputs: tuple[Any, ...]
+) -> np.ndarray:
+    """
+    NaN/0-filled `(n_series, n_bars)` output, reusing a caller buffer when given.
+
+    A caller buffer must not share memory with the caller's `inputs`, even
+    where they were copied before reaching the kernel.
+    """
+    if out is None:
+        buf = np.empty(shape, dtype=dtype)
+    else:
+        expected = shape[::-1] if axis == 0 else shape
+        if not isinstance(out, np.ndarray):
+            raise ValueError("out must be a numpy array")
+        if out.shape != expected:
+            raise ValueError(f"out must have shape {expected}")
+        if out.dtype != dtype:
+            raise ValueError(f"out must have dtype {dtype.name}")
+        if not out.flags.writeable:
+            raise ValueError("out must be writeable")
+        check_no_overlap(out, inputs)
+        buf = out.T if axis == 0 else out
+    buf.fill(np.nan if dtype.kind == "f" else 0)
+    return buf
+
+
+def output_dtypes(func_name: str, output_dtype: Any) -> list[np.dtype]:
+    """
+    dtype of each output of `func_name` for its `output_dtype` argument.
+
+    Floating-point outputs are float64 or float32. Pattern and index outputs
+    are int32 unless `output_dtype` selects another integer type the
+    function's values fit in.
+    """
+    dtypes = [np.dtype(output_dtype_of(name)) for name in _load_meta()[func_name].outputs]
+    if all(dt.kind == "i" for dt in dtypes):
+        return [int_output_dtype(func_name, output_dtype)] * len(dtypes)
+    real = float_dtype(output_dtype)
+    return [real if dt.kind == "f" else dt for dt in dtypes]
+
+
+def apply_2d(
+    func_name: str,
+    inputs: tuple[Any, ...],
+    params: tuple[Any, ...],
+    axis: Any = 0,
+    out: Any = None,
+    output_dtype: Any = None,
+) -> Any:
+    """
+    Evaluate `func_name` over every series of 2-D `inputs`.
+
+    `params` are the optional parameters in signature order. Outputs have the
+    same shape and orientation as the inputs; multi-output functions return a
+    tuple, like their 1-D counterparts. `out` optionally provides the output
+    arrays (a tuple for multi-output functions), written in place;
+    `output_dtype` selects float32 or float64 floating-point outputs.
+    """
+    ax = _normalize_axis(axis)
+    arrays = [as_2d_float(x, ax) for x in inputs]
+    shape = arrays[0].shape
+    if any(a.shape != shape for a in arrays[1:]):
+        raise ValueError("inputs must have the same shape")
+
+    values = validate_params(func_name, params)
+    dtypes = output_dtypes(func_name, output_dtype)
+    bufs = (out,) if len(dtypes) == 1 else split_outputs(out, len(dtypes))
+    outs = [_new_output(shape, dt, buf, ax, inputs) for dt, buf in zip(dtypes, bufs)]
+
+    kernel = _batch_kernels().get(func_name)
+    if kernel is not None:
+        kernel(*arrays, *values, *outs)
+    else:
+        fn = get_function(func_name)
+        kwargs = {spec.name: v for spec, v in zip(param_specs(func_name), values)}
+        for j in range(shape[0]):
+            res = fn(*(a[j] for a in arrays), **kwargs)
+            if not isinstance(res, tuple):
+                res = (res,)
+            for buf, r in zip(outs, res):
+                buf[j] = r
+
+    results = [
+        given if given is not None else (buf.T if ax == 0 else buf)
+        for given, buf in zip(bufs, outs)
+    ]
+    return tuple(results) if len(results) > 1 else results[0]
+
+
+def apply_2d_kernel(
+    kernel: Callable[..., None],
+    inputs: tuple[Any, ...],
+    params: tuple[Any, ...],
+    dtypes: list[np.dtype],
+    axis: Any,
+    outs: tuple[Any, ...],
+) -> tuple[np.ndarray, ...]:
+    """
+    Run a `prange` bundle kernel (`HT_ALL`, `DMI`) over 2-D `inputs`.
+
+    `params` are already validated; `dtypes` and `outs` give one dtype and
+    one optional caller buffer per output. Returns the outputs in the
+    orientation of the inputs.
+    """
+    ax = _normalize_axis(axis)
+    arrays = [as_2d_float(x, ax) for x in inputs]
+    shape = arrays[0].shape
+    if any(a.shape != shape for a in arrays[1:]):
+        raise ValueError("inputs must have the same shape")
+    bufs = [_new_output(shape, dt, buf, ax, inputs) for dt, buf in zip(dtypes, outs)]
+    kernel(*arrays, *params, *bufs)
+    return tuple(
+        given if given is not None else (buf.T if ax == 0 else buf)
+        for given, buf in zip(outs, bufs)
+    )
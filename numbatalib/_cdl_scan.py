@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+"""
+Every candlestick pattern from one traversal of the OHLC series.
+
+    signals = numbatalib.CDL_SCAN(open, high, low, close)  # int8, shape (n, 61)
+
+Each CDL function keeps its own running totals of candle ranges (real body,
+high-low range or shadows over the last 5 or 10 bars) for the candle
+settings it compares against, and most patterns need the same few. `CDL_SCAN`
+computes each bar's candle ranges once, keeps one running total per distinct
+window and evaluates every requested pattern from those shared totals with
+the pattern's own per-bar test (`_cdl*_bar`).
+
+A running total's rounding depends on the bar its first window starts at,
+which follows from the pattern's lookback and from which candle of the
+pattern the setting applies to. Totals are shared per (range type, window
+length, first bar), so every column is bit-identical to the individual
+function.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from numbatalib._batch import _normalize_axis, as_2d_float
+from numbatalib._core._params import TA_REAL_MAX
+from numbatalib._core._validation import as_1d_float, check_float_param, is_2d
+from numbatalib._func._candles import (
+    _CANDLE_AVG_PERIOD,
+    _CANDLE_RANGE_TYPE,
+    BODY_DOJI,
+    BODY_LONG,
+    RANGE_HIGHLOW,
+    RANGE_REALBODY,
+    RANGE_SHADOWS,
+    SHADOW_SHORT,
+    candle_range,
+)
+from numbatalib._generated.cdl_scan_patterns import CDL_PATTERNS, _pattern_block
+from numbatalib._lookback import _CDL_LOOKBACKS
+
+# CDL_PATTERNS: pattern -> (bars of setup state evaluated before the lookback,
+# (candle setting, candle offset back from the current bar) for each running
+# total the pattern's `_bar` function takes, in order). A third element
+# overrides the window length where the kernel's differs from the setting's
+# average period. Generated from the `_<NAME>_SETUP` and `_<NAME>_TOTALS`
+# constants next to each `_bar` function.
+_NAMES = tuple(CDL_PATTERNS)
+_CODES = {name: code for code, name in enumerate(_NAMES)}
+_PENETRATION = {
+    "CDLABANDONEDBABY": 0.3,
+    "CDLDARKCLOUDCOVER": 0.5,
+    "CDLEVENINGDOJISTAR": 0.3,
+    "CDLEVENINGSTAR": 0.3,
+    "CDLMATHOLD": 0.5,
+    "CDLMORNINGDOJISTAR": 0.3,
+    "CDLMORNINGSTAR": 0.3,
+}
+_MAX_TOTALS = max(len(totals) for _, totals in CDL_PATTERNS.values())
+# Totals are read up to this many bars back from the bar being evaluated.
+_CARRY = max(lag for _, totals in CDL_PATTERNS.values() for _, lag, *_ in totals)
+# Candle ranges are kept back to the longest window plus one.
+_RANGE_RING = 16
+_BLOCK = 4096
+_UNUSED = -2
+
+
+@njit(cache=True, nogil=True)
+def _cdl_scan_blocks(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    codes: np.ndarray,
+    starts: np.ndarray,
+    lookbacks: np.ndarray,
+    penetration: np.ndarray,
+    slots: np.ndarray,
+    lags: np.ndarray,
+    key_type: np.ndarray,
+    key_width: np.ndarray,
+    key_start: np.ndarray,
+    ranges: np.ndarray,
+    totals: np.ndarray,
+    t: np.ndarray,
+    states: np.ndarray,
+    column: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    n = open_.shape[0]
+    n_keys = key_type.shape[0]
+    for base in range(0, n, _BLOCK):
+        stop = min(base + _BLOCK, n)
+        # totals[k, _CARRY + j] is total k before bar base + j; the first
+        # _CARRY columns are carried over from the previous block.
+        for i in range(base, stop):
+            col = _CARRY + i - base
+            r = i % _RANGE_RING
+            ranges[RANGE_REALBODY, r] = candle_range(BODY_LONG, open_, high, low, close, i)
+            ranges[RANGE_HIGHLOW, r] = candle_range(BODY_DOJI, open_, high, low, close, i)
+            ranges[RANGE_SHADOWS, r] = candle_range(SHADOW_SHORT, open_, high, low, close, i)
+            # Summed in bar order when the window first fills, then rolled
+            # forward as the pattern kernels do.
+            for k in range(n_keys):
+                first = key_start[k]
+                width = key_width[k]
+                if i < first + width:
+                    continue
+                rt = key_type[k]
+                if i == first + width:
+                    total = 0.0
+                    for m in range(first, i):
+                        total += ranges[rt, m % _RANGE_RING]
+                else:
+                    entering = ranges[rt, (i - 1) % _RANGE_RING]
+                    leaving = ranges[rt, (i - 1 - width) % _RANGE_RING]
+                    total = totals[k, col - 1] + (entering - leaving)
+                totals[k, col] = total
+
+        # Each pattern over the whole block, with its totals gathered by bar.
+        for p in range(codes.shape[0]):
+            lo = max(base, starts[p])
+            if lo >= stop:
+                continue
+            for m in range(slots.shape[1]):
+                k = slots[p, m]
+                if k < 0:
+                    break
+                shift = _CARRY - lags[p, m]
+                for j in range(lo - base, stop - base):
+                    t[m, j] = totals[k, j + shift]
+            _pattern_block(
+                codes[p],
+                open_,
+                high,
+                low,
+                close,
+                base,
+                lo,
+                stop,
+                t,
+                penetration[p],
+                states[p],
+                column,
+            )
+            for i in range(lo, stop):
+                out[i, p] = column[i - base]
+
+        for k in range(n_keys):
+            for j in range(_CARRY):
+                totals[k, j] = totals[k, stop - base + j]
+
+    # Bars before the lookback only advance the hikkake setup state.
+    for p in range(codes.shape[0]):
+        for i in range(starts[p], min(lookbacks[p], n)):
+            out[i, p] = 0
+
+
+@njit(cache=True, nogil=True)
+def _cdl_scan_kernel(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    codes: np.ndarray,
+    starts: np.ndarray,
+    lookbacks: np.ndarray,
+    penetration: np.ndarray,
+    slots: np.ndarray,
+    lags: np.ndarray,
+    key_type: np.ndarray,
+    key_width: np.ndarray,
+    key_start: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    _cdl_scan_blocks(
+        open_,
+        high,
+        low,
+        close,
+        codes,
+        starts,
+        lookbacks,
+        penetration,
+        slots,
+        lags,
+        key_type,
+        key_width,
+        key_start,
+        np.zeros((3, _RANGE_RING), dtype=np.float64),
+        # One more row of zeros for settings whose total is unused.
+        np.zeros((key_type.shape[0] + 1, _CARRY + _BLOCK), dtype=np.float64),
+        np.zeros((slots.shape[1], _BLOCK), dtype=np.float64),
+        np.zeros((codes.shape[0], 2), dtype=np.int64),
+        np.zeros(_BLOCK, dtype=np.int8),
+        out,
+    )
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdl_scan_2d(
+    open_,
+    high,
+    low,
+    close,
+    codes,
+    starts,
+    lookbacks,
+    penetration,
+    slots,
+    lags,
+    key_type,
+    key_width,
+    key_start,
+    out,
+):
+    for j in prange(open_.shape[0]):
+        _cdl_scan_kernel(
+            open_[j],
+            high[j],
+            low[j],
+            close[j],
+            codes,
+            starts,
+            lookbacks,
+            penetration,
+            slots,
+            lags,
+            key_type,
+            key_width,
+            key_start,
+            out[j],
+        )
+
+
+def _scan_plan(patterns, penetration) -> tuple[np.ndarray, ...]:
+    """Pattern codes and the shared running totals for the kernel."""
+    if patterns is None:
+        names = list(_NAMES)
+    else:
+        names = [patterns] if isinstance(patterns, str) else list(patterns)
+        if not names:
+            raise ValueError("patterns must not be empty")
+    pen = None
+    if penetration is not None:
+        pen = check_float_param("penetration", penetration, 0.0, TA_REAL_MAX)
+
+    n_patterns = len(names)
+    codes = np.empty(n_patterns, dtype=np.int64)
+    starts = np.empty(n_patterns, dtype=np.int64)
+    lookbacks = np.empty(n_patterns, dtype=np.int64)
+    pens = np.zeros(n_patterns, dtype=np.float64)
+    slots = np.full((n_patterns, _MAX_TOTALS), -1, dtype=np.int64)
+    lags = np.zeros((n_patterns, _MAX_TOTALS), dtype=np.int64)
+    keys: dict[tuple[int, int, int], int] = {}
+    for p, name in enumerate(names):
+        key = str(name).upper()
+        if key not in _CODES:
+            raise ValueError(f"unknown candlestick pattern: {name}")
+        setup, totals = CDL_PATTERNS[key]
+        lookback = _CDL_LOOKBACKS[key]
+        codes[p] = _CODES[key]
+        starts[p] = lookback - setup
+        lookbacks[p] = lookback
+        if key in _PENETRATION:
+            pens[p] = _PENETRATION[key] if pen is None else pen
+        for m, (setting, lag, *width) in enumerate(totals):
+            period = int(_CANDLE_AVG_PERIOD[setting])
+            if period == 0:
+                # The average is the candle's own range; the total is unused.
+                slots[p, m] = _UNUSED
+                continue
+            w = width[0] if width else period
+            total_key = (int(_CANDLE_RANGE_TYPE[setting]), w, lookback - setup - lag - w)
+            slots[p, m] = keys.setdefault(total_key, len(keys))
+            lags[p, m] = lag
+
+    # Unused totals read the row of zeros after the last shared total.
+    slots[slots == _UNUSED] = len(keys)
+    key_type, key_width, key_start = (
+        np.array([k[f] for k in keys], dtype=np.int64) for f in range(3)
+    )
+    return codes, starts, lookbacks, pens, slots, lags, key_type, key_width, key_start
+
+
+def CDL_SCAN(open, high, low, close, patterns=None, penetration=None, *, axis: int = 0):
+    """
+    Candlestick scan - every requested CDL pattern in one pass
+
+    Returns an int8 matrix with one column per pattern, in the order of
+    `patterns` (default: all 61 CDL functions in `implemented_functions()`
+    order). Each entry is the pattern function's output divided by 100: +1 or
+    -1, +2 or -2 for confirmed CDLHIKKAKE/CDLHIKKAKEMOD signals, 0 otherwise.
+    `penetration`, when given, replaces the default of every pattern that
+    takes one (0.5 for CDLDARKCLOUDCOVER and CDLMATHOLD, 0.3 for the
+    others). 1-D inputs give shape (n, n_patterns); 2-D inputs give the input
+    shape plus a trailing pattern axis, with time along `axis`.
+    """
+    plan = _scan_plan(patterns, penetration)
+    n_patterns = plan[0].shape[0]
+    if is_2d(open):
+        ax = _normalize_axis(axis)
+        arrays = [as_2d_float(x, ax) for x in (open, high, low, close)]
+        shape = arrays[0].shape
+        if any(a.shape != shape for a in arrays[1:]):
+            raise ValueError("inputs must have the same shape")
+        # Kernel rows are series; the result keeps the input's layout.
+        result = np.zeros((shape[::-1] if ax == 0 else shape) + (n_patterns,), dtype=np.int8)
+        _cdl_scan_2d(*arrays, *plan, result.transpose(1, 0, 2) if ax == 0 else result)
+        return result
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
+    n = o.shape[0]
+    if h.shape[0] != n or l.shape[0] != n or c.shape[0] != n:
+        raise ValueError("inputs must have the same length")
+    result = np.zeros((n, n_patterns), dtype=np.int8)
+    _cdl_scan_kernel(o, h, l, c, *plan, result)
+    return result
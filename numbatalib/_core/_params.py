@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from numbatalib._core._validation import Range, validate_float_param, validate_int_param
+
+
+TA_REAL_MIN = -3e37
+TA_REAL_MAX = 3e37
+
+MATYPE_RANGE = Range(min=0, max=8)
+
+
+@dataclass(frozen=True)
+class ParamSpec:
+    name: str
+    kind: str  # "int", "double" or "matype"
+    allowed: Range
+
+
+def optin_to_kw(optin_name: str) -> str:
+    if not optin_name.startswith("optIn"):
+        return optin_name
+    return optin_name[len("optIn") :].lower()
+
+
+def input_to_arg(in_name: str) -> str:
+    if not in_name.startswith("in"):
+        return in_name
+    return in_name[len("in") :].lower()
+
+
+def output_dtype(output_name: str) -> Any:
+    """dtype of a TA-Lib output (`int32` for pattern/index outputs, else `float64`)."""
+    if output_name.startswith("outInteger") or output_name in ("outMinIdx", "outMaxIdx"):
+        return np.int32
+    return np.float64
+
+
+# `output_dtype`s accepted for integer outputs, narrowest first. Bar indices
+# need 32 bits; CDLHIKKAKE/CDLHIKKAKEMOD values reach +-200.
+_INDEX_DTYPES = tuple(np.dtype(t) for t in (np.int32, np.int64))
+_PATTERN_DTYPES = tuple(np.dtype(t) for t in (np.int8, np.int16, np.int32))
+_WIDE_PATTERN_DTYPES = _PATTERN_DTYPES[1:]
+_INT_OUTPUT_DTYPES = {
+    "MAXINDEX": _INDEX_DTYPES,
+    "MININDEX": _INDEX_DTYPES,
+    "MINMAXINDEX": _INDEX_DTYPES,
+    "CDLHIKKAKE": _WIDE_PATTERN_DTYPES,
+    "CDLHIKKAKEMOD": _WIDE_PATTERN_DTYPES,
+}
+_INT32 = np.dtype(np.int32)
+
+
+def int_output_dtype(func_name: str, output_dtype: Any) -> np.dtype:
+    """Validated `output_dtype` of `func_name`'s integer outputs (int32 when None)."""
+    if output_dtype is None:
+        return _INT32
+    allowed = _INT_OUTPUT_DTYPES.get(func_name, _PATTERN_DTYPES)
+    names = ", ".join(str(t) for t in allowed)
+    try:
+        dtype = np.dtype(output_dtype)
+    except TypeError as e:
+        raise ValueError(f"output_dtype of {func_name} must be one of {names}") from e
+    if dtype not in allowed:
+        raise ValueError(f"output_dtype of {func_name} must be one of {names}")
+    return dtype
+
+
+def _bound(x: str | None, kind: str) -> int | float | None:
+    if x is None:
+        return None
+    if x == "TA_REAL_MIN":
+        return TA_REAL_MIN
+    if x == "TA_REAL_MAX":
+        return TA_REAL_MAX
+    return int(x) if kind == "int" else float(x)
+
+
+@lru_cache(maxsize=None)
+def param_specs(func_name: str) -> tuple[ParamSpec, ...]:
+    """
+    Optional-parameter specs for `func_name`, in signature order.
+
+    Built from `ta_func_meta.json`, which the Python wrappers mirror exactly
+    (same keyword names, order and ranges).
+    """
+    from numbatalib._registry import _load_meta
+
+    specs: list[ParamSpec] = []
+    for opt in _load_meta()[func_name].opt_inputs:
+        c_type = opt.get("c_type", "")
+        if c_type == "TA_MAType":
+            kind = "matype"
+            allowed = MATYPE_RANGE
+        else:
+            kind = "double" if c_type == "double" else "int"
+            allowed = Range(
+                min=_bound(opt.get("range_from"), kind), max=_bound(opt.get("range_to"), kind)
+            )
+        specs.append(ParamSpec(name=optin_to_kw(opt["name"]), kind=kind, allowed=allowed))
+    return tuple(specs)
+
+
+def validate_params(func_name: str, values: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Validate positional optional-parameter values the way the wrappers do."""
+    out: list[Any] = []
+    for spec, value in zip(param_specs(func_name), values):
+        if spec.kind == "double":
+            out.append(validate_float_param(spec.name, value, spec.allowed))
+        else:
+            out.append(validate_int_param(spec.name, value, spec.allowed))
+    return tuple(out)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator
 
 import numpy as np
 
@@ -12,42 +14,210 @@ class Range:
     max: int | float | None = None
 
 
-def as_1d_float64(x: Any) -> np.ndarray:
-    arr = np.asarray(x, dtype=np.float64)
+# Input dtypes the kernels are compiled for; anything else is converted to float64.
+_KERNEL_DTYPES = frozenset(np.dtype(t) for t in (np.float64, np.float32, np.int64, np.int32))
+
+_FLOAT64 = np.dtype(np.float64)
+_FLOAT32 = np.dtype(np.float32)
+
+# Set by `trusted_inputs()`: inputs and parameters are passed to the kernels unchecked.
+_trusted: ContextVar[bool] = ContextVar("numbatalib_trusted_inputs", default=False)
+
+
+@contextmanager
+def trusted_inputs() -> Iterator[None]:
+    """
+    Skip input and parameter validation inside the block.
+
+    For hot loops over small arrays whose inputs are known to be valid: 1-D
+    float64/float32/int64/int32 arrays of equal length, and parameters of the
+    right type within their TA-Lib range. Nothing is converted or checked, so
+    anything else is undefined behavior (wrong results or a crash in a
+    kernel). The mode applies to the calling thread (or asyncio task) only;
+    calls on other threads, including numbatalib's own worker pools, are
+    still validated.
+    """
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+# Number of inputs copied before reaching a kernel, by reason (see `input_copies`).
+_input_copies: dict[str, int] = {"dtype": 0}
+
+
+def count_input_copy(reason: str) -> None:
+    _input_copies[reason] += 1
+
+
+def input_copies() -> dict[str, int]:
+    """
+    Debug counter of forced input copies since the last `reset_input_copies()`.
+
+    `"dtype"` counts conversions to float64 (lists, bool/int8/int16/float16,
+    non-native byte order, ...). Strided 1-D views and 2-D panels in either
+    orientation are read in place and never copied.
+    """
+    return dict(_input_copies)
+
+
+def reset_input_copies() -> None:
+    for reason in _input_copies:
+        _input_copies[reason] = 0
+
+
+def is_2d(x: Any) -> bool:
+    """`np.ndim(x) == 2`, without its dispatch cost for arrays."""
+    if type(x) is np.ndarray:
+        return x.ndim == 2
+    return np.ndim(x) == 2
+
+
+def as_1d_float(x: Any) -> np.ndarray:
+    """
+    1-D kernel input, without copying float64/float32/int64/int32 arrays.
+
+    Kernels are compiled for these dtypes and for strided views, so columns of
+    a row-major OHLCV block or integer tick prices are read in place. float32
+    inputs follow TA-Lib's `TA_S_<NAME>` entry points: elements are read as
+    float32 and accumulated in float64. Other inputs are converted to float64.
+    """
+    if _trusted.get():
+        return x
+    arr = x if type(x) is np.ndarray else np.asarray(x)
     if arr.ndim != 1:
         raise ValueError("input must be 1-D")
-    return np.ascontiguousarray(arr)
+    if arr.dtype is not _FLOAT64 and arr.dtype not in _KERNEL_DTYPES:
+        count_input_copy("dtype")
+        arr = arr.astype(np.float64)
+    return arr
 
 
-def validate_int_param(name: str, value: Any, allowed: Range) -> int:
+def float_dtype(output_dtype: Any) -> np.dtype:
+    """Validated `output_dtype` of a floating-point output (float64 when None)."""
+    if output_dtype is None:
+        return _FLOAT64
     try:
-        v = int(value)
-    except Exception as e:
-        raise ValueError(f"{name} must be an int") from e
+        dtype = np.dtype(output_dtype)
+    except TypeError as e:
+        raise ValueError("output_dtype must be float32 or float64") from e
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("output_dtype must be float32 or float64")
+    return dtype
 
-    if allowed.min is not None and v < allowed.min:
-        raise ValueError(f"{name} out of range")
-    if allowed.max is not None and v > allowed.max:
+
+def check_int_param(
+    name: str, value: Any, min: int | float | None = None, max: int | float | None = None
+) -> int:
+    """
+    Validate an integer parameter against plain bounds.
+
+    The per-call path of the function wrappers, whose bounds are the
+    `ta_func_meta.json` ranges written out as constants: Python ints skip the
+    `int()` conversion and no `Range` is built.
+    """
+    if _trusted.get():
+        return value
+    if type(value) is int:
+        v = value
+    else:
+        try:
+            v = int(value)
+        except Exception as e:
+            raise ValueError(f"{name} must be an int") from e
+
+    if (min is not None and v < min) or (max is not None and v > max):
         raise ValueError(f"{name} out of range")
     return v
 
 
-def validate_float_param(name: str, value: Any, allowed: Range) -> float:
-    try:
-        v = float(value)
-    except Exception as e:
-        raise ValueError(f"{name} must be a float") from e
+def check_float_param(
+    name: str, value: Any, min: int | float | None = None, max: int | float | None = None
+) -> float:
+    """Validate a floating-point parameter against plain bounds (see `check_int_param`)."""
+    if _trusted.get():
+        return value
+    if type(value) is float:
+        v = value
+    else:
+        try:
+            v = float(value)
+        except Exception as e:
+            raise ValueError(f"{name} must be a float") from e
 
-    if allowed.min is not None and v < allowed.min:
-        raise ValueError(f"{name} out of range")
-    if allowed.max is not None and v > allowed.max:
+    if (min is not None and v < min) or (max is not None and v > max):
         raise ValueError(f"{name} out of range")
     return v
 
 
-def nan_like(x: np.ndarray, dtype: Any = np.float64) -> np.ndarray:
-    out = np.empty(x.shape[0], dtype=dtype)
-    if np.issubdtype(out.dtype, np.floating):
+def validate_int_param(name: str, value: Any, allowed: Range) -> int:
+    return check_int_param(name, value, allowed.min, allowed.max)
+
+
+def validate_float_param(name: str, value: Any, allowed: Range) -> float:
+    return check_float_param(name, value, allowed.min, allowed.max)
+
+
+def check_output(
+    out: Any, n: int, dtype: Any = np.float64, inputs: tuple[np.ndarray, ...] = ()
+) -> np.ndarray:
+    """
+    Validate a caller-provided output buffer of length `n`.
+
+    `out` must not share memory with any of `inputs`: it is filled and
+    written before the kernel has read them.
+    """
+    if not isinstance(out, np.ndarray):
+        raise ValueError("out must be a numpy array")
+    if out.shape != (n,):
+        raise ValueError(f"out must have shape ({n},)")
+    if out.dtype != np.dtype(dtype):
+        raise ValueError(f"out must have dtype {np.dtype(dtype).name}")
+    if not out.flags.writeable:
+        raise ValueError("out must be writeable")
+    check_no_overlap(out, inputs)
+    return out
+
+
+def check_no_overlap(out: np.ndarray, inputs: Any) -> None:
+    """Reject an output buffer that shares memory with one of the kernel `inputs`."""
+    for x in inputs:
+        if isinstance(x, np.ndarray) and np.shares_memory(out, x):
+            raise ValueError("out must not share memory with an input")
+
+
+def split_outputs(out: Any, n_outputs: int) -> tuple[Any, ...]:
+    """Per-output buffers from the `out=` argument of a multi-output function."""
+    if out is None:
+        return (None,) * n_outputs
+    if not isinstance(out, (tuple, list)) or len(out) != n_outputs:
+        raise ValueError(f"out must be a tuple of {n_outputs} arrays")
+    return tuple(out)
+
+
+def empty_output(
+    n: int, dtype: Any = np.float64, out: Any = None, inputs: tuple[np.ndarray, ...] = ()
+) -> np.ndarray:
+    if out is None:
+        return np.empty(n, dtype=dtype)
+    return check_output(out, n, dtype, inputs)
+
+
+def nan_like(
+    x: np.ndarray, dtype: Any = np.float64, out: Any = None, inputs: tuple[np.ndarray, ...] = ()
+) -> np.ndarray:
+    """
+    NaN-filled (0 for integer dtypes) output of the length of `x`.
+
+    A caller buffer `out` must not share memory with `x` or `inputs`.
+    """
+    if out is None:
+        out = np.empty(x.shape[0], dtype=dtype)
+    else:
+        out = check_output(out, x.shape[0], dtype, (x, *inputs))
+    if out.dtype.kind == "f":
         out.fill(np.nan)
     else:
         out.fill(0)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+"""
+The directional movement family from one traversal of the series.
+
+    adx, adxr, dx, plus_di, minus_di, plus_dm, minus_dm, atr = numbatalib.DMI(high, low, close)
+
+ADX, ADXR, DX, PLUS_DI, MINUS_DI, PLUS_DM, MINUS_DM and ATR each recompute the
+true range and the directional movement of every bar. `DMI` computes them
+once per bar and keeps every function's running state side by side: the
+Wilder sums of +DM, -DM and TR shared by the DM, DI, DX and ADX kernels, and
+ATR's own Wilder average. Every output is bit-identical to its individual
+function.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+from numbatalib._batch import apply_2d_kernel
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+    split_outputs,
+)
+from numbatalib._func._dmi_shared import _dm_deltas, _ta_is_zero, _true_range
+from numbatalib._func.ta_atr import _atr_step
+
+_OUTPUTS = ("adx", "adxr", "dx", "plus_di", "minus_di", "plus_dm", "minus_dm", "atr")
+
+
+@njit(cache=True, nogil=True)
+def _dmi_kernel(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    timeperiod: int,
+    out_adx: np.ndarray,
+    out_adxr: np.ndarray,
+    out_dx: np.ndarray,
+    out_plus_di: np.ndarray,
+    out_minus_di: np.ndarray,
+    out_plus_dm: np.ndarray,
+    out_minus_dm: np.ndarray,
+    out_atr: np.ndarray,
+) -> None:
+    n = high.shape[0]
+    if n == 0:
+        return
+
+    # Lookbacks: DM tp - 1, DI/DX/ATR tp, ADX 2 * tp - 1, ADXR 3 * tp - 2.
+    adx_start = (2 * timeperiod) - 1
+    adxr_start = (3 * timeperiod) - 2
+    adxr_shift = timeperiod - 1
+    # ADX values of the last `adxr_shift` bars, by bar index modulo the shift.
+    adx_hist = np.empty(adxr_shift, dtype=np.float64)
+
+    prev_minus_dm = 0.0
+    prev_plus_dm = 0.0
+    prev_tr = 0.0
+    tr_sum = 0.0
+    atr = 0.0
+    dx = 0.0
+    sum_dx = 0.0
+    prev_adx = 0.0
+
+    prev_high = np.float64(high[0])
+    prev_low = np.float64(low[0])
+    prev_close = np.float64(close[0])
+
+    for today in range(1, n):
+        curr_high = np.float64(high[today])
+        curr_low = np.float64(low[today])
+        diff_p, diff_m = _dm_deltas(curr_high, curr_low, prev_high, prev_low)
+        prev_high = curr_high
+        prev_low = curr_low
+        tr = _true_range(curr_high, curr_low, prev_close)
+        prev_close = np.float64(close[today])
+
+        # ATR: SMA of the first `timeperiod` true ranges, then Wilder's average.
+        if today < timeperiod:
+            tr_sum += tr
+        elif today == timeperiod:
+            tr_sum += tr
+            atr = tr_sum / timeperiod
+            out_atr[today] = atr
+        else:
+            atr = _atr_step(atr, tr, timeperiod)
+            out_atr[today] = atr
+
+        if today < timeperiod:
+            if (diff_m > 0.0) and (diff_p < diff_m):
+                prev_minus_dm += diff_m
+            elif (diff_p > 0.0) and (diff_p > diff_m):
+                prev_plus_dm += diff_p
+            prev_tr += tr
+            if today == timeperiod - 1:
+                out_plus_dm[today] = prev_plus_dm
+                out_minus_dm[today] = prev_minus_dm
+            continue
+
+        prev_minus_dm -= prev_minus_dm / timeperiod
+        prev_plus_dm -= prev_plus_dm / timeperiod
+        if (diff_m > 0.0) and (diff_p < diff_m):
+            prev_minus_dm += diff_m
+        elif (diff_p > 0.0) and (diff_p > diff_m):
+            prev_plus_dm += diff_p
+        prev_tr = prev_tr - (prev_tr / timeperiod) + tr
+        out_plus_dm[today] = prev_plus_dm
+        out_minus_dm[today] = prev_minus_dm
+
+        # DI and DX; on zero denominators DI is 0, DX carries its previous
+        # value (0 on the first bar) and ADX skips the bar.
+        valid = False
+        if not _ta_is_zero(prev_tr):
+            minus_di = 100.0 * (prev_minus_dm / prev_tr)
+            plus_di = 100.0 * (prev_plus_dm / prev_tr)
+            s = minus_di + plus_di
+            if not _ta_is_zero(s):
+                dx = 100.0 * (math.fabs(minus_di - plus_di) / s)
+                valid = True
+        else:
+            minus_di = 0.0
+            plus_di = 0.0
+        if not valid and today == timeperiod:
+            dx = 0.0
+        out_plus_di[today] = plus_di
+        out_minus_di[today] = minus_di
+        out_dx[today] = dx
+
+        if today < adx_start:
+            if valid:
+                sum_dx += dx
+            continue
+        if today == adx_start:
+            if valid:
+                sum_dx += dx
+            prev_adx = sum_dx / timeperiod
+        elif valid:
+            prev_adx = ((prev_adx * (timeperiod - 1)) + dx) / timeperiod
+        out_adx[today] = prev_adx
+
+        slot = today % adxr_shift
+        if today >= adxr_start:
+            out_adxr[today] = (prev_adx + adx_hist[slot]) / 2.0
+        adx_hist[slot] = prev_adx
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _dmi_2d(high, low, close, timeperiod, out0, out1, out2, out3, out4, out5, out6, out7):
+    for j in prange(high.shape[0]):
+        _dmi_kernel(
+            high[j],
+            low[j],
+            close[j],
+            timeperiod,
+            out0[j],
+            out1[j],
+            out2[j],
+            out3[j],
+            out4[j],
+            out5[j],
+            out6[j],
+            out7[j],
+        )
+
+
+def DMI(high, low, close, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
+    """
+    Directional Movement bundle - ADX, ADXR, DX, +DI, -DI, +DM, -DM and ATR in one pass
+
+    Returns (adx, adxr, dx, plus_di, minus_di, plus_dm, minus_dm, atr), each
+    bit-identical to the function of the same name with the same
+    `timeperiod` (at least 2, as for ADX). `out` is an optional tuple of the
+    eight output arrays.
+    """
+    outs = split_outputs(out, len(_OUTPUTS))
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    dtypes = [float_dtype(output_dtype)] * len(_OUTPUTS)
+    if is_2d(high):
+        return apply_2d_kernel(_dmi_2d, (high, low, close), (tp,), dtypes, axis, outs)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
+    n = h.shape[0]
+    if l.shape[0] != n or c.shape[0] != n:
+        raise ValueError("inputs must have the same length")
+
+    results = [nan_like(h, dtype=dt, out=buf, inputs=(l, c)) for dt, buf in zip(dtypes, outs)]
+    _dmi_kernel(h, l, c, tp, *results)
+    return tuple(results)
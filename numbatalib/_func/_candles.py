@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import math
+from typing import Any
 
 import numpy as np
-from numba import njit
+from numba import njit, types
+from numba.extending import overload
 
 
 # TA-Lib RangeType enum
@@ -78,34 +80,38 @@ _CANDLE_FACTOR = np.array(
 )
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def real_body(open_: np.ndarray, close: np.ndarray, idx: int) -> float:
     return math.fabs(close[idx] - open_[idx])
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def upper_shadow(open_: np.ndarray, high: np.ndarray, close: np.ndarray, idx: int) -> float:
-    oc_max = close[idx] if close[idx] >= open_[idx] else open_[idx]
+    o = open_[idx]
+    c = close[idx]
+    oc_max = c if c >= o else o
     return high[idx] - oc_max
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def lower_shadow(open_: np.ndarray, low: np.ndarray, close: np.ndarray, idx: int) -> float:
-    oc_min = open_[idx] if close[idx] >= open_[idx] else close[idx]
+    o = open_[idx]
+    c = close[idx]
+    oc_min = o if c >= o else c
     return oc_min - low[idx]
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def high_low_range(high: np.ndarray, low: np.ndarray, idx: int) -> float:
     return high[idx] - low[idx]
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def candle_color(open_: np.ndarray, close: np.ndarray, idx: int) -> int:
     return 1 if close[idx] >= open_[idx] else -1
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def candle_range(
     setting: int,
     open_: np.ndarray,
@@ -123,7 +129,7 @@ def candle_range(
     return upper_shadow(open_, high, close, idx) + lower_shadow(open_, low, close, idx)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def candle_average(
     setting: int,
     period_total: float,
@@ -145,26 +151,97 @@ def candle_average(
     return float(_CANDLE_FACTOR[setting]) * rng
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def real_body_gap_up(open_: np.ndarray, close: np.ndarray, idx2: int, idx1: int) -> bool:
-    lo2 = open_[idx2] if open_[idx2] < close[idx2] else close[idx2]
-    hi1 = open_[idx1] if open_[idx1] > close[idx1] else close[idx1]
+    o2 = open_[idx2]
+    c2 = close[idx2]
+    o1 = open_[idx1]
+    c1 = close[idx1]
+    lo2 = o2 if o2 < c2 else c2
+    hi1 = o1 if o1 > c1 else c1
     return lo2 > hi1
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def real_body_gap_down(open_: np.ndarray, close: np.ndarray, idx2: int, idx1: int) -> bool:
-    hi2 = open_[idx2] if open_[idx2] > close[idx2] else close[idx2]
-    lo1 = open_[idx1] if open_[idx1] < close[idx1] else close[idx1]
+    o2 = open_[idx2]
+    c2 = close[idx2]
+    o1 = open_[idx1]
+    c1 = close[idx1]
+    hi2 = o2 if o2 > c2 else c2
+    lo1 = o1 if o1 < c1 else c1
     return hi2 < lo1
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def candle_gap_up(high: np.ndarray, low: np.ndarray, idx2: int, idx1: int) -> bool:
     return low[idx2] > high[idx1]
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def candle_gap_down(high: np.ndarray, low: np.ndarray, idx2: int, idx1: int) -> bool:
     return high[idx2] < low[idx1]
 
+
+def emit_signal(out, indices, values, count, idx, value):
+    """
+    Store the signal `value` of bar `idx` from inside a CDL kernel and return
+    the updated event count.
+
+    Kernels pass `indices=values=None` for dense output into `out`, and
+    `out=None` for sparse output. The two cases are compiled separately, so
+    the per-bar store carries no mode check.
+    """
+    raise NotImplementedError("emit_signal is only callable from jitted code")
+
+
+@overload(emit_signal, jit_options={"cache": True, "nogil": True})
+def _emit_signal(out, indices, values, count, idx, value):
+    if isinstance(indices, types.NoneType):
+
+        def dense(out, indices, values, count, idx, value):
+            out[idx] = value
+            return count
+
+        return dense
+
+    def sparse(out, indices, values, count, idx, value):
+        # Every bar is written at `count`, which only advances past nonzero
+        # values, so the store does not branch on the value. Once the buffer
+        # is full the last slot is scratch; events are still counted.
+        k = count if count < indices.shape[0] else indices.shape[0] - 1
+        indices[k] = idx
+        values[k] = value
+        return count + (value != 0)
+
+    return sparse
+
+
+# Smallest event buffer `pattern_events` starts with.
+_MIN_EVENT_CAPACITY = 1024
+
+
+def pattern_events(
+    run, args: tuple, out=None, dtype: Any = np.int32
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    `sparse=True` output of a CDL function: the bars where the pattern fired
+    (int64) and its values there (`dtype`), emitted by the kernel `run`.
+
+    Events are first filled into a buffer sized for 1 bar in 16, plus the
+    scratch slot `emit_signal` writes non-events to once it is full. Only
+    when a pattern fires more often is the kernel run again with the exact
+    count.
+    """
+    if out is not None:
+        raise ValueError("out is not supported with sparse=True")
+    n = args[0].shape[0]
+    capacity = min(n, max(_MIN_EVENT_CAPACITY, n // 16))
+    indices = np.empty(capacity + 1, dtype=np.int64)
+    values = np.empty(capacity + 1, dtype=dtype)
+    count = run(*args, None, indices, values)
+    if count > capacity:
+        indices = np.empty(count + 1, dtype=np.int64)
+        values = np.empty(count + 1, dtype=dtype)
+        run(*args, None, indices, values)
+    return indices[:count].copy(), values[:count].copy()
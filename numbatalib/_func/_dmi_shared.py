@@ -9,12 +9,12 @@ from numba import njit
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _ta_is_zero(x: float) -> bool:
     return math.fabs(x) < TA_EPSILON
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _true_range(curr_high: float, curr_low: float, prev_close: float) -> float:
     """TA-Lib TRUE_RANGE macro."""
     tr = curr_high - curr_low
@@ -27,7 +27,7 @@ def _true_range(curr_high: float, curr_low: float, prev_close: float) -> float:
     return tr
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _dm_deltas(
     curr_high: float, curr_low: float, prev_high: float, prev_low: float
 ) -> tuple[float, float]:
@@ -3,13 +3,14 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, check_int_param, is_2d, split_outputs
 from numbatalib._func.ta_sma import SMA
 
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _accbands_transform_kernel(high: np.ndarray, low: np.ndarray, out_high: np.ndarray, out_low: np.ndarray) -> None:
     n = high.shape[0]
     for i in range(n):
@@ -23,24 +24,28 @@ def _accbands_transform_kernel(high: np.ndarray, low: np.ndarray, out_high: np.n
             out_low[i] = low[i]
 
 
-def ACCBANDS(high, low, close, timeperiod: int = 20):
+def ACCBANDS(high, low, close, timeperiod: int = 20, *, axis: int = 0, out=None, output_dtype=None):
     """
     Acceleration Bands
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(high):
+        return apply_2d("ACCBANDS", (high, low, close), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
 
     t_high = np.empty(n, dtype=np.float64)
     t_low = np.empty(n, dtype=np.float64)
     _accbands_transform_kernel(h, l, t_high, t_low)
 
-    middle = SMA(c, timeperiod=tp)
-    upper = SMA(t_high, timeperiod=tp)
-    lower = SMA(t_low, timeperiod=tp)
+    outs = split_outputs(out, 3)
+    middle = SMA(c, timeperiod=tp, out=outs[1], output_dtype=output_dtype)
+    upper = SMA(t_high, timeperiod=tp, out=outs[0], output_dtype=output_dtype)
+    lower = SMA(t_low, timeperiod=tp, out=outs[2], output_dtype=output_dtype)
     return upper, middle, lower
@@ -3,33 +3,40 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, float_dtype, is_2d, nan_like
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _ad_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray, out: np.ndarray) -> None:
     n = high.shape[0]
     ad = 0.0
     for i in range(n):
-        tmp = high[i] - low[i]
+        high_ = np.float64(high[i])
+        low_ = np.float64(low[i])
+        close_ = np.float64(close[i])
+        tmp = high_ - low_
         if tmp > 0.0:
-            ad += (((close[i] - low[i]) - (high[i] - close[i])) / tmp) * volume[i]
+            ad += (((close_ - low_) - (high_ - close_)) / tmp) * np.float64(volume[i])
         out[i] = ad
 
 
-def AD(high, low, close, volume):
+def AD(high, low, close, volume, *, axis: int = 0, out=None, output_dtype=None):
     """
     Chaikin A/D Line
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
-    v = as_1d_float64(volume)
+    if is_2d(high):
+        return apply_2d("AD", (high, low, close, volume), (), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
+    v = as_1d_float(volume)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n or v.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(h, dtype=np.float64)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l, c, v))
     _ad_kernel(h, l, c, v, out)
     return out
 
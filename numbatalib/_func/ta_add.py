@@ -3,28 +3,32 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, empty_output, float_dtype, is_2d
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _add_kernel(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
     n = a.shape[0]
     for i in range(n):
         out[i] = a[i] + b[i]
 
 
-def ADD(real0, real1):
+def ADD(real0, real1, *, axis: int = 0, out=None, output_dtype=None):
     """
     Vector Arithmetic Add
 
     Mirrors TA-Lib behavior: elementwise add, output length equals input length.
     """
-    a = as_1d_float64(real0)
-    b = as_1d_float64(real1)
+    if is_2d(real0):
+        return apply_2d("ADD", (real0, real1), (), axis, out, output_dtype)
+
+    a = as_1d_float(real0)
+    b = as_1d_float(real1)
     if a.shape[0] != b.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = np.empty(a.shape[0], dtype=np.float64)
+    out = empty_output(a.shape[0], dtype=float_dtype(output_dtype), out=out)
     _add_kernel(a, b, out)
     return out
 
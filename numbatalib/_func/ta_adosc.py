@@ -3,10 +3,17 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _adosc_kernel(
     high: np.ndarray,
     low: np.ndarray,
@@ -35,48 +42,98 @@ def _adosc_kernel(
     one_minus_slowk = 1.0 - slowk
 
     # Seed with first A/D value.
-    tmp = high[today] - low[today]
+    high_ = np.float64(high[today])
+    low_ = np.float64(low[today])
+    close_ = np.float64(close[today])
+    tmp = high_ - low_
     if tmp > 0.0:
-        ad += (((close[today] - low[today]) - (high[today] - close[today])) / tmp) * volume[today]
+        ad += (((close_ - low_) - (high_ - close_)) / tmp) * np.float64(volume[today])
     today += 1
     fast_ema = ad
     slow_ema = ad
 
     # Warm up until `start`.
     while today < start:
-        tmp = high[today] - low[today]
+        high_ = np.float64(high[today])
+        low_ = np.float64(low[today])
+        close_ = np.float64(close[today])
+        tmp = high_ - low_
         if tmp > 0.0:
-            ad += (((close[today] - low[today]) - (high[today] - close[today])) / tmp) * volume[today]
+            ad += (((close_ - low_) - (high_ - close_)) / tmp) * np.float64(volume[today])
         today += 1
         fast_ema = (fastk * ad) + (one_minus_fastk * fast_ema)
         slow_ema = (slowk * ad) + (one_minus_slowk * slow_ema)
 
     while today < n:
-        tmp = high[today] - low[today]
+        high_ = np.float64(high[today])
+        low_ = np.float64(low[today])
+        close_ = np.float64(close[today])
+        tmp = high_ - low_
         if tmp > 0.0:
-            ad += (((close[today] - low[today]) - (high[today] - close[today])) / tmp) * volume[today]
+            ad += (((close_ - low_) - (high_ - close_)) / tmp) * np.float64(volume[today])
         today += 1
         fast_ema = (fastk * ad) + (one_minus_fastk * fast_ema)
         slow_ema = (slowk * ad) + (one_minus_slowk * slow_ema)
         out[today - 1] = fast_ema - slow_ema
 
 
-def ADOSC(high, low, close, volume, fastperiod: int = 3, slowperiod: int = 10):
+@njit(cache=True, nogil=True)
+def _adosc_from_ad_kernel(
+    ad: np.ndarray, fastperiod: int, slowperiod: int, out: np.ndarray
+) -> None:
+    """`_adosc_kernel` over a precomputed A/D line (`parallel.scan`)."""
+    n = ad.shape[0]
+    slowest = slowperiod if fastperiod < slowperiod else fastperiod
+    lookback = slowest - 1
+    if n <= lookback or n == 0:
+        return
+
+    fastk = 2.0 / (fastperiod + 1.0)
+    slowk = 2.0 / (slowperiod + 1.0)
+    one_minus_fastk = 1.0 - fastk
+    one_minus_slowk = 1.0 - slowk
+
+    fast_ema = ad[0]
+    slow_ema = ad[0]
+    for today in range(1, n):
+        fast_ema = (fastk * ad[today]) + (one_minus_fastk * fast_ema)
+        slow_ema = (slowk * ad[today]) + (one_minus_slowk * slow_ema)
+        if today >= lookback:
+            out[today] = fast_ema - slow_ema
+
+
+def ADOSC(
+    high,
+    low,
+    close,
+    volume,
+    fastperiod: int = 3,
+    slowperiod: int = 10,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+):
     """
     Chaikin A/D Oscillator
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
-    v = as_1d_float64(volume)
+    if is_2d(high):
+        return apply_2d(
+            "ADOSC", (high, low, close, volume), (fastperiod, slowperiod), axis, out, output_dtype
+        )
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
+    v = as_1d_float(volume)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n or v.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    fp = validate_int_param("fastperiod", fastperiod, Range(min=2, max=100000))
-    sp = validate_int_param("slowperiod", slowperiod, Range(min=2, max=100000))
+    fp = check_int_param("fastperiod", fastperiod, 2, 100000)
+    sp = check_int_param("slowperiod", slowperiod, 2, 100000)
 
-    out = nan_like(h, dtype=np.float64)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l, c, v))
     _adosc_kernel(h, l, c, v, fp, sp, out)
     return out
 
@@ -5,11 +5,18 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 from numbatalib._func._dmi_shared import _dm_deltas, _ta_is_zero, _true_range
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _adx_kernel(
     high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int, out: np.ndarray
 ) -> None:
@@ -26,15 +33,15 @@ def _adx_kernel(
     prev_tr = 0.0
 
     today = 0
-    prev_high = high[today]
-    prev_low = low[today]
-    prev_close = close[today]
+    prev_high = np.float64(high[today])
+    prev_low = np.float64(low[today])
+    prev_close = np.float64(close[today])
 
     # Initial DM and TR (timeperiod-1 bars).
     for _ in range(timeperiod - 1):
         today += 1
-        curr_high = high[today]
-        curr_low = low[today]
+        curr_high = np.float64(high[today])
+        curr_low = np.float64(low[today])
         diff_p, diff_m = _dm_deltas(curr_high, curr_low, prev_high, prev_low)
         prev_high = curr_high
         prev_low = curr_low
@@ -46,14 +53,14 @@ def _adx_kernel(
 
         tr = _true_range(curr_high, curr_low, prev_close)
         prev_tr += tr
-        prev_close = close[today]
+        prev_close = np.float64(close[today])
 
     # Sum first `timeperiod` DX values.
     sum_dx = 0.0
     for _ in range(timeperiod):
         today += 1
-        curr_high = high[today]
-        curr_low = low[today]
+        curr_high = np.float64(high[today])
+        curr_low = np.float64(low[today])
         diff_p, diff_m = _dm_deltas(curr_high, curr_low, prev_high, prev_low)
         prev_high = curr_high
         prev_low = curr_low
@@ -67,7 +74,7 @@ def _adx_kernel(
 
         tr = _true_range(curr_high, curr_low, prev_close)
         prev_tr = prev_tr - (prev_tr / timeperiod) + tr
-        prev_close = close[today]
+        prev_close = np.float64(close[today])
 
         if not _ta_is_zero(prev_tr):
             minus_di = 100.0 * (prev_minus_dm / prev_tr)
@@ -81,8 +88,8 @@ def _adx_kernel(
 
     # Subsequent ADX.
     for today in range(lookback_total + 1, n):
-        curr_high = high[today]
-        curr_low = low[today]
+        curr_high = np.float64(high[today])
+        curr_low = np.float64(low[today])
         diff_p, diff_m = _dm_deltas(curr_high, curr_low, prev_high, prev_low)
         prev_high = curr_high
         prev_low = curr_low
@@ -96,7 +103,7 @@ def _adx_kernel(
 
         tr = _true_range(curr_high, curr_low, prev_close)
         prev_tr = prev_tr - (prev_tr / timeperiod) + tr
-        prev_close = close[today]
+        prev_close = np.float64(close[today])
 
         if not _ta_is_zero(prev_tr):
             minus_di = 100.0 * (prev_minus_dm / prev_tr)
@@ -109,19 +116,22 @@ def _adx_kernel(
         out[today] = prev_adx
 
 
-def ADX(high, low, close, timeperiod: int = 14):
+def ADX(high, low, close, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Average Directional Movement Index
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(high):
+        return apply_2d("ADX", (high, low, close), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    out = nan_like(h, dtype=np.float64)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l, c))
     _adx_kernel(h, l, c, tp, out)
     return out
 
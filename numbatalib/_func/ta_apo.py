@@ -2,17 +2,36 @@ from __future__ import annotations
 
 import numpy as np
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    empty_output,
+    float_dtype,
+    is_2d,
+)
 from numbatalib._func.ta_ma import MA, _validate_matype
 
 
-def APO(real, fastperiod: int = 12, slowperiod: int = 26, matype: int = 0):
+def APO(
+    real,
+    fastperiod: int = 12,
+    slowperiod: int = 26,
+    matype: int = 0,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+):
     """
     Absolute Price Oscillator
     """
-    real_arr = as_1d_float64(real)
-    fp = validate_int_param("fastperiod", fastperiod, Range(min=2, max=100000))
-    sp = validate_int_param("slowperiod", slowperiod, Range(min=2, max=100000))
+    if is_2d(real):
+        return apply_2d("APO", (real,), (fastperiod, slowperiod, matype), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    fp = check_int_param("fastperiod", fastperiod, 2, 100000)
+    sp = check_int_param("slowperiod", slowperiod, 2, 100000)
     mt = _validate_matype(matype)
 
     if sp < fp:
@@ -20,7 +39,7 @@ def APO(real, fastperiod: int = 12, slowperiod: int = 26, matype: int = 0):
 
     fast_ma = MA(real_arr, timeperiod=fp, matype=mt)
     slow_ma = MA(real_arr, timeperiod=sp, matype=mt)
-    out = nan_like(real_arr, dtype=np.float64)
-    out[:] = fast_ma - slow_ma
+    out = empty_output(real_arr.shape[0], dtype=float_dtype(output_dtype), out=out)
+    np.subtract(fast_ma, slow_ma, out=out)
     return out
 
@@ -3,10 +3,18 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+    split_outputs,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _aroon_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out_down: np.ndarray, out_up: np.ndarray) -> None:
     n = high.shape[0]
     if n <= timeperiod:
@@ -58,18 +66,22 @@ def _aroon_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out_down:
         trailing_idx += 1
 
 
-def AROON(high, low, timeperiod: int = 14):
+def AROON(high, low, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Aroon
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
+    if is_2d(high):
+        return apply_2d("AROON", (high, low), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
     if l.shape[0] != h.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    out_down = nan_like(h, dtype=np.float64)
-    out_up = nan_like(h, dtype=np.float64)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    outs = split_outputs(out, 2)
+    out_down = nan_like(h, dtype=float_dtype(output_dtype), out=outs[0], inputs=(l,))
+    out_up = nan_like(h, dtype=float_dtype(output_dtype), out=outs[1], inputs=(l,))
     _aroon_kernel(h, l, tp, out_down, out_up)
     return out_down, out_up
 
@@ -3,10 +3,17 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _aroonosc_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = high.shape[0]
     if n <= timeperiod:
@@ -57,17 +64,20 @@ def _aroonosc_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out: np
         trailing_idx += 1
 
 
-def AROONOSC(high, low, timeperiod: int = 14):
+def AROONOSC(high, low, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Aroon Oscillator
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
+    if is_2d(high):
+        return apply_2d("AROONOSC", (high, low), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
     if l.shape[0] != h.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    out = nan_like(h, dtype=np.float64)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l,))
     _aroonosc_kernel(h, l, tp, out)
     return out
 
@@ -3,22 +3,26 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, empty_output, float_dtype, is_2d
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _atan_kernel(real: np.ndarray, out: np.ndarray) -> None:
     n = real.shape[0]
     for i in range(n):
-        out[i] = np.arctan(real[i])
+        out[i] = np.arctan(np.float64(real[i]))
 
 
-def ATAN(real):
+def ATAN(real, *, axis: int = 0, out=None, output_dtype=None):
     """
     Vector Trigonometric ATan
     """
-    real_arr = as_1d_float64(real)
-    out = np.empty(real_arr.shape[0], dtype=np.float64)
+    if is_2d(real):
+        return apply_2d("ATAN", (real,), (), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    out = empty_output(real_arr.shape[0], dtype=float_dtype(output_dtype), out=out)
     _atan_kernel(real_arr, out)
     return out
 
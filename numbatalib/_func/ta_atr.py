@@ -3,10 +3,23 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
+def _atr_step(atr: float, tr: float, timeperiod: int) -> float:
+    """One step of Wilder's ATR smoothing."""
+    return ((atr * (timeperiod - 1)) + tr) / timeperiod
+
+
+@njit(cache=True, nogil=True)
 def _atr_kernel(
     high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int, out: np.ndarray
 ) -> None:
@@ -18,9 +31,9 @@ def _atr_kernel(
     tr_sum = 0.0
     i = 1
     while i <= timeperiod:
-        temp_lt = low[i]
-        temp_ht = high[i]
-        temp_cy = close[i - 1]
+        temp_lt = np.float64(low[i])
+        temp_ht = np.float64(high[i])
+        temp_cy = np.float64(close[i - 1])
 
         greatest = temp_ht - temp_lt
         val2 = abs(temp_cy - temp_ht)
@@ -39,9 +52,9 @@ def _atr_kernel(
     # Wilder smoothing.
     i = timeperiod + 1
     while i < n:
-        temp_lt = low[i]
-        temp_ht = high[i]
-        temp_cy = close[i - 1]
+        temp_lt = np.float64(low[i])
+        temp_ht = np.float64(high[i])
+        temp_cy = np.float64(close[i - 1])
 
         greatest = temp_ht - temp_lt
         val2 = abs(temp_cy - temp_ht)
@@ -51,25 +64,28 @@ def _atr_kernel(
         if val3 > greatest:
             greatest = val3
 
-        atr = ((atr * (timeperiod - 1)) + greatest) / timeperiod
+        atr = _atr_step(atr, greatest, timeperiod)
         out[i] = atr
         i += 1
 
 
-def ATR(high, low, close, timeperiod: int = 14):
+def ATR(high, low, close, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Average True Range
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(high):
+        return apply_2d("ATR", (high, low, close), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=1, max=100000))
+    tp = check_int_param("timeperiod", timeperiod, 1, 100000)
 
-    out = nan_like(h, dtype=np.float64)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l, c))
     _atr_kernel(h, l, c, tp, out)
     return out
 
@@ -3,29 +3,33 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, empty_output, float_dtype, is_2d
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _avgprice_kernel(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray) -> None:
     n = open_.shape[0]
     for i in range(n):
-        out[i] = (open_[i] + high[i] + low[i] + close[i]) * 0.25
+        out[i] = (high[i] + low[i] + close[i] + open_[i]) * 0.25
 
 
-def AVGPRICE(open, high, low, close):
+def AVGPRICE(open, high, low, close, *, axis: int = 0, out=None, output_dtype=None):
     """
     Average Price
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open):
+        return apply_2d("AVGPRICE", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = o.shape[0]
     if h.shape[0] != n or l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    out = np.empty(n, dtype=np.float64)
+    out = empty_output(n, dtype=float_dtype(output_dtype), out=out)
     _avgprice_kernel(o, h, l, c, out)
     return out
 
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import numpy as np
 
+from numbatalib._batch import apply_2d
 from numbatalib._core._validation import (
-    Range,
-    as_1d_float64,
-    validate_float_param,
-    validate_int_param,
+    as_1d_float,
+    check_float_param,
+    check_int_param,
+    empty_output,
+    float_dtype,
+    is_2d,
+    split_outputs,
 )
 from numbatalib._func.ta_ma import MA
 from numbatalib._func.ta_stddev import STDDEV, TA_REAL_MAX, TA_REAL_MIN
@@ -18,19 +22,46 @@ def BBANDS(
     nbdevup: float = 2.0,
     nbdevdn: float = 2.0,
     matype: int = 0,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
 ):
     """
     Bollinger Bands
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    up = validate_float_param("nbdevup", nbdevup, Range(min=TA_REAL_MIN, max=TA_REAL_MAX))
-    dn = validate_float_param("nbdevdn", nbdevdn, Range(min=TA_REAL_MIN, max=TA_REAL_MAX))
+    if is_2d(real):
+        return apply_2d(
+            "BBANDS", (real,), (timeperiod, nbdevup, nbdevdn, matype), axis, out, output_dtype
+        )
 
-    middle = MA(real_arr, timeperiod=tp, matype=matype)
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    up = check_float_param("nbdevup", nbdevup, TA_REAL_MIN, TA_REAL_MAX)
+    dn = check_float_param("nbdevdn", nbdevdn, TA_REAL_MIN, TA_REAL_MAX)
+
+    n = real_arr.shape[0]
+    outs = split_outputs(out, 3)
+    dtype = float_dtype(output_dtype)
+    upper = empty_output(n, dtype=dtype, out=outs[0])
+    lower = empty_output(n, dtype=dtype, out=outs[2])
     std = STDDEV(real_arr, timeperiod=tp, nbdev=1.0)
 
-    upper = middle + (up * std)
-    lower = middle - (dn * std)
+    if dtype != np.float64:
+        # Combine in float64 and round each band once.
+        middle = MA(real_arr, timeperiod=tp, matype=matype)
+        upper[:] = middle + (up * std)
+        lower[:] = middle - (dn * std)
+        middle_out = empty_output(n, dtype=dtype, out=outs[1])
+        middle_out[:] = middle
+        return upper, middle_out, lower
+
+    middle = MA(real_arr, timeperiod=tp, matype=matype, out=outs[1])
+
+    # upper = middle + (up * std), lower = middle - (dn * std), without temporaries.
+    np.multiply(up, std, out=upper)
+    np.add(middle, upper, out=upper)
+    np.multiply(dn, std, out=lower)
+    np.subtract(middle, lower, out=lower)
     return upper, middle, lower
 
@@ -3,13 +3,20 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _beta_kernel(real0: np.ndarray, real1: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real0.shape[0]
     if n == 0 or timeperiod > n - 1:
@@ -25,21 +32,21 @@ def _beta_kernel(real0: np.ndarray, real1: np.ndarray, timeperiod: int, out: np.
     s_y = 0.0
 
     trailing_idx = 0
-    last_x = real0[trailing_idx]
-    last_y = real1[trailing_idx]
+    last_x = np.float64(real0[trailing_idx])
+    last_y = np.float64(real1[trailing_idx])
     trailing_last_x = last_x
     trailing_last_y = last_y
 
     i = trailing_idx + 1
     while i < start:
-        tmp = real0[i]
+        tmp = np.float64(real0[i])
         if abs(last_x) >= TA_EPSILON:
             x = (tmp - last_x) / last_x
         else:
             x = 0.0
         last_x = tmp
 
-        tmp = real1[i]
+        tmp = np.float64(real1[i])
         if abs(last_y) >= TA_EPSILON:
             y = (tmp - last_y) / last_y
         else:
@@ -56,14 +63,14 @@ def _beta_kernel(real0: np.ndarray, real1: np.ndarray, timeperiod: int, out: np.
     n_f = float(timeperiod)
     trailing_idx = 1
     while i < n:
-        tmp = real0[i]
+        tmp = np.float64(real0[i])
         if abs(last_x) >= TA_EPSILON:
             x = (tmp - last_x) / last_x
         else:
             x = 0.0
         last_x = tmp
 
-        tmp = real1[i]
+        tmp = np.float64(real1[i])
         if abs(last_y) >= TA_EPSILON:
             y = (tmp - last_y) / last_y
         else:
@@ -76,14 +83,14 @@ def _beta_kernel(real0: np.ndarray, real1: np.ndarray, timeperiod: int, out: np.
         s_y += y
 
         # trailing returns (read before write).
-        tmp = real0[trailing_idx]
+        tmp = np.float64(real0[trailing_idx])
         if abs(trailing_last_x) >= TA_EPSILON:
             x_t = (tmp - trailing_last_x) / trailing_last_x
         else:
             x_t = 0.0
         trailing_last_x = tmp
 
-        tmp = real1[trailing_idx]
+        tmp = np.float64(real1[trailing_idx])
         if abs(trailing_last_y) >= TA_EPSILON:
             y_t = (tmp - trailing_last_y) / trailing_last_y
         else:
@@ -105,16 +112,19 @@ def _beta_kernel(real0: np.ndarray, real1: np.ndarray, timeperiod: int, out: np.
         i += 1
 
 
-def BETA(real0, real1, timeperiod: int = 5):
+def BETA(real0, real1, timeperiod: int = 5, *, axis: int = 0, out=None, output_dtype=None):
     """
     Beta
     """
-    x = as_1d_float64(real0)
-    y = as_1d_float64(real1)
+    if is_2d(real0):
+        return apply_2d("BETA", (real0, real1), (timeperiod,), axis, out, output_dtype)
+
+    x = as_1d_float(real0)
+    y = as_1d_float(real1)
     if y.shape[0] != x.shape[0]:
         raise ValueError("inputs must have the same length")
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=1, max=100000))
+    tp = check_int_param("timeperiod", timeperiod, 1, 100000)
 
-    out = nan_like(x, dtype=np.float64)
+    out = nan_like(x, dtype=float_dtype(output_dtype), out=out, inputs=(y,))
     _beta_kernel(x, y, tp, out)
     return out
@@ -4,7 +4,14 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 from numbatalib._func.ta_avgdev import AVGDEV
 from numbatalib._func.ta_sma import SMA
 
@@ -12,7 +19,7 @@ from numbatalib._func.ta_sma import SMA
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _cci_kernel(tp: np.ndarray, ma: np.ndarray, dev: np.ndarray, out: np.ndarray) -> None:
     n = tp.shape[0]
     for i in range(n):
@@ -27,24 +34,27 @@ def _cci_kernel(tp: np.ndarray, ma: np.ndarray, dev: np.ndarray, out: np.ndarray
             out[i] = (tp[i] - m) / denom
 
 
-def CCI(high, low, close, timeperiod: int = 14):
+def CCI(high, low, close, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Commodity Channel Index
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(high):
+        return apply_2d("CCI", (high, low, close), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
 
     typical = (h + l + c) / 3.0
     ma = SMA(typical, timeperiod=tp)
     dev = AVGDEV(typical, timeperiod=tp)
 
-    out = nan_like(typical, dtype=np.float64)
+    out = nan_like(typical, dtype=float_dtype(output_dtype), out=out, inputs=(h, l, c))
     _cci_kernel(typical, ma, dev, out)
     return out
 
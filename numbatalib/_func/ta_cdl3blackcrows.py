@@ -3,25 +3,88 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     SHADOW_VERY_SHORT,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
 )
 
 
-@njit(cache=True)
-def _cdl3blackcrows_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDL3BLACKCROWS_TOTALS = ((SHADOW_VERY_SHORT, 2), (SHADOW_VERY_SHORT, 1), (SHADOW_VERY_SHORT, 0))
+
+
+@njit(cache=True, nogil=True)
+def _cdl3blackcrows_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    tot2: float,
+    tot1: float,
+    tot0: float,
+) -> int:
+    color3 = candle_color(open_, close, i - 3)
+    color2 = candle_color(open_, close, i - 2)
+    lower2 = lower_shadow(open_, low, close, i - 2)
+    shadow_very_short2 = candle_average(SHADOW_VERY_SHORT, tot2, open_, high, low, close, i - 2)
+    color1 = candle_color(open_, close, i - 1)
+    lower1 = lower_shadow(open_, low, close, i - 1)
+    shadow_very_short1 = candle_average(SHADOW_VERY_SHORT, tot1, open_, high, low, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    lower0 = lower_shadow(open_, low, close, i)
+    shadow_very_short0 = candle_average(SHADOW_VERY_SHORT, tot0, open_, high, low, close, i)
+    open1 = open_[i - 1]
+    open2 = open_[i - 2]
+    close2 = close[i - 2]
+    open0 = open_[i]
+    close1 = close[i - 1]
+    high3 = high[i - 3]
+    close0 = close[i]
+
+    if (
+        color3 == 1
+        and color2 == -1
+        and lower2 < shadow_very_short2
+        and color1 == -1
+        and lower1 < shadow_very_short1
+        and color0 == -1
+        and lower0 < shadow_very_short0
+        and open1 < open2
+        and open1 > close2
+        and open0 < open1
+        and open0 > close1
+        and high3 > close2
+        and close2 > close1
+        and close1 > close0
+    ):
+        return -100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdl3blackcrows_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 13  # TA_CANDLEAVGPERIOD(ShadowVeryShort) + 3
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     shadow_vs_trailing = start_idx - 10  # avgPeriod(ShadowVeryShort)=10
 
@@ -37,28 +100,8 @@ def _cdl3blackcrows_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        if (
-            candle_color(open_, close, i - 3) == 1
-            and candle_color(open_, close, i - 2) == -1
-            and lower_shadow(open_, low, close, i - 2)
-            < candle_average(SHADOW_VERY_SHORT, tot2, open_, high, low, close, i - 2)
-            and candle_color(open_, close, i - 1) == -1
-            and lower_shadow(open_, low, close, i - 1)
-            < candle_average(SHADOW_VERY_SHORT, tot1, open_, high, low, close, i - 1)
-            and candle_color(open_, close, i) == -1
-            and lower_shadow(open_, low, close, i)
-            < candle_average(SHADOW_VERY_SHORT, tot0, open_, high, low, close, i)
-            and open_[i - 1] < open_[i - 2]
-            and open_[i - 1] > close[i - 2]
-            and open_[i] < open_[i - 1]
-            and open_[i] > close[i - 1]
-            and high[i - 3] > close[i - 2]
-            and close[i - 2] > close[i - 1]
-            and close[i - 1] > close[i]
-        ):
-            out[i] = -100
-        else:
-            out[i] = 0
+        v = _cdl3blackcrows_bar(open_, high, low, close, i, tot2, tot1, tot0)
+        count = emit_signal(out, indices, values, count, i, v)
 
         tot2 += candle_range(SHADOW_VERY_SHORT, open_, high, low, close, i - 2) - candle_range(
             SHADOW_VERY_SHORT, open_, high, low, close, shadow_vs_trailing - 2
@@ -70,22 +113,39 @@ def _cdl3blackcrows_kernel(
             SHADOW_VERY_SHORT, open_, high, low, close, shadow_vs_trailing
         )
         shadow_vs_trailing += 1
+    return count
 
 
-def CDL3BLACKCROWS(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdl3blackcrows_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdl3blackcrows_run(open_, high, low, close, out, None, None)
+
+
+def CDL3BLACKCROWS(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Three Black Crows
 
     Output is an int array with values in {0, -100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDL3BLACKCROWS", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDL3BLACKCROWS", output_dtype)
+    if sparse:
+        return pattern_events(_cdl3blackcrows_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdl3blackcrows_kernel(o, h, l, c, out)
     return out
 
@@ -3,26 +3,80 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_LONG,
     BODY_SHORT,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
+    pattern_events,
     real_body,
 )
 
 
-@njit(cache=True)
-def _cdl3inside_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDL3INSIDE_TOTALS = ((BODY_LONG, 2), (BODY_SHORT, 1))
+
+
+@njit(cache=True, nogil=True)
+def _cdl3inside_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_long_total: float,
+    body_short_total: float,
+) -> int:
+    close1 = close[i - 1]
+    open1 = open_[i - 1]
+    close2 = close[i - 2]
+    open2 = open_[i - 2]
+    body2 = real_body(open_, close, i - 2)
+    body_long2 = candle_average(BODY_LONG, body_long_total, open_, high, low, close, i - 2)
+    body1 = real_body(open_, close, i - 1)
+    body_short1 = candle_average(BODY_SHORT, body_short_total, open_, high, low, close, i - 1)
+    color2 = candle_color(open_, close, i - 2)
+    color0 = candle_color(open_, close, i)
+    close0 = close[i]
+
+    oc1_max = close1 if close1 > open1 else open1
+    oc1_min = open1 if close1 > open1 else close1
+    oc2_max = close2 if close2 > open2 else open2
+    oc2_min = open2 if close2 > open2 else close2
+    if (
+        body2 > body_long2
+        and body1 <= body_short1
+        and oc1_max < oc2_max
+        and oc1_min > oc2_min
+        and (
+            (color2 == 1 and color0 == -1 and close0 < open2)
+            or (color2 == -1 and color0 == 1 and close0 > open2)
+        )
+    ):
+        return -color2 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdl3inside_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 12  # max(BodyShort, BodyLong) + 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     body_long_total = 0.0
     body_short_total = 0.0
@@ -40,34 +94,8 @@ def _cdl3inside_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        oc1_max = close[i - 1] if close[i - 1] > open_[i - 1] else open_[i - 1]
-        oc1_min = open_[i - 1] if close[i - 1] > open_[i - 1] else close[i - 1]
-        oc2_max = close[i - 2] if close[i - 2] > open_[i - 2] else open_[i - 2]
-        oc2_min = open_[i - 2] if close[i - 2] > open_[i - 2] else close[i - 2]
-
-        if (
-            real_body(open_, close, i - 2)
-            > candle_average(BODY_LONG, body_long_total, open_, high, low, close, i - 2)
-            and real_body(open_, close, i - 1)
-            <= candle_average(BODY_SHORT, body_short_total, open_, high, low, close, i - 1)
-            and oc1_max < oc2_max
-            and oc1_min > oc2_min
-            and (
-                (
-                    candle_color(open_, close, i - 2) == 1
-                    and candle_color(open_, close, i) == -1
-                    and close[i] < open_[i - 2]
-                )
-                or (
-                    candle_color(open_, close, i - 2) == -1
-                    and candle_color(open_, close, i) == 1
-                    and close[i] > open_[i - 2]
-                )
-            )
-        ):
-            out[i] = -candle_color(open_, close, i - 2) * 100
-        else:
-            out[i] = 0
+        v = _cdl3inside_bar(open_, high, low, close, i, body_long_total, body_short_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_long_total += candle_range(BODY_LONG, open_, high, low, close, i - 2) - candle_range(
             BODY_LONG, open_, high, low, close, body_long_trailing
@@ -77,22 +105,39 @@ def _cdl3inside_kernel(
         ) - candle_range(BODY_SHORT, open_, high, low, close, body_short_trailing)
         body_long_trailing += 1
         body_short_trailing += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdl3inside_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdl3inside_run(open_, high, low, close, out, None, None)
 
 
-def CDL3INSIDE(open, high, low, close):
+def CDL3INSIDE(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Three Inside Up/Down
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDL3INSIDE", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDL3INSIDE", output_dtype)
+    if sparse:
+        return pattern_events(_cdl3inside_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdl3inside_kernel(o, h, l, c, out)
     return out
 
@@ -3,19 +3,96 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
-from numbatalib._func._candles import NEAR, candle_average, candle_color, candle_range
-
-
-@njit(cache=True)
-def _cdl3linestrike_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
+from numbatalib._func._candles import (
+    NEAR,
+    candle_average,
+    candle_color,
+    candle_range,
+    emit_signal,
+    pattern_events,
+)
+
+
+_CDL3LINESTRIKE_TOTALS = ((NEAR, 3), (NEAR, 2))
+
+
+@njit(cache=True, nogil=True)
+def _cdl3linestrike_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    tot3: float,
+    tot2: float,
+) -> int:
+    c1 = candle_color(open_, close, i - 3)
+    c2 = candle_color(open_, close, i - 2)
+    c3 = candle_color(open_, close, i - 1)
+    c4 = candle_color(open_, close, i)
+    open3 = open_[i - 3]
+    close3 = close[i - 3]
+    open2 = open_[i - 2]
+    close2 = close[i - 2]
+    near1 = candle_average(NEAR, tot3, open_, high, low, close, i - 3)
+    near2 = candle_average(NEAR, tot2, open_, high, low, close, i - 2)
+    open1 = open_[i - 1]
+    close1 = close[i - 1]
+    open0 = open_[i]
+    close0 = close[i]
+
+    oc13_min = open3 if open3 < close3 else close3
+    oc13_max = open3 if open3 > close3 else close3
+    oc12_min = open2 if open2 < close2 else close2
+    oc12_max = open2 if open2 > close2 else close2
+    if (
+        c1 == c2
+        and c2 == c3
+        and c4 == -c3
+        and open2 >= oc13_min - near1
+        and open2 <= oc13_max + near1
+        and open1 >= oc12_min - near2
+        and open1 <= oc12_max + near2
+        and (
+            (
+                c3 == 1
+                and close1 > close2
+                and close2 > close3
+                and open0 > close1
+                and close0 < open3
+            )
+            or (
+                c3 == -1
+                and close1 < close2
+                and close2 < close3
+                and open0 < close1
+                and close0 > open3
+            )
+        )
+    ):
+        return c3 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdl3linestrike_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 8  # TA_CANDLEAVGPERIOD(Near) + 3
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     near_trailing = start_idx - 5  # avgPeriod(Near)=5
     tot3 = 0.0
@@ -28,47 +105,8 @@ def _cdl3linestrike_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        c1 = candle_color(open_, close, i - 3)
-        c2 = candle_color(open_, close, i - 2)
-        c3 = candle_color(open_, close, i - 1)
-        c4 = candle_color(open_, close, i)
-
-        oc13_min = open_[i - 3] if open_[i - 3] < close[i - 3] else close[i - 3]
-        oc13_max = open_[i - 3] if open_[i - 3] > close[i - 3] else close[i - 3]
-        oc12_min = open_[i - 2] if open_[i - 2] < close[i - 2] else close[i - 2]
-        oc12_max = open_[i - 2] if open_[i - 2] > close[i - 2] else close[i - 2]
-
-        near1 = candle_average(NEAR, tot3, open_, high, low, close, i - 3)
-        near2 = candle_average(NEAR, tot2, open_, high, low, close, i - 2)
-
-        if (
-            c1 == c2
-            and c2 == c3
-            and c4 == -c3
-            and open_[i - 2] >= oc13_min - near1
-            and open_[i - 2] <= oc13_max + near1
-            and open_[i - 1] >= oc12_min - near2
-            and open_[i - 1] <= oc12_max + near2
-            and (
-                (
-                    c3 == 1
-                    and close[i - 1] > close[i - 2]
-                    and close[i - 2] > close[i - 3]
-                    and open_[i] > close[i - 1]
-                    and close[i] < open_[i - 3]
-                )
-                or (
-                    c3 == -1
-                    and close[i - 1] < close[i - 2]
-                    and close[i - 2] < close[i - 3]
-                    and open_[i] < close[i - 1]
-                    and close[i] > open_[i - 3]
-                )
-            )
-        ):
-            out[i] = c3 * 100
-        else:
-            out[i] = 0
+        v = _cdl3linestrike_bar(open_, high, low, close, i, tot3, tot2)
+        count = emit_signal(out, indices, values, count, i, v)
 
         tot3 += candle_range(NEAR, open_, high, low, close, i - 3) - candle_range(
             NEAR, open_, high, low, close, near_trailing - 3
@@ -77,22 +115,39 @@ def _cdl3linestrike_kernel(
             NEAR, open_, high, low, close, near_trailing - 2
         )
         near_trailing += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdl3linestrike_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdl3linestrike_run(open_, high, low, close, out, None, None)
 
 
-def CDL3LINESTRIKE(open, high, low, close):
+def CDL3LINESTRIKE(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Three-Line Strike
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDL3LINESTRIKE", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDL3LINESTRIKE", output_dtype)
+    if sparse:
+        return pattern_events(_cdl3linestrike_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdl3linestrike_kernel(o, h, l, c, out)
     return out
 
@@ -3,52 +3,88 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
-from numbatalib._func._candles import candle_color
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
+from numbatalib._func._candles import candle_color, emit_signal, pattern_events
 
 
-@njit(cache=True)
-def _cdl3outside_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+@njit(cache=True, nogil=True)
+def _cdl3outside_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+) -> int:
+    color1 = candle_color(open_, close, i - 1)
+    color2 = candle_color(open_, close, i - 2)
+    close1 = close[i - 1]
+    open2 = open_[i - 2]
+    open1 = open_[i - 1]
+    close2 = close[i - 2]
+    close0 = close[i]
+
+    if (
+        (color1 == 1 and color2 == -1 and close1 > open2 and open1 < close2 and close0 > close1)
+        or (color1 == -1 and color2 == 1 and open1 > close2 and close1 < open2 and close0 < close1)
+    ):
+        return color1 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdl3outside_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 3
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     for i in range(lookback_total, n):
-        if (
-            candle_color(open_, close, i - 1) == 1
-            and candle_color(open_, close, i - 2) == -1
-            and close[i - 1] > open_[i - 2]
-            and open_[i - 1] < close[i - 2]
-            and close[i] > close[i - 1]
-        ) or (
-            candle_color(open_, close, i - 1) == -1
-            and candle_color(open_, close, i - 2) == 1
-            and open_[i - 1] > close[i - 2]
-            and close[i - 1] < open_[i - 2]
-            and close[i] < close[i - 1]
-        ):
-            out[i] = candle_color(open_, close, i - 1) * 100
-        else:
-            out[i] = 0
-
-
-def CDL3OUTSIDE(open, high, low, close):
+        v = _cdl3outside_bar(open_, high, low, close, i)
+        count = emit_signal(out, indices, values, count, i, v)
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdl3outside_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdl3outside_run(open_, high, low, close, out, None, None)
+
+
+def CDL3OUTSIDE(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Three Outside Up/Down
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDL3OUTSIDE", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDL3OUTSIDE", output_dtype)
+    if sparse:
+        return pattern_events(_cdl3outside_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdl3outside_kernel(o, h, l, c, out)
     return out
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_LONG,
     BODY_SHORT,
@@ -12,21 +14,100 @@ from numbatalib._func._candles import (
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
     real_body,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdl3starsinsouth_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDL3STARSINSOUTH_TOTALS = (
+    (BODY_LONG, 2),
+    (SHADOW_LONG, 2),
+    (SHADOW_VERY_SHORT, 1),
+    (SHADOW_VERY_SHORT, 0),
+    (BODY_SHORT, 0),
+)
+
+
+@njit(cache=True, nogil=True)
+def _cdl3starsinsouth_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    bodylong_total: float,
+    shadowlong_total: float,
+    svs_total1: float,
+    svs_total0: float,
+    bodyshort_total: float,
+) -> int:
+    color2 = candle_color(open_, close, i - 2)
+    color1 = candle_color(open_, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    body2 = real_body(open_, close, i - 2)
+    body_long2 = candle_average(BODY_LONG, bodylong_total, open_, high, low, close, i - 2)
+    lower2 = lower_shadow(open_, low, close, i - 2)
+    shadow_long2 = candle_average(SHADOW_LONG, shadowlong_total, open_, high, low, close, i - 2)
+    body1 = real_body(open_, close, i - 1)
+    open1 = open_[i - 1]
+    close2 = close[i - 2]
+    high2 = high[i - 2]
+    low1 = low[i - 1]
+    low2 = low[i - 2]
+    lower1 = lower_shadow(open_, low, close, i - 1)
+    shadow_very_short1 = candle_average(
+        SHADOW_VERY_SHORT, svs_total1, open_, high, low, close, i - 1
+    )
+    body0 = real_body(open_, close, i)
+    body_short0 = candle_average(BODY_SHORT, bodyshort_total, open_, high, low, close, i)
+    lower0 = lower_shadow(open_, low, close, i)
+    shadow_very_short0 = candle_average(SHADOW_VERY_SHORT, svs_total0, open_, high, low, close, i)
+    upper0 = upper_shadow(open_, high, close, i)
+    low0 = low[i]
+    high0 = high[i]
+    high1 = high[i - 1]
+
+    if (
+        color2 == -1
+        and color1 == -1
+        and color0 == -1
+        and body2 > body_long2
+        and lower2 > shadow_long2
+        and body1 < body2
+        and open1 > close2
+        and open1 <= high2
+        and low1 < close2
+        and low1 >= low2
+        and lower1 > shadow_very_short1
+        and body0 < body_short0
+        and lower0 < shadow_very_short0
+        and upper0 < shadow_very_short0
+        and low0 > low1
+        and high0 < high1
+    ):
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdl3starsinsouth_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 12  # max(ShadowVeryShort, ShadowLong, BodyLong, BodyShort) + 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     bodylong_total = 0.0
     shadowlong_total = 0.0
@@ -61,33 +142,19 @@ def _cdl3starsinsouth_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        if (
-            candle_color(open_, close, i - 2) == -1
-            and candle_color(open_, close, i - 1) == -1
-            and candle_color(open_, close, i) == -1
-            and real_body(open_, close, i - 2)
-            > candle_average(BODY_LONG, bodylong_total, open_, high, low, close, i - 2)
-            and lower_shadow(open_, low, close, i - 2)
-            > candle_average(SHADOW_LONG, shadowlong_total, open_, high, low, close, i - 2)
-            and real_body(open_, close, i - 1) < real_body(open_, close, i - 2)
-            and open_[i - 1] > close[i - 2]
-            and open_[i - 1] <= high[i - 2]
-            and low[i - 1] < close[i - 2]
-            and low[i - 1] >= low[i - 2]
-            and lower_shadow(open_, low, close, i - 1)
-            > candle_average(SHADOW_VERY_SHORT, svs_total1, open_, high, low, close, i - 1)
-            and real_body(open_, close, i)
-            < candle_average(BODY_SHORT, bodyshort_total, open_, high, low, close, i)
-            and lower_shadow(open_, low, close, i)
-            < candle_average(SHADOW_VERY_SHORT, svs_total0, open_, high, low, close, i)
-            and upper_shadow(open_, high, close, i)
-            < candle_average(SHADOW_VERY_SHORT, svs_total0, open_, high, low, close, i)
-            and low[i] > low[i - 1]
-            and high[i] < high[i - 1]
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdl3starsinsouth_bar(
+            open_,
+            high,
+            low,
+            close,
+            i,
+            bodylong_total,
+            shadowlong_total,
+            svs_total1,
+            svs_total0,
+            bodyshort_total,
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         bodylong_total += candle_range(BODY_LONG, open_, high, low, close, i - 2) - candle_range(
             BODY_LONG, open_, high, low, close, bodylong_trailing - 2
@@ -109,22 +176,39 @@ def _cdl3starsinsouth_kernel(
         shadowlong_trailing += 1
         svs_trailing += 1
         bodyshort_trailing += 1
+    return count
 
 
-def CDL3STARSINSOUTH(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdl3starsinsouth_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdl3starsinsouth_run(open_, high, low, close, out, None, None)
+
+
+def CDL3STARSINSOUTH(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Three Stars In The South
 
     Output is an int array with values in {0, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDL3STARSINSOUTH", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDL3STARSINSOUTH", output_dtype)
+    if sparse:
+        return pattern_events(_cdl3starsinsouth_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdl3starsinsouth_kernel(o, h, l, c, out)
     return out
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_SHORT,
     FAR,
@@ -12,20 +14,106 @@ from numbatalib._func._candles import (
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
+    pattern_events,
     real_body,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdl3whitesoldiers_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDL3WHITESOLDIERS_TOTALS = (
+    (SHADOW_VERY_SHORT, 2),
+    (SHADOW_VERY_SHORT, 1),
+    (SHADOW_VERY_SHORT, 0),
+    (NEAR, 2),
+    (NEAR, 1),
+    (FAR, 2),
+    (FAR, 1),
+    (BODY_SHORT, 0),
+)
+
+
+@njit(cache=True, nogil=True)
+def _cdl3whitesoldiers_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    svs_total2: float,
+    svs_total1: float,
+    svs_total0: float,
+    near_total2: float,
+    near_total1: float,
+    far_total2: float,
+    far_total1: float,
+    bodyshort_total: float,
+) -> int:
+    color2 = candle_color(open_, close, i - 2)
+    upper2 = upper_shadow(open_, high, close, i - 2)
+    shadow_very_short2 = candle_average(
+        SHADOW_VERY_SHORT, svs_total2, open_, high, low, close, i - 2
+    )
+    color1 = candle_color(open_, close, i - 1)
+    upper1 = upper_shadow(open_, high, close, i - 1)
+    shadow_very_short1 = candle_average(
+        SHADOW_VERY_SHORT, svs_total1, open_, high, low, close, i - 1
+    )
+    color0 = candle_color(open_, close, i)
+    upper0 = upper_shadow(open_, high, close, i)
+    shadow_very_short0 = candle_average(SHADOW_VERY_SHORT, svs_total0, open_, high, low, close, i)
+    close0 = close[i]
+    close1 = close[i - 1]
+    close2 = close[i - 2]
+    open1 = open_[i - 1]
+    open2 = open_[i - 2]
+    near2 = candle_average(NEAR, near_total2, open_, high, low, close, i - 2)
+    open0 = open_[i]
+    near1 = candle_average(NEAR, near_total1, open_, high, low, close, i - 1)
+    body1 = real_body(open_, close, i - 1)
+    body2 = real_body(open_, close, i - 2)
+    far2 = candle_average(FAR, far_total2, open_, high, low, close, i - 2)
+    body0 = real_body(open_, close, i)
+    far1 = candle_average(FAR, far_total1, open_, high, low, close, i - 1)
+    body_short0 = candle_average(BODY_SHORT, bodyshort_total, open_, high, low, close, i)
+
+    if (
+        color2 == 1
+        and upper2 < shadow_very_short2
+        and color1 == 1
+        and upper1 < shadow_very_short1
+        and color0 == 1
+        and upper0 < shadow_very_short0
+        and close0 > close1
+        and close1 > close2
+        and open1 > open2
+        and open1 <= close2 + near2
+        and open0 > open1
+        and open0 <= close1 + near1
+        and body1 > body2 - far2
+        and body0 > body1 - far1
+        and body0 > body_short0
+    ):
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdl3whitesoldiers_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 12  # max(ShadowVeryShort, BodyShort, Far, Near) + 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     svs_total2 = 0.0
     svs_total1 = 0.0
@@ -66,36 +154,22 @@ def _cdl3whitesoldiers_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        if (
-            candle_color(open_, close, i - 2) == 1
-            and upper_shadow(open_, high, close, i - 2)
-            < candle_average(SHADOW_VERY_SHORT, svs_total2, open_, high, low, close, i - 2)
-            and candle_color(open_, close, i - 1) == 1
-            and upper_shadow(open_, high, close, i - 1)
-            < candle_average(SHADOW_VERY_SHORT, svs_total1, open_, high, low, close, i - 1)
-            and candle_color(open_, close, i) == 1
-            and upper_shadow(open_, high, close, i)
-            < candle_average(SHADOW_VERY_SHORT, svs_total0, open_, high, low, close, i)
-            and close[i] > close[i - 1]
-            and close[i - 1] > close[i - 2]
-            and open_[i - 1] > open_[i - 2]
-            and open_[i - 1]
-            <= close[i - 2] + candle_average(NEAR, near_total2, open_, high, low, close, i - 2)
-            and open_[i] > open_[i - 1]
-            and open_[i]
-            <= close[i - 1] + candle_average(NEAR, near_total1, open_, high, low, close, i - 1)
-            and real_body(open_, close, i - 1)
-            > real_body(open_, close, i - 2)
-            - candle_average(FAR, far_total2, open_, high, low, close, i - 2)
-            and real_body(open_, close, i)
-            > real_body(open_, close, i - 1)
-            - candle_average(FAR, far_total1, open_, high, low, close, i - 1)
-            and real_body(open_, close, i)
-            > candle_average(BODY_SHORT, bodyshort_total, open_, high, low, close, i)
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdl3whitesoldiers_bar(
+            open_,
+            high,
+            low,
+            close,
+            i,
+            svs_total2,
+            svs_total1,
+            svs_total0,
+            near_total2,
+            near_total1,
+            far_total2,
+            far_total1,
+            bodyshort_total,
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         svs_total2 += candle_range(SHADOW_VERY_SHORT, open_, high, low, close, i - 2) - candle_range(
             SHADOW_VERY_SHORT, open_, high, low, close, svs_trailing - 2
@@ -126,22 +200,39 @@ def _cdl3whitesoldiers_kernel(
         near_trailing += 1
         far_trailing += 1
         bodyshort_trailing += 1
+    return count
 
 
-def CDL3WHITESOLDIERS(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdl3whitesoldiers_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdl3whitesoldiers_run(open_, high, low, close, out, None, None)
+
+
+def CDL3WHITESOLDIERS(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Three Advancing White Soldiers
 
     Output is an int array with values in {0, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDL3WHITESOLDIERS", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDL3WHITESOLDIERS", output_dtype)
+    if sparse:
+        return pattern_events(_cdl3whitesoldiers_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdl3whitesoldiers_kernel(o, h, l, c, out)
     return out
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_float_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, check_float_param, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_DOJI,
     BODY_LONG,
@@ -13,6 +15,8 @@ from numbatalib._func._candles import (
     candle_gap_down,
     candle_gap_up,
     candle_range,
+    emit_signal,
+    pattern_events,
     real_body,
 )
 
@@ -20,20 +24,78 @@ from numbatalib._func._candles import (
 TA_REAL_MAX = 3e37
 
 
-@njit(cache=True)
-def _cdlabandonedbaby_kernel(
+_CDLABANDONEDBABY_TOTALS = ((BODY_LONG, 2), (BODY_DOJI, 1), (BODY_SHORT, 0))
+
+
+@njit(cache=True, nogil=True)
+def _cdlabandonedbaby_bar(
     open_: np.ndarray,
     high: np.ndarray,
     low: np.ndarray,
     close: np.ndarray,
+    i: int,
+    bodylong_total: float,
+    bodydoji_total: float,
+    bodyshort_total: float,
     penetration: float,
-    out: np.ndarray,
-) -> None:
+) -> int:
+    body2 = real_body(open_, close, i - 2)
+    body_long2 = candle_average(BODY_LONG, bodylong_total, open_, high, low, close, i - 2)
+    body1 = real_body(open_, close, i - 1)
+    body_doji1 = candle_average(BODY_DOJI, bodydoji_total, open_, high, low, close, i - 1)
+    body0 = real_body(open_, close, i)
+    body_short0 = candle_average(BODY_SHORT, bodyshort_total, open_, high, low, close, i)
+    color2 = candle_color(open_, close, i - 2)
+    color0 = candle_color(open_, close, i)
+    close0 = close[i]
+    close2 = close[i - 2]
+    gap_up12 = candle_gap_up(high, low, i - 1, i - 2)
+    gap_down01 = candle_gap_down(high, low, i, i - 1)
+    gap_down12 = candle_gap_down(high, low, i - 1, i - 2)
+    gap_up01 = candle_gap_up(high, low, i, i - 1)
+
+    if (
+        body2 > body_long2
+        and body1 <= body_doji1
+        and body0 > body_short0
+        and (
+            (
+                color2 == 1
+                and color0 == -1
+                and close0 < close2 - body2 * penetration
+                and gap_up12
+                and gap_down01
+            )
+            or (
+                color2 == -1
+                and color0 == 1
+                and close0 > close2 + body2 * penetration
+                and gap_down12
+                and gap_up01
+            )
+        )
+    ):
+        return color0 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlabandonedbaby_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 12  # max(BodyDoji, BodyLong, BodyShort) + 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     bodylong_total = 0.0
     bodydoji_total = 0.0
@@ -59,33 +121,10 @@ def _cdlabandonedbaby_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        if (
-            real_body(open_, close, i - 2)
-            > candle_average(BODY_LONG, bodylong_total, open_, high, low, close, i - 2)
-            and real_body(open_, close, i - 1)
-            <= candle_average(BODY_DOJI, bodydoji_total, open_, high, low, close, i - 1)
-            and real_body(open_, close, i)
-            > candle_average(BODY_SHORT, bodyshort_total, open_, high, low, close, i)
-            and (
-                (
-                    candle_color(open_, close, i - 2) == 1
-                    and candle_color(open_, close, i) == -1
-                    and close[i] < close[i - 2] - real_body(open_, close, i - 2) * penetration
-                    and candle_gap_up(high, low, i - 1, i - 2)
-                    and candle_gap_down(high, low, i, i - 1)
-                )
-                or (
-                    candle_color(open_, close, i - 2) == -1
-                    and candle_color(open_, close, i) == 1
-                    and close[i] > close[i - 2] + real_body(open_, close, i - 2) * penetration
-                    and candle_gap_down(high, low, i - 1, i - 2)
-                    and candle_gap_up(high, low, i, i - 1)
-                )
-            )
-        ):
-            out[i] = candle_color(open_, close, i) * 100
-        else:
-            out[i] = 0
+        v = _cdlabandonedbaby_bar(
+            open_, high, low, close, i, bodylong_total, bodydoji_total, bodyshort_total, penetration
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         bodylong_total += candle_range(BODY_LONG, open_, high, low, close, i - 2) - candle_range(
             BODY_LONG, open_, high, low, close, bodylong_trailing
@@ -99,23 +138,56 @@ def _cdlabandonedbaby_kernel(
         bodylong_trailing += 1
         bodydoji_trailing += 1
         bodyshort_trailing += 1
+    return count
 
 
-def CDLABANDONEDBABY(open, high, low, close, penetration=0.3):
+@njit(cache=True, nogil=True)
+def _cdlabandonedbaby_kernel(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float,
+    out: np.ndarray,
+) -> None:
+    _cdlabandonedbaby_run(open_, high, low, close, penetration, out, None, None)
+
+
+def CDLABANDONEDBABY(
+    open,
+    high,
+    low,
+    close,
+    penetration=0.3,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+    sparse: bool = False,
+):
     """
     Abandoned Baby
 
     Output is an int array with values in {0, -100, 100}.
     """
-    pen = validate_float_param("penetration", penetration, Range(min=0.0, max=TA_REAL_MAX))
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d(
+            "CDLABANDONEDBABY", (open, high, low, close), (penetration,), axis, out, output_dtype
+        )
+
+    pen = check_float_param("penetration", penetration, 0.0, TA_REAL_MAX)
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLABANDONEDBABY", output_dtype)
+    if sparse:
+        return pattern_events(_cdlabandonedbaby_run, (o, h, l, c, pen), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlabandonedbaby_kernel(o, h, l, c, pen, out)
     return out
 
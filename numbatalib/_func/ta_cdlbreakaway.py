@@ -3,27 +3,100 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_LONG,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
+    pattern_events,
     real_body,
     real_body_gap_down,
     real_body_gap_up,
 )
 
 
-@njit(cache=True)
-def _cdlbreakaway_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLBREAKAWAY_TOTALS = ((BODY_LONG, 4),)
+
+
+@njit(cache=True, nogil=True)
+def _cdlbreakaway_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    bodylong_total: float,
+) -> int:
+    c4 = candle_color(open_, close, i - 4)
+    body4 = real_body(open_, close, i - 4)
+    body_long4 = candle_average(BODY_LONG, bodylong_total, open_, high, low, close, i - 4)
+    color3 = candle_color(open_, close, i - 3)
+    color1 = candle_color(open_, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    body_gap_down34 = real_body_gap_down(open_, close, i - 3, i - 4)
+    high2 = high[i - 2]
+    high3 = high[i - 3]
+    low2 = low[i - 2]
+    low3 = low[i - 3]
+    high1 = high[i - 1]
+    low1 = low[i - 1]
+    close0 = close[i]
+    open3 = open_[i - 3]
+    close4 = close[i - 4]
+    body_gap_up34 = real_body_gap_up(open_, close, i - 3, i - 4)
+
+    if (
+        body4 > body_long4
+        and c4 == color3
+        and color3 == color1
+        and color1 == -color0
+        and (
+            (
+                c4 == -1
+                and body_gap_down34
+                and high2 < high3
+                and low2 < low3
+                and high1 < high2
+                and low1 < low2
+                and close0 > open3
+                and close0 < close4
+            )
+            or (
+                c4 == 1
+                and body_gap_up34
+                and high2 > high3
+                and low2 > low3
+                and high1 > high2
+                and low1 > low2
+                and close0 < open3
+                and close0 > close4
+            )
+        )
+    ):
+        return color0 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlbreakaway_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 14  # avgPeriod(BodyLong) + 4
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     bodylong_total = 0.0
     bodylong_trailing = start_idx - 10  # avgPeriod(BodyLong)=10
@@ -34,60 +107,46 @@ def _cdlbreakaway_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        c4 = candle_color(open_, close, i - 4)
-        if (
-            real_body(open_, close, i - 4)
-            > candle_average(BODY_LONG, bodylong_total, open_, high, low, close, i - 4)
-            and c4 == candle_color(open_, close, i - 3)
-            and candle_color(open_, close, i - 3) == candle_color(open_, close, i - 1)
-            and candle_color(open_, close, i - 1) == -candle_color(open_, close, i)
-            and (
-                (
-                    c4 == -1
-                    and real_body_gap_down(open_, close, i - 3, i - 4)
-                    and high[i - 2] < high[i - 3]
-                    and low[i - 2] < low[i - 3]
-                    and high[i - 1] < high[i - 2]
-                    and low[i - 1] < low[i - 2]
-                    and close[i] > open_[i - 3]
-                    and close[i] < close[i - 4]
-                )
-                or (
-                    c4 == 1
-                    and real_body_gap_up(open_, close, i - 3, i - 4)
-                    and high[i - 2] > high[i - 3]
-                    and low[i - 2] > low[i - 3]
-                    and high[i - 1] > high[i - 2]
-                    and low[i - 1] > low[i - 2]
-                    and close[i] < open_[i - 3]
-                    and close[i] > close[i - 4]
-                )
-            )
-        ):
-            out[i] = candle_color(open_, close, i) * 100
-        else:
-            out[i] = 0
+        v = _cdlbreakaway_bar(open_, high, low, close, i, bodylong_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         bodylong_total += candle_range(BODY_LONG, open_, high, low, close, i - 4) - candle_range(
             BODY_LONG, open_, high, low, close, bodylong_trailing - 4
         )
         bodylong_trailing += 1
+    return count
 
 
-def CDLBREAKAWAY(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdlbreakaway_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlbreakaway_run(open_, high, low, close, out, None, None)
+
+
+def CDLBREAKAWAY(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Breakaway
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLBREAKAWAY", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLBREAKAWAY", output_dtype)
+    if sparse:
+        return pattern_events(_cdlbreakaway_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlbreakaway_kernel(o, h, l, c, out)
     return out
 
@@ -3,28 +3,72 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_LONG,
     SHADOW_VERY_SHORT,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
     real_body,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdlclosingmarubozu_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLCLOSINGMARUBOZU_TOTALS = ((BODY_LONG, 0), (SHADOW_VERY_SHORT, 0))
+
+
+@njit(cache=True, nogil=True)
+def _cdlclosingmarubozu_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_long_total: float,
+    shadow_vs_total: float,
+) -> int:
+    col = candle_color(open_, close, i)
+    body0 = real_body(open_, close, i)
+    body_long0 = candle_average(BODY_LONG, body_long_total, open_, high, low, close, i)
+    upper0 = upper_shadow(open_, high, close, i)
+    shadow_very_short0 = candle_average(
+        SHADOW_VERY_SHORT, shadow_vs_total, open_, high, low, close, i
+    )
+    lower0 = lower_shadow(open_, low, close, i)
+
+    if (
+        body0 > body_long0
+        and (
+            (col == 1 and upper0 < shadow_very_short0)
+            or (col == -1 and lower0 < shadow_very_short0)
+        )
+    ):
+        return col * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlclosingmarubozu_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 10  # max(BodyLong, ShadowVeryShort)
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     body_long_total = 0.0
     shadow_vs_total = 0.0
     body_long_trailing = 0
@@ -37,20 +81,10 @@ def _cdlclosingmarubozu_kernel(
         i += 1
 
     for i in range(lookback_total, n):
-        col = candle_color(open_, close, i)
-        if real_body(open_, close, i) > candle_average(
-            BODY_LONG, body_long_total, open_, high, low, close, i
-        ) and (
-            (col == 1 and upper_shadow(open_, high, close, i) < candle_average(
-                SHADOW_VERY_SHORT, shadow_vs_total, open_, high, low, close, i
-            ))
-            or (col == -1 and lower_shadow(open_, low, close, i) < candle_average(
-                SHADOW_VERY_SHORT, shadow_vs_total, open_, high, low, close, i
-            ))
-        ):
-            out[i] = col * 100
-        else:
-            out[i] = 0
+        v = _cdlclosingmarubozu_bar(
+            open_, high, low, close, i, body_long_total, shadow_vs_total
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_long_total += candle_range(BODY_LONG, open_, high, low, close, i) - candle_range(
             BODY_LONG, open_, high, low, close, body_long_trailing
@@ -60,22 +94,39 @@ def _cdlclosingmarubozu_kernel(
         ) - candle_range(SHADOW_VERY_SHORT, open_, high, low, close, shadow_vs_trailing)
         body_long_trailing += 1
         shadow_vs_trailing += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdlclosingmarubozu_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlclosingmarubozu_run(open_, high, low, close, out, None, None)
 
 
-def CDLCLOSINGMARUBOZU(open, high, low, close):
+def CDLCLOSINGMARUBOZU(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Closing Marubozu
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLCLOSINGMARUBOZU", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLCLOSINGMARUBOZU", output_dtype)
+    if sparse:
+        return pattern_events(_cdlclosingmarubozu_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlclosingmarubozu_kernel(o, h, l, c, out)
     return out
 
@@ -3,27 +3,100 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     SHADOW_VERY_SHORT,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
     real_body_gap_down,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdlconcealbabyswall_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLCONCEALBABYSWALL_TOTALS = (
+    (SHADOW_VERY_SHORT, 3),
+    (SHADOW_VERY_SHORT, 2),
+    (SHADOW_VERY_SHORT, 1),
+)
+
+
+@njit(cache=True, nogil=True)
+def _cdlconcealbabyswall_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    svs_total3: float,
+    svs_total2: float,
+    svs_total1: float,
+) -> int:
+    color3 = candle_color(open_, close, i - 3)
+    color2 = candle_color(open_, close, i - 2)
+    color1 = candle_color(open_, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    lower3 = lower_shadow(open_, low, close, i - 3)
+    shadow_very_short3 = candle_average(
+        SHADOW_VERY_SHORT, svs_total3, open_, high, low, close, i - 3
+    )
+    upper3 = upper_shadow(open_, high, close, i - 3)
+    lower2 = lower_shadow(open_, low, close, i - 2)
+    shadow_very_short2 = candle_average(
+        SHADOW_VERY_SHORT, svs_total2, open_, high, low, close, i - 2
+    )
+    upper2 = upper_shadow(open_, high, close, i - 2)
+    body_gap_down12 = real_body_gap_down(open_, close, i - 1, i - 2)
+    upper1 = upper_shadow(open_, high, close, i - 1)
+    shadow_very_short1 = candle_average(
+        SHADOW_VERY_SHORT, svs_total1, open_, high, low, close, i - 1
+    )
+    high1 = high[i - 1]
+    close2 = close[i - 2]
+    high0 = high[i]
+    low0 = low[i]
+    low1 = low[i - 1]
+
+    if (
+        color3 == -1
+        and color2 == -1
+        and color1 == -1
+        and color0 == -1
+        and lower3 < shadow_very_short3
+        and upper3 < shadow_very_short3
+        and lower2 < shadow_very_short2
+        and upper2 < shadow_very_short2
+        and body_gap_down12
+        and upper1 > shadow_very_short1
+        and high1 > close2
+        and high0 > high1
+        and low0 < low1
+    ):
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlconcealbabyswall_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 13  # avgPeriod(ShadowVeryShort) + 3
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     svs_total3 = 0.0
     svs_total2 = 0.0
@@ -38,29 +111,10 @@ def _cdlconcealbabyswall_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        if (
-            candle_color(open_, close, i - 3) == -1
-            and candle_color(open_, close, i - 2) == -1
-            and candle_color(open_, close, i - 1) == -1
-            and candle_color(open_, close, i) == -1
-            and lower_shadow(open_, low, close, i - 3)
-            < candle_average(SHADOW_VERY_SHORT, svs_total3, open_, high, low, close, i - 3)
-            and upper_shadow(open_, high, close, i - 3)
-            < candle_average(SHADOW_VERY_SHORT, svs_total3, open_, high, low, close, i - 3)
-            and lower_shadow(open_, low, close, i - 2)
-            < candle_average(SHADOW_VERY_SHORT, svs_total2, open_, high, low, close, i - 2)
-            and upper_shadow(open_, high, close, i - 2)
-            < candle_average(SHADOW_VERY_SHORT, svs_total2, open_, high, low, close, i - 2)
-            and real_body_gap_down(open_, close, i - 1, i - 2)
-            and upper_shadow(open_, high, close, i - 1)
-            > candle_average(SHADOW_VERY_SHORT, svs_total1, open_, high, low, close, i - 1)
-            and high[i - 1] > close[i - 2]
-            and high[i] > high[i - 1]
-            and low[i] < low[i - 1]
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdlconcealbabyswall_bar(
+            open_, high, low, close, i, svs_total3, svs_total2, svs_total1
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         svs_total3 += candle_range(SHADOW_VERY_SHORT, open_, high, low, close, i - 3) - candle_range(
             SHADOW_VERY_SHORT, open_, high, low, close, svs_trailing - 3
@@ -72,22 +126,41 @@ def _cdlconcealbabyswall_kernel(
             SHADOW_VERY_SHORT, open_, high, low, close, svs_trailing - 1
         )
         svs_trailing += 1
+    return count
+
 
+@njit(cache=True, nogil=True)
+def _cdlconcealbabyswall_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlconcealbabyswall_run(open_, high, low, close, out, None, None)
 
-def CDLCONCEALBABYSWALL(open, high, low, close):
+
+def CDLCONCEALBABYSWALL(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Concealing Baby Swallow
 
     Output is an int array with values in {0, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d(
+            "CDLCONCEALBABYSWALL", (open, high, low, close), (), axis, out, output_dtype
+        )
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLCONCEALBABYSWALL", output_dtype)
+    if sparse:
+        return pattern_events(_cdlconcealbabyswall_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlconcealbabyswall_kernel(o, h, l, c, out)
     return out
 
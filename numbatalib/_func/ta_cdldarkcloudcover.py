@@ -3,27 +3,75 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_float_param
-from numbatalib._func._candles import BODY_LONG, candle_average, candle_color, candle_range, real_body
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, check_float_param, is_2d, nan_like
+from numbatalib._func._candles import (
+    BODY_LONG,
+    candle_average,
+    candle_color,
+    candle_range,
+    emit_signal,
+    pattern_events,
+    real_body,
+)
 
 
 TA_REAL_MAX = 3e37
 
 
-@njit(cache=True)
-def _cdldarkcloudcover_kernel(
+_CDLDARKCLOUDCOVER_TOTALS = ((BODY_LONG, 1),)
+
+
+@njit(cache=True, nogil=True)
+def _cdldarkcloudcover_bar(
     open_: np.ndarray,
     high: np.ndarray,
     low: np.ndarray,
     close: np.ndarray,
+    i: int,
+    body_long_total: float,
     penetration: float,
-    out: np.ndarray,
-) -> None:
+) -> int:
+    rb1 = real_body(open_, close, i - 1)
+    color1 = candle_color(open_, close, i - 1)
+    body_long1 = candle_average(BODY_LONG, body_long_total, open_, high, low, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    open0 = open_[i]
+    high1 = high[i - 1]
+    close0 = close[i]
+    open1 = open_[i - 1]
+    close1 = close[i - 1]
+
+    if (
+        color1 == 1
+        and rb1 > body_long1
+        and color0 == -1
+        and open0 > high1
+        and close0 > open1
+        and close0 < close1 - rb1 * penetration
+    ):
+        return -100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdldarkcloudcover_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 11  # TA_CANDLEAVGPERIOD(BodyLong) + 1
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     body_long_total = 0.0
     body_long_trailing = start_idx - 10  # avgPeriod(BodyLong)=10
@@ -34,40 +82,63 @@ def _cdldarkcloudcover_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        rb1 = real_body(open_, close, i - 1)
-        if (
-            candle_color(open_, close, i - 1) == 1
-            and rb1 > candle_average(BODY_LONG, body_long_total, open_, high, low, close, i - 1)
-            and candle_color(open_, close, i) == -1
-            and open_[i] > high[i - 1]
-            and close[i] > open_[i - 1]
-            and close[i] < close[i - 1] - rb1 * penetration
-        ):
-            out[i] = -100
-        else:
-            out[i] = 0
+        v = _cdldarkcloudcover_bar(open_, high, low, close, i, body_long_total, penetration)
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_long_total += candle_range(BODY_LONG, open_, high, low, close, i - 1) - candle_range(
             BODY_LONG, open_, high, low, close, body_long_trailing - 1
         )
         body_long_trailing += 1
+    return count
 
 
-def CDLDARKCLOUDCOVER(open, high, low, close, penetration: float = 0.5):
+@njit(cache=True, nogil=True)
+def _cdldarkcloudcover_kernel(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float,
+    out: np.ndarray,
+) -> None:
+    _cdldarkcloudcover_run(open_, high, low, close, penetration, out, None, None)
+
+
+def CDLDARKCLOUDCOVER(
+    open,
+    high,
+    low,
+    close,
+    penetration: float = 0.5,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+    sparse: bool = False,
+):
     """
     Dark Cloud Cover
 
     Output is an int array with values in {0, -100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d(
+            "CDLDARKCLOUDCOVER", (open, high, low, close), (penetration,), axis, out, output_dtype
+        )
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    pen = validate_float_param("penetration", penetration, Range(min=0.0, max=TA_REAL_MAX))
-    out = nan_like(o, dtype=np.int32)
+    pen = check_float_param("penetration", penetration, 0.0, TA_REAL_MAX)
+    dtype = int_output_dtype("CDLDARKCLOUDCOVER", output_dtype)
+    if sparse:
+        return pattern_events(_cdldarkcloudcover_run, (o, h, l, c, pen), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdldarkcloudcover_kernel(o, h, l, c, pen, out)
     return out
 
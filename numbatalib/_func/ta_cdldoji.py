@@ -3,19 +3,55 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
-from numbatalib._func._candles import BODY_DOJI, candle_average, candle_range, real_body
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
+from numbatalib._func._candles import (
+    BODY_DOJI,
+    candle_average,
+    candle_range,
+    emit_signal,
+    pattern_events,
+    real_body,
+)
 
 
-@njit(cache=True)
-def _cdldoji_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLDOJI_TOTALS = ((BODY_DOJI, 0),)
+
+
+@njit(cache=True, nogil=True)
+def _cdldoji_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_doji_total: float,
+) -> int:
+    body0 = real_body(open_, close, i)
+    body_doji0 = candle_average(BODY_DOJI, body_doji_total, open_, high, low, close, i)
+
+    if body0 <= body_doji0:
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdldoji_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 10  # TA_CANDLEAVGPERIOD(BodyDoji)
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     body_doji_total = 0.0
     trailing_idx = 0
     i = 0
@@ -24,33 +60,46 @@ def _cdldoji_kernel(
         i += 1
 
     for i in range(lookback_total, n):
-        if real_body(open_, close, i) <= candle_average(
-            BODY_DOJI, body_doji_total, open_, high, low, close, i
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdldoji_bar(open_, high, low, close, i, body_doji_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_doji_total += candle_range(BODY_DOJI, open_, high, low, close, i) - candle_range(
             BODY_DOJI, open_, high, low, close, trailing_idx
         )
         trailing_idx += 1
+    return count
 
 
-def CDLDOJI(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdldoji_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdldoji_run(open_, high, low, close, out, None, None)
+
+
+def CDLDOJI(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Doji
 
     Output is an int array with values in {0, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLDOJI", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLDOJI", output_dtype)
+    if sparse:
+        return pattern_events(_cdldoji_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdldoji_kernel(o, h, l, c, out)
     return out
 
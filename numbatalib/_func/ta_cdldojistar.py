@@ -3,28 +3,69 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_DOJI,
     BODY_LONG,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
+    pattern_events,
     real_body,
     real_body_gap_down,
     real_body_gap_up,
 )
 
 
-@njit(cache=True)
-def _cdldojistar_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLDOJISTAR_TOTALS = ((BODY_LONG, 1), (BODY_DOJI, 0))
+
+
+@njit(cache=True, nogil=True)
+def _cdldojistar_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_long_total: float,
+    body_doji_total: float,
+) -> int:
+    body1 = real_body(open_, close, i - 1)
+    body_long1 = candle_average(BODY_LONG, body_long_total, open_, high, low, close, i - 1)
+    body0 = real_body(open_, close, i)
+    body_doji0 = candle_average(BODY_DOJI, body_doji_total, open_, high, low, close, i)
+    color1 = candle_color(open_, close, i - 1)
+    body_gap_up01 = real_body_gap_up(open_, close, i, i - 1)
+    body_gap_down01 = real_body_gap_down(open_, close, i, i - 1)
+
+    if (
+        body1 > body_long1
+        and body0 <= body_doji0
+        and ((color1 == 1 and body_gap_up01) or (color1 == -1 and body_gap_down01))
+    ):
+        return -color1 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdldojistar_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 11  # max(BodyDoji, BodyLong) + 1
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     body_long_total = 0.0
     body_doji_total = 0.0
@@ -43,25 +84,8 @@ def _cdldojistar_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        if (
-            real_body(open_, close, i - 1)
-            > candle_average(BODY_LONG, body_long_total, open_, high, low, close, i - 1)
-            and real_body(open_, close, i)
-            <= candle_average(BODY_DOJI, body_doji_total, open_, high, low, close, i)
-            and (
-                (
-                    candle_color(open_, close, i - 1) == 1
-                    and real_body_gap_up(open_, close, i, i - 1)
-                )
-                or (
-                    candle_color(open_, close, i - 1) == -1
-                    and real_body_gap_down(open_, close, i, i - 1)
-                )
-            )
-        ):
-            out[i] = -candle_color(open_, close, i - 1) * 100
-        else:
-            out[i] = 0
+        v = _cdldojistar_bar(open_, high, low, close, i, body_long_total, body_doji_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_long_total += candle_range(BODY_LONG, open_, high, low, close, i - 1) - candle_range(
             BODY_LONG, open_, high, low, close, body_long_trailing
@@ -71,22 +95,39 @@ def _cdldojistar_kernel(
         )
         body_long_trailing += 1
         body_doji_trailing += 1
+    return count
 
 
-def CDLDOJISTAR(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdldojistar_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdldojistar_run(open_, high, low, close, out, None, None)
+
+
+def CDLDOJISTAR(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Doji Star
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLDOJISTAR", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLDOJISTAR", output_dtype)
+    if sparse:
+        return pattern_events(_cdldojistar_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdldojistar_kernel(o, h, l, c, out)
     return out
 
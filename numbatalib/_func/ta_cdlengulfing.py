@@ -3,55 +3,85 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
-from numbatalib._func._candles import candle_color
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
+from numbatalib._func._candles import candle_color, emit_signal, pattern_events
 
 
-@njit(cache=True)
-def _cdlengulfing_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+@njit(cache=True, nogil=True)
+def _cdlengulfing_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+) -> int:
+    c0 = candle_color(open_, close, i)
+    c1 = candle_color(open_, close, i - 1)
+    close0 = close[i]
+    open1 = open_[i - 1]
+    open0 = open_[i]
+    close1 = close[i - 1]
+
+    bullish = c0 == 1 and c1 == -1 and close0 > open1 and open0 < close1
+    bearish = c0 == -1 and c1 == 1 and open0 > close1 and close0 < open1
+    if bullish or bearish:
+        return c0 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlengulfing_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     for i in range(lookback_total, n):
-        c0 = candle_color(open_, close, i)
-        c1 = candle_color(open_, close, i - 1)
-
-        bullish = (
-            c0 == 1
-            and c1 == -1
-            and close[i] > open_[i - 1]
-            and open_[i] < close[i - 1]
-        )
-        bearish = (
-            c0 == -1
-            and c1 == 1
-            and open_[i] > close[i - 1]
-            and close[i] < open_[i - 1]
-        )
-
-        if bullish or bearish:
-            out[i] = c0 * 100
-        else:
-            out[i] = 0
-
-
-def CDLENGULFING(open, high, low, close):
+        v = _cdlengulfing_bar(open_, high, low, close, i)
+        count = emit_signal(out, indices, values, count, i, v)
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdlengulfing_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlengulfing_run(open_, high, low, close, out, None, None)
+
+
+def CDLENGULFING(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Engulfing Pattern
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLENGULFING", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLENGULFING", output_dtype)
+    if sparse:
+        return pattern_events(_cdlengulfing_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlengulfing_kernel(o, h, l, c, out)
     return out
@@ -3,28 +3,80 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     EQUAL,
     NEAR,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
+    pattern_events,
     real_body,
     real_body_gap_down,
     real_body_gap_up,
 )
 
 
-@njit(cache=True)
-def _cdlgapsidesidewhite_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLGAPSIDESIDEWHITE_TOTALS = ((NEAR, 1), (EQUAL, 1))
+
+
+@njit(cache=True, nogil=True)
+def _cdlgapsidesidewhite_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    near_total: float,
+    eq_total: float,
+) -> int:
+    body_gap_up12 = real_body_gap_up(open_, close, i - 1, i - 2)
+    body_gap_up02 = real_body_gap_up(open_, close, i, i - 2)
+    body_gap_down12 = real_body_gap_down(open_, close, i - 1, i - 2)
+    body_gap_down02 = real_body_gap_down(open_, close, i, i - 2)
+    color1 = candle_color(open_, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    body0 = real_body(open_, close, i)
+    body1 = real_body(open_, close, i - 1)
+    near1 = candle_average(NEAR, near_total, open_, high, low, close, i - 1)
+    open0 = open_[i]
+    open1 = open_[i - 1]
+    equal1 = candle_average(EQUAL, eq_total, open_, high, low, close, i - 1)
+
+    gap_up = body_gap_up12 and body_gap_up02
+    gap_down = body_gap_down12 and body_gap_down02
+    if (
+        (gap_up or gap_down)
+        and color1 == 1
+        and color0 == 1
+        and body0 >= body1 - near1
+        and body0 <= body1 + near1
+        and open0 >= open1 - equal1
+        and open0 <= open1 + equal1
+    ):
+        return 100 if gap_up else -100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlgapsidesidewhite_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 7  # max(Near, Equal) + 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     near_total = 0.0
     eq_total = 0.0
@@ -42,31 +94,8 @@ def _cdlgapsidesidewhite_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        gap_up = real_body_gap_up(open_, close, i - 1, i - 2) and real_body_gap_up(
-            open_, close, i, i - 2
-        )
-        gap_down = real_body_gap_down(open_, close, i - 1, i - 2) and real_body_gap_down(
-            open_, close, i, i - 2
-        )
-
-        if (
-            (gap_up or gap_down)
-            and candle_color(open_, close, i - 1) == 1
-            and candle_color(open_, close, i) == 1
-            and real_body(open_, close, i)
-            >= real_body(open_, close, i - 1)
-            - candle_average(NEAR, near_total, open_, high, low, close, i - 1)
-            and real_body(open_, close, i)
-            <= real_body(open_, close, i - 1)
-            + candle_average(NEAR, near_total, open_, high, low, close, i - 1)
-            and open_[i]
-            >= open_[i - 1] - candle_average(EQUAL, eq_total, open_, high, low, close, i - 1)
-            and open_[i]
-            <= open_[i - 1] + candle_average(EQUAL, eq_total, open_, high, low, close, i - 1)
-        ):
-            out[i] = 100 if gap_up else -100
-        else:
-            out[i] = 0
+        v = _cdlgapsidesidewhite_bar(open_, high, low, close, i, near_total, eq_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         near_total += candle_range(NEAR, open_, high, low, close, i - 1) - candle_range(
             NEAR, open_, high, low, close, near_trailing - 1
@@ -76,22 +105,41 @@ def _cdlgapsidesidewhite_kernel(
         )
         near_trailing += 1
         eq_trailing += 1
+    return count
+
 
+@njit(cache=True, nogil=True)
+def _cdlgapsidesidewhite_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlgapsidesidewhite_run(open_, high, low, close, out, None, None)
 
-def CDLGAPSIDESIDEWHITE(open, high, low, close):
+
+def CDLGAPSIDESIDEWHITE(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Up/Down-gap side-by-side white lines
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d(
+            "CDLGAPSIDESIDEWHITE", (open, high, low, close), (), axis, out, output_dtype
+        )
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLGAPSIDESIDEWHITE", output_dtype)
+    if sparse:
+        return pattern_events(_cdlgapsidesidewhite_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlgapsidesidewhite_kernel(o, h, l, c, out)
     return out
 
@@ -3,27 +3,64 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_DOJI,
     SHADOW_VERY_SHORT,
     candle_average,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
     real_body,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdlgravestonedoji_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLGRAVESTONEDOJI_TOTALS = ((BODY_DOJI, 0), (SHADOW_VERY_SHORT, 0))
+
+
+@njit(cache=True, nogil=True)
+def _cdlgravestonedoji_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_doji_total: float,
+    shadow_vs_total: float,
+) -> int:
+    body0 = real_body(open_, close, i)
+    body_doji0 = candle_average(BODY_DOJI, body_doji_total, open_, high, low, close, i)
+    lower0 = lower_shadow(open_, low, close, i)
+    shadow_very_short0 = candle_average(
+        SHADOW_VERY_SHORT, shadow_vs_total, open_, high, low, close, i
+    )
+    upper0 = upper_shadow(open_, high, close, i)
+
+    if body0 <= body_doji0 and lower0 < shadow_very_short0 and upper0 > shadow_very_short0:
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlgravestonedoji_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 10  # max(BodyDoji, ShadowVeryShort)
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     body_doji_total = 0.0
     shadow_vs_total = 0.0
     body_trailing = 0
@@ -36,17 +73,10 @@ def _cdlgravestonedoji_kernel(
         i += 1
 
     for i in range(lookback_total, n):
-        if (
-            real_body(open_, close, i)
-            <= candle_average(BODY_DOJI, body_doji_total, open_, high, low, close, i)
-            and lower_shadow(open_, low, close, i)
-            < candle_average(SHADOW_VERY_SHORT, shadow_vs_total, open_, high, low, close, i)
-            and upper_shadow(open_, high, close, i)
-            > candle_average(SHADOW_VERY_SHORT, shadow_vs_total, open_, high, low, close, i)
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdlgravestonedoji_bar(
+            open_, high, low, close, i, body_doji_total, shadow_vs_total
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_doji_total += candle_range(BODY_DOJI, open_, high, low, close, i) - candle_range(
             BODY_DOJI, open_, high, low, close, body_trailing
@@ -56,22 +86,39 @@ def _cdlgravestonedoji_kernel(
         ) - candle_range(SHADOW_VERY_SHORT, open_, high, low, close, shadow_trailing)
         body_trailing += 1
         shadow_trailing += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdlgravestonedoji_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlgravestonedoji_run(open_, high, low, close, out, None, None)
 
 
-def CDLGRAVESTONEDOJI(open, high, low, close):
+def CDLGRAVESTONEDOJI(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Gravestone Doji
 
     Output is an int array with values in {0, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLGRAVESTONEDOJI", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLGRAVESTONEDOJI", output_dtype)
+    if sparse:
+        return pattern_events(_cdlgravestonedoji_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlgravestonedoji_kernel(o, h, l, c, out)
     return out
 
@@ -3,71 +3,117 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
+from numbatalib._func._candles import emit_signal, pattern_events
 
 
-@njit(cache=True)
-def _cdlhikkake_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLHIKKAKE_SETUP = 3
+
+
+@njit(cache=True, nogil=True)
+def _cdlhikkake_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    state: np.ndarray,
+) -> int:
+    # state: [bar of the last inside-bar setup, its result]; updated in place.
+    pattern_idx = state[0]
+    pattern_result = state[1]
+    high0 = high[i]
+    high1 = high[i - 1]
+    high2 = high[i - 2]
+    low0 = low[i]
+    low1 = low[i - 1]
+    low2 = low[i - 2]
+    close0 = close[i]
+    # Only read when `pattern_idx` is set; index -1 is still in bounds otherwise.
+    setup_high = high[pattern_idx - 1]
+    setup_low = low[pattern_idx - 1]
+
+    if (
+        high1 < high2
+        and low1 > low2
+        and ((high0 < high1 and low0 < low1) or (high0 > high1 and low0 > low1))
+    ):
+        pattern_result = 100 * (1 if high0 < high1 else -1)
+        state[0] = i
+        state[1] = pattern_result
+        return pattern_result
+    if (
+        pattern_idx != 0
+        and i <= pattern_idx + 3
+        and (
+            (pattern_result > 0 and close0 > setup_high)
+            or (pattern_result < 0 and close0 < setup_low)
+        )
+    ):
+        state[0] = 0
+        return pattern_result + 100 * (1 if pattern_result > 0 else -1)
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlhikkake_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = high.shape[0]
     lookback_total = 5
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
-    pattern_idx = 0
-    pattern_result = 0
-
-    i = start_idx - 3
-    while i < start_idx:
-        if high[i - 1] < high[i - 2] and low[i - 1] > low[i - 2] and (
-            (high[i] < high[i - 1] and low[i] < low[i - 1])
-            or (high[i] > high[i - 1] and low[i] > low[i - 1])
-        ):
-            pattern_result = 100 * (1 if high[i] < high[i - 1] else -1)
-            pattern_idx = i
-        else:
-            if pattern_idx != 0 and i <= pattern_idx + 3 and (
-                (pattern_result > 0 and close[i] > high[pattern_idx - 1])
-                or (pattern_result < 0 and close[i] < low[pattern_idx - 1])
-            ):
-                pattern_idx = 0
-        i += 1
-
-    for i in range(start_idx, n):
-        if high[i - 1] < high[i - 2] and low[i - 1] > low[i - 2] and (
-            (high[i] < high[i - 1] and low[i] < low[i - 1])
-            or (high[i] > high[i - 1] and low[i] > low[i - 1])
-        ):
-            pattern_result = 100 * (1 if high[i] < high[i - 1] else -1)
-            pattern_idx = i
-            out[i] = pattern_result
-        else:
-            if pattern_idx != 0 and i <= pattern_idx + 3 and (
-                (pattern_result > 0 and close[i] > high[pattern_idx - 1])
-                or (pattern_result < 0 and close[i] < low[pattern_idx - 1])
-            ):
-                out[i] = pattern_result + 100 * (1 if pattern_result > 0 else -1)
-                pattern_idx = 0
-            else:
-                out[i] = 0
-
-
-def CDLHIKKAKE(open, high, low, close):
+    state = np.zeros(2, dtype=np.int64)
+
+    # The setup state starts three bars before the first output.
+    for i in range(start_idx - _CDLHIKKAKE_SETUP, n):
+        v = _cdlhikkake_bar(open_, high, low, close, i, state)
+        if i >= start_idx:
+            count = emit_signal(out, indices, values, count, i, v)
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdlhikkake_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlhikkake_run(open_, high, low, close, out, None, None)
+
+
+def CDLHIKKAKE(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Hikkake Pattern
 
     Output is an int array with values in {0, -200, -100, 100, 200}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLHIKKAKE", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLHIKKAKE", output_dtype)
+    if sparse:
+        return pattern_events(_cdlhikkake_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlhikkake_kernel(o, h, l, c, out)
     return out
 
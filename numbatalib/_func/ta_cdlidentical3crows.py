@@ -3,26 +3,94 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     EQUAL,
     SHADOW_VERY_SHORT,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
 )
 
 
-@njit(cache=True)
-def _cdlidentical3crows_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLIDENTICAL3CROWS_TOTALS = (
+    (SHADOW_VERY_SHORT, 2),
+    (SHADOW_VERY_SHORT, 1),
+    (SHADOW_VERY_SHORT, 0),
+    (EQUAL, 2),
+    (EQUAL, 1),
+)
+
+
+@njit(cache=True, nogil=True)
+def _cdlidentical3crows_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    sh2: float,
+    sh1: float,
+    sh0: float,
+    eq2: float,
+    eq1: float,
+) -> int:
+    eq_2_avg = candle_average(EQUAL, eq2, open_, high, low, close, i - 2)
+    eq_1_avg = candle_average(EQUAL, eq1, open_, high, low, close, i - 1)
+    color2 = candle_color(open_, close, i - 2)
+    lower2 = lower_shadow(open_, low, close, i - 2)
+    shadow_very_short2 = candle_average(SHADOW_VERY_SHORT, sh2, open_, high, low, close, i - 2)
+    color1 = candle_color(open_, close, i - 1)
+    lower1 = lower_shadow(open_, low, close, i - 1)
+    shadow_very_short1 = candle_average(SHADOW_VERY_SHORT, sh1, open_, high, low, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    lower0 = lower_shadow(open_, low, close, i)
+    shadow_very_short0 = candle_average(SHADOW_VERY_SHORT, sh0, open_, high, low, close, i)
+    close2 = close[i - 2]
+    close1 = close[i - 1]
+    close0 = close[i]
+    open1 = open_[i - 1]
+    open0 = open_[i]
+
+    if (
+        color2 == -1
+        and lower2 < shadow_very_short2
+        and color1 == -1
+        and lower1 < shadow_very_short1
+        and color0 == -1
+        and lower0 < shadow_very_short0
+        and close2 > close1
+        and close1 > close0
+        and open1 <= close2 + eq_2_avg
+        and open1 >= close2 - eq_2_avg
+        and open0 <= close1 + eq_1_avg
+        and open0 >= close1 - eq_1_avg
+    ):
+        return -100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlidentical3crows_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 12  # max(ShadowVeryShort, Equal) + 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     shadow_trailing = start_idx - 10  # avgPeriod(ShadowVeryShort)=10
     eq_trailing = start_idx - 5  # avgPeriod(Equal)=5
@@ -47,29 +115,8 @@ def _cdlidentical3crows_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        eq_2_avg = candle_average(EQUAL, eq2, open_, high, low, close, i - 2)
-        eq_1_avg = candle_average(EQUAL, eq1, open_, high, low, close, i - 1)
-
-        if (
-            candle_color(open_, close, i - 2) == -1
-            and lower_shadow(open_, low, close, i - 2)
-            < candle_average(SHADOW_VERY_SHORT, sh2, open_, high, low, close, i - 2)
-            and candle_color(open_, close, i - 1) == -1
-            and lower_shadow(open_, low, close, i - 1)
-            < candle_average(SHADOW_VERY_SHORT, sh1, open_, high, low, close, i - 1)
-            and candle_color(open_, close, i) == -1
-            and lower_shadow(open_, low, close, i)
-            < candle_average(SHADOW_VERY_SHORT, sh0, open_, high, low, close, i)
-            and close[i - 2] > close[i - 1]
-            and close[i - 1] > close[i]
-            and open_[i - 1] <= close[i - 2] + eq_2_avg
-            and open_[i - 1] >= close[i - 2] - eq_2_avg
-            and open_[i] <= close[i - 1] + eq_1_avg
-            and open_[i] >= close[i - 1] - eq_1_avg
-        ):
-            out[i] = -100
-        else:
-            out[i] = 0
+        v = _cdlidentical3crows_bar(open_, high, low, close, i, sh2, sh1, sh0, eq2, eq1)
+        count = emit_signal(out, indices, values, count, i, v)
 
         sh2 += candle_range(SHADOW_VERY_SHORT, open_, high, low, close, i - 2) - candle_range(
             SHADOW_VERY_SHORT, open_, high, low, close, shadow_trailing - 2
@@ -88,22 +135,39 @@ def _cdlidentical3crows_kernel(
         )
         shadow_trailing += 1
         eq_trailing += 1
+    return count
 
 
-def CDLIDENTICAL3CROWS(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdlidentical3crows_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlidentical3crows_run(open_, high, low, close, out, None, None)
+
+
+def CDLIDENTICAL3CROWS(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Identical Three Crows
 
     Output is an int array with values in {0, -100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLIDENTICAL3CROWS", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLIDENTICAL3CROWS", output_dtype)
+    if sparse:
+        return pattern_events(_cdlidentical3crows_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlidentical3crows_kernel(o, h, l, c, out)
     return out
 
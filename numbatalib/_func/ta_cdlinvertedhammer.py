@@ -3,29 +3,74 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_SHORT,
     SHADOW_LONG,
     SHADOW_VERY_SHORT,
     candle_average,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
     real_body,
     real_body_gap_down,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdlinvertedhammer_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLINVERTEDHAMMER_TOTALS = ((BODY_SHORT, 0), (SHADOW_LONG, 0), (SHADOW_VERY_SHORT, 0))
+
+
+@njit(cache=True, nogil=True)
+def _cdlinvertedhammer_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_total: float,
+    shadow_long_total: float,
+    shadow_vs_total: float,
+) -> int:
+    body0 = real_body(open_, close, i)
+    body_short0 = candle_average(BODY_SHORT, body_total, open_, high, low, close, i)
+    upper0 = upper_shadow(open_, high, close, i)
+    shadow_long0 = candle_average(SHADOW_LONG, shadow_long_total, open_, high, low, close, i)
+    lower0 = lower_shadow(open_, low, close, i)
+    shadow_very_short0 = candle_average(
+        SHADOW_VERY_SHORT, shadow_vs_total, open_, high, low, close, i
+    )
+    body_gap_down01 = real_body_gap_down(open_, close, i, i - 1)
+
+    if (
+        body0 < body_short0
+        and upper0 > shadow_long0
+        and lower0 < shadow_very_short0
+        and body_gap_down01
+    ):
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlinvertedhammer_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 11
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     body_total = 0.0
     shadow_long_total = 0.0
@@ -50,18 +95,10 @@ def _cdlinvertedhammer_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        if (
-            real_body(open_, close, i)
-            < candle_average(BODY_SHORT, body_total, open_, high, low, close, i)
-            and upper_shadow(open_, high, close, i)
-            > candle_average(SHADOW_LONG, shadow_long_total, open_, high, low, close, i)
-            and lower_shadow(open_, low, close, i)
-            < candle_average(SHADOW_VERY_SHORT, shadow_vs_total, open_, high, low, close, i)
-            and real_body_gap_down(open_, close, i, i - 1)
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdlinvertedhammer_bar(
+            open_, high, low, close, i, body_total, shadow_long_total, shadow_vs_total
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_total += candle_range(BODY_SHORT, open_, high, low, close, i) - candle_range(
             BODY_SHORT, open_, high, low, close, body_trailing
@@ -75,22 +112,39 @@ def _cdlinvertedhammer_kernel(
         body_trailing += 1
         shadow_long_trailing += 1
         shadow_vs_trailing += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdlinvertedhammer_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlinvertedhammer_run(open_, high, low, close, out, None, None)
 
 
-def CDLINVERTEDHAMMER(open, high, low, close):
+def CDLINVERTEDHAMMER(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Inverted Hammer
 
     Output is an int array with values in {0, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLINVERTEDHAMMER", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLINVERTEDHAMMER", output_dtype)
+    if sparse:
+        return pattern_events(_cdlinvertedhammer_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlinvertedhammer_kernel(o, h, l, c, out)
     return out
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_LONG,
     SHADOW_VERY_SHORT,
@@ -12,21 +14,73 @@ from numbatalib._func._candles import (
     candle_gap_down,
     candle_gap_up,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
     real_body,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdlkickingbylength_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLKICKINGBYLENGTH_TOTALS = (
+    (SHADOW_VERY_SHORT, 1),
+    (SHADOW_VERY_SHORT, 0),
+    (BODY_LONG, 1),
+    (BODY_LONG, 0),
+)
+
+
+@njit(cache=True, nogil=True)
+def _cdlkickingbylength_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    sh1: float,
+    sh0: float,
+    bd1: float,
+    bd0: float,
+) -> int:
+    c1 = candle_color(open_, close, i - 1)
+    c0 = candle_color(open_, close, i)
+    rb1 = real_body(open_, close, i - 1)
+    rb0 = real_body(open_, close, i)
+    body_long1 = candle_average(BODY_LONG, bd1, open_, high, low, close, i - 1)
+    upper1 = upper_shadow(open_, high, close, i - 1)
+    shadow_very_short1 = candle_average(SHADOW_VERY_SHORT, sh1, open_, high, low, close, i - 1)
+    lower1 = lower_shadow(open_, low, close, i - 1)
+    body_long0 = candle_average(BODY_LONG, bd0, open_, high, low, close, i)
+    upper0 = upper_shadow(open_, high, close, i)
+    shadow_very_short0 = candle_average(SHADOW_VERY_SHORT, sh0, open_, high, low, close, i)
+    lower0 = lower_shadow(open_, low, close, i)
+    gap_up01 = candle_gap_up(high, low, i, i - 1)
+    gap_down01 = candle_gap_down(high, low, i, i - 1)
+
+    is_marubozu_1 = rb1 > body_long1 and upper1 < shadow_very_short1 and lower1 < shadow_very_short1
+    is_marubozu_0 = rb0 > body_long0 and upper0 < shadow_very_short0 and lower0 < shadow_very_short0
+    gap_ok = (c1 == -1 and gap_up01) or (c1 == 1 and gap_down01)
+    if c1 == -c0 and is_marubozu_1 and is_marubozu_0 and gap_ok:
+        return (c0 if rb0 > rb1 else c1) * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlkickingbylength_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 11  # max(ShadowVeryShort, BodyLong) + 1
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     shadow_trailing = start_idx - 10  # avgPeriod(ShadowVeryShort)=10
     body_trailing = start_idx - 10  # avgPeriod(BodyLong)=10
@@ -49,36 +103,8 @@ def _cdlkickingbylength_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        c1 = candle_color(open_, close, i - 1)
-        c0 = candle_color(open_, close, i)
-
-        rb1 = real_body(open_, close, i - 1)
-        rb0 = real_body(open_, close, i)
-
-        is_marubozu_1 = (
-            rb1 > candle_average(BODY_LONG, bd1, open_, high, low, close, i - 1)
-            and upper_shadow(open_, high, close, i - 1)
-            < candle_average(SHADOW_VERY_SHORT, sh1, open_, high, low, close, i - 1)
-            and lower_shadow(open_, low, close, i - 1)
-            < candle_average(SHADOW_VERY_SHORT, sh1, open_, high, low, close, i - 1)
-        )
-        is_marubozu_0 = (
-            rb0 > candle_average(BODY_LONG, bd0, open_, high, low, close, i)
-            and upper_shadow(open_, high, close, i)
-            < candle_average(SHADOW_VERY_SHORT, sh0, open_, high, low, close, i)
-            and lower_shadow(open_, low, close, i)
-            < candle_average(SHADOW_VERY_SHORT, sh0, open_, high, low, close, i)
-        )
-
-        gap_ok = (c1 == -1 and candle_gap_up(high, low, i, i - 1)) or (
-            c1 == 1 and candle_gap_down(high, low, i, i - 1)
-        )
-
-        if c1 == -c0 and is_marubozu_1 and is_marubozu_0 and gap_ok:
-            pick = i if rb0 > rb1 else i - 1
-            out[i] = candle_color(open_, close, pick) * 100
-        else:
-            out[i] = 0
+        v = _cdlkickingbylength_bar(open_, high, low, close, i, sh1, sh0, bd1, bd0)
+        count = emit_signal(out, indices, values, count, i, v)
 
         bd1 += candle_range(BODY_LONG, open_, high, low, close, i - 1) - candle_range(
             BODY_LONG, open_, high, low, close, body_trailing - 1
@@ -94,22 +120,39 @@ def _cdlkickingbylength_kernel(
         )
         body_trailing += 1
         shadow_trailing += 1
+    return count
 
 
-def CDLKICKINGBYLENGTH(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdlkickingbylength_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlkickingbylength_run(open_, high, low, close, out, None, None)
+
+
+def CDLKICKINGBYLENGTH(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Kicking - bull/bear determined by the longer marubozu
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLKICKINGBYLENGTH", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLKICKINGBYLENGTH", output_dtype)
+    if sparse:
+        return pattern_events(_cdlkickingbylength_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlkickingbylength_kernel(o, h, l, c, out)
     return out
 
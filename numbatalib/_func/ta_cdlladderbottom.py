@@ -3,19 +3,86 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
-from numbatalib._func._candles import SHADOW_VERY_SHORT, candle_average, candle_color, candle_range, upper_shadow
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
+from numbatalib._func._candles import (
+    SHADOW_VERY_SHORT,
+    candle_average,
+    candle_color,
+    candle_range,
+    emit_signal,
+    pattern_events,
+    upper_shadow,
+)
 
 
-@njit(cache=True)
-def _cdlladderbottom_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLLADDERBOTTOM_TOTALS = ((SHADOW_VERY_SHORT, 1),)
+
+
+@njit(cache=True, nogil=True)
+def _cdlladderbottom_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    svs_total: float,
+) -> int:
+    color4 = candle_color(open_, close, i - 4)
+    color3 = candle_color(open_, close, i - 3)
+    color2 = candle_color(open_, close, i - 2)
+    open4 = open_[i - 4]
+    open3 = open_[i - 3]
+    open2 = open_[i - 2]
+    close4 = close[i - 4]
+    close3 = close[i - 3]
+    close2 = close[i - 2]
+    color1 = candle_color(open_, close, i - 1)
+    upper1 = upper_shadow(open_, high, close, i - 1)
+    shadow_very_short1 = candle_average(
+        SHADOW_VERY_SHORT, svs_total, open_, high, low, close, i - 1
+    )
+    color0 = candle_color(open_, close, i)
+    open0 = open_[i]
+    open1 = open_[i - 1]
+    close0 = close[i]
+    high1 = high[i - 1]
+
+    if (
+        color4 == -1
+        and color3 == -1
+        and color2 == -1
+        and open4 > open3
+        and open3 > open2
+        and close4 > close3
+        and close3 > close2
+        and color1 == -1
+        and upper1 > shadow_very_short1
+        and color0 == 1
+        and open0 > open1
+        and close0 > high1
+    ):
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlladderbottom_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 14  # avgPeriod(ShadowVeryShort) + 4
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     svs_total = 0.0
     svs_trailing = start_idx - 10  # avgPeriod(ShadowVeryShort)=10
@@ -26,45 +93,46 @@ def _cdlladderbottom_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        if (
-            candle_color(open_, close, i - 4) == -1
-            and candle_color(open_, close, i - 3) == -1
-            and candle_color(open_, close, i - 2) == -1
-            and open_[i - 4] > open_[i - 3]
-            and open_[i - 3] > open_[i - 2]
-            and close[i - 4] > close[i - 3]
-            and close[i - 3] > close[i - 2]
-            and candle_color(open_, close, i - 1) == -1
-            and upper_shadow(open_, high, close, i - 1)
-            > candle_average(SHADOW_VERY_SHORT, svs_total, open_, high, low, close, i - 1)
-            and candle_color(open_, close, i) == 1
-            and open_[i] > open_[i - 1]
-            and close[i] > high[i - 1]
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdlladderbottom_bar(open_, high, low, close, i, svs_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         svs_total += candle_range(SHADOW_VERY_SHORT, open_, high, low, close, i - 1) - candle_range(
             SHADOW_VERY_SHORT, open_, high, low, close, svs_trailing - 1
         )
         svs_trailing += 1
+    return count
 
 
-def CDLLADDERBOTTOM(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdlladderbottom_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlladderbottom_run(open_, high, low, close, out, None, None)
+
+
+def CDLLADDERBOTTOM(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Ladder Bottom
 
     Output is an int array with values in {0, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLLADDERBOTTOM", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLLADDERBOTTOM", output_dtype)
+    if sparse:
+        return pattern_events(_cdlladderbottom_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlladderbottom_kernel(o, h, l, c, out)
     return out
 
@@ -3,27 +3,62 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_DOJI,
     SHADOW_LONG,
     candle_average,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
     real_body,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdllongleggeddoji_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLLONGLEGGEDDOJI_TOTALS = ((BODY_DOJI, 0), (SHADOW_LONG, 0))
+
+
+@njit(cache=True, nogil=True)
+def _cdllongleggeddoji_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_doji_total: float,
+    shadow_long_total: float,
+) -> int:
+    sh_long_avg = candle_average(SHADOW_LONG, shadow_long_total, open_, high, low, close, i)
+    body0 = real_body(open_, close, i)
+    body_doji0 = candle_average(BODY_DOJI, body_doji_total, open_, high, low, close, i)
+    lower0 = lower_shadow(open_, low, close, i)
+    upper0 = upper_shadow(open_, high, close, i)
+
+    if body0 <= body_doji0 and (lower0 > sh_long_avg or upper0 > sh_long_avg):
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdllongleggeddoji_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 10  # max(BodyDoji, ShadowLong)
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     body_doji_total = 0.0
     shadow_long_total = 0.0
     body_trailing = 0
@@ -36,18 +71,10 @@ def _cdllongleggeddoji_kernel(
         i += 1
 
     for i in range(lookback_total, n):
-        sh_long_avg = candle_average(SHADOW_LONG, shadow_long_total, open_, high, low, close, i)
-        if (
-            real_body(open_, close, i)
-            <= candle_average(BODY_DOJI, body_doji_total, open_, high, low, close, i)
-            and (
-                lower_shadow(open_, low, close, i) > sh_long_avg
-                or upper_shadow(open_, high, close, i) > sh_long_avg
-            )
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdllongleggeddoji_bar(
+            open_, high, low, close, i, body_doji_total, shadow_long_total
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_doji_total += candle_range(BODY_DOJI, open_, high, low, close, i) - candle_range(
             BODY_DOJI, open_, high, low, close, body_trailing
@@ -57,22 +84,39 @@ def _cdllongleggeddoji_kernel(
         ) - candle_range(SHADOW_LONG, open_, high, low, close, shadow_trailing)
         body_trailing += 1
         shadow_trailing += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdllongleggeddoji_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdllongleggeddoji_run(open_, high, low, close, out, None, None)
 
 
-def CDLLONGLEGGEDDOJI(open, high, low, close):
+def CDLLONGLEGGEDDOJI(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Long Legged Doji
 
     Output is an int array with values in {0, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLLONGLEGGEDDOJI", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLLONGLEGGEDDOJI", output_dtype)
+    if sparse:
+        return pattern_events(_cdllongleggeddoji_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdllongleggeddoji_kernel(o, h, l, c, out)
     return out
 
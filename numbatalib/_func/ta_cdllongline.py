@@ -3,28 +3,64 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_LONG,
     SHADOW_SHORT,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
     real_body,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdllongline_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLLONGLINE_TOTALS = ((BODY_LONG, 0), (SHADOW_SHORT, 0))
+
+
+@njit(cache=True, nogil=True)
+def _cdllongline_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_total: float,
+    shadow_total: float,
+) -> int:
+    body0 = real_body(open_, close, i)
+    body_long0 = candle_average(BODY_LONG, body_total, open_, high, low, close, i)
+    upper0 = upper_shadow(open_, high, close, i)
+    shadow_short0 = candle_average(SHADOW_SHORT, shadow_total, open_, high, low, close, i)
+    lower0 = lower_shadow(open_, low, close, i)
+    color0 = candle_color(open_, close, i)
+
+    if body0 > body_long0 and upper0 < shadow_short0 and lower0 < shadow_short0:
+        return color0 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdllongline_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 10  # max(BodyLong, ShadowShort)
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     body_total = 0.0
     shadow_total = 0.0
     body_trailing = 0
@@ -37,16 +73,8 @@ def _cdllongline_kernel(
         i += 1
 
     for i in range(lookback_total, n):
-        if (
-            real_body(open_, close, i) > candle_average(BODY_LONG, body_total, open_, high, low, close, i)
-            and upper_shadow(open_, high, close, i)
-            < candle_average(SHADOW_SHORT, shadow_total, open_, high, low, close, i)
-            and lower_shadow(open_, low, close, i)
-            < candle_average(SHADOW_SHORT, shadow_total, open_, high, low, close, i)
-        ):
-            out[i] = candle_color(open_, close, i) * 100
-        else:
-            out[i] = 0
+        v = _cdllongline_bar(open_, high, low, close, i, body_total, shadow_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_total += candle_range(BODY_LONG, open_, high, low, close, i) - candle_range(
             BODY_LONG, open_, high, low, close, body_trailing
@@ -56,22 +84,39 @@ def _cdllongline_kernel(
         )
         body_trailing += 1
         shadow_trailing += 1
+    return count
 
 
-def CDLLONGLINE(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdllongline_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdllongline_run(open_, high, low, close, out, None, None)
+
+
+def CDLLONGLINE(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Long Line Candle
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLLONGLINE", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLLONGLINE", output_dtype)
+    if sparse:
+        return pattern_events(_cdllongline_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdllongline_kernel(o, h, l, c, out)
     return out
 
@@ -3,19 +3,58 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
-from numbatalib._func._candles import EQUAL, candle_average, candle_color, candle_range
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
+from numbatalib._func._candles import (
+    EQUAL,
+    candle_average,
+    candle_color,
+    candle_range,
+    emit_signal,
+    pattern_events,
+)
 
 
-@njit(cache=True)
-def _cdlmatchinglow_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLMATCHINGLOW_TOTALS = ((EQUAL, 1),)
+
+
+@njit(cache=True, nogil=True)
+def _cdlmatchinglow_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    eq_total: float,
+) -> int:
+    eq = candle_average(EQUAL, eq_total, open_, high, low, close, i - 1)
+    color1 = candle_color(open_, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    close0 = close[i]
+    close1 = close[i - 1]
+
+    if color1 == -1 and color0 == -1 and close0 <= close1 + eq and close0 >= close1 - eq:
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlmatchinglow_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 6  # TA_CANDLEAVGPERIOD(Equal) + 1
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     eq_total = 0.0
     trailing = start_idx - 5  # avgPeriod(Equal)=5
@@ -26,37 +65,46 @@ def _cdlmatchinglow_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        eq = candle_average(EQUAL, eq_total, open_, high, low, close, i - 1)
-        if (
-            candle_color(open_, close, i - 1) == -1
-            and candle_color(open_, close, i) == -1
-            and close[i] <= close[i - 1] + eq
-            and close[i] >= close[i - 1] - eq
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdlmatchinglow_bar(open_, high, low, close, i, eq_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         eq_total += candle_range(EQUAL, open_, high, low, close, i - 1) - candle_range(
             EQUAL, open_, high, low, close, trailing - 1
         )
         trailing += 1
+    return count
 
 
-def CDLMATCHINGLOW(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdlmatchinglow_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlmatchinglow_run(open_, high, low, close, out, None, None)
+
+
+def CDLMATCHINGLOW(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Matching Low
 
     Output is an int array with values in {0, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLMATCHINGLOW", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLMATCHINGLOW", output_dtype)
+    if sparse:
+        return pattern_events(_cdlmatchinglow_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlmatchinglow_kernel(o, h, l, c, out)
     return out
 
@@ -3,13 +3,17 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_float_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, check_float_param, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_LONG,
     BODY_SHORT,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
+    pattern_events,
     real_body,
     real_body_gap_up,
 )
@@ -18,20 +22,89 @@ from numbatalib._func._candles import (
 TA_REAL_MAX = 3e37
 
 
-@njit(cache=True)
-def _cdlmathold_kernel(
+_CDLMATHOLD_TOTALS = ((BODY_LONG, 4), (BODY_SHORT, 3), (BODY_SHORT, 2), (BODY_SHORT, 1))
+
+
+@njit(cache=True, nogil=True)
+def _cdlmathold_bar(
     open_: np.ndarray,
     high: np.ndarray,
     low: np.ndarray,
     close: np.ndarray,
+    i: int,
+    bodylong_total4: float,
+    bodyshort_total3: float,
+    bodyshort_total2: float,
+    bodyshort_total1: float,
     penetration: float,
-    out: np.ndarray,
-) -> None:
+) -> int:
+    open2 = open_[i - 2]
+    close2 = close[i - 2]
+    open1 = open_[i - 1]
+    close1 = close[i - 1]
+    i3_high = high[i - 3]
+    i2_high = high[i - 2]
+    i1_high = high[i - 1]
+    body4 = real_body(open_, close, i - 4)
+    body_long4 = candle_average(BODY_LONG, bodylong_total4, open_, high, low, close, i - 4)
+    body3 = real_body(open_, close, i - 3)
+    body_short3 = candle_average(BODY_SHORT, bodyshort_total3, open_, high, low, close, i - 3)
+    body2 = real_body(open_, close, i - 2)
+    body_short2 = candle_average(BODY_SHORT, bodyshort_total2, open_, high, low, close, i - 2)
+    body1 = real_body(open_, close, i - 1)
+    body_short1 = candle_average(BODY_SHORT, bodyshort_total1, open_, high, low, close, i - 1)
+    color4 = candle_color(open_, close, i - 4)
+    color3 = candle_color(open_, close, i - 3)
+    color0 = candle_color(open_, close, i)
+    body_gap_up34 = real_body_gap_up(open_, close, i - 3, i - 4)
+    close4 = close[i - 4]
+    open3 = open_[i - 3]
+    open0 = open_[i]
+    close0 = close[i]
+
+    i2_min_oc = open2 if open2 < close2 else close2
+    i2_max_oc = open2 if open2 > close2 else close2
+    i1_min_oc = open1 if open1 < close1 else close1
+    i1_max_oc = open1 if open1 > close1 else close1
+    if (
+        body4 > body_long4
+        and body3 < body_short3
+        and body2 < body_short2
+        and body1 < body_short1
+        and color4 == 1
+        and color3 == -1
+        and color0 == 1
+        and body_gap_up34
+        and i2_min_oc < close4
+        and i1_min_oc < close4
+        and i2_min_oc > close4 - body4 * penetration
+        and i1_min_oc > close4 - body4 * penetration
+        and i2_max_oc < open3
+        and i1_max_oc < i2_max_oc
+        and open0 > close1
+        and close0 > (i3_high if i3_high >= i2_high else i2_high if i2_high >= i1_high else i1_high)
+    ):
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlmathold_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 14  # max(BodyShort, BodyLong) + 4
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     bodylong_total4 = 0.0
     bodyshort_total3 = 0.0
@@ -54,39 +127,19 @@ def _cdlmathold_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        i2_min_oc = open_[i - 2] if open_[i - 2] < close[i - 2] else close[i - 2]
-        i2_max_oc = open_[i - 2] if open_[i - 2] > close[i - 2] else close[i - 2]
-        i1_min_oc = open_[i - 1] if open_[i - 1] < close[i - 1] else close[i - 1]
-        i1_max_oc = open_[i - 1] if open_[i - 1] > close[i - 1] else close[i - 1]
-        i3_high = high[i - 3]
-        i2_high = high[i - 2]
-        i1_high = high[i - 1]
-
-        if (
-            real_body(open_, close, i - 4)
-            > candle_average(BODY_LONG, bodylong_total4, open_, high, low, close, i - 4)
-            and real_body(open_, close, i - 3)
-            < candle_average(BODY_SHORT, bodyshort_total3, open_, high, low, close, i - 3)
-            and real_body(open_, close, i - 2)
-            < candle_average(BODY_SHORT, bodyshort_total2, open_, high, low, close, i - 2)
-            and real_body(open_, close, i - 1)
-            < candle_average(BODY_SHORT, bodyshort_total1, open_, high, low, close, i - 1)
-            and candle_color(open_, close, i - 4) == 1
-            and candle_color(open_, close, i - 3) == -1
-            and candle_color(open_, close, i) == 1
-            and real_body_gap_up(open_, close, i - 3, i - 4)
-            and i2_min_oc < close[i - 4]
-            and i1_min_oc < close[i - 4]
-            and i2_min_oc > close[i - 4] - real_body(open_, close, i - 4) * penetration
-            and i1_min_oc > close[i - 4] - real_body(open_, close, i - 4) * penetration
-            and i2_max_oc < open_[i - 3]
-            and i1_max_oc < i2_max_oc
-            and open_[i] > close[i - 1]
-            and close[i] > (i3_high if i3_high >= i2_high else i2_high if i2_high >= i1_high else i1_high)
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdlmathold_bar(
+            open_,
+            high,
+            low,
+            close,
+            i,
+            bodylong_total4,
+            bodyshort_total3,
+            bodyshort_total2,
+            bodyshort_total1,
+            penetration,
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         bodylong_total4 += candle_range(BODY_LONG, open_, high, low, close, i - 4) - candle_range(
             BODY_LONG, open_, high, low, close, bodylong_trailing - 4
@@ -103,23 +156,56 @@ def _cdlmathold_kernel(
 
         bodyshort_trailing += 1
         bodylong_trailing += 1
+    return count
 
 
-def CDLMATHOLD(open, high, low, close, penetration=0.5):
+@njit(cache=True, nogil=True)
+def _cdlmathold_kernel(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float,
+    out: np.ndarray,
+) -> None:
+    _cdlmathold_run(open_, high, low, close, penetration, out, None, None)
+
+
+def CDLMATHOLD(
+    open,
+    high,
+    low,
+    close,
+    penetration=0.5,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+    sparse: bool = False,
+):
     """
     Mat Hold
 
     Output is an int array with values in {0, 100}.
     """
-    pen = validate_float_param("penetration", penetration, Range(min=0.0, max=TA_REAL_MAX))
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d(
+            "CDLMATHOLD", (open, high, low, close), (penetration,), axis, out, output_dtype
+        )
+
+    pen = check_float_param("penetration", penetration, 0.0, TA_REAL_MAX)
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLMATHOLD", output_dtype)
+    if sparse:
+        return pattern_events(_cdlmathold_run, (o, h, l, c, pen), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlmathold_kernel(o, h, l, c, pen, out)
     return out
 
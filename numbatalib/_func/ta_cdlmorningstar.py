@@ -3,13 +3,17 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_float_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, check_float_param, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_LONG,
     BODY_SHORT,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
+    pattern_events,
     real_body,
     real_body_gap_down,
 )
@@ -18,20 +22,63 @@ from numbatalib._func._candles import (
 TA_REAL_MAX = 3e37
 
 
-@njit(cache=True)
-def _cdlmorningstar_kernel(
+_CDLMORNINGSTAR_TOTALS = ((BODY_LONG, 2), (BODY_SHORT, 1), (BODY_SHORT, 0))
+
+
+@njit(cache=True, nogil=True)
+def _cdlmorningstar_bar(
     open_: np.ndarray,
     high: np.ndarray,
     low: np.ndarray,
     close: np.ndarray,
+    i: int,
+    bodylong_total: float,
+    bodyshort_total: float,
+    bodyshort_total2: float,
     penetration: float,
-    out: np.ndarray,
-) -> None:
+) -> int:
+    body2 = real_body(open_, close, i - 2)
+    body_long2 = candle_average(BODY_LONG, bodylong_total, open_, high, low, close, i - 2)
+    color2 = candle_color(open_, close, i - 2)
+    body1 = real_body(open_, close, i - 1)
+    body_short1 = candle_average(BODY_SHORT, bodyshort_total, open_, high, low, close, i - 1)
+    body_gap_down12 = real_body_gap_down(open_, close, i - 1, i - 2)
+    body0 = real_body(open_, close, i)
+    body_short0 = candle_average(BODY_SHORT, bodyshort_total2, open_, high, low, close, i)
+    color0 = candle_color(open_, close, i)
+    close0 = close[i]
+    close2 = close[i - 2]
+
+    if (
+        body2 > body_long2
+        and color2 == -1
+        and body1 <= body_short1
+        and body_gap_down12
+        and body0 > body_short0
+        and color0 == 1
+        and close0 > close2 + body2 * penetration
+    ):
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlmorningstar_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 12  # max(BodyShort, BodyLong) + 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     bodylong_total = 0.0
     bodyshort_total = 0.0
@@ -52,21 +99,18 @@ def _cdlmorningstar_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        if (
-            real_body(open_, close, i - 2)
-            > candle_average(BODY_LONG, bodylong_total, open_, high, low, close, i - 2)
-            and candle_color(open_, close, i - 2) == -1
-            and real_body(open_, close, i - 1)
-            <= candle_average(BODY_SHORT, bodyshort_total, open_, high, low, close, i - 1)
-            and real_body_gap_down(open_, close, i - 1, i - 2)
-            and real_body(open_, close, i)
-            > candle_average(BODY_SHORT, bodyshort_total2, open_, high, low, close, i)
-            and candle_color(open_, close, i) == 1
-            and close[i] > close[i - 2] + real_body(open_, close, i - 2) * penetration
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdlmorningstar_bar(
+            open_,
+            high,
+            low,
+            close,
+            i,
+            bodylong_total,
+            bodyshort_total,
+            bodyshort_total2,
+            penetration,
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         bodylong_total += candle_range(BODY_LONG, open_, high, low, close, i - 2) - candle_range(
             BODY_LONG, open_, high, low, close, bodylong_trailing
@@ -80,23 +124,56 @@ def _cdlmorningstar_kernel(
 
         bodylong_trailing += 1
         bodyshort_trailing += 1
+    return count
 
 
-def CDLMORNINGSTAR(open, high, low, close, penetration=0.3):
+@njit(cache=True, nogil=True)
+def _cdlmorningstar_kernel(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float,
+    out: np.ndarray,
+) -> None:
+    _cdlmorningstar_run(open_, high, low, close, penetration, out, None, None)
+
+
+def CDLMORNINGSTAR(
+    open,
+    high,
+    low,
+    close,
+    penetration=0.3,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+    sparse: bool = False,
+):
     """
     Morning Star
 
     Output is an int array with values in {0, 100}.
     """
-    pen = validate_float_param("penetration", penetration, Range(min=0.0, max=TA_REAL_MAX))
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d(
+            "CDLMORNINGSTAR", (open, high, low, close), (penetration,), axis, out, output_dtype
+        )
+
+    pen = check_float_param("penetration", penetration, 0.0, TA_REAL_MAX)
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLMORNINGSTAR", output_dtype)
+    if sparse:
+        return pattern_events(_cdlmorningstar_run, (o, h, l, c, pen), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlmorningstar_kernel(o, h, l, c, pen, out)
     return out
 
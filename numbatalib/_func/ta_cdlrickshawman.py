@@ -3,29 +3,80 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_DOJI,
     NEAR,
     SHADOW_LONG,
     candle_average,
     candle_range,
+    emit_signal,
     high_low_range,
     lower_shadow,
+    pattern_events,
     real_body,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdlrickshawman_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+# NEAR is averaged over 10 bars here rather than its default 5.
+_CDLRICKSHAWMAN_TOTALS = ((BODY_DOJI, 0), (SHADOW_LONG, 0), (NEAR, 0, 10))
+
+
+@njit(cache=True, nogil=True)
+def _cdlrickshawman_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_doji_total: float,
+    shadow_long_total: float,
+    near_total: float,
+) -> int:
+    body0 = real_body(open_, close, i)
+    body_doji0 = candle_average(BODY_DOJI, body_doji_total, open_, high, low, close, i)
+    sh_long_avg = candle_average(SHADOW_LONG, shadow_long_total, open_, high, low, close, i)
+    near_avg = candle_average(NEAR, near_total, open_, high, low, close, i)
+    open0 = open_[i]
+    close0 = close[i]
+    low0 = low[i]
+    range0 = high_low_range(high, low, i)
+    lower0 = lower_shadow(open_, low, close, i)
+    upper0 = upper_shadow(open_, high, close, i)
+
+    is_doji = body0 <= body_doji0
+    oc_min = open0 if open0 < close0 else close0
+    oc_max = open0 if open0 > close0 else close0
+    midpoint = low0 + range0 * 0.5
+    if (
+        is_doji
+        and lower0 > sh_long_avg
+        and upper0 > sh_long_avg
+        and (oc_min <= midpoint + near_avg and oc_max >= midpoint - near_avg)
+    ):
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlrickshawman_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 10  # max(max(BodyDoji, ShadowLong), Near)
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     body_doji_total = 0.0
     shadow_long_total = 0.0
     near_total = 0.0
@@ -41,25 +92,10 @@ def _cdlrickshawman_kernel(
         i += 1
 
     for i in range(lookback_total, n):
-        is_doji = real_body(open_, close, i) <= candle_average(
-            BODY_DOJI, body_doji_total, open_, high, low, close, i
+        v = _cdlrickshawman_bar(
+            open_, high, low, close, i, body_doji_total, shadow_long_total, near_total
         )
-        sh_long_avg = candle_average(SHADOW_LONG, shadow_long_total, open_, high, low, close, i)
-        near_avg = candle_average(NEAR, near_total, open_, high, low, close, i)
-
-        oc_min = open_[i] if open_[i] < close[i] else close[i]
-        oc_max = open_[i] if open_[i] > close[i] else close[i]
-        midpoint = low[i] + high_low_range(high, low, i) * 0.5
-
-        if (
-            is_doji
-            and lower_shadow(open_, low, close, i) > sh_long_avg
-            and upper_shadow(open_, high, close, i) > sh_long_avg
-            and (oc_min <= midpoint + near_avg and oc_max >= midpoint - near_avg)
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_doji_total += candle_range(BODY_DOJI, open_, high, low, close, i) - candle_range(
             BODY_DOJI, open_, high, low, close, body_trailing
@@ -74,22 +110,39 @@ def _cdlrickshawman_kernel(
         body_trailing += 1
         shadow_trailing += 1
         near_trailing += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdlrickshawman_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlrickshawman_run(open_, high, low, close, out, None, None)
 
 
-def CDLRICKSHAWMAN(open, high, low, close):
+def CDLRICKSHAWMAN(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Rickshaw Man
 
     Output is an int array with values in {0, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLRICKSHAWMAN", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLRICKSHAWMAN", output_dtype)
+    if sparse:
+        return pattern_events(_cdlrickshawman_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlrickshawman_kernel(o, h, l, c, out)
     return out
 
@@ -3,26 +3,111 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_LONG,
     BODY_SHORT,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
+    pattern_events,
     real_body,
 )
 
 
-@njit(cache=True)
-def _cdlrisefall3methods_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLRISEFALL3METHODS_TOTALS = (
+    (BODY_LONG, 4),
+    (BODY_LONG, 0),
+    (BODY_SHORT, 3),
+    (BODY_SHORT, 2),
+    (BODY_SHORT, 1),
+)
+
+
+@njit(cache=True, nogil=True)
+def _cdlrisefall3methods_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    bodylong_total4: float,
+    bodylong_total0: float,
+    bodyshort_total3: float,
+    bodyshort_total2: float,
+    bodyshort_total1: float,
+) -> int:
+    c4 = candle_color(open_, close, i - 4)
+    body4 = real_body(open_, close, i - 4)
+    body_long4 = candle_average(BODY_LONG, bodylong_total4, open_, high, low, close, i - 4)
+    body3 = real_body(open_, close, i - 3)
+    body_short3 = candle_average(BODY_SHORT, bodyshort_total3, open_, high, low, close, i - 3)
+    body2 = real_body(open_, close, i - 2)
+    body_short2 = candle_average(BODY_SHORT, bodyshort_total2, open_, high, low, close, i - 2)
+    body1 = real_body(open_, close, i - 1)
+    body_short1 = candle_average(BODY_SHORT, bodyshort_total1, open_, high, low, close, i - 1)
+    body0 = real_body(open_, close, i)
+    body_long0 = candle_average(BODY_LONG, bodylong_total0, open_, high, low, close, i)
+    color3 = candle_color(open_, close, i - 3)
+    color2 = candle_color(open_, close, i - 2)
+    color1 = candle_color(open_, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    open3 = open_[i - 3]
+    close3 = close[i - 3]
+    high4 = high[i - 4]
+    low4 = low[i - 4]
+    open2 = open_[i - 2]
+    close2 = close[i - 2]
+    open1 = open_[i - 1]
+    close1 = close[i - 1]
+    open0 = open_[i]
+    close0 = close[i]
+    close4 = close[i - 4]
+
+    if (
+        body4 > body_long4
+        and body3 < body_short3
+        and body2 < body_short2
+        and body1 < body_short1
+        and body0 > body_long0
+        and c4 == -color3
+        and color3 == color2
+        and color2 == color1
+        and color1 == -color0
+        and (open3 if open3 < close3 else close3) < high4
+        and (open3 if open3 > close3 else close3) > low4
+        and (open2 if open2 < close2 else close2) < high4
+        and (open2 if open2 > close2 else close2) > low4
+        and (open1 if open1 < close1 else close1) < high4
+        and (open1 if open1 > close1 else close1) > low4
+        and close2 * c4 < close3 * c4
+        and close1 * c4 < close2 * c4
+        and open0 * c4 > close1 * c4
+        and close0 * c4 > close4 * c4
+    ):
+        return 100 * c4
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlrisefall3methods_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 14  # max(BodyShort, BodyLong) + 4
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     bodylong_total4 = 0.0
     bodylong_total0 = 0.0
@@ -47,36 +132,19 @@ def _cdlrisefall3methods_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        c4 = candle_color(open_, close, i - 4)
-        if (
-            real_body(open_, close, i - 4)
-            > candle_average(BODY_LONG, bodylong_total4, open_, high, low, close, i - 4)
-            and real_body(open_, close, i - 3)
-            < candle_average(BODY_SHORT, bodyshort_total3, open_, high, low, close, i - 3)
-            and real_body(open_, close, i - 2)
-            < candle_average(BODY_SHORT, bodyshort_total2, open_, high, low, close, i - 2)
-            and real_body(open_, close, i - 1)
-            < candle_average(BODY_SHORT, bodyshort_total1, open_, high, low, close, i - 1)
-            and real_body(open_, close, i)
-            > candle_average(BODY_LONG, bodylong_total0, open_, high, low, close, i)
-            and c4 == -candle_color(open_, close, i - 3)
-            and candle_color(open_, close, i - 3) == candle_color(open_, close, i - 2)
-            and candle_color(open_, close, i - 2) == candle_color(open_, close, i - 1)
-            and candle_color(open_, close, i - 1) == -candle_color(open_, close, i)
-            and (open_[i - 3] if open_[i - 3] < close[i - 3] else close[i - 3]) < high[i - 4]
-            and (open_[i - 3] if open_[i - 3] > close[i - 3] else close[i - 3]) > low[i - 4]
-            and (open_[i - 2] if open_[i - 2] < close[i - 2] else close[i - 2]) < high[i - 4]
-            and (open_[i - 2] if open_[i - 2] > close[i - 2] else close[i - 2]) > low[i - 4]
-            and (open_[i - 1] if open_[i - 1] < close[i - 1] else close[i - 1]) < high[i - 4]
-            and (open_[i - 1] if open_[i - 1] > close[i - 1] else close[i - 1]) > low[i - 4]
-            and close[i - 2] * c4 < close[i - 3] * c4
-            and close[i - 1] * c4 < close[i - 2] * c4
-            and open_[i] * c4 > close[i - 1] * c4
-            and close[i] * c4 > close[i - 4] * c4
-        ):
-            out[i] = 100 * c4
-        else:
-            out[i] = 0
+        v = _cdlrisefall3methods_bar(
+            open_,
+            high,
+            low,
+            close,
+            i,
+            bodylong_total4,
+            bodylong_total0,
+            bodyshort_total3,
+            bodyshort_total2,
+            bodyshort_total1,
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         bodylong_total4 += candle_range(BODY_LONG, open_, high, low, close, i - 4) - candle_range(
             BODY_LONG, open_, high, low, close, bodylong_trailing - 4
@@ -96,22 +164,41 @@ def _cdlrisefall3methods_kernel(
 
         bodyshort_trailing += 1
         bodylong_trailing += 1
+    return count
 
 
-def CDLRISEFALL3METHODS(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdlrisefall3methods_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlrisefall3methods_run(open_, high, low, close, out, None, None)
+
+
+def CDLRISEFALL3METHODS(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Rising/Falling Three Methods
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d(
+            "CDLRISEFALL3METHODS", (open, high, low, close), (), axis, out, output_dtype
+        )
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLRISEFALL3METHODS", output_dtype)
+    if sparse:
+        return pattern_events(_cdlrisefall3methods_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlrisefall3methods_kernel(o, h, l, c, out)
     return out
 
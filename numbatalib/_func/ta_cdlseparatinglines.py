@@ -3,7 +3,9 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_LONG,
     EQUAL,
@@ -11,21 +13,69 @@ from numbatalib._func._candles import (
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
     real_body,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdlseparatinglines_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLSEPARATINGLINES_TOTALS = ((SHADOW_VERY_SHORT, 0), (BODY_LONG, 0), (EQUAL, 1))
+
+
+@njit(cache=True, nogil=True)
+def _cdlseparatinglines_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    shadow_total: float,
+    body_total: float,
+    eq_total: float,
+) -> int:
+    eq = candle_average(EQUAL, eq_total, open_, high, low, close, i - 1)
+    col0 = candle_color(open_, close, i)
+    color1 = candle_color(open_, close, i - 1)
+    open0 = open_[i]
+    open1 = open_[i - 1]
+    body0 = real_body(open_, close, i)
+    body_long0 = candle_average(BODY_LONG, body_total, open_, high, low, close, i)
+    lower0 = lower_shadow(open_, low, close, i)
+    shadow_very_short0 = candle_average(SHADOW_VERY_SHORT, shadow_total, open_, high, low, close, i)
+    upper0 = upper_shadow(open_, high, close, i)
+
+    if (
+        color1 == -col0
+        and open0 <= open1 + eq
+        and open0 >= open1 - eq
+        and body0 > body_long0
+        and (
+            (col0 == 1 and lower0 < shadow_very_short0)
+            or (col0 == -1 and upper0 < shadow_very_short0)
+        )
+    ):
+        return col0 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlseparatinglines_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 11
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     shadow_total = 0.0
     body_total = 0.0
@@ -51,30 +101,10 @@ def _cdlseparatinglines_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        eq = candle_average(EQUAL, eq_total, open_, high, low, close, i - 1)
-        col0 = candle_color(open_, close, i)
-        if (
-            candle_color(open_, close, i - 1) == -col0
-            and open_[i] <= open_[i - 1] + eq
-            and open_[i] >= open_[i - 1] - eq
-            and real_body(open_, close, i)
-            > candle_average(BODY_LONG, body_total, open_, high, low, close, i)
-            and (
-                (
-                    col0 == 1
-                    and lower_shadow(open_, low, close, i)
-                    < candle_average(SHADOW_VERY_SHORT, shadow_total, open_, high, low, close, i)
-                )
-                or (
-                    col0 == -1
-                    and upper_shadow(open_, high, close, i)
-                    < candle_average(SHADOW_VERY_SHORT, shadow_total, open_, high, low, close, i)
-                )
-            )
-        ):
-            out[i] = col0 * 100
-        else:
-            out[i] = 0
+        v = _cdlseparatinglines_bar(
+            open_, high, low, close, i, shadow_total, body_total, eq_total
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         shadow_total += candle_range(
             SHADOW_VERY_SHORT, open_, high, low, close, i
@@ -88,22 +118,39 @@ def _cdlseparatinglines_kernel(
         shadow_trailing += 1
         body_trailing += 1
         eq_trailing += 1
+    return count
+
 
+@njit(cache=True, nogil=True)
+def _cdlseparatinglines_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlseparatinglines_run(open_, high, low, close, out, None, None)
 
-def CDLSEPARATINGLINES(open, high, low, close):
+
+def CDLSEPARATINGLINES(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Separating Lines
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLSEPARATINGLINES", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLSEPARATINGLINES", output_dtype)
+    if sparse:
+        return pattern_events(_cdlseparatinglines_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlseparatinglines_kernel(o, h, l, c, out)
     return out
 
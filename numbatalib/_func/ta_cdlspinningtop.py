@@ -3,27 +3,61 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_SHORT,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
     lower_shadow,
+    pattern_events,
     real_body,
     upper_shadow,
 )
 
 
-@njit(cache=True)
-def _cdlspinningtop_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLSPINNINGTOP_TOTALS = ((BODY_SHORT, 0),)
+
+
+@njit(cache=True, nogil=True)
+def _cdlspinningtop_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_total: float,
+) -> int:
+    rb = real_body(open_, close, i)
+    body_short0 = candle_average(BODY_SHORT, body_total, open_, high, low, close, i)
+    upper0 = upper_shadow(open_, high, close, i)
+    lower0 = lower_shadow(open_, low, close, i)
+    color0 = candle_color(open_, close, i)
+
+    if rb < body_short0 and upper0 > rb and lower0 > rb:
+        return color0 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlspinningtop_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 10  # TA_CANDLEAVGPERIOD(BodyShort)
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     body_total = 0.0
     trailing = 0
     i = 0
@@ -32,36 +66,46 @@ def _cdlspinningtop_kernel(
         i += 1
 
     for i in range(lookback_total, n):
-        rb = real_body(open_, close, i)
-        if (
-            rb < candle_average(BODY_SHORT, body_total, open_, high, low, close, i)
-            and upper_shadow(open_, high, close, i) > rb
-            and lower_shadow(open_, low, close, i) > rb
-        ):
-            out[i] = candle_color(open_, close, i) * 100
-        else:
-            out[i] = 0
+        v = _cdlspinningtop_bar(open_, high, low, close, i, body_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_total += candle_range(BODY_SHORT, open_, high, low, close, i) - candle_range(
             BODY_SHORT, open_, high, low, close, trailing
         )
         trailing += 1
+    return count
 
 
-def CDLSPINNINGTOP(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdlspinningtop_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlspinningtop_run(open_, high, low, close, out, None, None)
+
+
+def CDLSPINNINGTOP(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Spinning Top
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLSPINNINGTOP", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLSPINNINGTOP", output_dtype)
+    if sparse:
+        return pattern_events(_cdlspinningtop_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlspinningtop_kernel(o, h, l, c, out)
     return out
 
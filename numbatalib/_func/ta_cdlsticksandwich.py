@@ -3,19 +3,67 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
-from numbatalib._func._candles import EQUAL, candle_average, candle_color, candle_range
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
+from numbatalib._func._candles import (
+    EQUAL,
+    candle_average,
+    candle_color,
+    candle_range,
+    emit_signal,
+    pattern_events,
+)
 
 
-@njit(cache=True)
-def _cdlsticksandwich_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLSTICKSANDWICH_TOTALS = ((EQUAL, 2),)
+
+
+@njit(cache=True, nogil=True)
+def _cdlsticksandwich_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    eq_total: float,
+) -> int:
+    eq = candle_average(EQUAL, eq_total, open_, high, low, close, i - 2)
+    color2 = candle_color(open_, close, i - 2)
+    color1 = candle_color(open_, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    low1 = low[i - 1]
+    close2 = close[i - 2]
+    close0 = close[i]
+
+    if (
+        color2 == -1
+        and color1 == 1
+        and color0 == -1
+        and low1 > close2
+        and close0 <= close2 + eq
+        and close0 >= close2 - eq
+    ):
+        return 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlsticksandwich_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 7  # TA_CANDLEAVGPERIOD(Equal) + 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     eq_total = 0.0
     trailing = start_idx - 5  # avgPeriod(Equal)=5
@@ -26,39 +74,46 @@ def _cdlsticksandwich_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        eq = candle_average(EQUAL, eq_total, open_, high, low, close, i - 2)
-        if (
-            candle_color(open_, close, i - 2) == -1
-            and candle_color(open_, close, i - 1) == 1
-            and candle_color(open_, close, i) == -1
-            and low[i - 1] > close[i - 2]
-            and close[i] <= close[i - 2] + eq
-            and close[i] >= close[i - 2] - eq
-        ):
-            out[i] = 100
-        else:
-            out[i] = 0
+        v = _cdlsticksandwich_bar(open_, high, low, close, i, eq_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         eq_total += candle_range(EQUAL, open_, high, low, close, i - 2) - candle_range(
             EQUAL, open_, high, low, close, trailing - 2
         )
         trailing += 1
+    return count
 
 
-def CDLSTICKSANDWICH(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdlsticksandwich_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlsticksandwich_run(open_, high, low, close, out, None, None)
+
+
+def CDLSTICKSANDWICH(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Stick Sandwich
 
     Output is an int array with values in {0, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLSTICKSANDWICH", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLSTICKSANDWICH", output_dtype)
+    if sparse:
+        return pattern_events(_cdlsticksandwich_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlsticksandwich_kernel(o, h, l, c, out)
     return out
 
@@ -3,19 +3,89 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
-from numbatalib._func._candles import NEAR, candle_average, candle_color, candle_range, real_body, real_body_gap_down, real_body_gap_up
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
+from numbatalib._func._candles import (
+    NEAR,
+    candle_average,
+    candle_color,
+    candle_range,
+    emit_signal,
+    pattern_events,
+    real_body,
+    real_body_gap_down,
+    real_body_gap_up,
+)
 
 
-@njit(cache=True)
-def _cdltasukigap_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLTASUKIGAP_TOTALS = ((NEAR, 1),)
+
+
+@njit(cache=True, nogil=True)
+def _cdltasukigap_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    near_total: float,
+) -> int:
+    near_avg = candle_average(NEAR, near_total, open_, high, low, close, i - 1)
+    rb1 = real_body(open_, close, i - 1)
+    rb0 = real_body(open_, close, i)
+    body_gap_up12 = real_body_gap_up(open_, close, i - 1, i - 2)
+    color1 = candle_color(open_, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    open0 = open_[i]
+    close1 = close[i - 1]
+    open1 = open_[i - 1]
+    close0 = close[i]
+    close2 = close[i - 2]
+    open2 = open_[i - 2]
+    body_gap_down12 = real_body_gap_down(open_, close, i - 1, i - 2)
+
+    upside = (
+        body_gap_up12
+        and color1 == 1
+        and color0 == -1
+        and open0 < close1
+        and open0 > open1
+        and close0 < open1
+        and close0 > (close2 if close2 > open2 else open2)
+        and abs(rb1 - rb0) < near_avg
+    )
+    downside = (
+        body_gap_down12
+        and color1 == -1
+        and color0 == 1
+        and open0 < open1
+        and open0 > close1
+        and close0 > open1
+        and close0 < (close2 if close2 < open2 else open2)
+        and abs(rb1 - rb0) < near_avg
+    )
+    if upside or downside:
+        return color1 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdltasukigap_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 7  # TA_CANDLEAVGPERIOD(Near) + 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     near_total = 0.0
     near_trailing = start_idx - 5  # avgPeriod(Near)=5
@@ -26,56 +96,46 @@ def _cdltasukigap_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        near_avg = candle_average(NEAR, near_total, open_, high, low, close, i - 1)
-        rb1 = real_body(open_, close, i - 1)
-        rb0 = real_body(open_, close, i)
-
-        upside = (
-            real_body_gap_up(open_, close, i - 1, i - 2)
-            and candle_color(open_, close, i - 1) == 1
-            and candle_color(open_, close, i) == -1
-            and open_[i] < close[i - 1]
-            and open_[i] > open_[i - 1]
-            and close[i] < open_[i - 1]
-            and close[i] > (close[i - 2] if close[i - 2] > open_[i - 2] else open_[i - 2])
-            and abs(rb1 - rb0) < near_avg
-        )
-        downside = (
-            real_body_gap_down(open_, close, i - 1, i - 2)
-            and candle_color(open_, close, i - 1) == -1
-            and candle_color(open_, close, i) == 1
-            and open_[i] < open_[i - 1]
-            and open_[i] > close[i - 1]
-            and close[i] > open_[i - 1]
-            and close[i] < (close[i - 2] if close[i - 2] < open_[i - 2] else open_[i - 2])
-            and abs(rb1 - rb0) < near_avg
-        )
-
-        if upside or downside:
-            out[i] = candle_color(open_, close, i - 1) * 100
-        else:
-            out[i] = 0
+        v = _cdltasukigap_bar(open_, high, low, close, i, near_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         near_total += candle_range(NEAR, open_, high, low, close, i - 1) - candle_range(
             NEAR, open_, high, low, close, near_trailing - 1
         )
         near_trailing += 1
+    return count
 
 
-def CDLTASUKIGAP(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdltasukigap_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdltasukigap_run(open_, high, low, close, out, None, None)
+
+
+def CDLTASUKIGAP(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Tasuki Gap
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLTASUKIGAP", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLTASUKIGAP", output_dtype)
+    if sparse:
+        return pattern_events(_cdltasukigap_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdltasukigap_kernel(o, h, l, c, out)
     return out
 
@@ -3,19 +3,72 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
-from numbatalib._func._candles import BODY_LONG, EQUAL, candle_average, candle_color, candle_range, real_body
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
+from numbatalib._func._candles import (
+    BODY_LONG,
+    EQUAL,
+    candle_average,
+    candle_color,
+    candle_range,
+    emit_signal,
+    pattern_events,
+    real_body,
+)
 
 
-@njit(cache=True)
-def _cdlthrusting_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLTHRUSTING_TOTALS = ((EQUAL, 1), (BODY_LONG, 1))
+
+
+@njit(cache=True, nogil=True)
+def _cdlthrusting_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    equal_total: float,
+    body_long_total: float,
+) -> int:
+    rb1 = real_body(open_, close, i - 1)
+    color1 = candle_color(open_, close, i - 1)
+    body_long1 = candle_average(BODY_LONG, body_long_total, open_, high, low, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    open0 = open_[i]
+    low1 = low[i - 1]
+    close0 = close[i]
+    close1 = close[i - 1]
+    equal1 = candle_average(EQUAL, equal_total, open_, high, low, close, i - 1)
+
+    if (
+        color1 == -1
+        and rb1 > body_long1
+        and color0 == 1
+        and open0 < low1
+        and close0 > close1 + equal1
+        and close0 <= close1 + rb1 * 0.5
+    ):
+        return -100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlthrusting_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 11  # max(Equal, BodyLong) + 1
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     equal_total = 0.0
     body_long_total = 0.0
@@ -33,20 +86,8 @@ def _cdlthrusting_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        rb1 = real_body(open_, close, i - 1)
-        if (
-            candle_color(open_, close, i - 1) == -1
-            and rb1 > candle_average(BODY_LONG, body_long_total, open_, high, low, close, i - 1)
-            and candle_color(open_, close, i) == 1
-            and open_[i] < low[i - 1]
-            and close[i]
-            > close[i - 1]
-            + candle_average(EQUAL, equal_total, open_, high, low, close, i - 1)
-            and close[i] <= close[i - 1] + rb1 * 0.5
-        ):
-            out[i] = -100
-        else:
-            out[i] = 0
+        v = _cdlthrusting_bar(open_, high, low, close, i, equal_total, body_long_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         equal_total += candle_range(EQUAL, open_, high, low, close, i - 1) - candle_range(
             EQUAL, open_, high, low, close, equal_trailing - 1
@@ -56,22 +97,39 @@ def _cdlthrusting_kernel(
         )
         equal_trailing += 1
         body_long_trailing += 1
+    return count
 
 
-def CDLTHRUSTING(open, high, low, close):
+@njit(cache=True, nogil=True)
+def _cdlthrusting_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlthrusting_run(open_, high, low, close, out, None, None)
+
+
+def CDLTHRUSTING(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Thrusting Pattern
 
     Output is an int array with values in {0, -100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLTHRUSTING", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLTHRUSTING", output_dtype)
+    if sparse:
+        return pattern_events(_cdlthrusting_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlthrusting_kernel(o, h, l, c, out)
     return out
 
@@ -3,26 +3,76 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_DOJI,
     candle_average,
     candle_range,
+    emit_signal,
+    pattern_events,
     real_body,
     real_body_gap_down,
     real_body_gap_up,
 )
 
 
-@njit(cache=True)
-def _cdltristar_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLTRISTAR_TOTALS = ((BODY_DOJI, 2),)
+
+
+@njit(cache=True, nogil=True)
+def _cdltristar_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_total: float,
+) -> int:
+    body2 = real_body(open_, close, i - 2)
+    body_doji2 = candle_average(BODY_DOJI, body_total, open_, high, low, close, i - 2)
+    body1 = real_body(open_, close, i - 1)
+    body0 = real_body(open_, close, i)
+    body_gap_up12 = real_body_gap_up(open_, close, i - 1, i - 2)
+    open0 = open_[i]
+    close0 = close[i]
+    open1 = open_[i - 1]
+    close1 = close[i - 1]
+    body_gap_down12 = real_body_gap_down(open_, close, i - 1, i - 2)
+
+    if body2 <= body_doji2 and body1 <= body_doji2 and body0 <= body_doji2:
+        v = 0
+        if (
+            body_gap_up12
+            and (open0 if open0 > close0 else close0) < (open1 if open1 > close1 else close1)
+        ):
+            v = -100
+        if (
+            body_gap_down12
+            and (open0 if open0 < close0 else close0) > (open1 if open1 < close1 else close1)
+        ):
+            v = 100
+        return v
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdltristar_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 12  # avgPeriod(BodyDoji) + 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     body_total = 0.0
     body_trailing = start_idx - 2 - 10  # avgPeriod(BodyDoji)=10
@@ -33,49 +83,46 @@ def _cdltristar_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        if (
-            real_body(open_, close, i - 2)
-            <= candle_average(BODY_DOJI, body_total, open_, high, low, close, i - 2)
-            and real_body(open_, close, i - 1)
-            <= candle_average(BODY_DOJI, body_total, open_, high, low, close, i - 2)
-            and real_body(open_, close, i)
-            <= candle_average(BODY_DOJI, body_total, open_, high, low, close, i - 2)
-        ):
-            v = 0
-            if real_body_gap_up(open_, close, i - 1, i - 2) and (
-                (open_[i] if open_[i] > close[i] else close[i])
-                < (open_[i - 1] if open_[i - 1] > close[i - 1] else close[i - 1])
-            ):
-                v = -100
-            if real_body_gap_down(open_, close, i - 1, i - 2) and (
-                (open_[i] if open_[i] < close[i] else close[i])
-                > (open_[i - 1] if open_[i - 1] < close[i - 1] else close[i - 1])
-            ):
-                v = 100
-            out[i] = v
-        else:
-            out[i] = 0
+        v = _cdltristar_bar(open_, high, low, close, i, body_total)
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_total += candle_range(BODY_DOJI, open_, high, low, close, i - 2) - candle_range(
             BODY_DOJI, open_, high, low, close, body_trailing
         )
         body_trailing += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdltristar_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdltristar_run(open_, high, low, close, out, None, None)
 
 
-def CDLTRISTAR(open, high, low, close):
+def CDLTRISTAR(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Tristar Pattern
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLTRISTAR", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLTRISTAR", output_dtype)
+    if sparse:
+        return pattern_events(_cdltristar_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdltristar_kernel(o, h, l, c, out)
     return out
 
@@ -3,27 +3,80 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 from numbatalib._func._candles import (
     BODY_LONG,
     BODY_SHORT,
     candle_average,
     candle_color,
     candle_range,
+    emit_signal,
+    pattern_events,
     real_body,
     real_body_gap_up,
 )
 
 
-@njit(cache=True)
-def _cdlupsidegap2crows_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+_CDLUPSIDEGAP2CROWS_TOTALS = ((BODY_LONG, 2), (BODY_SHORT, 1))
+
+
+@njit(cache=True, nogil=True)
+def _cdlupsidegap2crows_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+    body_long_total: float,
+    body_short_total: float,
+) -> int:
+    color2 = candle_color(open_, close, i - 2)
+    body2 = real_body(open_, close, i - 2)
+    body_long2 = candle_average(BODY_LONG, body_long_total, open_, high, low, close, i - 2)
+    color1 = candle_color(open_, close, i - 1)
+    body1 = real_body(open_, close, i - 1)
+    body_short1 = candle_average(BODY_SHORT, body_short_total, open_, high, low, close, i - 1)
+    body_gap_up12 = real_body_gap_up(open_, close, i - 1, i - 2)
+    color0 = candle_color(open_, close, i)
+    open0 = open_[i]
+    open1 = open_[i - 1]
+    close0 = close[i]
+    close1 = close[i - 1]
+    close2 = close[i - 2]
+
+    if (
+        color2 == 1
+        and body2 > body_long2
+        and color1 == -1
+        and body1 <= body_short1
+        and body_gap_up12
+        and color0 == -1
+        and open0 > open1
+        and close0 < close1
+        and close0 > close2
+    ):
+        return -100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlupsidegap2crows_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 12  # max(BodyShort, BodyLong) + 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     start_idx = lookback_total
     body_long_total = 0.0
     body_short_total = 0.0
@@ -41,22 +94,10 @@ def _cdlupsidegap2crows_kernel(
         i += 1
 
     for i in range(start_idx, n):
-        if (
-            candle_color(open_, close, i - 2) == 1
-            and real_body(open_, close, i - 2)
-            > candle_average(BODY_LONG, body_long_total, open_, high, low, close, i - 2)
-            and candle_color(open_, close, i - 1) == -1
-            and real_body(open_, close, i - 1)
-            <= candle_average(BODY_SHORT, body_short_total, open_, high, low, close, i - 1)
-            and real_body_gap_up(open_, close, i - 1, i - 2)
-            and candle_color(open_, close, i) == -1
-            and open_[i] > open_[i - 1]
-            and close[i] < close[i - 1]
-            and close[i] > close[i - 2]
-        ):
-            out[i] = -100
-        else:
-            out[i] = 0
+        v = _cdlupsidegap2crows_bar(
+            open_, high, low, close, i, body_long_total, body_short_total
+        )
+        count = emit_signal(out, indices, values, count, i, v)
 
         body_long_total += candle_range(BODY_LONG, open_, high, low, close, i - 2) - candle_range(
             BODY_LONG, open_, high, low, close, body_long_trailing
@@ -66,22 +107,39 @@ def _cdlupsidegap2crows_kernel(
         ) - candle_range(BODY_SHORT, open_, high, low, close, body_short_trailing)
         body_long_trailing += 1
         body_short_trailing += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdlupsidegap2crows_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlupsidegap2crows_run(open_, high, low, close, out, None, None)
 
 
-def CDLUPSIDEGAP2CROWS(open, high, low, close):
+def CDLUPSIDEGAP2CROWS(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Upside Gap Two Crows
 
     Output is an int array with values in {0, -100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d("CDLUPSIDEGAP2CROWS", (open, high, low, close), (), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLUPSIDEGAP2CROWS", output_dtype)
+    if sparse:
+        return pattern_events(_cdlupsidegap2crows_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlupsidegap2crows_kernel(o, h, l, c, out)
     return out
 
@@ -3,62 +3,109 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
-from numbatalib._func._candles import candle_color, real_body_gap_down, real_body_gap_up
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
+from numbatalib._func._candles import (
+    candle_color,
+    emit_signal,
+    pattern_events,
+    real_body_gap_down,
+    real_body_gap_up,
+)
 
 
-@njit(cache=True)
-def _cdlxsidegap3methods_kernel(
-    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
-) -> None:
+@njit(cache=True, nogil=True)
+def _cdlxsidegap3methods_bar(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+) -> int:
+    close1 = close[i - 1]
+    open1 = open_[i - 1]
+    close2 = close[i - 2]
+    open2 = open_[i - 2]
+    color2 = candle_color(open_, close, i - 2)
+    color1 = candle_color(open_, close, i - 1)
+    color0 = candle_color(open_, close, i)
+    open0 = open_[i]
+    close0 = close[i]
+    body_gap_up12 = real_body_gap_up(open_, close, i - 1, i - 2)
+    body_gap_down12 = real_body_gap_down(open_, close, i - 1, i - 2)
+
+    oc1_max = close1 if close1 > open1 else open1
+    oc1_min = open1 if close1 > open1 else close1
+    oc2_max = close2 if close2 > open2 else open2
+    oc2_min = open2 if close2 > open2 else close2
+    if (
+        color2 == color1
+        and color1 == -color0
+        and open0 < oc1_max
+        and open0 > oc1_min
+        and close0 < oc2_max
+        and close0 > oc2_min
+        and ((color2 == 1 and body_gap_up12) or (color2 == -1 and body_gap_down12))
+    ):
+        return color2 * 100
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _cdlxsidegap3methods_run(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    out: np.ndarray | None,
+    indices: np.ndarray | None,
+    values: np.ndarray | None,
+) -> int:
     n = open_.shape[0]
     lookback_total = 2
     if n <= lookback_total:
-        return
+        return 0
 
+    count = 0
     for i in range(lookback_total, n):
-        oc1_max = close[i - 1] if close[i - 1] > open_[i - 1] else open_[i - 1]
-        oc1_min = open_[i - 1] if close[i - 1] > open_[i - 1] else close[i - 1]
-        oc2_max = close[i - 2] if close[i - 2] > open_[i - 2] else open_[i - 2]
-        oc2_min = open_[i - 2] if close[i - 2] > open_[i - 2] else close[i - 2]
-
-        if (
-            candle_color(open_, close, i - 2) == candle_color(open_, close, i - 1)
-            and candle_color(open_, close, i - 1) == -candle_color(open_, close, i)
-            and open_[i] < oc1_max
-            and open_[i] > oc1_min
-            and close[i] < oc2_max
-            and close[i] > oc2_min
-            and (
-                (
-                    candle_color(open_, close, i - 2) == 1
-                    and real_body_gap_up(open_, close, i - 1, i - 2)
-                )
-                or (
-                    candle_color(open_, close, i - 2) == -1
-                    and real_body_gap_down(open_, close, i - 1, i - 2)
-                )
-            )
-        ):
-            out[i] = candle_color(open_, close, i - 2) * 100
-        else:
-            out[i] = 0
-
-
-def CDLXSIDEGAP3METHODS(open, high, low, close):
+        v = _cdlxsidegap3methods_bar(open_, high, low, close, i)
+        count = emit_signal(out, indices, values, count, i, v)
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _cdlxsidegap3methods_kernel(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray
+) -> None:
+    _cdlxsidegap3methods_run(open_, high, low, close, out, None, None)
+
+
+def CDLXSIDEGAP3METHODS(
+    open, high, low, close, *, axis: int = 0, out=None, output_dtype=None, sparse: bool = False
+):
     """
     Upside/Downside Gap Three Methods
 
     Output is an int array with values in {0, -100, 100}.
     """
-    o = as_1d_float64(open)
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(open) and not sparse:
+        return apply_2d(
+            "CDLXSIDEGAP3METHODS", (open, high, low, close), (), axis, out, output_dtype
+        )
+
+    o = as_1d_float(open)
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     if h.shape[0] != o.shape[0] or l.shape[0] != o.shape[0] or c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(o, dtype=np.int32)
+    dtype = int_output_dtype("CDLXSIDEGAP3METHODS", output_dtype)
+    if sparse:
+        return pattern_events(_cdlxsidegap3methods_run, (o, h, l, c), out, dtype)
+
+    out = nan_like(o, dtype=dtype, out=out, inputs=(h, l, c))
     _cdlxsidegap3methods_kernel(o, h, l, c, out)
     return out
 
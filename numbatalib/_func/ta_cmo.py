@@ -4,25 +4,32 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _cmo_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real.shape[0]
     lookback = timeperiod
     if n <= lookback:
         return
 
-    prev_value = real[0]
+    prev_value = np.float64(real[0])
     prev_gain = 0.0
     prev_loss = 0.0
 
     for i in range(1, timeperiod + 1):
-        v = real[i]
+        v = np.float64(real[i])
         diff = v - prev_value
         prev_value = v
         if diff < 0.0:
@@ -40,7 +47,7 @@ def _cmo_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
         out[timeperiod] = 0.0
 
     for i in range(timeperiod + 1, n):
-        v = real[i]
+        v = np.float64(real[i])
         diff = v - prev_value
         prev_value = v
 
@@ -60,13 +67,16 @@ def _cmo_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
             out[i] = 0.0
 
 
-def CMO(real, timeperiod: int = 14):
+def CMO(real, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Chande Momentum Oscillator
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    out = nan_like(real_arr, dtype=np.float64)
+    if is_2d(real):
+        return apply_2d("CMO", (real,), (timeperiod,), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _cmo_kernel(real_arr, tp, out)
     return out
 
@@ -4,13 +4,20 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _correl_kernel(real0: np.ndarray, real1: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real0.shape[0]
     if timeperiod > n:
@@ -24,8 +31,8 @@ def _correl_kernel(real0: np.ndarray, real1: np.ndarray, timeperiod: int, out: n
     sum_x2 = 0.0
     sum_y2 = 0.0
     for i in range(timeperiod):
-        x = real0[i]
-        y = real1[i]
+        x = np.float64(real0[i])
+        y = np.float64(real1[i])
         sum_x += x
         sum_y += y
         sum_xy += x * y
@@ -36,8 +43,8 @@ def _correl_kernel(real0: np.ndarray, real1: np.ndarray, timeperiod: int, out: n
     today = lookback
     n_f = float(timeperiod)
 
-    trailing_x = real0[trailing_idx]
-    trailing_y = real1[trailing_idx]
+    trailing_x = np.float64(real0[trailing_idx])
+    trailing_y = np.float64(real1[trailing_idx])
     trailing_idx += 1
     temp = (sum_x2 - ((sum_x * sum_x) / n_f)) * (sum_y2 - ((sum_y * sum_y) / n_f))
     if temp > TA_EPSILON:
@@ -53,16 +60,16 @@ def _correl_kernel(real0: np.ndarray, real1: np.ndarray, timeperiod: int, out: n
         sum_y -= trailing_y
         sum_y2 -= trailing_y * trailing_y
 
-        x = real0[today]
-        y = real1[today]
+        x = np.float64(real0[today])
+        y = np.float64(real1[today])
         sum_x += x
         sum_x2 += x * x
         sum_y += y
         sum_y2 += y * y
         sum_xy += x * y
 
-        trailing_x = real0[trailing_idx]
-        trailing_y = real1[trailing_idx]
+        trailing_x = np.float64(real0[trailing_idx])
+        trailing_y = np.float64(real1[trailing_idx])
         trailing_idx += 1
 
         temp = (sum_x2 - ((sum_x * sum_x) / n_f)) * (sum_y2 - ((sum_y * sum_y) / n_f))
@@ -74,17 +81,20 @@ def _correl_kernel(real0: np.ndarray, real1: np.ndarray, timeperiod: int, out: n
         today += 1
 
 
-def CORREL(real0, real1, timeperiod: int = 30):
+def CORREL(real0, real1, timeperiod: int = 30, *, axis: int = 0, out=None, output_dtype=None):
     """
     Pearson's Correlation Coefficient (r)
     """
-    x = as_1d_float64(real0)
-    y = as_1d_float64(real1)
+    if is_2d(real0):
+        return apply_2d("CORREL", (real0, real1), (timeperiod,), axis, out, output_dtype)
+
+    x = as_1d_float(real0)
+    y = as_1d_float(real1)
     if y.shape[0] != x.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=1, max=100000))
-    out = nan_like(x, dtype=np.float64)
+    tp = check_int_param("timeperiod", timeperiod, 1, 100000)
+    out = nan_like(x, dtype=float_dtype(output_dtype), out=out, inputs=(y,))
     _correl_kernel(x, y, tp, out)
     return out
 
@@ -4,22 +4,26 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, empty_output, float_dtype, is_2d
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _cosh_kernel(real: np.ndarray, out: np.ndarray) -> None:
     n = real.shape[0]
     for i in range(n):
-        out[i] = math.cosh(real[i])
+        out[i] = math.cosh(np.float64(real[i]))
 
 
-def COSH(real):
+def COSH(real, *, axis: int = 0, out=None, output_dtype=None):
     """
     Vector Trigonometric Cosh
     """
-    real_arr = as_1d_float64(real)
-    out = np.empty(real_arr.shape[0], dtype=np.float64)
+    if is_2d(real):
+        return apply_2d("COSH", (real,), (), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    out = empty_output(real_arr.shape[0], dtype=float_dtype(output_dtype), out=out)
     _cosh_kernel(real_arr, out)
     return out
 
@@ -2,21 +2,31 @@ from __future__ import annotations
 
 import numpy as np
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 from numbatalib._func.ta_ema import EMA
 
 
-def DEMA(real, timeperiod: int = 30):
+def DEMA(real, timeperiod: int = 30, *, axis: int = 0, out=None, output_dtype=None):
     """
     Double Exponential Moving Average
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+    if is_2d(real):
+        return apply_2d("DEMA", (real,), (timeperiod,), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
     n = real_arr.shape[0]
 
     lb = tp - 1
     lookback = 2 * lb
-    out = nan_like(real_arr, dtype=np.float64)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     if n <= lookback:
         return out
 
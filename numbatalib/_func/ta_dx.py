@@ -5,11 +5,18 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 from numbatalib._func._dmi_shared import _dm_deltas, _ta_is_zero, _true_range
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _dx_kernel(
     high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int, out: np.ndarray
 ) -> None:
@@ -27,15 +34,15 @@ def _dx_kernel(
     prev_tr = 0.0
 
     today = 0
-    prev_high = high[today]
-    prev_low = low[today]
-    prev_close = close[today]
+    prev_high = np.float64(high[today])
+    prev_low = np.float64(low[today])
+    prev_close = np.float64(close[today])
 
     # Initial DM/TR (timeperiod-1 bars).
     for _ in range(timeperiod - 1):
         today += 1
-        curr_high = high[today]
-        curr_low = low[today]
+        curr_high = np.float64(high[today])
+        curr_low = np.float64(low[today])
         diff_p, diff_m = _dm_deltas(curr_high, curr_low, prev_high, prev_low)
         prev_high = curr_high
         prev_low = curr_low
@@ -47,12 +54,12 @@ def _dx_kernel(
 
         tr = _true_range(curr_high, curr_low, prev_close)
         prev_tr += tr
-        prev_close = close[today]
+        prev_close = np.float64(close[today])
 
     # Unstable period assumed 0; execute once to get first DI and DX.
     today += 1
-    curr_high = high[today]
-    curr_low = low[today]
+    curr_high = np.float64(high[today])
+    curr_low = np.float64(low[today])
     diff_p, diff_m = _dm_deltas(curr_high, curr_low, prev_high, prev_low)
     prev_high = curr_high
     prev_low = curr_low
@@ -66,7 +73,7 @@ def _dx_kernel(
 
     tr = _true_range(curr_high, curr_low, prev_close)
     prev_tr = prev_tr - (prev_tr / timeperiod) + tr
-    prev_close = close[today]
+    prev_close = np.float64(close[today])
 
     if not _ta_is_zero(prev_tr):
         minus_di = 100.0 * (prev_minus_dm / prev_tr)
@@ -81,8 +88,8 @@ def _dx_kernel(
 
     # Subsequent DX (carry previous on 0 denominators).
     for today in range(lookback_total + 1, n):
-        curr_high = high[today]
-        curr_low = low[today]
+        curr_high = np.float64(high[today])
+        curr_low = np.float64(low[today])
         diff_p, diff_m = _dm_deltas(curr_high, curr_low, prev_high, prev_low)
         prev_high = curr_high
         prev_low = curr_low
@@ -96,7 +103,7 @@ def _dx_kernel(
 
         tr = _true_range(curr_high, curr_low, prev_close)
         prev_tr = prev_tr - (prev_tr / timeperiod) + tr
-        prev_close = close[today]
+        prev_close = np.float64(close[today])
 
         if not _ta_is_zero(prev_tr):
             minus_di = 100.0 * (prev_minus_dm / prev_tr)
@@ -110,19 +117,22 @@ def _dx_kernel(
             out[today] = out[today - 1]
 
 
-def DX(high, low, close, timeperiod: int = 14):
+def DX(high, low, close, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Directional Movement Index
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(high):
+        return apply_2d("DX", (high, low, close), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    out = nan_like(h, dtype=np.float64)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l, c))
     _dx_kernel(h, l, c, tp, out)
     return out
 
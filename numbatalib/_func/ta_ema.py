@@ -1,12 +1,37 @@
 from __future__ import annotations
 
+import math
+from contextvars import ContextVar
+
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
+
+# Set by `numbatalib.parallel.ema_scan()` for the calling context: (workers,
+# min_size, chunk_size) of the parallel affine scan, or None for the serial kernel.
+_parallel: ContextVar[tuple[int, int, int | None] | None] = ContextVar(
+    "numbatalib_ema_scan", default=None
+)
+
+# Decay below which the carried state no longer shifts an affine-scan block.
+_SHIFT_CUTOFF = 2.0**-56
+
 
+@njit(cache=True, nogil=True)
+def _ema_step(prev: float, value: float, k: float) -> float:
+    """One step of the TA-Lib EMA recurrence."""
+    return ((value - prev) * k) + prev
 
-@njit(cache=True)
+
+@njit(cache=True, nogil=True)
 def _ema_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real.shape[0]
     if timeperiod > n:
@@ -24,11 +49,37 @@ def _ema_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     out[out_idx] = prev
 
     for i in range(timeperiod, n):
-        prev = ((real[i] - prev) * k) + prev
+        prev = _ema_step(prev, real[i], k)
         out[i] = prev
 
 
-def EMA(real, timeperiod: int = 30):
+@njit(cache=True, nogil=True)
+def _ema_block_kernel(real: np.ndarray, begin: int, end: int, k: float, out: np.ndarray) -> None:
+    """The EMA recurrence over bars [begin, end) started from a zero state."""
+    prev = 0.0
+    for i in range(begin, end):
+        prev = _ema_step(prev, real[i], k)
+        out[i] = prev
+
+
+@njit(cache=True, nogil=True)
+def _ema_shift_kernel(begin: int, end: int, decay: float, carry: float, out: np.ndarray) -> None:
+    """Add the decayed state `carry * decay**(i - begin + 1)` to out[begin:end]."""
+    if not math.isfinite(carry):
+        # The serial recurrence stays NaN once its state is NaN or inf.
+        for i in range(begin, end):
+            out[i] = np.nan
+        return
+    p = decay
+    for i in range(begin, end):
+        if p < _SHIFT_CUTOFF:
+            # Below 1/16 ulp of `carry` from here on (and subnormals are slow).
+            return
+        out[i] += carry * p
+        p *= decay
+
+
+def EMA(real, timeperiod: int = 30, *, axis: int = 0, out=None, output_dtype=None):
     """
     Exponential Moving Average
 
@@ -38,10 +89,20 @@ def EMA(real, timeperiod: int = 30):
       - TA-Lib's unstable period support is not wired yet; current implementation
         matches the default (unstable period = 0).
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+    if is_2d(real):
+        return apply_2d("EMA", (real,), (timeperiod,), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
+    scan = _parallel.get()
+    if scan is not None and real_arr.shape[0] >= scan[1]:
+        from numbatalib.parallel import _ema_affine_scan
 
-    out = nan_like(real_arr, dtype=np.float64)
-    _ema_kernel(real_arr, tp, out)
+        workers, _, chunk_size = scan
+        _ema_affine_scan(real_arr, tp, out, workers, chunk_size)
+    else:
+        _ema_kernel(real_arr, tp, out)
     return out
 
@@ -5,10 +5,11 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, float_dtype, is_2d, nan_like, split_outputs
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _ht_sine_kernel(real: np.ndarray, out_sine: np.ndarray, out_leadsine: np.ndarray) -> None:
     n = real.shape[0]
     lookback_total = 63
@@ -33,15 +34,15 @@ def _ht_sine_kernel(real: np.ndarray, out_sine: np.ndarray, out_leadsine: np.nda
     trailing_wma_idx = start_idx - lookback_total
     today = trailing_wma_idx
 
-    temp_real = real[today]
+    temp_real = np.float64(real[today])
     today += 1
     period_wma_sub = temp_real
     period_wma_sum = temp_real
-    temp_real = real[today]
+    temp_real = np.float64(real[today])
     today += 1
     period_wma_sub += temp_real
     period_wma_sum += temp_real * 2.0
-    temp_real = real[today]
+    temp_real = np.float64(real[today])
     today += 1
     period_wma_sub += temp_real
     period_wma_sum += temp_real * 3.0
@@ -50,12 +51,12 @@ def _ht_sine_kernel(real: np.ndarray, out_sine: np.ndarray, out_leadsine: np.nda
     smoothed_value = 0.0
 
     for _ in range(34):
-        temp_real = real[today]
+        temp_real = np.float64(real[today])
         today += 1
         period_wma_sub += temp_real
         period_wma_sub -= trailing_wma_value
         period_wma_sum += temp_real * 4.0
-        trailing_wma_value = real[trailing_wma_idx]
+        trailing_wma_value = np.float64(real[trailing_wma_idx])
         trailing_wma_idx += 1
         smoothed_value = period_wma_sum * 0.1
         period_wma_sum -= period_wma_sub
@@ -116,11 +117,11 @@ def _ht_sine_kernel(real: np.ndarray, out_sine: np.ndarray, out_leadsine: np.nda
     while today <= end_idx:
         adjusted_prev_period = (0.075 * period) + 0.54
 
-        today_value = real[today]
+        today_value = np.float64(real[today])
         period_wma_sub += today_value
         period_wma_sub -= trailing_wma_value
         period_wma_sum += today_value * 4.0
-        trailing_wma_value = real[trailing_wma_idx]
+        trailing_wma_value = np.float64(real[trailing_wma_idx])
         trailing_wma_idx += 1
         smoothed_value = period_wma_sum * 0.1
         period_wma_sum -= period_wma_sub
@@ -289,15 +290,19 @@ def _ht_sine_kernel(real: np.ndarray, out_sine: np.ndarray, out_leadsine: np.nda
         today += 1
 
 
-def HT_SINE(real):
+def HT_SINE(real, *, axis: int = 0, out=None, output_dtype=None):
     """
     Hilbert Transform - SineWave
 
     Returns (sine, leadsine).
     """
-    real_arr = as_1d_float64(real)
-    out_sine = nan_like(real_arr, dtype=np.float64)
-    out_leadsine = nan_like(real_arr, dtype=np.float64)
+    if is_2d(real):
+        return apply_2d("HT_SINE", (real,), (), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    outs = split_outputs(out, 2)
+    out_sine = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[0])
+    out_leadsine = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[1])
     _ht_sine_kernel(real_arr, out_sine, out_leadsine)
     return out_sine, out_leadsine
 
@@ -5,10 +5,11 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, float_dtype, is_2d, nan_like
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _ht_trendline_kernel(real: np.ndarray, out: np.ndarray) -> None:
     n = real.shape[0]
     lookback_total = 63
@@ -272,12 +273,15 @@ def _ht_trendline_kernel(real: np.ndarray, out: np.ndarray) -> None:
         today += 1
 
 
-def HT_TRENDLINE(real):
+def HT_TRENDLINE(real, *, axis: int = 0, out=None, output_dtype=None):
     """
     Hilbert Transform - Instantaneous Trendline
     """
-    real_arr = as_1d_float64(real)
-    out = nan_like(real_arr, dtype=np.float64)
+    if is_2d(real):
+        return apply_2d("HT_TRENDLINE", (real,), (), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _ht_trendline_kernel(real_arr, out)
     return out
 
@@ -5,10 +5,12 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, is_2d, nan_like
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _ht_trendmode_kernel(real: np.ndarray, out: np.ndarray) -> None:
     n = real.shape[0]
     lookback_total = 63
@@ -348,14 +350,17 @@ def _ht_trendmode_kernel(real: np.ndarray, out: np.ndarray) -> None:
         today += 1
 
 
-def HT_TRENDMODE(real):
+def HT_TRENDMODE(real, *, axis: int = 0, out=None, output_dtype=None):
     """
     Hilbert Transform - Trend vs Cycle Mode
 
     Returns an int array (0/1).
     """
-    real_arr = as_1d_float64(real)
-    out = nan_like(real_arr, dtype=np.int32)
+    if is_2d(real):
+        return apply_2d("HT_TRENDMODE", (real,), (), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    out = nan_like(real_arr, dtype=int_output_dtype("HT_TRENDMODE", output_dtype), out=out)
     _ht_trendmode_kernel(real_arr, out)
     return out
 
@@ -3,10 +3,17 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True, error_model="numpy")
 def _imi_kernel(open_: np.ndarray, close: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = open_.shape[0]
     lookback = timeperiod - 1
@@ -18,8 +25,8 @@ def _imi_kernel(open_: np.ndarray, close: np.ndarray, timeperiod: int, out: np.n
         downsum = 0.0
         start = today - lookback
         for i in range(start, today + 1):
-            c = close[i]
-            o = open_[i]
+            c = np.float64(close[i])
+            o = np.float64(open_[i])
             if c > o:
                 upsum += c - o
             else:
@@ -27,17 +34,20 @@ def _imi_kernel(open_: np.ndarray, close: np.ndarray, timeperiod: int, out: np.n
         out[today] = 100.0 * (upsum / (upsum + downsum))
 
 
-def IMI(open, close, timeperiod: int = 14):
+def IMI(open, close, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Intraday Momentum Index
     """
-    o = as_1d_float64(open)
-    c = as_1d_float64(close)
+    if is_2d(open):
+        return apply_2d("IMI", (open, close), (timeperiod,), axis, out, output_dtype)
+
+    o = as_1d_float(open)
+    c = as_1d_float(close)
     if c.shape[0] != o.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    out = nan_like(o, dtype=np.float64)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    out = nan_like(o, dtype=float_dtype(output_dtype), out=out, inputs=(c,))
     _imi_kernel(o, c, tp, out)
     return out
 
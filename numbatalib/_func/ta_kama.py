@@ -4,46 +4,59 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
 TA_EPSILON = 1e-14
 
+_CONST_MAX = 2.0 / (30.0 + 1.0)
+_CONST_DIFF = 2.0 / (2.0 + 1.0) - _CONST_MAX
 
-@njit(cache=True)
+
+@njit(cache=True, nogil=True)
+def _kama_step(prev_kama: float, value: float, period_roc: float, sum_roc1: float) -> float:
+    """One step of the KAMA recurrence, from the window's net and total change."""
+    if (sum_roc1 <= period_roc) or (math.fabs(sum_roc1) < TA_EPSILON):
+        er = 1.0
+    else:
+        er = math.fabs(period_roc / sum_roc1)
+
+    sc = (er * _CONST_DIFF) + _CONST_MAX
+    sc *= sc
+    return ((value - prev_kama) * sc) + prev_kama
+
+
+@njit(cache=True, nogil=True)
 def _kama_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real.shape[0]
     lookback = timeperiod
     if n <= lookback:
         return
 
-    const_max = 2.0 / (30.0 + 1.0)
-    const_diff = 2.0 / (2.0 + 1.0) - const_max
-
     sum_roc1 = 0.0
     today = 0
     trailing_idx = 0
     for _ in range(timeperiod):
-        temp = real[today] - real[today + 1]
+        temp = np.float64(real[today]) - np.float64(real[today + 1])
         sum_roc1 += math.fabs(temp)
         today += 1
 
-    prev_kama = real[today - 1]
+    prev_kama = np.float64(real[today - 1])
 
-    temp_real = real[today]
-    temp_real2 = real[trailing_idx]
+    temp_real = np.float64(real[today])
+    temp_real2 = np.float64(real[trailing_idx])
     period_roc = temp_real - temp_real2
     trailing_idx += 1
     trailing_value = temp_real2
 
-    if (sum_roc1 <= period_roc) or (math.fabs(sum_roc1) < TA_EPSILON):
-        er = 1.0
-    else:
-        er = math.fabs(period_roc / sum_roc1)
-
-    sc = (er * const_diff) + const_max
-    sc *= sc
-    prev_kama = ((real[today] - prev_kama) * sc) + prev_kama
+    prev_kama = _kama_step(prev_kama, temp_real, period_roc, sum_roc1)
     today += 1
 
     # Unstable period = 0; compute first output at index `lookback`.
@@ -51,35 +64,30 @@ def _kama_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     out[idx] = prev_kama
 
     while today < n:
-        temp_real = real[today]
-        temp_real2 = real[trailing_idx]
+        temp_real = np.float64(real[today])
+        temp_real2 = np.float64(real[trailing_idx])
         period_roc = temp_real - temp_real2
         trailing_idx += 1
 
         sum_roc1 -= math.fabs(trailing_value - temp_real2)
-        sum_roc1 += math.fabs(temp_real - real[today - 1])
+        sum_roc1 += math.fabs(temp_real - np.float64(real[today - 1]))
         trailing_value = temp_real2
 
-        if (sum_roc1 <= period_roc) or (math.fabs(sum_roc1) < TA_EPSILON):
-            er = 1.0
-        else:
-            er = math.fabs(period_roc / sum_roc1)
-
-        sc = (er * const_diff) + const_max
-        sc *= sc
-
-        prev_kama = ((temp_real - prev_kama) * sc) + prev_kama
+        prev_kama = _kama_step(prev_kama, temp_real, period_roc, sum_roc1)
         out[today] = prev_kama
         today += 1
 
 
-def KAMA(real, timeperiod: int = 30):
+def KAMA(real, timeperiod: int = 30, *, axis: int = 0, out=None, output_dtype=None):
     """
     Kaufman Adaptive Moving Average
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    out = nan_like(real_arr, dtype=np.float64)
+    if is_2d(real):
+        return apply_2d("KAMA", (real,), (timeperiod,), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _kama_kernel(real_arr, tp, out)
     return out
 
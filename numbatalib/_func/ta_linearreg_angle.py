@@ -4,13 +4,20 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
 PI = 3.14159265358979323846
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _linearreg_angle_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real.shape[0]
     if timeperiod > n:
@@ -32,13 +39,16 @@ def _linearreg_angle_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray)
         out[today] = math.atan(m) * (180.0 / PI)
 
 
-def LINEARREG_ANGLE(real, timeperiod: int = 14):
+def LINEARREG_ANGLE(real, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Linear Regression Angle
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    out = nan_like(real_arr, dtype=np.float64)
+    if is_2d(real):
+        return apply_2d("LINEARREG_ANGLE", (real,), (timeperiod,), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _linearreg_angle_kernel(real_arr, tp, out)
     return out
 
@@ -3,10 +3,17 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _linearreg_intercept_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real.shape[0]
     if timeperiod > n:
@@ -29,13 +36,16 @@ def _linearreg_intercept_kernel(real: np.ndarray, timeperiod: int, out: np.ndarr
         out[today] = b
 
 
-def LINEARREG_INTERCEPT(real, timeperiod: int = 14):
+def LINEARREG_INTERCEPT(real, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Linear Regression Intercept
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    out = nan_like(real_arr, dtype=np.float64)
+    if is_2d(real):
+        return apply_2d("LINEARREG_INTERCEPT", (real,), (timeperiod,), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _linearreg_intercept_kernel(real_arr, tp, out)
     return out
 
@@ -1,18 +1,18 @@
 from __future__ import annotations
 
-import numpy as np
-
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    empty_output,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
 def _validate_matype(matype: int) -> int:
-    try:
-        mt = int(matype)
-    except Exception as e:
-        raise ValueError("matype must be an int") from e
-    if mt < 0 or mt > 8:
-        raise ValueError("matype out of range")
-    return mt
+    return check_int_param("matype", matype, 0, 8)
 
 
 def _ma_lookback(timeperiod: int, matype: int) -> int:
@@ -47,66 +47,71 @@ def _ma_lookback(timeperiod: int, matype: int) -> int:
     return lb
 
 
-def MA(real, timeperiod: int = 30, matype: int = 0):
+def MA(real, timeperiod: int = 30, matype: int = 0, *, axis: int = 0, out=None, output_dtype=None):
     """
     Moving average with selectable type.
 
     MAType mapping (TA-Lib):
       0=SMA, 1=EMA, 2=WMA, 3=DEMA, 4=TEMA, 5=TRIMA, 6=KAMA, 7=MAMA, 8=T3
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=1, max=100000))
+    if is_2d(real):
+        return apply_2d("MA", (real,), (timeperiod, matype), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 1, 100000)
     mt = _validate_matype(matype)
 
     if mt == 7:
         from numbatalib._func.ta_mama import MAMA
 
         # TA-Lib behavior: ignore `timeperiod` and use the MAMA output with fixed limits.
-        mama, _fama = MAMA(real_arr, fastlimit=0.5, slowlimit=0.05)
+        mama, _fama = MAMA(
+            real_arr, fastlimit=0.5, slowlimit=0.05, out=(out, None), output_dtype=output_dtype
+        )
         return mama
 
     if tp == 1:
-        return np.asarray(real_arr, dtype=np.float64).copy()
+        out = empty_output(real_arr.shape[0], dtype=float_dtype(output_dtype), out=out)
+        out[:] = real_arr
+        return out
 
     if mt == 0:
         from numbatalib._func.ta_sma import _sma_kernel
 
-        out = nan_like(real_arr, dtype=np.float64)
+        out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
         _sma_kernel(real_arr, tp, out)
         return out
     if mt == 1:
-        from numbatalib._func.ta_ema import _ema_kernel
+        from numbatalib._func.ta_ema import EMA
 
-        out = nan_like(real_arr, dtype=np.float64)
-        _ema_kernel(real_arr, tp, out)
-        return out
+        return EMA(real_arr, timeperiod=tp, out=out, output_dtype=output_dtype)
     if mt == 2:
         from numbatalib._func.ta_wma import _wma_kernel
 
-        out = nan_like(real_arr, dtype=np.float64)
+        out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
         _wma_kernel(real_arr, tp, out)
         return out
     if mt == 3:
         from numbatalib._func.ta_dema import DEMA
 
-        return DEMA(real_arr, timeperiod=tp)
+        return DEMA(real_arr, timeperiod=tp, out=out, output_dtype=output_dtype)
     if mt == 4:
         from numbatalib._func.ta_tema import TEMA
 
-        return TEMA(real_arr, timeperiod=tp)
+        return TEMA(real_arr, timeperiod=tp, out=out, output_dtype=output_dtype)
     if mt == 5:
         from numbatalib._func.ta_trima import TRIMA
 
-        return TRIMA(real_arr, timeperiod=tp)
+        return TRIMA(real_arr, timeperiod=tp, out=out, output_dtype=output_dtype)
     if mt == 6:
         from numbatalib._func.ta_kama import KAMA
 
-        return KAMA(real_arr, timeperiod=tp)
+        return KAMA(real_arr, timeperiod=tp, out=out, output_dtype=output_dtype)
     if mt == 7:
         raise RuntimeError("unreachable")
     if mt == 8:
         from numbatalib._func.ta_t3 import T3
 
-        return T3(real_arr, timeperiod=tp, vfactor=0.7)
+        return T3(real_arr, timeperiod=tp, vfactor=0.7, out=out, output_dtype=output_dtype)
 
     raise RuntimeError("unreachable")
@@ -3,10 +3,19 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
-
-
-@njit(cache=True)
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+    split_outputs,
+)
+from numbatalib._func.ta_ema import _ema_step
+
+
+@njit(cache=True, nogil=True)
 def _ema_seeded_from_idx0_kernel(
     real: np.ndarray, start_idx: int, period: int, k: float, out: np.ndarray
 ) -> None:
@@ -39,28 +48,20 @@ def _ema_seeded_from_idx0_kernel(
 
     out_i = 1
     for i in range(start_idx + 1, n):
-        prev = ((real[i] - prev) * k) + prev
+        prev = _ema_step(prev, real[i], k)
         out[out_i] = prev
         out_i += 1
 
 
-@njit(cache=True)
-def _macd_kernel(
-    real: np.ndarray,
-    fast_period: int,
-    slow_period: int,
-    signal_period: int,
-    out_macd: np.ndarray,
-    out_signal: np.ndarray,
-    out_hist: np.ndarray,
-) -> None:
-    n = real.shape[0]
-    if n == 0:
-        return
+@njit(cache=True, nogil=True)
+def _macd_periods(fast_period: int, slow_period: int) -> tuple[int, int, float, float]:
+    """
+    Normalize MACD periods the way TA_INT_MACD does.
 
+    Returns (fast_period, slow_period, k_fast, k_slow).
+    """
     fp = fast_period
     sp = slow_period
-    sigp = signal_period
 
     # TA-Lib behavior: swap if slow < fast.
     if sp < fp:
@@ -79,6 +80,26 @@ def _macd_kernel(
         fp = 12
         k_fast = 0.15  # fixed 12
 
+    return fp, sp, k_fast, k_slow
+
+
+@njit(cache=True, nogil=True)
+def _macd_kernel(
+    real: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int,
+    out_macd: np.ndarray,
+    out_signal: np.ndarray,
+    out_hist: np.ndarray,
+) -> None:
+    n = real.shape[0]
+    if n == 0:
+        return
+
+    sigp = signal_period
+    fp, sp, k_fast, k_slow = _macd_periods(fast_period, slow_period)
+
     lookback_signal = sigp - 1 if sigp > 1 else 0
     lookback_total = lookback_signal + (sp - 1)
     if lookback_total >= n:
@@ -122,7 +143,7 @@ def _macd_kernel(
         if t == lookback_signal:
             sig_val = prev_sig
         else:
-            prev_sig = ((macd_val - prev_sig) * k_sig) + prev_sig
+            prev_sig = _ema_step(prev_sig, macd_val, k_sig)
             sig_val = prev_sig
 
         out_macd[idx] = macd_val
@@ -130,18 +151,33 @@ def _macd_kernel(
         out_hist[idx] = macd_val - sig_val
 
 
-def MACD(real, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9):
+def MACD(
+    real,
+    fastperiod: int = 12,
+    slowperiod: int = 26,
+    signalperiod: int = 9,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+):
     """
     Moving Average Convergence/Divergence
     """
-    real_arr = as_1d_float64(real)
-    fp = validate_int_param("fastperiod", fastperiod, Range(min=2, max=100000))
-    sp = validate_int_param("slowperiod", slowperiod, Range(min=2, max=100000))
-    sigp = validate_int_param("signalperiod", signalperiod, Range(min=1, max=100000))
-
-    out_macd = nan_like(real_arr, dtype=np.float64)
-    out_signal = nan_like(real_arr, dtype=np.float64)
-    out_hist = nan_like(real_arr, dtype=np.float64)
+    if is_2d(real):
+        return apply_2d(
+            "MACD", (real,), (fastperiod, slowperiod, signalperiod), axis, out, output_dtype
+        )
+
+    real_arr = as_1d_float(real)
+    fp = check_int_param("fastperiod", fastperiod, 2, 100000)
+    sp = check_int_param("slowperiod", slowperiod, 2, 100000)
+    sigp = check_int_param("signalperiod", signalperiod, 1, 100000)
+
+    outs = split_outputs(out, 3)
+    out_macd = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[0])
+    out_signal = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[1])
+    out_hist = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[2])
 
     _macd_kernel(real_arr, fp, sp, sigp, out_macd, out_signal, out_hist)
     return out_macd, out_signal, out_hist
@@ -2,7 +2,15 @@ from __future__ import annotations
 
 import numpy as np
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+    split_outputs,
+)
 from numbatalib._func.ta_ma import MA, _ma_lookback, _validate_matype
 
 
@@ -14,14 +22,35 @@ def MACDEXT(
     slowmatype: int = 0,
     signalperiod: int = 9,
     signalmatype: int = 0,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
 ):
     """
     MACD with controllable MA types for each stage.
     """
-    real_arr = as_1d_float64(real)
-    fp = validate_int_param("fastperiod", fastperiod, Range(min=2, max=100000))
-    sp = validate_int_param("slowperiod", slowperiod, Range(min=2, max=100000))
-    sigp = validate_int_param("signalperiod", signalperiod, Range(min=1, max=100000))
+    if is_2d(real):
+        return apply_2d(
+            "MACDEXT",
+            (real,),
+            (
+                fastperiod,
+                fastmatype,
+                slowperiod,
+                slowmatype,
+                signalperiod,
+                signalmatype,
+            ),
+            axis,
+            out,
+            output_dtype,
+        )
+
+    real_arr = as_1d_float(real)
+    fp = check_int_param("fastperiod", fastperiod, 2, 100000)
+    sp = check_int_param("slowperiod", slowperiod, 2, 100000)
+    sigp = check_int_param("signalperiod", signalperiod, 1, 100000)
     fmt = _validate_matype(fastmatype)
     smt = _validate_matype(slowmatype)
     sigmt = _validate_matype(signalmatype)
@@ -32,9 +61,10 @@ def MACDEXT(
         fmt, smt = smt, fmt
 
     n = real_arr.shape[0]
-    out_macd = nan_like(real_arr, dtype=np.float64)
-    out_signal = nan_like(real_arr, dtype=np.float64)
-    out_hist = nan_like(real_arr, dtype=np.float64)
+    outs = split_outputs(out, 3)
+    out_macd = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[0])
+    out_signal = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[1])
+    out_hist = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[2])
     if n == 0:
         return out_macd, out_signal, out_hist
 
@@ -60,6 +90,6 @@ def MACDEXT(
 
     out_macd[lookback_total:] = macd_line[lookback_total:]
     out_signal[lookback_total:] = signal_valid
-    out_hist[lookback_total:] = out_macd[lookback_total:] - signal_valid
+    out_hist[lookback_total:] = macd_line[lookback_total:] - signal_valid
     return out_macd, out_signal, out_hist
 
@@ -1,21 +1,31 @@
 from __future__ import annotations
 
-import numpy as np
-
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+    split_outputs,
+)
 from numbatalib._func.ta_macd import _macd_kernel
 
 
-def MACDFIX(real, signalperiod: int = 9):
+def MACDFIX(real, signalperiod: int = 9, *, axis: int = 0, out=None, output_dtype=None):
     """
     MACD Fix 12/26
     """
-    real_arr = as_1d_float64(real)
-    sigp = validate_int_param("signalperiod", signalperiod, Range(min=1, max=100000))
+    if is_2d(real):
+        return apply_2d("MACDFIX", (real,), (signalperiod,), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    sigp = check_int_param("signalperiod", signalperiod, 1, 100000)
 
-    out_macd = nan_like(real_arr, dtype=np.float64)
-    out_signal = nan_like(real_arr, dtype=np.float64)
-    out_hist = nan_like(real_arr, dtype=np.float64)
+    outs = split_outputs(out, 3)
+    out_macd = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[0])
+    out_signal = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[1])
+    out_hist = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[2])
 
     # TA-Lib defines MACDFIX as INT_MACD with (fast=0, slow=0) which triggers
     # fixed k values (12/26 => 0.15/0.075).
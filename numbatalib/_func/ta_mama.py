@@ -5,10 +5,18 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_float_param
-
-
-@njit(cache=True)
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_float_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+    split_outputs,
+)
+
+
+@njit(cache=True, nogil=True)
 def _mama_kernel(
     real: np.ndarray,
     fast_limit: float,
@@ -33,15 +41,15 @@ def _mama_kernel(
     trailing_wma_idx = start_idx - lookback_total
     today = trailing_wma_idx
 
-    temp_real = real[today]
+    temp_real = np.float64(real[today])
     today += 1
     period_wma_sub = temp_real
     period_wma_sum = temp_real
-    temp_real = real[today]
+    temp_real = np.float64(real[today])
     today += 1
     period_wma_sub += temp_real
     period_wma_sum += temp_real * 2.0
-    temp_real = real[today]
+    temp_real = np.float64(real[today])
     today += 1
     period_wma_sub += temp_real
     period_wma_sum += temp_real * 3.0
@@ -51,12 +59,12 @@ def _mama_kernel(
 
     # Warm-up smoother (9 iterations).
     for _ in range(9):
-        temp_real = real[today]
+        temp_real = np.float64(real[today])
         today += 1
         period_wma_sub += temp_real
         period_wma_sub -= trailing_wma_value
         period_wma_sum += temp_real * 4.0
-        trailing_wma_value = real[trailing_wma_idx]
+        trailing_wma_value = np.float64(real[trailing_wma_idx])
         trailing_wma_idx += 1
         smoothed_value = period_wma_sum * 0.1
         period_wma_sum -= period_wma_sub
@@ -120,12 +128,12 @@ def _mama_kernel(
     while today <= end_idx:
         adjusted_prev_period = (0.075 * period) + 0.54
 
-        today_value = real[today]
+        today_value = np.float64(real[today])
         # DO_PRICE_WMA(today_value, smoothed_value)
         period_wma_sub += today_value
         period_wma_sub -= trailing_wma_value
         period_wma_sum += today_value * 4.0
-        trailing_wma_value = real[trailing_wma_idx]
+        trailing_wma_value = np.float64(real[trailing_wma_idx])
         trailing_wma_idx += 1
         smoothed_value = period_wma_sum * 0.1
         period_wma_sum -= period_wma_sub
@@ -293,18 +301,30 @@ def _mama_kernel(
         today += 1
 
 
-def MAMA(real, fastlimit: float = 0.5, slowlimit: float = 0.05):
+def MAMA(
+    real,
+    fastlimit: float = 0.5,
+    slowlimit: float = 0.05,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+):
     """
     MESA Adaptive Moving Average
 
     Returns (mama, fama).
     """
-    real_arr = as_1d_float64(real)
-    fl = validate_float_param("fastlimit", fastlimit, Range(min=0.01, max=0.99))
-    sl = validate_float_param("slowlimit", slowlimit, Range(min=0.01, max=0.99))
+    if is_2d(real):
+        return apply_2d("MAMA", (real,), (fastlimit, slowlimit), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    fl = check_float_param("fastlimit", fastlimit, 0.01, 0.99)
+    sl = check_float_param("slowlimit", slowlimit, 0.01, 0.99)
 
-    out_mama = nan_like(real_arr, dtype=np.float64)
-    out_fama = nan_like(real_arr, dtype=np.float64)
+    outs = split_outputs(out, 2)
+    out_mama = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[0])
+    out_fama = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[1])
     _mama_kernel(real_arr, fl, sl, out_mama, out_fama)
     return out_mama, out_fama
 
@@ -2,25 +2,47 @@ from __future__ import annotations
 
 import numpy as np
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 from numbatalib._func.ta_ma import MA, _ma_lookback, _validate_matype
 
 
-def MAVP(real, periods, minperiod: int = 2, maxperiod: int = 30, matype: int = 0):
+def MAVP(
+    real,
+    periods,
+    minperiod: int = 2,
+    maxperiod: int = 30,
+    matype: int = 0,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+):
     """
     Moving average with variable period
     """
-    real_arr = as_1d_float64(real)
-    periods_arr = as_1d_float64(periods)
+    if is_2d(real):
+        return apply_2d(
+            "MAVP", (real, periods), (minperiod, maxperiod, matype), axis, out, output_dtype
+        )
+
+    real_arr = as_1d_float(real)
+    periods_arr = as_1d_float(periods)
     n = real_arr.shape[0]
     if periods_arr.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    minp = validate_int_param("minperiod", minperiod, Range(min=2, max=100000))
-    maxp = validate_int_param("maxperiod", maxperiod, Range(min=2, max=100000))
+    minp = check_int_param("minperiod", minperiod, 2, 100000)
+    maxp = check_int_param("maxperiod", maxperiod, 2, 100000)
     mt = _validate_matype(matype)
 
-    out = nan_like(real_arr, dtype=np.float64)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out, inputs=(periods_arr,))
     if n == 0:
         return out
 
@@ -3,26 +3,30 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, empty_output, float_dtype, is_2d
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _medprice_kernel(high: np.ndarray, low: np.ndarray, out: np.ndarray) -> None:
     n = high.shape[0]
     for i in range(n):
         out[i] = (high[i] + low[i]) * 0.5
 
 
-def MEDPRICE(high, low):
+def MEDPRICE(high, low, *, axis: int = 0, out=None, output_dtype=None):
     """
     Median Price
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
+    if is_2d(high):
+        return apply_2d("MEDPRICE", (high, low), (), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
     if h.shape[0] != l.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = np.empty(h.shape[0], dtype=np.float64)
+    out = empty_output(h.shape[0], dtype=float_dtype(output_dtype), out=out)
     _medprice_kernel(h, l, out)
     return out
 
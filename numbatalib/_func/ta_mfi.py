@@ -4,10 +4,17 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _mfi_kernel(
     high: np.ndarray,
     low: np.ndarray,
@@ -87,21 +94,26 @@ def _mfi_kernel(
             out[day] = 100.0 * (pos_sum / total)
 
 
-def MFI(high, low, close, volume, timeperiod: int = 14):
+def MFI(
+    high, low, close, volume, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None
+):
     """
     Money Flow Index
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
-    v = as_1d_float64(volume)
+    if is_2d(high):
+        return apply_2d("MFI", (high, low, close, volume), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
+    v = as_1d_float(volume)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n or v.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
 
-    out = nan_like(h, dtype=np.float64)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l, c, v))
     pos_buf = np.zeros(tp, dtype=np.float64)
     neg_buf = np.zeros(tp, dtype=np.float64)
     _mfi_kernel(h, l, c, v, tp, pos_buf, neg_buf, out)
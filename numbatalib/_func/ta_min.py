@@ -3,10 +3,17 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _min_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real.shape[0]
     if timeperiod > n:
@@ -40,14 +47,17 @@ def _min_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
         today += 1
 
 
-def MIN(real, timeperiod: int = 30):
+def MIN(real, timeperiod: int = 30, *, axis: int = 0, out=None, output_dtype=None):
     """
     Lowest value over a specified period.
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+    if is_2d(real):
+        return apply_2d("MIN", (real,), (timeperiod,), axis, out, output_dtype)
 
-    out = nan_like(real_arr, dtype=np.float64)
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _min_kernel(real_arr, tp, out)
     return out
 
@@ -3,10 +3,12 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import as_1d_float, check_int_param, is_2d, nan_like
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _minindex_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real.shape[0]
     if timeperiod > n:
@@ -40,14 +42,17 @@ def _minindex_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None
         today += 1
 
 
-def MININDEX(real, timeperiod: int = 30):
+def MININDEX(real, timeperiod: int = 30, *, axis: int = 0, out=None, output_dtype=None):
     """
     Index of lowest value over a specified period.
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+    if is_2d(real):
+        return apply_2d("MININDEX", (real,), (timeperiod,), axis, out, output_dtype)
 
-    out = np.zeros(real_arr.shape[0], dtype=np.int32)
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+
+    out = nan_like(real_arr, dtype=int_output_dtype("MININDEX", output_dtype), out=out)
     _minindex_kernel(real_arr, tp, out)
     return out
 
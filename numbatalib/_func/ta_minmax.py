@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import is_2d, split_outputs
 from numbatalib._func.ta_max import MAX
 from numbatalib._func.ta_min import MIN
 
 
-def MINMAX(real, timeperiod: int = 30):
+def MINMAX(real, timeperiod: int = 30, *, axis: int = 0, out=None, output_dtype=None):
     """
     Lowest and highest values over a specified period.
     """
-    return MIN(real, timeperiod=timeperiod), MAX(real, timeperiod=timeperiod)
+    if is_2d(real):
+        return apply_2d("MINMAX", (real,), (timeperiod,), axis, out, output_dtype)
+
+    outs = split_outputs(out, 2)
+    lowest = MIN(real, timeperiod=timeperiod, out=outs[0], output_dtype=output_dtype)
+    highest = MAX(real, timeperiod=timeperiod, out=outs[1], output_dtype=output_dtype)
+    return lowest, highest
 
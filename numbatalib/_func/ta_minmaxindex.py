@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+from numbatalib._batch import apply_2d
+from numbatalib._core._params import int_output_dtype
+from numbatalib._core._validation import is_2d, split_outputs
 from numbatalib._func.ta_maxindex import MAXINDEX
 from numbatalib._func.ta_minindex import MININDEX
 
 
-def MINMAXINDEX(real, timeperiod: int = 30):
+def MINMAXINDEX(real, timeperiod: int = 30, *, axis: int = 0, out=None, output_dtype=None):
     """
     Indices of lowest and highest values over a specified period.
     """
-    return MININDEX(real, timeperiod=timeperiod), MAXINDEX(real, timeperiod=timeperiod)
+    if is_2d(real):
+        return apply_2d("MINMAXINDEX", (real,), (timeperiod,), axis, out, output_dtype)
+
+    dtype = int_output_dtype("MINMAXINDEX", output_dtype)
+    outs = split_outputs(out, 2)
+    min_idx = MININDEX(real, timeperiod=timeperiod, out=outs[0], output_dtype=dtype)
+    max_idx = MAXINDEX(real, timeperiod=timeperiod, out=outs[1], output_dtype=dtype)
+    return min_idx, max_idx
 
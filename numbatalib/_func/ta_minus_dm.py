@@ -3,10 +3,17 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _minus_dm_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = high.shape[0]
     if n == 0:
@@ -21,13 +28,13 @@ def _minus_dm_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out: np
         return
 
     if timeperiod <= 1:
-        prev_high = high[lookback_total - 1]
-        prev_low = low[lookback_total - 1]
+        prev_high = np.float64(high[lookback_total - 1])
+        prev_low = np.float64(low[lookback_total - 1])
         for today in range(lookback_total, n):
-            diff_p = high[today] - prev_high
-            diff_m = prev_low - low[today]
-            prev_high = high[today]
-            prev_low = low[today]
+            diff_p = np.float64(high[today]) - prev_high
+            diff_m = prev_low - np.float64(low[today])
+            prev_high = np.float64(high[today])
+            prev_low = np.float64(low[today])
             if (diff_m > 0.0) and (diff_p < diff_m):
                 out[today] = diff_m
             else:
@@ -36,24 +43,24 @@ def _minus_dm_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out: np
 
     prev_minus_dm = 0.0
     today = 0
-    prev_high = high[today]
-    prev_low = low[today]
+    prev_high = np.float64(high[today])
+    prev_low = np.float64(low[today])
     for _ in range(timeperiod - 1):
         today += 1
-        diff_p = high[today] - prev_high
-        diff_m = prev_low - low[today]
-        prev_high = high[today]
-        prev_low = low[today]
+        diff_p = np.float64(high[today]) - prev_high
+        diff_m = prev_low - np.float64(low[today])
+        prev_high = np.float64(high[today])
+        prev_low = np.float64(low[today])
         if (diff_m > 0.0) and (diff_p < diff_m):
             prev_minus_dm += diff_m
 
     out[lookback_total] = prev_minus_dm
 
     for today in range(lookback_total + 1, n):
-        diff_p = high[today] - prev_high
-        diff_m = prev_low - low[today]
-        prev_high = high[today]
-        prev_low = low[today]
+        diff_p = np.float64(high[today]) - prev_high
+        diff_m = prev_low - np.float64(low[today])
+        prev_high = np.float64(high[today])
+        prev_low = np.float64(low[today])
 
         prev_minus_dm -= prev_minus_dm / timeperiod
         if (diff_m > 0.0) and (diff_p < diff_m):
@@ -61,18 +68,21 @@ def _minus_dm_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out: np
         out[today] = prev_minus_dm
 
 
-def MINUS_DM(high, low, timeperiod: int = 14):
+def MINUS_DM(high, low, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Minus Directional Movement
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
+    if is_2d(high):
+        return apply_2d("MINUS_DM", (high, low), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
     n = h.shape[0]
     if l.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=1, max=100000))
-    out = nan_like(h, dtype=np.float64)
+    tp = check_int_param("timeperiod", timeperiod, 1, 100000)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l,))
     _minus_dm_kernel(h, l, tp, out)
     return out
 
@@ -3,41 +3,68 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, empty_output, float_dtype, is_2d
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _obv_kernel(real: np.ndarray, volume: np.ndarray, out: np.ndarray) -> None:
     n = real.shape[0]
     if n == 0:
         return
 
-    prev_obv = volume[0]
-    prev_real = real[0]
+    prev_obv = np.float64(volume[0])
+    prev_real = np.float64(real[0])
 
     i = 0
     while i < n:
-        temp_real = real[i]
+        temp_real = np.float64(real[i])
         if temp_real > prev_real:
-            prev_obv += volume[i]
+            prev_obv += np.float64(volume[i])
         elif temp_real < prev_real:
-            prev_obv -= volume[i]
+            prev_obv -= np.float64(volume[i])
 
         out[i] = prev_obv
         prev_real = temp_real
         i += 1
 
 
-def OBV(real, volume):
+@njit(cache=True, nogil=True)
+def _obv_block_kernel(
+    real: np.ndarray, volume: np.ndarray, begin: int, end: int, out: np.ndarray
+) -> None:
+    """OBV of bars [begin, end) with the running total restarted at zero (`parallel.scan`)."""
+    if begin == 0:
+        prev_obv = np.float64(volume[0])
+        prev_real = np.float64(real[0])
+    else:
+        prev_obv = 0.0
+        prev_real = np.float64(real[begin - 1])
+
+    for i in range(begin, end):
+        temp_real = np.float64(real[i])
+        if temp_real > prev_real:
+            prev_obv += np.float64(volume[i])
+        elif temp_real < prev_real:
+            prev_obv -= np.float64(volume[i])
+
+        out[i] = prev_obv
+        prev_real = temp_real
+
+
+def OBV(real, volume, *, axis: int = 0, out=None, output_dtype=None):
     """
     On Balance Volume
     """
-    r = as_1d_float64(real)
-    v = as_1d_float64(volume)
+    if is_2d(real):
+        return apply_2d("OBV", (real, volume), (), axis, out, output_dtype)
+
+    r = as_1d_float(real)
+    v = as_1d_float(volume)
     if r.shape[0] != v.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    out = np.empty(r.shape[0], dtype=np.float64)
+    out = empty_output(r.shape[0], dtype=float_dtype(output_dtype), out=out)
     _obv_kernel(r, v, out)
     return out
 
@@ -3,11 +3,18 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 from numbatalib._func._dmi_shared import _dm_deltas, _ta_is_zero, _true_range
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _plus_di_kernel(
     high: np.ndarray, low: np.ndarray, close: np.ndarray, timeperiod: int, out: np.ndarray
 ) -> None:
@@ -25,12 +32,12 @@ def _plus_di_kernel(
 
     # No smoothing: +DI1 = +DM1 / TR1 (no *100).
     if timeperiod <= 1:
-        prev_high = high[lookback_total - 1]
-        prev_low = low[lookback_total - 1]
-        prev_close = close[lookback_total - 1]
+        prev_high = np.float64(high[lookback_total - 1])
+        prev_low = np.float64(low[lookback_total - 1])
+        prev_close = np.float64(close[lookback_total - 1])
         for today in range(lookback_total, n):
-            curr_high = high[today]
-            curr_low = low[today]
+            curr_high = np.float64(high[today])
+            curr_low = np.float64(low[today])
             diff_p, diff_m = _dm_deltas(curr_high, curr_low, prev_high, prev_low)
             prev_high = curr_high
             prev_low = curr_low
@@ -39,21 +46,21 @@ def _plus_di_kernel(
                 out[today] = 0.0 if _ta_is_zero(tr) else (diff_p / tr)
             else:
                 out[today] = 0.0
-            prev_close = close[today]
+            prev_close = np.float64(close[today])
         return
 
     # Initial DM and TR.
     prev_plus_dm = 0.0
     prev_tr = 0.0
     today = 0
-    prev_high = high[today]
-    prev_low = low[today]
-    prev_close = close[today]
+    prev_high = np.float64(high[today])
+    prev_low = np.float64(low[today])
+    prev_close = np.float64(close[today])
 
     for _ in range(timeperiod - 1):
         today += 1
-        curr_high = high[today]
-        curr_low = low[today]
+        curr_high = np.float64(high[today])
+        curr_low = np.float64(low[today])
         diff_p, diff_m = _dm_deltas(curr_high, curr_low, prev_high, prev_low)
         prev_high = curr_high
         prev_low = curr_low
@@ -61,12 +68,12 @@ def _plus_di_kernel(
             prev_plus_dm += diff_p
         tr = _true_range(curr_high, curr_low, prev_close)
         prev_tr += tr
-        prev_close = close[today]
+        prev_close = np.float64(close[today])
 
     # Unstable period is assumed 0; execute once to get first DI.
     today += 1
-    curr_high = high[today]
-    curr_low = low[today]
+    curr_high = np.float64(high[today])
+    curr_low = np.float64(low[today])
     diff_p, diff_m = _dm_deltas(curr_high, curr_low, prev_high, prev_low)
     prev_high = curr_high
     prev_low = curr_low
@@ -77,7 +84,7 @@ def _plus_di_kernel(
 
     tr = _true_range(curr_high, curr_low, prev_close)
     prev_tr = prev_tr - (prev_tr / timeperiod) + tr
-    prev_close = close[today]
+    prev_close = np.float64(close[today])
 
     if not _ta_is_zero(prev_tr):
         out[lookback_total] = 100.0 * (prev_plus_dm / prev_tr)
@@ -86,8 +93,8 @@ def _plus_di_kernel(
 
     # Subsequent DI.
     for today in range(lookback_total + 1, n):
-        curr_high = high[today]
-        curr_low = low[today]
+        curr_high = np.float64(high[today])
+        curr_low = np.float64(low[today])
         diff_p, diff_m = _dm_deltas(curr_high, curr_low, prev_high, prev_low)
         prev_high = curr_high
         prev_low = curr_low
@@ -98,24 +105,27 @@ def _plus_di_kernel(
 
         tr = _true_range(curr_high, curr_low, prev_close)
         prev_tr = prev_tr - (prev_tr / timeperiod) + tr
-        prev_close = close[today]
+        prev_close = np.float64(close[today])
 
         out[today] = 0.0 if _ta_is_zero(prev_tr) else (100.0 * (prev_plus_dm / prev_tr))
 
 
-def PLUS_DI(high, low, close, timeperiod: int = 14):
+def PLUS_DI(high, low, close, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Plus Directional Indicator
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(high):
+        return apply_2d("PLUS_DI", (high, low, close), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=1, max=100000))
-    out = nan_like(h, dtype=np.float64)
+    tp = check_int_param("timeperiod", timeperiod, 1, 100000)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l, c))
     _plus_di_kernel(h, l, c, tp, out)
     return out
 
@@ -3,10 +3,17 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _plus_dm_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = high.shape[0]
     if n == 0:
@@ -23,13 +30,13 @@ def _plus_dm_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out: np.
 
     # No smoothing: +DM1 for each bar.
     if timeperiod <= 1:
-        prev_high = high[lookback_total - 1]
-        prev_low = low[lookback_total - 1]
+        prev_high = np.float64(high[lookback_total - 1])
+        prev_low = np.float64(low[lookback_total - 1])
         for today in range(lookback_total, n):
-            diff_p = high[today] - prev_high
-            diff_m = prev_low - low[today]
-            prev_high = high[today]
-            prev_low = low[today]
+            diff_p = np.float64(high[today]) - prev_high
+            diff_m = prev_low - np.float64(low[today])
+            prev_high = np.float64(high[today])
+            prev_low = np.float64(low[today])
             if (diff_p > 0.0) and (diff_p > diff_m):
                 out[today] = diff_p
             else:
@@ -39,14 +46,14 @@ def _plus_dm_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out: np.
     # Initial DM sum.
     prev_plus_dm = 0.0
     today = 0
-    prev_high = high[today]
-    prev_low = low[today]
+    prev_high = np.float64(high[today])
+    prev_low = np.float64(low[today])
     for _ in range(timeperiod - 1):
         today += 1
-        diff_p = high[today] - prev_high
-        diff_m = prev_low - low[today]
-        prev_high = high[today]
-        prev_low = low[today]
+        diff_p = np.float64(high[today]) - prev_high
+        diff_m = prev_low - np.float64(low[today])
+        prev_high = np.float64(high[today])
+        prev_low = np.float64(low[today])
         if (diff_p > 0.0) and (diff_p > diff_m):
             prev_plus_dm += diff_p
 
@@ -54,10 +61,10 @@ def _plus_dm_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out: np.
 
     # Wilder smoothing for subsequent bars.
     for today in range(lookback_total + 1, n):
-        diff_p = high[today] - prev_high
-        diff_m = prev_low - low[today]
-        prev_high = high[today]
-        prev_low = low[today]
+        diff_p = np.float64(high[today]) - prev_high
+        diff_m = prev_low - np.float64(low[today])
+        prev_high = np.float64(high[today])
+        prev_low = np.float64(low[today])
 
         prev_plus_dm -= prev_plus_dm / timeperiod
         if (diff_p > 0.0) and (diff_p > diff_m):
@@ -65,18 +72,21 @@ def _plus_dm_kernel(high: np.ndarray, low: np.ndarray, timeperiod: int, out: np.
         out[today] = prev_plus_dm
 
 
-def PLUS_DM(high, low, timeperiod: int = 14):
+def PLUS_DM(high, low, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Plus Directional Movement
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
+    if is_2d(high):
+        return apply_2d("PLUS_DM", (high, low), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
     n = h.shape[0]
     if l.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=1, max=100000))
-    out = nan_like(h, dtype=np.float64)
+    tp = check_int_param("timeperiod", timeperiod, 1, 100000)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l,))
     _plus_dm_kernel(h, l, tp, out)
     return out
 
@@ -4,14 +4,21 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 from numbatalib._func.ta_ma import MA, _validate_matype
 
 
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _ppo_kernel(fast_ma: np.ndarray, slow_ma: np.ndarray, out: np.ndarray) -> None:
     n = fast_ma.shape[0]
     for i in range(n):
@@ -24,13 +31,25 @@ def _ppo_kernel(fast_ma: np.ndarray, slow_ma: np.ndarray, out: np.ndarray) -> No
             out[i] = ((fast_ma[i] - s) / s) * 100.0
 
 
-def PPO(real, fastperiod: int = 12, slowperiod: int = 26, matype: int = 0):
+def PPO(
+    real,
+    fastperiod: int = 12,
+    slowperiod: int = 26,
+    matype: int = 0,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+):
     """
     Percentage Price Oscillator
     """
-    real_arr = as_1d_float64(real)
-    fp = validate_int_param("fastperiod", fastperiod, Range(min=2, max=100000))
-    sp = validate_int_param("slowperiod", slowperiod, Range(min=2, max=100000))
+    if is_2d(real):
+        return apply_2d("PPO", (real,), (fastperiod, slowperiod, matype), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    fp = check_int_param("fastperiod", fastperiod, 2, 100000)
+    sp = check_int_param("slowperiod", slowperiod, 2, 100000)
     mt = _validate_matype(matype)
 
     if sp < fp:
@@ -39,7 +58,7 @@ def PPO(real, fastperiod: int = 12, slowperiod: int = 26, matype: int = 0):
     fast_ma = MA(real_arr, timeperiod=fp, matype=mt)
     slow_ma = MA(real_arr, timeperiod=sp, matype=mt)
 
-    out = nan_like(real_arr, dtype=np.float64)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _ppo_kernel(fast_ma, slow_ma, out)
     return out
 
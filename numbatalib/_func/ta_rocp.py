@@ -3,32 +3,42 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _rocp_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real.shape[0]
     if n <= timeperiod:
         return
     i = timeperiod
     while i < n:
-        old = real[i - timeperiod]
+        old = np.float64(real[i - timeperiod])
         if old == 0.0:
             out[i] = 0.0
         else:
-            out[i] = (real[i] - old) / old
+            out[i] = (np.float64(real[i]) - old) / old
         i += 1
 
 
-def ROCP(real, timeperiod: int = 10):
+def ROCP(real, timeperiod: int = 10, *, axis: int = 0, out=None, output_dtype=None):
     """
     Rate of change Percentage: (price-prevPrice)/prevPrice
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=1, max=100000))
+    if is_2d(real):
+        return apply_2d("ROCP", (real,), (timeperiod,), axis, out, output_dtype)
 
-    out = nan_like(real_arr, dtype=np.float64)
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 1, 100000)
+
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _rocp_kernel(real_arr, tp, out)
     return out
 
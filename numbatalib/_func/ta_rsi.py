@@ -4,25 +4,56 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
+def _rsi_value(prev_gain: float, prev_loss: float) -> float:
+    denom = prev_gain + prev_loss
+    if math.fabs(denom) >= TA_EPSILON:
+        return 100.0 * (prev_gain / denom)
+    return 0.0
+
+
+@njit(cache=True, nogil=True)
+def _rsi_step(
+    prev_gain: float, prev_loss: float, diff: float, timeperiod: int
+) -> tuple[float, float]:
+    """Wilder-smooth the average gain/loss with one more price difference."""
+    prev_loss *= timeperiod - 1
+    prev_gain *= timeperiod - 1
+    if diff < 0.0:
+        prev_loss -= diff
+    else:
+        prev_gain += diff
+    prev_loss /= timeperiod
+    prev_gain /= timeperiod
+    return prev_gain, prev_loss
+
+
+@njit(cache=True, nogil=True)
 def _rsi_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real.shape[0]
     lookback = timeperiod
     if n <= lookback:
         return
 
-    prev_value = real[0]
+    prev_value = np.float64(real[0])
     prev_gain = 0.0
     prev_loss = 0.0
 
     for i in range(1, timeperiod + 1):
-        v = real[i]
+        v = np.float64(real[i])
         diff = v - prev_value
         prev_value = v
         if diff < 0.0:
@@ -33,40 +64,27 @@ def _rsi_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     prev_loss /= timeperiod
     prev_gain /= timeperiod
 
-    denom = prev_gain + prev_loss
-    if math.fabs(denom) >= TA_EPSILON:
-        out[timeperiod] = 100.0 * (prev_gain / denom)
-    else:
-        out[timeperiod] = 0.0
+    out[timeperiod] = _rsi_value(prev_gain, prev_loss)
 
     for i in range(timeperiod + 1, n):
-        v = real[i]
+        v = np.float64(real[i])
         diff = v - prev_value
         prev_value = v
 
-        prev_loss *= timeperiod - 1
-        prev_gain *= timeperiod - 1
-        if diff < 0.0:
-            prev_loss -= diff
-        else:
-            prev_gain += diff
-        prev_loss /= timeperiod
-        prev_gain /= timeperiod
-
-        denom = prev_gain + prev_loss
-        if math.fabs(denom) >= TA_EPSILON:
-            out[i] = 100.0 * (prev_gain / denom)
-        else:
-            out[i] = 0.0
+        prev_gain, prev_loss = _rsi_step(prev_gain, prev_loss, diff, timeperiod)
+        out[i] = _rsi_value(prev_gain, prev_loss)
 
 
-def RSI(real, timeperiod: int = 14):
+def RSI(real, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Relative Strength Index
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    out = nan_like(real_arr, dtype=np.float64)
+    if is_2d(real):
+        return apply_2d("RSI", (real,), (timeperiod,), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _rsi_kernel(real_arr, tp, out)
     return out
 
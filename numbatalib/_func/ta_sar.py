@@ -3,13 +3,20 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_float_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_float_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
 TA_REAL_MAX = 3e37
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _sar_kernel(
     high: np.ndarray,
     low: np.ndarray,
@@ -27,33 +34,33 @@ def _sar_kernel(
         af = maximum
 
     # Determine initial direction using -DM on the first transition.
-    up_move = high[1] - high[0]
-    down_move = low[0] - low[1]
+    up_move = np.float64(high[1]) - np.float64(high[0])
+    down_move = np.float64(low[0]) - np.float64(low[1])
     is_long = 1
     if down_move > 0.0 and down_move > up_move:
         is_long = 0
 
-    new_high = high[0]
-    new_low = low[0]
+    new_high = np.float64(high[0])
+    new_low = np.float64(low[0])
 
     if is_long == 1:
-        ep = high[1]
+        ep = np.float64(high[1])
         sar = new_low
     else:
-        ep = low[1]
+        ep = np.float64(low[1])
         sar = new_high
 
     # Cheat for first iteration.
-    new_low = low[1]
-    new_high = high[1]
+    new_low = np.float64(low[1])
+    new_high = np.float64(high[1])
 
     idx = 1
     while idx < n:
         prev_low = new_low
         prev_high = new_high
 
-        new_low = low[idx]
-        new_high = high[idx]
+        new_low = np.float64(low[idx])
+        new_high = np.float64(high[idx])
 
         if is_long == 1:
             if new_low <= sar:
@@ -125,21 +132,33 @@ def _sar_kernel(
         idx += 1
 
 
-def SAR(high, low, acceleration: float = 0.02, maximum: float = 0.2):
+def SAR(
+    high,
+    low,
+    acceleration: float = 0.02,
+    maximum: float = 0.2,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+):
     """
     Parabolic SAR
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
+    if is_2d(high):
+        return apply_2d("SAR", (high, low), (acceleration, maximum), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
     if l.shape[0] != h.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    acc = validate_float_param("acceleration", acceleration, Range(min=0.0, max=TA_REAL_MAX))
-    mx = validate_float_param("maximum", maximum, Range(min=0.0, max=TA_REAL_MAX))
+    acc = check_float_param("acceleration", acceleration, 0.0, TA_REAL_MAX)
+    mx = check_float_param("maximum", maximum, 0.0, TA_REAL_MAX)
     if acc > mx:
         acc = mx
 
-    out = nan_like(h, dtype=np.float64)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l,))
     _sar_kernel(h, l, acc, mx, out)
     return out
 
@@ -4,11 +4,13 @@ import math
 import numpy as np
 from numba import njit
 
+from numbatalib._batch import apply_2d
 from numbatalib._core._validation import (
-    Range,
-    as_1d_float64,
+    as_1d_float,
+    check_float_param,
+    float_dtype,
+    is_2d,
     nan_like,
-    validate_float_param,
 )
 
 
@@ -16,7 +18,7 @@ TA_REAL_MAX = 3e37
 TA_REAL_MIN = -3e37
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _sarext_kernel(
     high: np.ndarray,
     low: np.ndarray,
@@ -175,26 +177,49 @@ def SAREXT(
     accelerationinitshort: float = 0.02,
     accelerationshort: float = 0.02,
     accelerationmaxshort: float = 0.2,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
 ):
     """
     Parabolic SAR - Extended
 
     Note: Matches TA-Lib behavior where SAR values are negative when short.
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
+    if is_2d(high):
+        return apply_2d(
+            "SAREXT",
+            (high, low),
+            (
+                startvalue,
+                offsetonreverse,
+                accelerationinitlong,
+                accelerationlong,
+                accelerationmaxlong,
+                accelerationinitshort,
+                accelerationshort,
+                accelerationmaxshort,
+            ),
+            axis,
+            out,
+            output_dtype,
+        )
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
     if l.shape[0] != h.shape[0]:
         raise ValueError("inputs must have the same length")
 
-    sv = validate_float_param("startvalue", startvalue, Range(min=TA_REAL_MIN, max=TA_REAL_MAX))
-    oor = validate_float_param("offsetonreverse", offsetonreverse, Range(min=0.0, max=TA_REAL_MAX))
-    ail = validate_float_param("accelerationinitlong", accelerationinitlong, Range(min=0.0, max=TA_REAL_MAX))
-    al = validate_float_param("accelerationlong", accelerationlong, Range(min=0.0, max=TA_REAL_MAX))
-    aml = validate_float_param("accelerationmaxlong", accelerationmaxlong, Range(min=0.0, max=TA_REAL_MAX))
-    ais = validate_float_param("accelerationinitshort", accelerationinitshort, Range(min=0.0, max=TA_REAL_MAX))
-    a_s = validate_float_param("accelerationshort", accelerationshort, Range(min=0.0, max=TA_REAL_MAX))
-    ams = validate_float_param("accelerationmaxshort", accelerationmaxshort, Range(min=0.0, max=TA_REAL_MAX))
+    sv = check_float_param("startvalue", startvalue, TA_REAL_MIN, TA_REAL_MAX)
+    oor = check_float_param("offsetonreverse", offsetonreverse, 0.0, TA_REAL_MAX)
+    ail = check_float_param("accelerationinitlong", accelerationinitlong, 0.0, TA_REAL_MAX)
+    al = check_float_param("accelerationlong", accelerationlong, 0.0, TA_REAL_MAX)
+    aml = check_float_param("accelerationmaxlong", accelerationmaxlong, 0.0, TA_REAL_MAX)
+    ais = check_float_param("accelerationinitshort", accelerationinitshort, 0.0, TA_REAL_MAX)
+    a_s = check_float_param("accelerationshort", accelerationshort, 0.0, TA_REAL_MAX)
+    ams = check_float_param("accelerationmaxshort", accelerationmaxshort, 0.0, TA_REAL_MAX)
 
-    out = nan_like(h, dtype=np.float64)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l,))
     _sarext_kernel(h, l, sv, oor, ail, al, aml, ais, a_s, ams, out)
     return out
@@ -3,10 +3,17 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _sma_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
     n = real.shape[0]
     if timeperiod > n:
@@ -39,7 +46,7 @@ def _sma_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
             break
 
 
-def SMA(real, timeperiod: int = 30):
+def SMA(real, timeperiod: int = 30, *, axis: int = 0, out=None, output_dtype=None):
     """
     Simple Moving Average
 
@@ -48,9 +55,12 @@ def SMA(real, timeperiod: int = 30):
       - leading values are NaN (lookback)
       - `timeperiod` must be in [2, 100000] (TA-Lib range)
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+    if is_2d(real):
+        return apply_2d("SMA", (real,), (timeperiod,), axis, out, output_dtype)
 
-    out = nan_like(real_arr, dtype=np.float64)
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _sma_kernel(real_arr, tp, out)
     return out
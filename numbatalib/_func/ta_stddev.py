@@ -4,12 +4,14 @@ import math
 import numpy as np
 from numba import njit
 
+from numbatalib._batch import apply_2d
 from numbatalib._core._validation import (
-    Range,
-    as_1d_float64,
+    as_1d_float,
+    check_float_param,
+    check_int_param,
+    float_dtype,
+    is_2d,
     nan_like,
-    validate_float_param,
-    validate_int_param,
 )
 
 
@@ -17,7 +19,7 @@ TA_REAL_MIN = -3e37
 TA_REAL_MAX = 3e37
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _stddev_kernel(real: np.ndarray, timeperiod: int, nbdev: float, out: np.ndarray) -> None:
     n = real.shape[0]
     if timeperiod > n:
@@ -31,20 +33,20 @@ def _stddev_kernel(real: np.ndarray, timeperiod: int, nbdev: float, out: np.ndar
 
     i = 0
     while i < lookback:
-        temp = real[i]
+        temp = np.float64(real[i])
         sum1 += temp
         sum2 += temp * temp
         i += 1
 
     while i < n:
-        temp = real[i]
+        temp = np.float64(real[i])
         sum1 += temp
         sum2 += temp * temp
 
         mean1 = sum1 / timeperiod
         mean2 = sum2 / timeperiod
 
-        temp = real[trailing]
+        temp = np.float64(real[trailing])
         sum1 -= temp
         sum2 -= temp * temp
         trailing += 1
@@ -60,15 +62,20 @@ def _stddev_kernel(real: np.ndarray, timeperiod: int, nbdev: float, out: np.ndar
         i += 1
 
 
-def STDDEV(real, timeperiod: int = 5, nbdev: float = 1.0):
+def STDDEV(
+    real, timeperiod: int = 5, nbdev: float = 1.0, *, axis: int = 0, out=None, output_dtype=None
+):
     """
     Standard Deviation
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    nb = validate_float_param("nbdev", nbdev, Range(min=TA_REAL_MIN, max=TA_REAL_MAX))
+    if is_2d(real):
+        return apply_2d("STDDEV", (real,), (timeperiod, nbdev), axis, out, output_dtype)
 
-    out = nan_like(real_arr, dtype=np.float64)
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    nb = check_float_param("nbdev", nbdev, TA_REAL_MIN, TA_REAL_MAX)
+
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _stddev_kernel(real_arr, tp, nb, out)
     return out
 
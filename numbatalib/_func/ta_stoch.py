@@ -4,7 +4,15 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+    split_outputs,
+)
 from numbatalib._func.ta_ma import MA, _ma_lookback, _validate_matype
 from numbatalib._func.ta_max import _max_kernel
 from numbatalib._func.ta_min import _min_kernel
@@ -13,7 +21,7 @@ from numbatalib._func.ta_min import _min_kernel
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _stoch_k_kernel(close: np.ndarray, highest: np.ndarray, lowest: np.ndarray, out: np.ndarray) -> None:
     n = close.shape[0]
     for i in range(n):
@@ -37,20 +45,40 @@ def STOCH(
     slowk_matype: int = 0,
     slowd_period: int = 3,
     slowd_matype: int = 0,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
 ):
     """
     Stochastic Oscillator
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(high):
+        return apply_2d(
+            "STOCH",
+            (high, low, close),
+            (
+                fastk_period,
+                slowk_period,
+                slowk_matype,
+                slowd_period,
+                slowd_matype,
+            ),
+            axis,
+            out,
+            output_dtype,
+        )
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    fastk = validate_int_param("fastk_period", fastk_period, Range(min=1, max=100000))
-    slowk = validate_int_param("slowk_period", slowk_period, Range(min=1, max=100000))
-    slowd = validate_int_param("slowd_period", slowd_period, Range(min=1, max=100000))
+    fastk = check_int_param("fastk_period", fastk_period, 1, 100000)
+    slowk = check_int_param("slowk_period", slowk_period, 1, 100000)
+    slowd = check_int_param("slowd_period", slowd_period, 1, 100000)
     sk_mt = _validate_matype(slowk_matype)
     sd_mt = _validate_matype(slowd_matype)
 
@@ -67,8 +95,9 @@ def STOCH(
     slowd_lb = _ma_lookback(slowd, sd_mt)
     total_lb = fastk_lb + slowk_lb + slowd_lb
 
-    out_k = nan_like(c, dtype=np.float64)
-    out_d = nan_like(c, dtype=np.float64)
+    outs = split_outputs(out, 2)
+    out_k = nan_like(c, dtype=float_dtype(output_dtype), out=outs[0], inputs=(h, l))
+    out_d = nan_like(c, dtype=float_dtype(output_dtype), out=outs[1], inputs=(h, l))
     if total_lb >= n:
         return out_k, out_d
 
@@ -4,7 +4,15 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+    split_outputs,
+)
 from numbatalib._func.ta_ma import MA, _ma_lookback, _validate_matype
 from numbatalib._func.ta_max import _max_kernel
 from numbatalib._func.ta_min import _min_kernel
@@ -14,7 +22,7 @@ from numbatalib._func.ta_rsi import RSI
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _stoch_k_kernel(close: np.ndarray, highest: np.ndarray, lowest: np.ndarray, out: np.ndarray) -> None:
     n = close.shape[0]
     for i in range(n):
@@ -26,7 +34,7 @@ def _stoch_k_kernel(close: np.ndarray, highest: np.ndarray, lowest: np.ndarray,
         if math.fabs(denom) < TA_EPSILON:
             out[i] = 0.0
         else:
-            out[i] = 100.0 * ((close[i] - ll) / denom)
+            out[i] = 100.0 * ((np.float64(close[i]) - ll) / denom)
 
 
 def STOCHRSI(
@@ -35,21 +43,36 @@ def STOCHRSI(
     fastk_period: int = 5,
     fastd_period: int = 3,
     fastd_matype: int = 0,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
 ):
     """
     Stochastic Relative Strength Index
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    fastk = validate_int_param("fastk_period", fastk_period, Range(min=1, max=100000))
-    fastd = validate_int_param("fastd_period", fastd_period, Range(min=1, max=100000))
+    if is_2d(real):
+        return apply_2d(
+            "STOCHRSI",
+            (real,),
+            (timeperiod, fastk_period, fastd_period, fastd_matype),
+            axis,
+            out,
+            output_dtype,
+        )
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    fastk = check_int_param("fastk_period", fastk_period, 1, 100000)
+    fastd = check_int_param("fastd_period", fastd_period, 1, 100000)
     fd_mt = _validate_matype(fastd_matype)
 
     rsi_full = RSI(real_arr, timeperiod=tp)
     rsi_lb = tp
 
-    out_k = nan_like(real_arr, dtype=np.float64)
-    out_d = nan_like(real_arr, dtype=np.float64)
+    outs = split_outputs(out, 2)
+    out_k = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[0])
+    out_d = nan_like(real_arr, dtype=float_dtype(output_dtype), out=outs[1])
     n = real_arr.shape[0]
     if rsi_lb >= n:
         return out_k, out_d
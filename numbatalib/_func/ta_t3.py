@@ -3,10 +3,29 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_float_param, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_float_param,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
+
+
+@njit(cache=True, nogil=True)
+def _t3_coefficients(vfactor: float) -> tuple[float, float, float, float]:
+    """Weights of e6, e5, e4 and e3 in the T3 output."""
+    temp2 = vfactor * vfactor
+    c1 = -(temp2 * vfactor)
+    c2 = 3.0 * (temp2 - c1)
+    c3 = (-6.0 * temp2) - 3.0 * (vfactor - c1)
+    c4 = 1.0 + 3.0 * vfactor - c1 + 3.0 * temp2
+    return c1, c2, c3, c4
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _t3_kernel(real: np.ndarray, timeperiod: int, vfactor: float, out: np.ndarray) -> None:
     n = real.shape[0]
     if n == 0:
@@ -22,17 +41,17 @@ def _t3_kernel(real: np.ndarray, timeperiod: int, vfactor: float, out: np.ndarra
     today = 0
 
     # Initialize e1 with SMA of first period values.
-    temp = real[today]
+    temp = np.float64(real[today])
     today += 1
     for _ in range(timeperiod - 1):
-        temp += real[today]
+        temp += np.float64(real[today])
         today += 1
     e1 = temp / timeperiod
 
     # Initialize e2.
     temp = e1
     for _ in range(timeperiod - 1):
-        e1 = (k * real[today]) + (one_minus_k * e1)
+        e1 = (k * np.float64(real[today])) + (one_minus_k * e1)
         today += 1
         temp += e1
     e2 = temp / timeperiod
@@ -40,7 +59,7 @@ def _t3_kernel(real: np.ndarray, timeperiod: int, vfactor: float, out: np.ndarra
     # Initialize e3.
     temp = e2
     for _ in range(timeperiod - 1):
-        e1 = (k * real[today]) + (one_minus_k * e1)
+        e1 = (k * np.float64(real[today])) + (one_minus_k * e1)
         today += 1
         e2 = (k * e1) + (one_minus_k * e2)
         temp += e2
@@ -49,7 +68,7 @@ def _t3_kernel(real: np.ndarray, timeperiod: int, vfactor: float, out: np.ndarra
     # Initialize e4.
     temp = e3
     for _ in range(timeperiod - 1):
-        e1 = (k * real[today]) + (one_minus_k * e1)
+        e1 = (k * np.float64(real[today])) + (one_minus_k * e1)
         today += 1
         e2 = (k * e1) + (one_minus_k * e2)
         e3 = (k * e2) + (one_minus_k * e3)
@@ -59,7 +78,7 @@ def _t3_kernel(real: np.ndarray, timeperiod: int, vfactor: float, out: np.ndarra
     # Initialize e5.
     temp = e4
     for _ in range(timeperiod - 1):
-        e1 = (k * real[today]) + (one_minus_k * e1)
+        e1 = (k * np.float64(real[today])) + (one_minus_k * e1)
         today += 1
         e2 = (k * e1) + (one_minus_k * e2)
         e3 = (k * e2) + (one_minus_k * e3)
@@ -70,7 +89,7 @@ def _t3_kernel(real: np.ndarray, timeperiod: int, vfactor: float, out: np.ndarra
     # Initialize e6.
     temp = e5
     for _ in range(timeperiod - 1):
-        e1 = (k * real[today]) + (one_minus_k * e1)
+        e1 = (k * np.float64(real[today])) + (one_minus_k * e1)
         today += 1
         e2 = (k * e1) + (one_minus_k * e2)
         e3 = (k * e2) + (one_minus_k * e3)
@@ -79,19 +98,14 @@ def _t3_kernel(real: np.ndarray, timeperiod: int, vfactor: float, out: np.ndarra
         temp += e5
     e6 = temp / timeperiod
 
-    # Constants.
-    temp2 = vfactor * vfactor
-    c1 = -(temp2 * vfactor)
-    c2 = 3.0 * (temp2 - c1)
-    c3 = (-6.0 * temp2) - 3.0 * (vfactor - c1)
-    c4 = 1.0 + 3.0 * vfactor - c1 + 3.0 * temp2
+    c1, c2, c3, c4 = _t3_coefficients(vfactor)
 
     # First output is at index lookback, which corresponds to the last value consumed so far.
     out[lookback] = c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
 
     idx = lookback + 1
     while idx < n:
-        x = real[idx]
+        x = np.float64(real[idx])
         e1 = (k * x) + (one_minus_k * e1)
         e2 = (k * e1) + (one_minus_k * e2)
         e3 = (k * e2) + (one_minus_k * e3)
@@ -102,14 +116,19 @@ def _t3_kernel(real: np.ndarray, timeperiod: int, vfactor: float, out: np.ndarra
         idx += 1
 
 
-def T3(real, timeperiod: int = 5, vfactor: float = 0.7):
+def T3(
+    real, timeperiod: int = 5, vfactor: float = 0.7, *, axis: int = 0, out=None, output_dtype=None
+):
     """
     T3 Moving Average
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
-    vf = validate_float_param("vfactor", vfactor, Range(min=0.0, max=1.0))
-    out = nan_like(real_arr, dtype=np.float64)
+    if is_2d(real):
+        return apply_2d("T3", (real,), (timeperiod, vfactor), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
+    vf = check_float_param("vfactor", vfactor, 0.0, 1.0)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     _t3_kernel(real_arr, tp, vf, out)
     return out
 
@@ -3,10 +3,11 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64, nan_like
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, float_dtype, is_2d, nan_like
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _trange_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray) -> None:
     n = high.shape[0]
     if n <= 1:
@@ -14,9 +15,9 @@ def _trange_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np
 
     i = 1
     while i < n:
-        temp_lt = low[i]
-        temp_ht = high[i]
-        temp_cy = close[i - 1]
+        temp_lt = np.float64(low[i])
+        temp_ht = np.float64(high[i])
+        temp_cy = np.float64(close[i - 1])
 
         greatest = temp_ht - temp_lt
 
@@ -32,18 +33,21 @@ def _trange_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np
         i += 1
 
 
-def TRANGE(high, low, close):
+def TRANGE(high, low, close, *, axis: int = 0, out=None, output_dtype=None):
     """
     True Range
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(high):
+        return apply_2d("TRANGE", (high, low, close), (), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    out = nan_like(h, dtype=np.float64)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l, c))
     _trange_kernel(h, l, c, out)
     return out
 
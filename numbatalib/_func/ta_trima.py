@@ -2,18 +2,28 @@ from __future__ import annotations
 
 import numpy as np
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 from numbatalib._func.ta_sma import _sma_kernel
 
 
-def TRIMA(real, timeperiod: int = 30):
+def TRIMA(real, timeperiod: int = 30, *, axis: int = 0, out=None, output_dtype=None):
     """
     Triangular Moving Average
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+    if is_2d(real):
+        return apply_2d("TRIMA", (real,), (timeperiod,), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
     n = real_arr.shape[0]
-    out = nan_like(real_arr, dtype=np.float64)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     if n == 0 or tp > n:
         return out
 
@@ -25,7 +35,7 @@ def TRIMA(real, timeperiod: int = 30):
         p2 = p1
 
     if p1 == 1:
-        first_valid = np.ascontiguousarray(real_arr)
+        first_valid = real_arr
         p1_lb = 0
     else:
         first_full = nan_like(real_arr, dtype=np.float64)
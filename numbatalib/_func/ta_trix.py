@@ -4,14 +4,21 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 from numbatalib._func.ta_ema import EMA
 
 
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _trix_roc_kernel(series: np.ndarray, offset: int, out: np.ndarray) -> None:
     n = series.shape[0]
     # series is aligned to original index `offset` (series[0] corresponds to original[offset]).
@@ -23,13 +30,16 @@ def _trix_roc_kernel(series: np.ndarray, offset: int, out: np.ndarray) -> None:
             out[offset + i] = ((series[i] - prev) / prev) * 100.0
 
 
-def TRIX(real, timeperiod: int = 30):
+def TRIX(real, timeperiod: int = 30, *, axis: int = 0, out=None, output_dtype=None):
     """
     1-day Rate-Of-Change (ROC) of a Triple Smooth EMA
     """
-    real_arr = as_1d_float64(real)
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=1, max=100000))
-    out = nan_like(real_arr, dtype=np.float64)
+    if is_2d(real):
+        return apply_2d("TRIX", (real,), (timeperiod,), axis, out, output_dtype)
+
+    real_arr = as_1d_float(real)
+    tp = check_int_param("timeperiod", timeperiod, 1, 100000)
+    out = nan_like(real_arr, dtype=float_dtype(output_dtype), out=out)
     n = real_arr.shape[0]
     if n == 0:
         return out
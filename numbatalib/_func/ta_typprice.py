@@ -3,28 +3,32 @@ from __future__ import annotations
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import as_1d_float64
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import as_1d_float, empty_output, float_dtype, is_2d
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _typprice_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, out: np.ndarray) -> None:
     n = high.shape[0]
     for i in range(n):
         out[i] = (high[i] + low[i] + close[i]) / 3.0
 
 
-def TYPPRICE(high, low, close):
+def TYPPRICE(high, low, close, *, axis: int = 0, out=None, output_dtype=None):
     """
     Typical Price
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(high):
+        return apply_2d("TYPPRICE", (high, low, close), (), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    out = np.empty(n, dtype=np.float64)
+    out = empty_output(n, dtype=float_dtype(output_dtype), out=out)
     _typprice_kernel(h, l, c, out)
     return out
 
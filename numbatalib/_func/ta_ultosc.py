@@ -4,19 +4,26 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 
 
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _ultosc_terms(high: np.ndarray, low: np.ndarray, close: np.ndarray, day: int) -> tuple[float, float]:
-    lt = low[day]
-    ht = high[day]
-    cy = close[day - 1] if day > 0 else 0.0
+    lt = np.float64(low[day])
+    ht = np.float64(high[day])
+    cy = np.float64(close[day - 1]) if day > 0 else 0.0
     true_low = lt if lt < cy else cy
-    close_minus_true_low = close[day] - true_low
+    close_minus_true_low = np.float64(close[day]) - true_low
 
     true_range = ht - lt
     tmp = math.fabs(cy - ht)
@@ -28,7 +35,7 @@ def _ultosc_terms(high: np.ndarray, low: np.ndarray, close: np.ndarray, day: int
     return close_minus_true_low, true_range
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _ultosc_kernel(
     high: np.ndarray,
     low: np.ndarray,
@@ -102,26 +109,47 @@ def _ultosc_kernel(
         trailing3 += 1
 
 
-def ULTOSC(high, low, close, timeperiod1: int = 7, timeperiod2: int = 14, timeperiod3: int = 28):
+def ULTOSC(
+    high,
+    low,
+    close,
+    timeperiod1: int = 7,
+    timeperiod2: int = 14,
+    timeperiod3: int = 28,
+    *,
+    axis: int = 0,
+    out=None,
+    output_dtype=None,
+):
     """
     Ultimate Oscillator
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(high):
+        return apply_2d(
+            "ULTOSC",
+            (high, low, close),
+            (timeperiod1, timeperiod2, timeperiod3),
+            axis,
+            out,
+            output_dtype,
+        )
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    p1 = validate_int_param("timeperiod1", timeperiod1, Range(min=1, max=100000))
-    p2 = validate_int_param("timeperiod2", timeperiod2, Range(min=1, max=100000))
-    p3 = validate_int_param("timeperiod3", timeperiod3, Range(min=1, max=100000))
+    p1 = check_int_param("timeperiod1", timeperiod1, 1, 100000)
+    p2 = check_int_param("timeperiod2", timeperiod2, 1, 100000)
+    p3 = check_int_param("timeperiod3", timeperiod3, 1, 100000)
 
     # TA-Lib sorts the periods so p1 <= p2 <= p3.
     periods = [p1, p2, p3]
     periods.sort()
     p1, p2, p3 = periods[0], periods[1], periods[2]
 
-    out = nan_like(h, dtype=np.float64)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l, c))
     _ultosc_kernel(h, l, c, p1, p2, p3, out)
     return out
@@ -4,7 +4,14 @@ import math
 import numpy as np
 from numba import njit
 
-from numbatalib._core._validation import Range, as_1d_float64, nan_like, validate_int_param
+from numbatalib._batch import apply_2d
+from numbatalib._core._validation import (
+    as_1d_float,
+    check_int_param,
+    float_dtype,
+    is_2d,
+    nan_like,
+)
 from numbatalib._func.ta_max import _max_kernel
 from numbatalib._func.ta_min import _min_kernel
 
@@ -12,7 +19,7 @@ from numbatalib._func.ta_min import _min_kernel
 TA_EPSILON = 1e-14
 
 
-@njit(cache=True)
+@njit(cache=True, nogil=True)
 def _willr_kernel(highest: np.ndarray, lowest: np.ndarray, close: np.ndarray, out: np.ndarray) -> None:
     n = close.shape[0]
     for i in range(n):
@@ -27,25 +34,28 @@ def _willr_kernel(highest: np.ndarray, lowest: np.ndarray, close: np.ndarray, ou
             out[i] = (-100.0) * ((hh - close[i]) / rng)
 
 
-def WILLR(high, low, close, timeperiod: int = 14):
+def WILLR(high, low, close, timeperiod: int = 14, *, axis: int = 0, out=None, output_dtype=None):
     """
     Williams' %R
     """
-    h = as_1d_float64(high)
-    l = as_1d_float64(low)
-    c = as_1d_float64(close)
+    if is_2d(high):
+        return apply_2d("WILLR", (high, low, close), (timeperiod,), axis, out, output_dtype)
+
+    h = as_1d_float(high)
+    l = as_1d_float(low)
+    c = as_1d_float(close)
     n = h.shape[0]
     if l.shape[0] != n or c.shape[0] != n:
         raise ValueError("inputs must have the same length")
 
-    tp = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+    tp = check_int_param("timeperiod", timeperiod, 2, 100000)
 
     highest = nan_like(h, dtype=np.float64)
     lowest = nan_like(h, dtype=np.float64)
     _max_kernel(h, tp, highest)
     _min_kernel(l, tp, lowest)
 
-    out = nan_like(h, dtype=np.float64)
+    out = nan_like(h, dtype=float_dtype(output_dtype), out=out, inputs=(l, c))
     _willr_kernel(highest, lowest, c, out)
     return out
 
@@ -0,0 +1,1191 @@
+from __future__ import annotations
+
+# Generated by `python tools/generate_batch_kernels.py`; do not edit by hand.
+#
+# Each `_<name>_2d` kernel evaluates the 1-D kernel of <NAME> over the rows
+# of `(n_series, n_bars)` arrays, in any memory layout, in parallel.
+
+import numpy as np
+from numba import njit, prange
+
+from numbatalib._func.ta_acos import _acos_kernel
+from numbatalib._func.ta_ad import _ad_kernel
+from numbatalib._func.ta_add import _add_kernel
+from numbatalib._func.ta_adosc import _adosc_kernel
+from numbatalib._func.ta_adx import _adx_kernel
+from numbatalib._func.ta_adxr import _adxr_kernel
+from numbatalib._func.ta_aroon import _aroon_kernel
+from numbatalib._func.ta_aroonosc import _aroonosc_kernel
+from numbatalib._func.ta_asin import _asin_kernel
+from numbatalib._func.ta_atan import _atan_kernel
+from numbatalib._func.ta_atr import _atr_kernel
+from numbatalib._func.ta_avgdev import _avgdev_kernel
+from numbatalib._func.ta_avgprice import _avgprice_kernel
+from numbatalib._func.ta_beta import _beta_kernel
+from numbatalib._func.ta_bop import _bop_kernel
+from numbatalib._func.ta_cdl2crows import _cdl2crows_kernel
+from numbatalib._func.ta_cdl3blackcrows import _cdl3blackcrows_kernel
+from numbatalib._func.ta_cdl3inside import _cdl3inside_kernel
+from numbatalib._func.ta_cdl3linestrike import _cdl3linestrike_kernel
+from numbatalib._func.ta_cdl3outside import _cdl3outside_kernel
+from numbatalib._func.ta_cdl3starsinsouth import _cdl3starsinsouth_kernel
+from numbatalib._func.ta_cdl3whitesoldiers import _cdl3whitesoldiers_kernel
+from numbatalib._func.ta_cdlabandonedbaby import _cdlabandonedbaby_kernel
+from numbatalib._func.ta_cdladvanceblock import _cdladvanceblock_kernel
+from numbatalib._func.ta_cdlbelthold import _cdlbelthold_kernel
+from numbatalib._func.ta_cdlbreakaway import _cdlbreakaway_kernel
+from numbatalib._func.ta_cdlclosingmarubozu import _cdlclosingmarubozu_kernel
+from numbatalib._func.ta_cdlconcealbabyswall import _cdlconcealbabyswall_kernel
+from numbatalib._func.ta_cdlcounterattack import _cdlcounterattack_kernel
+from numbatalib._func.ta_cdldarkcloudcover import _cdldarkcloudcover_kernel
+from numbatalib._func.ta_cdldoji import _cdldoji_kernel
+from numbatalib._func.ta_cdldojistar import _cdldojistar_kernel
+from numbatalib._func.ta_cdldragonflydoji import _cdldragonflydoji_kernel
+from numbatalib._func.ta_cdlengulfing import _cdlengulfing_kernel
+from numbatalib._func.ta_cdleveningdojistar import _cdleveningdojistar_kernel
+from numbatalib._func.ta_cdleveningstar import _cdleveningstar_kernel
+from numbatalib._func.ta_cdlgapsidesidewhite import _cdlgapsidesidewhite_kernel
+from numbatalib._func.ta_cdlgravestonedoji import _cdlgravestonedoji_kernel
+from numbatalib._func.ta_cdlhammer import _cdlhammer_kernel
+from numbatalib._func.ta_cdlhangingman import _cdlhangingman_kernel
+from numbatalib._func.ta_cdlharami import _cdlharami_kernel
+from numbatalib._func.ta_cdlharamicross import _cdlharamicross_kernel
+from numbatalib._func.ta_cdlhighwave import _cdlhighwave_kernel
+from numbatalib._func.ta_cdlhikkake import _cdlhikkake_kernel
+from numbatalib._func.ta_cdlhikkakemod import _cdlhikkakemod_kernel
+from numbatalib._func.ta_cdlhomingpigeon import _cdlhomingpigeon_kernel
+from numbatalib._func.ta_cdlidentical3crows import _cdlidentical3crows_kernel
+from numbatalib._func.ta_cdlinneck import _cdlinneck_kernel
+from numbatalib._func.ta_cdlinvertedhammer import _cdlinvertedhammer_kernel
+from numbatalib._func.ta_cdlkicking import _cdlkicking_kernel
+from numbatalib._func.ta_cdlkickingbylength import _cdlkickingbylength_kernel
+from numbatalib._func.ta_cdlladderbottom import _cdlladderbottom_kernel
+from numbatalib._func.ta_cdllongleggeddoji import _cdllongleggeddoji_kernel
+from numbatalib._func.ta_cdllongline import _cdllongline_kernel
+from numbatalib._func.ta_cdlmarubozu import _cdlmarubozu_kernel
+from numbatalib._func.ta_cdlmatchinglow import _cdlmatchinglow_kernel
+from numbatalib._func.ta_cdlmathold import _cdlmathold_kernel
+from numbatalib._func.ta_cdlmorningdojistar import _cdlmorningdojistar_kernel
+from numbatalib._func.ta_cdlmorningstar import _cdlmorningstar_kernel
+from numbatalib._func.ta_cdlonneck import _cdlonneck_kernel
+from numbatalib._func.ta_cdlpiercing import _cdlpiercing_kernel
+from numbatalib._func.ta_cdlrickshawman import _cdlrickshawman_kernel
+from numbatalib._func.ta_cdlrisefall3methods import _cdlrisefall3methods_kernel
+from numbatalib._func.ta_cdlseparatinglines import _cdlseparatinglines_kernel
+from numbatalib._func.ta_cdlshootingstar import _cdlshootingstar_kernel
+from numbatalib._func.ta_cdlshortline import _cdlshortline_kernel
+from numbatalib._func.ta_cdlspinningtop import _cdlspinningtop_kernel
+from numbatalib._func.ta_cdlstalledpattern import _cdlstalledpattern_kernel
+from numbatalib._func.ta_cdlsticksandwich import _cdlsticksandwich_kernel
+from numbatalib._func.ta_cdltakuri import _cdltakuri_kernel
+from numbatalib._func.ta_cdltasukigap import _cdltasukigap_kernel
+from numbatalib._func.ta_cdlthrusting import _cdlthrusting_kernel
+from numbatalib._func.ta_cdltristar import _cdltristar_kernel
+from numbatalib._func.ta_cdlunique3river import _cdlunique3river_kernel
+from numbatalib._func.ta_cdlupsidegap2crows import _cdlupsidegap2crows_kernel
+from numbatalib._func.ta_cdlxsidegap3methods import _cdlxsidegap3methods_kernel
+from numbatalib._func.ta_ceil import _ceil_kernel
+from numbatalib._func.ta_cmo import _cmo_kernel
+from numbatalib._func.ta_correl import _correl_kernel
+from numbatalib._func.ta_cos import _cos_kernel
+from numbatalib._func.ta_cosh import _cosh_kernel
+from numbatalib._func.ta_div import _div_kernel
+from numbatalib._func.ta_dx import _dx_kernel
+from numbatalib._func.ta_ema import _ema_kernel
+from numbatalib._func.ta_exp import _exp_kernel
+from numbatalib._func.ta_floor import _floor_kernel
+from numbatalib._func.ta_ht_dcperiod import _ht_dcperiod_kernel
+from numbatalib._func.ta_ht_dcphase import _ht_dcphase_kernel
+from numbatalib._func.ta_ht_phasor import _ht_phasor_kernel
+from numbatalib._func.ta_ht_sine import _ht_sine_kernel
+from numbatalib._func.ta_ht_trendline import _ht_trendline_kernel
+from numbatalib._func.ta_ht_trendmode import _ht_trendmode_kernel
+from numbatalib._func.ta_imi import _imi_kernel
+from numbatalib._func.ta_kama import _kama_kernel
+from numbatalib._func.ta_linearreg import _linearreg_kernel
+from numbatalib._func.ta_linearreg_angle import _linearreg_angle_kernel
+from numbatalib._func.ta_linearreg_intercept import _linearreg_intercept_kernel
+from numbatalib._func.ta_linearreg_slope import _linearreg_slope_kernel
+from numbatalib._func.ta_ln import _ln_kernel
+from numbatalib._func.ta_log10 import _log10_kernel
+from numbatalib._func.ta_macd import _macd_kernel
+from numbatalib._func.ta_mama import _mama_kernel
+from numbatalib._func.ta_max import _max_kernel
+from numbatalib._func.ta_maxindex import _maxindex_kernel
+from numbatalib._func.ta_medprice import _medprice_kernel
+from numbatalib._func.ta_mfi import _mfi_kernel
+from numbatalib._func.ta_midpoint import _midpoint_kernel
+from numbatalib._func.ta_midprice import _midprice_kernel
+from numbatalib._func.ta_min import _min_kernel
+from numbatalib._func.ta_minindex import _minindex_kernel
+from numbatalib._func.ta_minus_di import _minus_di_kernel
+from numbatalib._func.ta_minus_dm import _minus_dm_kernel
+from numbatalib._func.ta_mom import _mom_kernel
+from numbatalib._func.ta_mult import _mult_kernel
+from numbatalib._func.ta_natr import _natr_kernel
+from numbatalib._func.ta_obv import _obv_kernel
+from numbatalib._func.ta_plus_di import _plus_di_kernel
+from numbatalib._func.ta_plus_dm import _plus_dm_kernel
+from numbatalib._func.ta_roc import _roc_kernel
+from numbatalib._func.ta_rocp import _rocp_kernel
+from numbatalib._func.ta_rocr import _rocr_kernel
+from numbatalib._func.ta_rocr100 import _rocr100_kernel
+from numbatalib._func.ta_rsi import _rsi_kernel
+from numbatalib._func.ta_sar import _sar_kernel
+from numbatalib._func.ta_sarext import _sarext_kernel
+from numbatalib._func.ta_sin import _sin_kernel
+from numbatalib._func.ta_sinh import _sinh_kernel
+from numbatalib._func.ta_sma import _sma_kernel
+from numbatalib._func.ta_sqrt import _sqrt_kernel
+from numbatalib._func.ta_stddev import _stddev_kernel
+from numbatalib._func.ta_sub import _sub_kernel
+from numbatalib._func.ta_sum import _sum_kernel
+from numbatalib._func.ta_t3 import _t3_kernel
+from numbatalib._func.ta_tan import _tan_kernel
+from numbatalib._func.ta_tanh import _tanh_kernel
+from numbatalib._func.ta_trange import _trange_kernel
+from numbatalib._func.ta_tsf import _tsf_kernel
+from numbatalib._func.ta_typprice import _typprice_kernel
+from numbatalib._func.ta_ultosc import _ultosc_kernel
+from numbatalib._func.ta_var import _var_kernel
+from numbatalib._func.ta_wclprice import _wclprice_kernel
+from numbatalib._func.ta_willr import _willr_kernel
+from numbatalib._func.ta_wma import _wma_kernel
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _acos_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _acos_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ad_2d(high, low, close, volume, out0):
+    for j in prange(high.shape[0]):
+        _ad_kernel(high[j], low[j], close[j], volume[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _add_2d(real0, real1, out0):
+    for j in prange(real0.shape[0]):
+        _add_kernel(real0[j], real1[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _adosc_2d(high, low, close, volume, fastperiod, slowperiod, out0):
+    for j in prange(high.shape[0]):
+        _adosc_kernel(high[j], low[j], close[j], volume[j], fastperiod, slowperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _adx_2d(high, low, close, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        _adx_kernel(high[j], low[j], close[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _adxr_2d(high, low, close, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        adx = np.full(high.shape[1], np.nan)
+        _adx_kernel(high[j], low[j], close[j], timeperiod, adx)
+        start = (3 * timeperiod) - 2
+        if start < high.shape[1]:
+            _adxr_kernel(adx, timeperiod - 1, start, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _aroon_2d(high, low, timeperiod, out0, out1):
+    for j in prange(high.shape[0]):
+        _aroon_kernel(high[j], low[j], timeperiod, out0[j], out1[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _aroonosc_2d(high, low, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        _aroonosc_kernel(high[j], low[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _asin_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _asin_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _atan_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _atan_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _atr_2d(high, low, close, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        _atr_kernel(high[j], low[j], close[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _avgdev_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _avgdev_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _avgprice_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _avgprice_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _beta_2d(real0, real1, timeperiod, out0):
+    for j in prange(real0.shape[0]):
+        _beta_kernel(real0[j], real1[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _bop_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _bop_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdl2crows_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdl2crows_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdl3blackcrows_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdl3blackcrows_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdl3inside_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdl3inside_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdl3linestrike_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdl3linestrike_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdl3outside_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdl3outside_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdl3starsinsouth_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdl3starsinsouth_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdl3whitesoldiers_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdl3whitesoldiers_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlabandonedbaby_2d(open, high, low, close, penetration, out0):
+    for j in prange(open.shape[0]):
+        _cdlabandonedbaby_kernel(open[j], high[j], low[j], close[j], penetration, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdladvanceblock_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdladvanceblock_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlbelthold_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlbelthold_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlbreakaway_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlbreakaway_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlclosingmarubozu_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlclosingmarubozu_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlconcealbabyswall_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlconcealbabyswall_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlcounterattack_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlcounterattack_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdldarkcloudcover_2d(open, high, low, close, penetration, out0):
+    for j in prange(open.shape[0]):
+        _cdldarkcloudcover_kernel(open[j], high[j], low[j], close[j], penetration, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdldoji_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdldoji_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdldojistar_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdldojistar_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdldragonflydoji_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdldragonflydoji_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlengulfing_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlengulfing_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdleveningdojistar_2d(open, high, low, close, penetration, out0):
+    for j in prange(open.shape[0]):
+        _cdleveningdojistar_kernel(open[j], high[j], low[j], close[j], penetration, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdleveningstar_2d(open, high, low, close, penetration, out0):
+    for j in prange(open.shape[0]):
+        _cdleveningstar_kernel(open[j], high[j], low[j], close[j], penetration, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlgapsidesidewhite_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlgapsidesidewhite_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlgravestonedoji_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlgravestonedoji_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlhammer_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlhammer_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlhangingman_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlhangingman_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlharami_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlharami_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlharamicross_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlharamicross_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlhighwave_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlhighwave_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlhikkake_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlhikkake_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlhikkakemod_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlhikkakemod_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlhomingpigeon_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlhomingpigeon_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlidentical3crows_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlidentical3crows_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlinneck_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlinneck_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlinvertedhammer_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlinvertedhammer_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlkicking_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlkicking_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlkickingbylength_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlkickingbylength_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlladderbottom_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlladderbottom_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdllongleggeddoji_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdllongleggeddoji_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdllongline_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdllongline_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlmarubozu_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlmarubozu_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlmatchinglow_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlmatchinglow_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlmathold_2d(open, high, low, close, penetration, out0):
+    for j in prange(open.shape[0]):
+        _cdlmathold_kernel(open[j], high[j], low[j], close[j], penetration, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlmorningdojistar_2d(open, high, low, close, penetration, out0):
+    for j in prange(open.shape[0]):
+        _cdlmorningdojistar_kernel(open[j], high[j], low[j], close[j], penetration, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlmorningstar_2d(open, high, low, close, penetration, out0):
+    for j in prange(open.shape[0]):
+        _cdlmorningstar_kernel(open[j], high[j], low[j], close[j], penetration, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlonneck_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlonneck_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlpiercing_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlpiercing_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlrickshawman_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlrickshawman_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlrisefall3methods_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlrisefall3methods_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlseparatinglines_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlseparatinglines_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlshootingstar_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlshootingstar_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlshortline_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlshortline_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlspinningtop_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlspinningtop_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlstalledpattern_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlstalledpattern_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlsticksandwich_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlsticksandwich_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdltakuri_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdltakuri_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdltasukigap_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdltasukigap_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlthrusting_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlthrusting_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdltristar_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdltristar_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlunique3river_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlunique3river_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlupsidegap2crows_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlupsidegap2crows_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cdlxsidegap3methods_2d(open, high, low, close, out0):
+    for j in prange(open.shape[0]):
+        _cdlxsidegap3methods_kernel(open[j], high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ceil_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _ceil_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cmo_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _cmo_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _correl_2d(real0, real1, timeperiod, out0):
+    for j in prange(real0.shape[0]):
+        _correl_kernel(real0[j], real1[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cos_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _cos_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _cosh_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _cosh_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _div_2d(real0, real1, out0):
+    for j in prange(real0.shape[0]):
+        _div_kernel(real0[j], real1[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _dx_2d(high, low, close, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        _dx_kernel(high[j], low[j], close[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ema_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _ema_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _exp_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _exp_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _floor_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _floor_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ht_dcperiod_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _ht_dcperiod_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ht_dcphase_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _ht_dcphase_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ht_phasor_2d(real, out0, out1):
+    for j in prange(real.shape[0]):
+        _ht_phasor_kernel(real[j], out0[j], out1[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ht_sine_2d(real, out0, out1):
+    for j in prange(real.shape[0]):
+        _ht_sine_kernel(real[j], out0[j], out1[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ht_trendline_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _ht_trendline_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ht_trendmode_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _ht_trendmode_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _imi_2d(open, close, timeperiod, out0):
+    for j in prange(open.shape[0]):
+        _imi_kernel(open[j], close[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _kama_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _kama_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _linearreg_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _linearreg_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _linearreg_angle_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _linearreg_angle_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _linearreg_intercept_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _linearreg_intercept_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _linearreg_slope_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _linearreg_slope_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ln_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _ln_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _log10_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _log10_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _macd_2d(real, fastperiod, slowperiod, signalperiod, out0, out1, out2):
+    for j in prange(real.shape[0]):
+        _macd_kernel(real[j], fastperiod, slowperiod, signalperiod, out0[j], out1[j], out2[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _macdfix_2d(real, signalperiod, out0, out1, out2):
+    for j in prange(real.shape[0]):
+        _macd_kernel(real[j], 0, 0, signalperiod, out0[j], out1[j], out2[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _mama_2d(real, fastlimit, slowlimit, out0, out1):
+    for j in prange(real.shape[0]):
+        _mama_kernel(real[j], fastlimit, slowlimit, out0[j], out1[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _max_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _max_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _maxindex_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _maxindex_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _medprice_2d(high, low, out0):
+    for j in prange(high.shape[0]):
+        _medprice_kernel(high[j], low[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _mfi_2d(high, low, close, volume, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        pos_buf = np.zeros(timeperiod, dtype=np.float64)
+        neg_buf = np.zeros(timeperiod, dtype=np.float64)
+        _mfi_kernel(high[j], low[j], close[j], volume[j], timeperiod, pos_buf, neg_buf, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _midpoint_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _midpoint_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _midprice_2d(high, low, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        _midprice_kernel(high[j], low[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _min_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _min_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _minindex_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _minindex_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _minmax_2d(real, timeperiod, out0, out1):
+    for j in prange(real.shape[0]):
+        _min_kernel(real[j], timeperiod, out0[j])
+        _max_kernel(real[j], timeperiod, out1[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _minmaxindex_2d(real, timeperiod, out0, out1):
+    for j in prange(real.shape[0]):
+        _minindex_kernel(real[j], timeperiod, out0[j])
+        _maxindex_kernel(real[j], timeperiod, out1[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _minus_di_2d(high, low, close, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        _minus_di_kernel(high[j], low[j], close[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _minus_dm_2d(high, low, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        _minus_dm_kernel(high[j], low[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _mom_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _mom_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _mult_2d(real0, real1, out0):
+    for j in prange(real0.shape[0]):
+        _mult_kernel(real0[j], real1[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _natr_2d(high, low, close, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        _natr_kernel(high[j], low[j], close[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _obv_2d(real, volume, out0):
+    for j in prange(real.shape[0]):
+        _obv_kernel(real[j], volume[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _plus_di_2d(high, low, close, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        _plus_di_kernel(high[j], low[j], close[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _plus_dm_2d(high, low, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        _plus_dm_kernel(high[j], low[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _roc_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _roc_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _rocp_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _rocp_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _rocr_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _rocr_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _rocr100_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _rocr100_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _rsi_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _rsi_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _sar_2d(high, low, acceleration, maximum, out0):
+    for j in prange(high.shape[0]):
+        _sar_kernel(high[j], low[j], acceleration, maximum, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _sarext_2d(high, low, startvalue, offsetonreverse, accelerationinitlong, accelerationlong, accelerationmaxlong, accelerationinitshort, accelerationshort, accelerationmaxshort, out0):
+    for j in prange(high.shape[0]):
+        _sarext_kernel(high[j], low[j], startvalue, offsetonreverse, accelerationinitlong, accelerationlong, accelerationmaxlong, accelerationinitshort, accelerationshort, accelerationmaxshort, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _sin_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _sin_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _sinh_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _sinh_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _sma_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _sma_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _sqrt_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _sqrt_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _stddev_2d(real, timeperiod, nbdev, out0):
+    for j in prange(real.shape[0]):
+        _stddev_kernel(real[j], timeperiod, nbdev, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _sub_2d(real0, real1, out0):
+    for j in prange(real0.shape[0]):
+        _sub_kernel(real0[j], real1[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _sum_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _sum_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _t3_2d(real, timeperiod, vfactor, out0):
+    for j in prange(real.shape[0]):
+        _t3_kernel(real[j], timeperiod, vfactor, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _tan_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _tan_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _tanh_2d(real, out0):
+    for j in prange(real.shape[0]):
+        _tanh_kernel(real[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _trange_2d(high, low, close, out0):
+    for j in prange(high.shape[0]):
+        _trange_kernel(high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _tsf_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _tsf_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _typprice_2d(high, low, close, out0):
+    for j in prange(high.shape[0]):
+        _typprice_kernel(high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ultosc_2d(high, low, close, timeperiod1, timeperiod2, timeperiod3, out0):
+    for j in prange(high.shape[0]):
+        _ultosc_kernel(high[j], low[j], close[j], timeperiod1, timeperiod2, timeperiod3, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _var_2d(real, timeperiod, nbdev, out0):
+    for j in prange(real.shape[0]):
+        _var_kernel(real[j], timeperiod, out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _wclprice_2d(high, low, close, out0):
+    for j in prange(high.shape[0]):
+        _wclprice_kernel(high[j], low[j], close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _willr_2d(high, low, close, timeperiod, out0):
+    for j in prange(high.shape[0]):
+        highest = np.full(high.shape[1], np.nan)
+        lowest = np.full(high.shape[1], np.nan)
+        _max_kernel(high[j], timeperiod, highest)
+        _min_kernel(low[j], timeperiod, lowest)
+        _willr_kernel(highest, lowest, close[j], out0[j])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _wma_2d(real, timeperiod, out0):
+    for j in prange(real.shape[0]):
+        _wma_kernel(real[j], timeperiod, out0[j])
+
+
+BATCH_KERNELS = {
+    "ACOS": _acos_2d,
+    "AD": _ad_2d,
+    "ADD": _add_2d,
+    "ADOSC": _adosc_2d,
+    "ADX": _adx_2d,
+    "ADXR": _adxr_2d,
+    "AROON": _aroon_2d,
+    "AROONOSC": _aroonosc_2d,
+    "ASIN": _asin_2d,
+    "ATAN": _atan_2d,
+    "ATR": _atr_2d,
+    "AVGDEV": _avgdev_2d,
+    "AVGPRICE": _avgprice_2d,
+    "BETA": _beta_2d,
+    "BOP": _bop_2d,
+    "CDL2CROWS": _cdl2crows_2d,
+    "CDL3BLACKCROWS": _cdl3blackcrows_2d,
+    "CDL3INSIDE": _cdl3inside_2d,
+    "CDL3LINESTRIKE": _cdl3linestrike_2d,
+    "CDL3OUTSIDE": _cdl3outside_2d,
+    "CDL3STARSINSOUTH": _cdl3starsinsouth_2d,
+    "CDL3WHITESOLDIERS": _cdl3whitesoldiers_2d,
+    "CDLABANDONEDBABY": _cdlabandonedbaby_2d,
+    "CDLADVANCEBLOCK": _cdladvanceblock_2d,
+    "CDLBELTHOLD": _cdlbelthold_2d,
+    "CDLBREAKAWAY": _cdlbreakaway_2d,
+    "CDLCLOSINGMARUBOZU": _cdlclosingmarubozu_2d,
+    "CDLCONCEALBABYSWALL": _cdlconcealbabyswall_2d,
+    "CDLCOUNTERATTACK": _cdlcounterattack_2d,
+    "CDLDARKCLOUDCOVER": _cdldarkcloudcover_2d,
+    "CDLDOJI": _cdldoji_2d,
+    "CDLDOJISTAR": _cdldojistar_2d,
+    "CDLDRAGONFLYDOJI": _cdldragonflydoji_2d,
+    "CDLENGULFING": _cdlengulfing_2d,
+    "CDLEVENINGDOJISTAR": _cdleveningdojistar_2d,
+    "CDLEVENINGSTAR": _cdleveningstar_2d,
+    "CDLGAPSIDESIDEWHITE": _cdlgapsidesidewhite_2d,
+    "CDLGRAVESTONEDOJI": _cdlgravestonedoji_2d,
+    "CDLHAMMER": _cdlhammer_2d,
+    "CDLHANGINGMAN": _cdlhangingman_2d,
+    "CDLHARAMI": _cdlharami_2d,
+    "CDLHARAMICROSS": _cdlharamicross_2d,
+    "CDLHIGHWAVE": _cdlhighwave_2d,
+    "CDLHIKKAKE": _cdlhikkake_2d,
+    "CDLHIKKAKEMOD": _cdlhikkakemod_2d,
+    "CDLHOMINGPIGEON": _cdlhomingpigeon_2d,
+    "CDLIDENTICAL3CROWS": _cdlidentical3crows_2d,
+    "CDLINNECK": _cdlinneck_2d,
+    "CDLINVERTEDHAMMER": _cdlinvertedhammer_2d,
+    "CDLKICKING": _cdlkicking_2d,
+    "CDLKICKINGBYLENGTH": _cdlkickingbylength_2d,
+    "CDLLADDERBOTTOM": _cdlladderbottom_2d,
+    "CDLLONGLEGGEDDOJI": _cdllongleggeddoji_2d,
+    "CDLLONGLINE": _cdllongline_2d,
+    "CDLMARUBOZU": _cdlmarubozu_2d,
+    "CDLMATCHINGLOW": _cdlmatchinglow_2d,
+    "CDLMATHOLD": _cdlmathold_2d,
+    "CDLMORNINGDOJISTAR": _cdlmorningdojistar_2d,
+    "CDLMORNINGSTAR": _cdlmorningstar_2d,
+    "CDLONNECK": _cdlonneck_2d,
+    "CDLPIERCING": _cdlpiercing_2d,
+    "CDLRICKSHAWMAN": _cdlrickshawman_2d,
+    "CDLRISEFALL3METHODS": _cdlrisefall3methods_2d,
+    "CDLSEPARATINGLINES": _cdlseparatinglines_2d,
+    "CDLSHOOTINGSTAR": _cdlshootingstar_2d,
+    "CDLSHORTLINE": _cdlshortline_2d,
+    "CDLSPINNINGTOP": _cdlspinningtop_2d,
+    "CDLSTALLEDPATTERN": _cdlstalledpattern_2d,
+    "CDLSTICKSANDWICH": _cdlsticksandwich_2d,
+    "CDLTAKURI": _cdltakuri_2d,
+    "CDLTASUKIGAP": _cdltasukigap_2d,
+    "CDLTHRUSTING": _cdlthrusting_2d,
+    "CDLTRISTAR": _cdltristar_2d,
+    "CDLUNIQUE3RIVER": _cdlunique3river_2d,
+    "CDLUPSIDEGAP2CROWS": _cdlupsidegap2crows_2d,
+    "CDLXSIDEGAP3METHODS": _cdlxsidegap3methods_2d,
+    "CEIL": _ceil_2d,
+    "CMO": _cmo_2d,
+    "CORREL": _correl_2d,
+    "COS": _cos_2d,
+    "COSH": _cosh_2d,
+    "DIV": _div_2d,
+    "DX": _dx_2d,
+    "EMA": _ema_2d,
+    "EXP": _exp_2d,
+    "FLOOR": _floor_2d,
+    "HT_DCPERIOD": _ht_dcperiod_2d,
+    "HT_DCPHASE": _ht_dcphase_2d,
+    "HT_PHASOR": _ht_phasor_2d,
+    "HT_SINE": _ht_sine_2d,
+    "HT_TRENDLINE": _ht_trendline_2d,
+    "HT_TRENDMODE": _ht_trendmode_2d,
+    "IMI": _imi_2d,
+    "KAMA": _kama_2d,
+    "LINEARREG": _linearreg_2d,
+    "LINEARREG_ANGLE": _linearreg_angle_2d,
+    "LINEARREG_INTERCEPT": _linearreg_intercept_2d,
+    "LINEARREG_SLOPE": _linearreg_slope_2d,
+    "LN": _ln_2d,
+    "LOG10": _log10_2d,
+    "MACD": _macd_2d,
+    "MACDFIX": _macdfix_2d,
+    "MAMA": _mama_2d,
+    "MAX": _max_2d,
+    "MAXINDEX": _maxindex_2d,
+    "MEDPRICE": _medprice_2d,
+    "MFI": _mfi_2d,
+    "MIDPOINT": _midpoint_2d,
+    "MIDPRICE": _midprice_2d,
+    "MIN": _min_2d,
+    "MININDEX": _minindex_2d,
+    "MINMAX": _minmax_2d,
+    "MINMAXINDEX": _minmaxindex_2d,
+    "MINUS_DI": _minus_di_2d,
+    "MINUS_DM": _minus_dm_2d,
+    "MOM": _mom_2d,
+    "MULT": _mult_2d,
+    "NATR": _natr_2d,
+    "OBV": _obv_2d,
+    "PLUS_DI": _plus_di_2d,
+    "PLUS_DM": _plus_dm_2d,
+    "ROC": _roc_2d,
+    "ROCP": _rocp_2d,
+    "ROCR": _rocr_2d,
+    "ROCR100": _rocr100_2d,
+    "RSI": _rsi_2d,
+    "SAR": _sar_2d,
+    "SAREXT": _sarext_2d,
+    "SIN": _sin_2d,
+    "SINH": _sinh_2d,
+    "SMA": _sma_2d,
+    "SQRT": _sqrt_2d,
+    "STDDEV": _stddev_2d,
+    "SUB": _sub_2d,
+    "SUM": _sum_2d,
+    "T3": _t3_2d,
+    "TAN": _tan_2d,
+    "TANH": _tanh_2d,
+    "TRANGE": _trange_2d,
+    "TSF": _tsf_2d,
+    "TYPPRICE": _typprice_2d,
+    "ULTOSC": _ultosc_2d,
+    "VAR": _var_2d,
+    "WCLPRICE": _wclprice_2d,
+    "WILLR": _willr_2d,
+    "WMA": _wma_2d,
+}
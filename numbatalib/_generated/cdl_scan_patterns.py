@@ -0,0 +1,834 @@
+from __future__ import annotations
+
+# Generated by `python tools/generate_cdl_scan.py`; do not edit by hand.
+#
+# `CDL_PATTERNS` maps every candlestick pattern to (setup bars, running
+# totals) for `numbatalib._cdl_scan`; `_pattern_block` evaluates pattern
+# `code` (its position in `CDL_PATTERNS`) over bars `lo:hi` of a block
+# starting at bar `base`.
+
+from numba import njit
+
+from numbatalib._func.ta_cdl2crows import _CDL2CROWS_TOTALS, _cdl2crows_bar
+from numbatalib._func.ta_cdl3blackcrows import _CDL3BLACKCROWS_TOTALS, _cdl3blackcrows_bar
+from numbatalib._func.ta_cdl3inside import _CDL3INSIDE_TOTALS, _cdl3inside_bar
+from numbatalib._func.ta_cdl3linestrike import _CDL3LINESTRIKE_TOTALS, _cdl3linestrike_bar
+from numbatalib._func.ta_cdl3outside import _cdl3outside_bar
+from numbatalib._func.ta_cdl3starsinsouth import _CDL3STARSINSOUTH_TOTALS, _cdl3starsinsouth_bar
+from numbatalib._func.ta_cdl3whitesoldiers import _CDL3WHITESOLDIERS_TOTALS, _cdl3whitesoldiers_bar
+from numbatalib._func.ta_cdlabandonedbaby import _CDLABANDONEDBABY_TOTALS, _cdlabandonedbaby_bar
+from numbatalib._func.ta_cdladvanceblock import _CDLADVANCEBLOCK_TOTALS, _cdladvanceblock_bar
+from numbatalib._func.ta_cdlbelthold import _CDLBELTHOLD_TOTALS, _cdlbelthold_bar
+from numbatalib._func.ta_cdlbreakaway import _CDLBREAKAWAY_TOTALS, _cdlbreakaway_bar
+from numbatalib._func.ta_cdlclosingmarubozu import (
+    _CDLCLOSINGMARUBOZU_TOTALS,
+    _cdlclosingmarubozu_bar,
+)
+from numbatalib._func.ta_cdlconcealbabyswall import (
+    _CDLCONCEALBABYSWALL_TOTALS,
+    _cdlconcealbabyswall_bar,
+)
+from numbatalib._func.ta_cdlcounterattack import _CDLCOUNTERATTACK_TOTALS, _cdlcounterattack_bar
+from numbatalib._func.ta_cdldarkcloudcover import _CDLDARKCLOUDCOVER_TOTALS, _cdldarkcloudcover_bar
+from numbatalib._func.ta_cdldoji import _CDLDOJI_TOTALS, _cdldoji_bar
+from numbatalib._func.ta_cdldojistar import _CDLDOJISTAR_TOTALS, _cdldojistar_bar
+from numbatalib._func.ta_cdldragonflydoji import _CDLDRAGONFLYDOJI_TOTALS, _cdldragonflydoji_bar
+from numbatalib._func.ta_cdlengulfing import _cdlengulfing_bar
+from numbatalib._func.ta_cdleveningdojistar import (
+    _CDLEVENINGDOJISTAR_TOTALS,
+    _cdleveningdojistar_bar,
+)
+from numbatalib._func.ta_cdleveningstar import _CDLEVENINGSTAR_TOTALS, _cdleveningstar_bar
+from numbatalib._func.ta_cdlgapsidesidewhite import (
+    _CDLGAPSIDESIDEWHITE_TOTALS,
+    _cdlgapsidesidewhite_bar,
+)
+from numbatalib._func.ta_cdlgravestonedoji import _CDLGRAVESTONEDOJI_TOTALS, _cdlgravestonedoji_bar
+from numbatalib._func.ta_cdlhammer import _CDLHAMMER_TOTALS, _cdlhammer_bar
+from numbatalib._func.ta_cdlhangingman import _CDLHANGINGMAN_TOTALS, _cdlhangingman_bar
+from numbatalib._func.ta_cdlharami import _CDLHARAMI_TOTALS, _cdlharami_bar
+from numbatalib._func.ta_cdlharamicross import _CDLHARAMICROSS_TOTALS, _cdlharamicross_bar
+from numbatalib._func.ta_cdlhighwave import _CDLHIGHWAVE_TOTALS, _cdlhighwave_bar
+from numbatalib._func.ta_cdlhikkake import _CDLHIKKAKE_SETUP, _cdlhikkake_bar
+from numbatalib._func.ta_cdlhikkakemod import (
+    _CDLHIKKAKEMOD_SETUP,
+    _CDLHIKKAKEMOD_TOTALS,
+    _cdlhikkakemod_bar,
+)
+from numbatalib._func.ta_cdlhomingpigeon import _CDLHOMINGPIGEON_TOTALS, _cdlhomingpigeon_bar
+from numbatalib._func.ta_cdlidentical3crows import (
+    _CDLIDENTICAL3CROWS_TOTALS,
+    _cdlidentical3crows_bar,
+)
+from numbatalib._func.ta_cdlinneck import _CDLINNECK_TOTALS, _cdlinneck_bar
+from numbatalib._func.ta_cdlinvertedhammer import _CDLINVERTEDHAMMER_TOTALS, _cdlinvertedhammer_bar
+from numbatalib._func.ta_cdlkicking import _CDLKICKING_TOTALS, _cdlkicking_bar
+from numbatalib._func.ta_cdlkickingbylength import (
+    _CDLKICKINGBYLENGTH_TOTALS,
+    _cdlkickingbylength_bar,
+)
+from numbatalib._func.ta_cdlladderbottom import _CDLLADDERBOTTOM_TOTALS, _cdlladderbottom_bar
+from numbatalib._func.ta_cdllongleggeddoji import _CDLLONGLEGGEDDOJI_TOTALS, _cdllongleggeddoji_bar
+from numbatalib._func.ta_cdllongline import _CDLLONGLINE_TOTALS, _cdllongline_bar
+from numbatalib._func.ta_cdlmarubozu import _CDLMARUBOZU_TOTALS, _cdlmarubozu_bar
+from numbatalib._func.ta_cdlmatchinglow import _CDLMATCHINGLOW_TOTALS, _cdlmatchinglow_bar
+from numbatalib._func.ta_cdlmathold import _CDLMATHOLD_TOTALS, _cdlmathold_bar
+from numbatalib._func.ta_cdlmorningdojistar import (
+    _CDLMORNINGDOJISTAR_TOTALS,
+    _cdlmorningdojistar_bar,
+)
+from numbatalib._func.ta_cdlmorningstar import _CDLMORNINGSTAR_TOTALS, _cdlmorningstar_bar
+from numbatalib._func.ta_cdlonneck import _CDLONNECK_TOTALS, _cdlonneck_bar
+from numbatalib._func.ta_cdlpiercing import _CDLPIERCING_TOTALS, _cdlpiercing_bar
+from numbatalib._func.ta_cdlrickshawman import _CDLRICKSHAWMAN_TOTALS, _cdlrickshawman_bar
+from numbatalib._func.ta_cdlrisefall3methods import (
+    _CDLRISEFALL3METHODS_TOTALS,
+    _cdlrisefall3methods_bar,
+)
+from numbatalib._func.ta_cdlseparatinglines import (
+    _CDLSEPARATINGLINES_TOTALS,
+    _cdlseparatinglines_bar,
+)
+from numbatalib._func.ta_cdlshootingstar import _CDLSHOOTINGSTAR_TOTALS, _cdlshootingstar_bar
+from numbatalib._func.ta_cdlshortline import _CDLSHORTLINE_TOTALS, _cdlshortline_bar
+from numbatalib._func.ta_cdlspinningtop import _CDLSPINNINGTOP_TOTALS, _cdlspinningtop_bar
+from numbatalib._func.ta_cdlstalledpattern import _CDLSTALLEDPATTERN_TOTALS, _cdlstalledpattern_bar
+from numbatalib._func.ta_cdlsticksandwich import _CDLSTICKSANDWICH_TOTALS, _cdlsticksandwich_bar
+from numbatalib._func.ta_cdltakuri import _CDLTAKURI_TOTALS, _cdltakuri_bar
+from numbatalib._func.ta_cdltasukigap import _CDLTASUKIGAP_TOTALS, _cdltasukigap_bar
+from numbatalib._func.ta_cdlthrusting import _CDLTHRUSTING_TOTALS, _cdlthrusting_bar
+from numbatalib._func.ta_cdltristar import _CDLTRISTAR_TOTALS, _cdltristar_bar
+from numbatalib._func.ta_cdlunique3river import _CDLUNIQUE3RIVER_TOTALS, _cdlunique3river_bar
+from numbatalib._func.ta_cdlupsidegap2crows import (
+    _CDLUPSIDEGAP2CROWS_TOTALS,
+    _cdlupsidegap2crows_bar,
+)
+from numbatalib._func.ta_cdlxsidegap3methods import _cdlxsidegap3methods_bar
+
+
+@njit(cache=True, nogil=True)
+def _cdl2crows_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdl2crows_bar(open_, high, low, close, i, t[0, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdl3blackcrows_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdl3blackcrows_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdl3inside_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdl3inside_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdl3linestrike_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdl3linestrike_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdl3outside_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdl3outside_bar(open_, high, low, close, i) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdl3starsinsouth_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdl3starsinsouth_bar(
+                open_, high, low, close, i, t[0, j], t[1, j], t[2, j], t[3, j], t[4, j]
+            )
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdl3whitesoldiers_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdl3whitesoldiers_bar(
+                open_,
+                high,
+                low,
+                close,
+                i,
+                t[0, j],
+                t[1, j],
+                t[2, j],
+                t[3, j],
+                t[4, j],
+                t[5, j],
+                t[6, j],
+                t[7, j],
+            )
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlabandonedbaby_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlabandonedbaby_bar(
+                open_, high, low, close, i, t[0, j], t[1, j], t[2, j], penetration
+            )
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdladvanceblock_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdladvanceblock_bar(
+                open_,
+                high,
+                low,
+                close,
+                i,
+                t[0, j],
+                t[1, j],
+                t[2, j],
+                t[3, j],
+                t[4, j],
+                t[5, j],
+                t[6, j],
+                t[7, j],
+                t[8, j],
+            )
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlbelthold_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlbelthold_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlbreakaway_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlbreakaway_bar(open_, high, low, close, i, t[0, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlclosingmarubozu_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlclosingmarubozu_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlconcealbabyswall_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlconcealbabyswall_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j])
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlcounterattack_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlcounterattack_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdldarkcloudcover_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdldarkcloudcover_bar(open_, high, low, close, i, t[0, j], penetration) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdldoji_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdldoji_bar(open_, high, low, close, i, t[0, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdldojistar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdldojistar_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdldragonflydoji_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdldragonflydoji_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlengulfing_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlengulfing_bar(open_, high, low, close, i) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdleveningdojistar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdleveningdojistar_bar(
+                open_, high, low, close, i, t[0, j], t[1, j], t[2, j], penetration
+            )
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdleveningstar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdleveningstar_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j], penetration)
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlgapsidesidewhite_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlgapsidesidewhite_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlgravestonedoji_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlgravestonedoji_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlhammer_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlhammer_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j], t[3, j])
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlhangingman_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlhangingman_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j], t[3, j])
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlharami_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlharami_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlharamicross_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlharamicross_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlhighwave_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlhighwave_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlhikkake_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlhikkake_bar(open_, high, low, close, i, state) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlhikkakemod_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlhikkakemod_bar(open_, high, low, close, i, t[0, j], state) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlhomingpigeon_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlhomingpigeon_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlidentical3crows_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlidentical3crows_bar(
+                open_, high, low, close, i, t[0, j], t[1, j], t[2, j], t[3, j], t[4, j]
+            )
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlinneck_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlinneck_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlinvertedhammer_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlinvertedhammer_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j])
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlkicking_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlkicking_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j], t[3, j])
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlkickingbylength_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlkickingbylength_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j], t[3, j])
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlladderbottom_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlladderbottom_bar(open_, high, low, close, i, t[0, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdllongleggeddoji_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdllongleggeddoji_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdllongline_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdllongline_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlmarubozu_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlmarubozu_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlmatchinglow_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlmatchinglow_bar(open_, high, low, close, i, t[0, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlmathold_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlmathold_bar(
+                open_, high, low, close, i, t[0, j], t[1, j], t[2, j], t[3, j], penetration
+            )
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlmorningdojistar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlmorningdojistar_bar(
+                open_, high, low, close, i, t[0, j], t[1, j], t[2, j], penetration
+            )
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlmorningstar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlmorningstar_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j], penetration)
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlonneck_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlonneck_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlpiercing_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlpiercing_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlrickshawman_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlrickshawman_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlrisefall3methods_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlrisefall3methods_bar(
+                open_, high, low, close, i, t[0, j], t[1, j], t[2, j], t[3, j], t[4, j]
+            )
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlseparatinglines_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlseparatinglines_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j])
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlshootingstar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlshootingstar_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlshortline_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlshortline_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlspinningtop_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlspinningtop_bar(open_, high, low, close, i, t[0, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlstalledpattern_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = (
+            _cdlstalledpattern_bar(
+                open_, high, low, close, i, t[0, j], t[1, j], t[2, j], t[3, j], t[4, j], t[5, j]
+            )
+            // 100
+        )
+
+
+@njit(cache=True, nogil=True)
+def _cdlsticksandwich_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlsticksandwich_bar(open_, high, low, close, i, t[0, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdltakuri_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdltakuri_bar(open_, high, low, close, i, t[0, j], t[1, j], t[2, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdltasukigap_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdltasukigap_bar(open_, high, low, close, i, t[0, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlthrusting_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlthrusting_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdltristar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdltristar_bar(open_, high, low, close, i, t[0, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlunique3river_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlunique3river_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlupsidegap2crows_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlupsidegap2crows_bar(open_, high, low, close, i, t[0, j], t[1, j]) // 100
+
+
+@njit(cache=True, nogil=True)
+def _cdlxsidegap3methods_block(open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    for i in range(lo, hi):
+        j = i - base
+        out[j] = _cdlxsidegap3methods_bar(open_, high, low, close, i) // 100
+
+
+@njit(cache=True, nogil=True)
+def _pattern_block(code, open_, high, low, close, base, lo, hi, t, penetration, state, out):
+    if code == 0:
+        _cdl2crows_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 1:
+        _cdl3blackcrows_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 2:
+        _cdl3inside_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 3:
+        _cdl3linestrike_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 4:
+        _cdl3outside_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 5:
+        _cdl3starsinsouth_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 6:
+        _cdl3whitesoldiers_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 7:
+        _cdlabandonedbaby_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 8:
+        _cdladvanceblock_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 9:
+        _cdlbelthold_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 10:
+        _cdlbreakaway_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 11:
+        _cdlclosingmarubozu_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 12:
+        _cdlconcealbabyswall_block(
+            open_, high, low, close, base, lo, hi, t, penetration, state, out
+        )
+    elif code == 13:
+        _cdlcounterattack_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 14:
+        _cdldarkcloudcover_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 15:
+        _cdldoji_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 16:
+        _cdldojistar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 17:
+        _cdldragonflydoji_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 18:
+        _cdlengulfing_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 19:
+        _cdleveningdojistar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 20:
+        _cdleveningstar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 21:
+        _cdlgapsidesidewhite_block(
+            open_, high, low, close, base, lo, hi, t, penetration, state, out
+        )
+    elif code == 22:
+        _cdlgravestonedoji_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 23:
+        _cdlhammer_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 24:
+        _cdlhangingman_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 25:
+        _cdlharami_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 26:
+        _cdlharamicross_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 27:
+        _cdlhighwave_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 28:
+        _cdlhikkake_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 29:
+        _cdlhikkakemod_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 30:
+        _cdlhomingpigeon_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 31:
+        _cdlidentical3crows_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 32:
+        _cdlinneck_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 33:
+        _cdlinvertedhammer_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 34:
+        _cdlkicking_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 35:
+        _cdlkickingbylength_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 36:
+        _cdlladderbottom_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 37:
+        _cdllongleggeddoji_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 38:
+        _cdllongline_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 39:
+        _cdlmarubozu_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 40:
+        _cdlmatchinglow_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 41:
+        _cdlmathold_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 42:
+        _cdlmorningdojistar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 43:
+        _cdlmorningstar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 44:
+        _cdlonneck_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 45:
+        _cdlpiercing_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 46:
+        _cdlrickshawman_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 47:
+        _cdlrisefall3methods_block(
+            open_, high, low, close, base, lo, hi, t, penetration, state, out
+        )
+    elif code == 48:
+        _cdlseparatinglines_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 49:
+        _cdlshootingstar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 50:
+        _cdlshortline_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 51:
+        _cdlspinningtop_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 52:
+        _cdlstalledpattern_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 53:
+        _cdlsticksandwich_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 54:
+        _cdltakuri_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 55:
+        _cdltasukigap_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 56:
+        _cdlthrusting_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 57:
+        _cdltristar_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 58:
+        _cdlunique3river_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 59:
+        _cdlupsidegap2crows_block(open_, high, low, close, base, lo, hi, t, penetration, state, out)
+    elif code == 60:
+        _cdlxsidegap3methods_block(
+            open_, high, low, close, base, lo, hi, t, penetration, state, out
+        )
+
+
+CDL_PATTERNS = {
+    "CDL2CROWS": (0, _CDL2CROWS_TOTALS),
+    "CDL3BLACKCROWS": (0, _CDL3BLACKCROWS_TOTALS),
+    "CDL3INSIDE": (0, _CDL3INSIDE_TOTALS),
+    "CDL3LINESTRIKE": (0, _CDL3LINESTRIKE_TOTALS),
+    "CDL3OUTSIDE": (0, ()),
+    "CDL3STARSINSOUTH": (0, _CDL3STARSINSOUTH_TOTALS),
+    "CDL3WHITESOLDIERS": (0, _CDL3WHITESOLDIERS_TOTALS),
+    "CDLABANDONEDBABY": (0, _CDLABANDONEDBABY_TOTALS),
+    "CDLADVANCEBLOCK": (0, _CDLADVANCEBLOCK_TOTALS),
+    "CDLBELTHOLD": (0, _CDLBELTHOLD_TOTALS),
+    "CDLBREAKAWAY": (0, _CDLBREAKAWAY_TOTALS),
+    "CDLCLOSINGMARUBOZU": (0, _CDLCLOSINGMARUBOZU_TOTALS),
+    "CDLCONCEALBABYSWALL": (0, _CDLCONCEALBABYSWALL_TOTALS),
+    "CDLCOUNTERATTACK": (0, _CDLCOUNTERATTACK_TOTALS),
+    "CDLDARKCLOUDCOVER": (0, _CDLDARKCLOUDCOVER_TOTALS),
+    "CDLDOJI": (0, _CDLDOJI_TOTALS),
+    "CDLDOJISTAR": (0, _CDLDOJISTAR_TOTALS),
+    "CDLDRAGONFLYDOJI": (0, _CDLDRAGONFLYDOJI_TOTALS),
+    "CDLENGULFING": (0, ()),
+    "CDLEVENINGDOJISTAR": (0, _CDLEVENINGDOJISTAR_TOTALS),
+    "CDLEVENINGSTAR": (0, _CDLEVENINGSTAR_TOTALS),
+    "CDLGAPSIDESIDEWHITE": (0, _CDLGAPSIDESIDEWHITE_TOTALS),
+    "CDLGRAVESTONEDOJI": (0, _CDLGRAVESTONEDOJI_TOTALS),
+    "CDLHAMMER": (0, _CDLHAMMER_TOTALS),
+    "CDLHANGINGMAN": (0, _CDLHANGINGMAN_TOTALS),
+    "CDLHARAMI": (0, _CDLHARAMI_TOTALS),
+    "CDLHARAMICROSS": (0, _CDLHARAMICROSS_TOTALS),
+    "CDLHIGHWAVE": (0, _CDLHIGHWAVE_TOTALS),
+    "CDLHIKKAKE": (_CDLHIKKAKE_SETUP, ()),
+    "CDLHIKKAKEMOD": (_CDLHIKKAKEMOD_SETUP, _CDLHIKKAKEMOD_TOTALS),
+    "CDLHOMINGPIGEON": (0, _CDLHOMINGPIGEON_TOTALS),
+    "CDLIDENTICAL3CROWS": (0, _CDLIDENTICAL3CROWS_TOTALS),
+    "CDLINNECK": (0, _CDLINNECK_TOTALS),
+    "CDLINVERTEDHAMMER": (0, _CDLINVERTEDHAMMER_TOTALS),
+    "CDLKICKING": (0, _CDLKICKING_TOTALS),
+    "CDLKICKINGBYLENGTH": (0, _CDLKICKINGBYLENGTH_TOTALS),
+    "CDLLADDERBOTTOM": (0, _CDLLADDERBOTTOM_TOTALS),
+    "CDLLONGLEGGEDDOJI": (0, _CDLLONGLEGGEDDOJI_TOTALS),
+    "CDLLONGLINE": (0, _CDLLONGLINE_TOTALS),
+    "CDLMARUBOZU": (0, _CDLMARUBOZU_TOTALS),
+    "CDLMATCHINGLOW": (0, _CDLMATCHINGLOW_TOTALS),
+    "CDLMATHOLD": (0, _CDLMATHOLD_TOTALS),
+    "CDLMORNINGDOJISTAR": (0, _CDLMORNINGDOJISTAR_TOTALS),
+    "CDLMORNINGSTAR": (0, _CDLMORNINGSTAR_TOTALS),
+    "CDLONNECK": (0, _CDLONNECK_TOTALS),
+    "CDLPIERCING": (0, _CDLPIERCING_TOTALS),
+    "CDLRICKSHAWMAN": (0, _CDLRICKSHAWMAN_TOTALS),
+    "CDLRISEFALL3METHODS": (0, _CDLRISEFALL3METHODS_TOTALS),
+    "CDLSEPARATINGLINES": (0, _CDLSEPARATINGLINES_TOTALS),
+    "CDLSHOOTINGSTAR": (0, _CDLSHOOTINGSTAR_TOTALS),
+    "CDLSHORTLINE": (0, _CDLSHORTLINE_TOTALS),
+    "CDLSPINNINGTOP": (0, _CDLSPINNINGTOP_TOTALS),
+    "CDLSTALLEDPATTERN": (0, _CDLSTALLEDPATTERN_TOTALS),
+    "CDLSTICKSANDWICH": (0, _CDLSTICKSANDWICH_TOTALS),
+    "CDLTAKURI": (0, _CDLTAKURI_TOTALS),
+    "CDLTASUKIGAP": (0, _CDLTASUKIGAP_TOTALS),
+    "CDLTHRUSTING": (0, _CDLTHRUSTING_TOTALS),
+    "CDLTRISTAR": (0, _CDLTRISTAR_TOTALS),
+    "CDLUNIQUE3RIVER": (0, _CDLUNIQUE3RIVER_TOTALS),
+    "CDLUPSIDEGAP2CROWS": (0, _CDLUPSIDEGAP2CROWS_TOTALS),
+    "CDLXSIDEGAP3METHODS": (0, ()),
+}
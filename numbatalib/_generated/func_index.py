@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+# Generated by `python tools/generate_func_index.py`; do not edit by hand.
+
+FUNC_MODULES: dict[str, str] = {
+    "ACCBANDS": "numbatalib._func.ta_accbands",
+    "ACOS": "numbatalib._func.ta_acos",
+    "AD": "numbatalib._func.ta_ad",
+    "ADD": "numbatalib._func.ta_add",
+    "ADOSC": "numbatalib._func.ta_adosc",
+    "ADX": "numbatalib._func.ta_adx",
+    "ADXR": "numbatalib._func.ta_adxr",
+    "APO": "numbatalib._func.ta_apo",
+    "AROON": "numbatalib._func.ta_aroon",
+    "AROONOSC": "numbatalib._func.ta_aroonosc",
+    "ASIN": "numbatalib._func.ta_asin",
+    "ATAN": "numbatalib._func.ta_atan",
+    "ATR": "numbatalib._func.ta_atr",
+    "AVGDEV": "numbatalib._func.ta_avgdev",
+    "AVGPRICE": "numbatalib._func.ta_avgprice",
+    "BBANDS": "numbatalib._func.ta_bbands",
+    "BETA": "numbatalib._func.ta_beta",
+    "BOP": "numbatalib._func.ta_bop",
+    "CCI": "numbatalib._func.ta_cci",
+    "CDL2CROWS": "numbatalib._func.ta_cdl2crows",
+    "CDL3BLACKCROWS": "numbatalib._func.ta_cdl3blackcrows",
+    "CDL3INSIDE": "numbatalib._func.ta_cdl3inside",
+    "CDL3LINESTRIKE": "numbatalib._func.ta_cdl3linestrike",
+    "CDL3OUTSIDE": "numbatalib._func.ta_cdl3outside",
+    "CDL3STARSINSOUTH": "numbatalib._func.ta_cdl3starsinsouth",
+    "CDL3WHITESOLDIERS": "numbatalib._func.ta_cdl3whitesoldiers",
+    "CDLABANDONEDBABY": "numbatalib._func.ta_cdlabandonedbaby",
+    "CDLADVANCEBLOCK": "numbatalib._func.ta_cdladvanceblock",
+    "CDLBELTHOLD": "numbatalib._func.ta_cdlbelthold",
+    "CDLBREAKAWAY": "numbatalib._func.ta_cdlbreakaway",
+    "CDLCLOSINGMARUBOZU": "numbatalib._func.ta_cdlclosingmarubozu",
+    "CDLCONCEALBABYSWALL": "numbatalib._func.ta_cdlconcealbabyswall",
+    "CDLCOUNTERATTACK": "numbatalib._func.ta_cdlcounterattack",
+    "CDLDARKCLOUDCOVER": "numbatalib._func.ta_cdldarkcloudcover",
+    "CDLDOJI": "numbatalib._func.ta_cdldoji",
+    "CDLDOJISTAR": "numbatalib._func.ta_cdldojistar",
+    "CDLDRAGONFLYDOJI": "numbatalib._func.ta_cdldragonflydoji",
+    "CDLENGULFING": "numbatalib._func.ta_cdlengulfing",
+    "CDLEVENINGDOJISTAR": "numbatalib._func.ta_cdleveningdojistar",
+    "CDLEVENINGSTAR": "numbatalib._func.ta_cdleveningstar",
+    "CDLGAPSIDESIDEWHITE": "numbatalib._func.ta_cdlgapsidesidewhite",
+    "CDLGRAVESTONEDOJI": "numbatalib._func.ta_cdlgravestonedoji",
+    "CDLHAMMER": "numbatalib._func.ta_cdlhammer",
+    "CDLHANGINGMAN": "numbatalib._func.ta_cdlhangingman",
+    "CDLHARAMI": "numbatalib._func.ta_cdlharami",
+    "CDLHARAMICROSS": "numbatalib._func.ta_cdlharamicross",
+    "CDLHIGHWAVE": "numbatalib._func.ta_cdlhighwave",
+    "CDLHIKKAKE": "numbatalib._func.ta_cdlhikkake",
+    "CDLHIKKAKEMOD": "numbatalib._func.ta_cdlhikkakemod",
+    "CDLHOMINGPIGEON": "numbatalib._func.ta_cdlhomingpigeon",
+    "CDLIDENTICAL3CROWS": "numbatalib._func.ta_cdlidentical3crows",
+    "CDLINNECK": "numbatalib._func.ta_cdlinneck",
+    "CDLINVERTEDHAMMER": "numbatalib._func.ta_cdlinvertedhammer",
+    "CDLKICKING": "numbatalib._func.ta_cdlkicking",
+    "CDLKICKINGBYLENGTH": "numbatalib._func.ta_cdlkickingbylength",
+    "CDLLADDERBOTTOM": "numbatalib._func.ta_cdlladderbottom",
+    "CDLLONGLEGGEDDOJI": "numbatalib._func.ta_cdllongleggeddoji",
+    "CDLLONGLINE": "numbatalib._func.ta_cdllongline",
+    "CDLMARUBOZU": "numbatalib._func.ta_cdlmarubozu",
+    "CDLMATCHINGLOW": "numbatalib._func.ta_cdlmatchinglow",
+    "CDLMATHOLD": "numbatalib._func.ta_cdlmathold",
+    "CDLMORNINGDOJISTAR": "numbatalib._func.ta_cdlmorningdojistar",
+    "CDLMORNINGSTAR": "numbatalib._func.ta_cdlmorningstar",
+    "CDLONNECK": "numbatalib._func.ta_cdlonneck",
+    "CDLPIERCING": "numbatalib._func.ta_cdlpiercing",
+    "CDLRICKSHAWMAN": "numbatalib._func.ta_cdlrickshawman",
+    "CDLRISEFALL3METHODS": "numbatalib._func.ta_cdlrisefall3methods",
+    "CDLSEPARATINGLINES": "numbatalib._func.ta_cdlseparatinglines",
+    "CDLSHOOTINGSTAR": "numbatalib._func.ta_cdlshootingstar",
+    "CDLSHORTLINE": "numbatalib._func.ta_cdlshortline",
+    "CDLSPINNINGTOP": "numbatalib._func.ta_cdlspinningtop",
+    "CDLSTALLEDPATTERN": "numbatalib._func.ta_cdlstalledpattern",
+    "CDLSTICKSANDWICH": "numbatalib._func.ta_cdlsticksandwich",
+    "CDLTAKURI": "numbatalib._func.ta_cdltakuri",
+    "CDLTASUKIGAP": "numbatalib._func.ta_cdltasukigap",
+    "CDLTHRUSTING": "numbatalib._func.ta_cdlthrusting",
+    "CDLTRISTAR": "numbatalib._func.ta_cdltristar",
+    "CDLUNIQUE3RIVER": "numbatalib._func.ta_cdlunique3river",
+    "CDLUPSIDEGAP2CROWS": "numbatalib._func.ta_cdlupsidegap2crows",
+    "CDLXSIDEGAP3METHODS": "numbatalib._func.ta_cdlxsidegap3methods",
+    "CEIL": "numbatalib._func.ta_ceil",
+    "CMO": "numbatalib._func.ta_cmo",
+    "CORREL": "numbatalib._func.ta_correl",
+    "COS": "numbatalib._func.ta_cos",
+    "COSH": "numbatalib._func.ta_cosh",
+    "DEMA": "numbatalib._func.ta_dema",
+    "DIV": "numbatalib._func.ta_div",
+    "DX": "numbatalib._func.ta_dx",
+    "EMA": "numbatalib._func.ta_ema",
+    "EXP": "numbatalib._func.ta_exp",
+    "FLOOR": "numbatalib._func.ta_floor",
+    "HT_DCPERIOD": "numbatalib._func.ta_ht_dcperiod",
+    "HT_DCPHASE": "numbatalib._func.ta_ht_dcphase",
+    "HT_PHASOR": "numbatalib._func.ta_ht_phasor",
+    "HT_SINE": "numbatalib._func.ta_ht_sine",
+    "HT_TRENDLINE": "numbatalib._func.ta_ht_trendline",
+    "HT_TRENDMODE": "numbatalib._func.ta_ht_trendmode",
+    "IMI": "numbatalib._func.ta_imi",
+    "KAMA": "numbatalib._func.ta_kama",
+    "LINEARREG": "numbatalib._func.ta_linearreg",
+    "LINEARREG_ANGLE": "numbatalib._func.ta_linearreg_angle",
+    "LINEARREG_INTERCEPT": "numbatalib._func.ta_linearreg_intercept",
+    "LINEARREG_SLOPE": "numbatalib._func.ta_linearreg_slope",
+    "LN": "numbatalib._func.ta_ln",
+    "LOG10": "numbatalib._func.ta_log10",
+    "MA": "numbatalib._func.ta_ma",
+    "MACD": "numbatalib._func.ta_macd",
+    "MACDEXT": "numbatalib._func.ta_macdext",
+    "MACDFIX": "numbatalib._func.ta_macdfix",
+    "MAMA": "numbatalib._func.ta_mama",
+    "MAVP": "numbatalib._func.ta_mavp",
+    "MAX": "numbatalib._func.ta_max",
+    "MAXINDEX": "numbatalib._func.ta_maxindex",
+    "MEDPRICE": "numbatalib._func.ta_medprice",
+    "MFI": "numbatalib._func.ta_mfi",
+    "MIDPOINT": "numbatalib._func.ta_midpoint",
+    "MIDPRICE": "numbatalib._func.ta_midprice",
+    "MIN": "numbatalib._func.ta_min",
+    "MININDEX": "numbatalib._func.ta_minindex",
+    "MINMAX": "numbatalib._func.ta_minmax",
+    "MINMAXINDEX": "numbatalib._func.ta_minmaxindex",
+    "MINUS_DI": "numbatalib._func.ta_minus_di",
+    "MINUS_DM": "numbatalib._func.ta_minus_dm",
+    "MOM": "numbatalib._func.ta_mom",
+    "MULT": "numbatalib._func.ta_mult",
+    "NATR": "numbatalib._func.ta_natr",
+    "OBV": "numbatalib._func.ta_obv",
+    "PLUS_DI": "numbatalib._func.ta_plus_di",
+    "PLUS_DM": "numbatalib._func.ta_plus_dm",
+    "PPO": "numbatalib._func.ta_ppo",
+    "ROC": "numbatalib._func.ta_roc",
+    "ROCP": "numbatalib._func.ta_rocp",
+    "ROCR": "numbatalib._func.ta_rocr",
+    "ROCR100": "numbatalib._func.ta_rocr100",
+    "RSI": "numbatalib._func.ta_rsi",
+    "SAR": "numbatalib._func.ta_sar",
+    "SAREXT": "numbatalib._func.ta_sarext",
+    "SIN": "numbatalib._func.ta_sin",
+    "SINH": "numbatalib._func.ta_sinh",
+    "SMA": "numbatalib._func.ta_sma",
+    "SQRT": "numbatalib._func.ta_sqrt",
+    "STDDEV": "numbatalib._func.ta_stddev",
+    "STOCH": "numbatalib._func.ta_stoch",
+    "STOCHF": "numbatalib._func.ta_stochf",
+    "STOCHRSI": "numbatalib._func.ta_stochrsi",
+    "SUB": "numbatalib._func.ta_sub",
+    "SUM": "numbatalib._func.ta_sum",
+    "T3": "numbatalib._func.ta_t3",
+    "TAN": "numbatalib._func.ta_tan",
+    "TANH": "numbatalib._func.ta_tanh",
+    "TEMA": "numbatalib._func.ta_tema",
+    "TRANGE": "numbatalib._func.ta_trange",
+    "TRIMA": "numbatalib._func.ta_trima",
+    "TRIX": "numbatalib._func.ta_trix",
+    "TSF": "numbatalib._func.ta_tsf",
+    "TYPPRICE": "numbatalib._func.ta_typprice",
+    "ULTOSC": "numbatalib._func.ta_ultosc",
+    "VAR": "numbatalib._func.ta_var",
+    "WCLPRICE": "numbatalib._func.ta_wclprice",
+    "WILLR": "numbatalib._func.ta_willr",
+    "WMA": "numbatalib._func.ta_wma",
+}
@@ -0,0 +1,9259 @@
+from __future__ import annotations
+
+# Generated by `python tools/generate_kernel_signatures.py`; do not edit by hand.
+
+PROFILES = (
+    "float64",
+    "float32",
+    "int64",
+    "int32",
+    "float64-strided",
+    "float32-strided",
+    "int64-strided",
+    "int32-strided",
+)
+ALL = PROFILES
+
+# kernel -> explicit Numba signature -> profiles that compile it
+SIGNATURES: dict[str, dict[str, tuple[str, ...]]] = {
+    "numbatalib._cdl_scan._cdl_scan_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, :, :])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, :, :])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, :, :])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, :, :])": (
+            "int64",
+        ),
+    },
+    "numbatalib._cdl_scan._cdl_scan_blocks": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, ::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, ::1])": (
+            "float32-strided",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, :])": (
+            "float32",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, ::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, ::1])": (
+            "float64-strided",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, :])": (
+            "float64",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, ::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, ::1])": (
+            "int32-strided",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, :])": (
+            "int32",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, ::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, ::1])": (
+            "int64-strided",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[:, ::1], int8[::1], int8[:, :])": (
+            "int64",
+        ),
+    },
+    "numbatalib._cdl_scan._cdl_scan_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, ::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, ::1])": (
+            "float32-strided",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, :])": (
+            "float32",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, ::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, ::1])": (
+            "float64-strided",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, :])": (
+            "float64",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, ::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, ::1])": (
+            "int32-strided",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, :])": (
+            "int32",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, ::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, ::1])": (
+            "int64-strided",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64[::1], int64[::1], int64[::1], float64[::1], int64[:, ::1], int64[:, ::1], int64[::1], int64[::1], int64[::1], int8[:, :])": (
+            "int64",
+        ),
+    },
+    "numbatalib._dmi._dmi_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], int64, float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], int64, float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int64, float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64, float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._dmi._dmi_kernel": {
+        "(float32[::1], float32[::1], float32[::1], int64, float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], int64, float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], int64, float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], int64, float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int64, float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int64, float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64, float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64, float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func._candles.candle_color": {
+        "(float32[::1], float32[::1], int64)": ("float32",),
+        "(float32[:], float32[:], int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64)": ("float64",),
+        "(float64[:], float64[:], int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64)": ("int32",),
+        "(int32[:], int32[:], int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64)": ("int64",),
+        "(int64[:], int64[:], int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func._candles.candle_gap_down": {
+        "(float32[::1], float32[::1], int64, int64)": ("float32",),
+        "(float32[:], float32[:], int64, int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64, int64)": ("float64",),
+        "(float64[:], float64[:], int64, int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64, int64)": ("int32",),
+        "(int32[:], int32[:], int64, int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, int64)": ("int64",),
+        "(int64[:], int64[:], int64, int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func._candles.candle_gap_up": {
+        "(float32[::1], float32[::1], int64, int64)": ("float32",),
+        "(float32[:], float32[:], int64, int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64, int64)": ("float64",),
+        "(float64[:], float64[:], int64, int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64, int64)": ("int32",),
+        "(int32[:], int32[:], int64, int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, int64)": ("int64",),
+        "(int64[:], int64[:], int64, int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func._candles.high_low_range": {
+        "(float32[::1], float32[::1], int64)": ("float32",),
+        "(float32[:], float32[:], int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64)": ("float64",),
+        "(float64[:], float64[:], int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64)": ("int32",),
+        "(int32[:], int32[:], int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64)": ("int64",),
+        "(int64[:], int64[:], int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func._candles.lower_shadow": {
+        "(float32[::1], float32[::1], float32[::1], int64)": ("float32",),
+        "(float32[:], float32[:], float32[:], int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], int64)": ("float64",),
+        "(float64[:], float64[:], float64[:], int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func._candles.real_body": {
+        "(float32[::1], float32[::1], int64)": ("float32",),
+        "(float32[:], float32[:], int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64)": ("float64",),
+        "(float64[:], float64[:], int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64)": ("int32",),
+        "(int32[:], int32[:], int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64)": ("int64",),
+        "(int64[:], int64[:], int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func._candles.real_body_gap_down": {
+        "(float32[::1], float32[::1], int64, int64)": ("float32",),
+        "(float32[:], float32[:], int64, int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64, int64)": ("float64",),
+        "(float64[:], float64[:], int64, int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64, int64)": ("int32",),
+        "(int32[:], int32[:], int64, int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, int64)": ("int64",),
+        "(int64[:], int64[:], int64, int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func._candles.real_body_gap_up": {
+        "(float32[::1], float32[::1], int64, int64)": ("float32",),
+        "(float32[:], float32[:], int64, int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64, int64)": ("float64",),
+        "(float64[:], float64[:], int64, int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64, int64)": ("int32",),
+        "(int32[:], int32[:], int64, int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, int64)": ("int64",),
+        "(int64[:], int64[:], int64, int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func._candles.upper_shadow": {
+        "(float32[::1], float32[::1], float32[::1], int64)": ("float32",),
+        "(float32[:], float32[:], float32[:], int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], int64)": ("float64",),
+        "(float64[:], float64[:], float64[:], int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func._dmi_shared._dm_deltas": {
+        "(float64, float64, float64, float64)": ALL,
+    },
+    "numbatalib._func._dmi_shared._ta_is_zero": {
+        "(float64,)": ALL,
+    },
+    "numbatalib._func._dmi_shared._true_range": {
+        "(float64, float64, float64)": ALL,
+    },
+    "numbatalib._func.ta_accbands._accbands_transform_kernel": {
+        "(float32[::1], float32[::1], float64[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float64[::1], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[::1], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], float64[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], float64[::1], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], float64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], float64[::1], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_acos._acos_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ad._ad_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], float64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], float64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_add._add_kernel": {
+        "(float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_adosc._adosc_from_ad_kernel": {
+        "(float64[::1], int64, int64, float64[::1])": ("float64",),
+    },
+    "numbatalib._func.ta_adosc._adosc_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, float64[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, float64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, float64[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, float64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, float64[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, float64[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_adx._adx_kernel": {
+        "(float32[::1], float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_adxr._adxr_kernel": {
+        "(float64[::1], int64, int64, float64[::1])": ALL,
+    },
+    "numbatalib._func.ta_aroon._aroon_kernel": {
+        "(float32[::1], float32[::1], int64, float64[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], int64, float64[::1], float64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], int64, float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], int64, float64[::1], float64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int64, float64[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], int64, float64[::1], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, float64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64, float64[::1], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_aroonosc._aroonosc_kernel": {
+        "(float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_asin._asin_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_atan._atan_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_atr._atr_kernel": {
+        "(float32[::1], float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_atr._atr_step": {
+        "(float64, float64, int64)": ALL,
+    },
+    "numbatalib._func.ta_avgdev._avgdev_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": (
+            "float64", "int64", "int32", "float64-strided", "int64-strided", "int32-strided"
+        ),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_avgprice._avgprice_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], float64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], float64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_beta._beta_kernel": {
+        "(float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_bop._bop_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], float64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], float64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cci._cci_kernel": {
+        "(float32[::1], float64[::1], float64[::1], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], float64[::1])": (
+            "float64", "int64", "int32", "float64-strided", "int64-strided", "int32-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdl2crows._cdl2crows_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdl2crows._cdl2crows_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdl2crows._cdl2crows_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdl3blackcrows._cdl3blackcrows_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdl3blackcrows._cdl3blackcrows_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdl3blackcrows._cdl3blackcrows_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdl3inside._cdl3inside_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdl3inside._cdl3inside_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdl3inside._cdl3inside_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdl3linestrike._cdl3linestrike_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdl3linestrike._cdl3linestrike_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdl3linestrike._cdl3linestrike_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdl3outside._cdl3outside_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdl3outside._cdl3outside_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdl3outside._cdl3outside_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdl3starsinsouth._cdl3starsinsouth_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdl3starsinsouth._cdl3starsinsouth_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdl3starsinsouth._cdl3starsinsouth_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdl3whitesoldiers._cdl3whitesoldiers_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdl3whitesoldiers._cdl3whitesoldiers_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdl3whitesoldiers._cdl3whitesoldiers_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlabandonedbaby._cdlabandonedbaby_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlabandonedbaby._cdlabandonedbaby_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlabandonedbaby._cdlabandonedbaby_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1], none, none)": (
+            "int32",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1], none, none)": (
+            "int64",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdladvanceblock._cdladvanceblock_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64, float64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdladvanceblock._cdladvanceblock_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdladvanceblock._cdladvanceblock_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlbelthold._cdlbelthold_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlbelthold._cdlbelthold_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlbelthold._cdlbelthold_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlbreakaway._cdlbreakaway_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlbreakaway._cdlbreakaway_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlbreakaway._cdlbreakaway_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlclosingmarubozu._cdlclosingmarubozu_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlclosingmarubozu._cdlclosingmarubozu_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlclosingmarubozu._cdlclosingmarubozu_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlconcealbabyswall._cdlconcealbabyswall_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlconcealbabyswall._cdlconcealbabyswall_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlconcealbabyswall._cdlconcealbabyswall_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlcounterattack._cdlcounterattack_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlcounterattack._cdlcounterattack_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlcounterattack._cdlcounterattack_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdldarkcloudcover._cdldarkcloudcover_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdldarkcloudcover._cdldarkcloudcover_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdldarkcloudcover._cdldarkcloudcover_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1], none, none)": (
+            "int32",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1], none, none)": (
+            "int64",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdldoji._cdldoji_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdldoji._cdldoji_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdldoji._cdldoji_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdldojistar._cdldojistar_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdldojistar._cdldojistar_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdldojistar._cdldojistar_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdldragonflydoji._cdldragonflydoji_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdldragonflydoji._cdldragonflydoji_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdldragonflydoji._cdldragonflydoji_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlengulfing._cdlengulfing_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlengulfing._cdlengulfing_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlengulfing._cdlengulfing_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdleveningdojistar._cdleveningdojistar_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdleveningdojistar._cdleveningdojistar_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdleveningdojistar._cdleveningdojistar_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1], none, none)": (
+            "int32",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1], none, none)": (
+            "int64",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdleveningstar._cdleveningstar_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdleveningstar._cdleveningstar_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdleveningstar._cdleveningstar_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1], none, none)": (
+            "int32",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1], none, none)": (
+            "int64",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlgapsidesidewhite._cdlgapsidesidewhite_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlgapsidesidewhite._cdlgapsidesidewhite_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlgapsidesidewhite._cdlgapsidesidewhite_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlgravestonedoji._cdlgravestonedoji_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlgravestonedoji._cdlgravestonedoji_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlgravestonedoji._cdlgravestonedoji_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlhammer._cdlhammer_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlhammer._cdlhammer_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlhammer._cdlhammer_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlhangingman._cdlhangingman_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlhangingman._cdlhangingman_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlhangingman._cdlhangingman_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlharami._cdlharami_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlharami._cdlharami_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlharami._cdlharami_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlharamicross._cdlharamicross_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlharamicross._cdlharamicross_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlharamicross._cdlharamicross_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlhighwave._cdlhighwave_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlhighwave._cdlhighwave_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlhighwave._cdlhighwave_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlhikkake._cdlhikkake_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlhikkake._cdlhikkake_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlhikkake._cdlhikkake_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlhikkakemod._cdlhikkakemod_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, int64[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, int64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, int64[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, int64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, int64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, int64[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, int64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, int64[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlhikkakemod._cdlhikkakemod_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlhikkakemod._cdlhikkakemod_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlhomingpigeon._cdlhomingpigeon_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlhomingpigeon._cdlhomingpigeon_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlhomingpigeon._cdlhomingpigeon_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlidentical3crows._cdlidentical3crows_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlidentical3crows._cdlidentical3crows_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlidentical3crows._cdlidentical3crows_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlinneck._cdlinneck_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlinneck._cdlinneck_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlinneck._cdlinneck_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlinvertedhammer._cdlinvertedhammer_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlinvertedhammer._cdlinvertedhammer_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlinvertedhammer._cdlinvertedhammer_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlkicking._cdlkicking_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlkicking._cdlkicking_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlkicking._cdlkicking_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlkickingbylength._cdlkickingbylength_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlkickingbylength._cdlkickingbylength_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlkickingbylength._cdlkickingbylength_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlladderbottom._cdlladderbottom_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlladderbottom._cdlladderbottom_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlladderbottom._cdlladderbottom_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdllongleggeddoji._cdllongleggeddoji_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdllongleggeddoji._cdllongleggeddoji_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdllongleggeddoji._cdllongleggeddoji_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdllongline._cdllongline_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdllongline._cdllongline_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdllongline._cdllongline_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlmarubozu._cdlmarubozu_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlmarubozu._cdlmarubozu_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlmarubozu._cdlmarubozu_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlmatchinglow._cdlmatchinglow_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlmatchinglow._cdlmatchinglow_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlmatchinglow._cdlmatchinglow_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlmathold._cdlmathold_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlmathold._cdlmathold_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlmathold._cdlmathold_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1], none, none)": (
+            "int32",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1], none, none)": (
+            "int64",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlmorningdojistar._cdlmorningdojistar_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlmorningdojistar._cdlmorningdojistar_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlmorningdojistar._cdlmorningdojistar_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1], none, none)": (
+            "int32",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1], none, none)": (
+            "int64",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlmorningstar._cdlmorningstar_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlmorningstar._cdlmorningstar_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlmorningstar._cdlmorningstar_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], float64, none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], float64, none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64, none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], float64, none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, int32[::1], none, none)": (
+            "int32",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], float64, none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], float64, none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, int32[::1], none, none)": (
+            "int64",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], float64, none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], float64, none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlonneck._cdlonneck_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlonneck._cdlonneck_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlonneck._cdlonneck_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlpiercing._cdlpiercing_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlpiercing._cdlpiercing_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlpiercing._cdlpiercing_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlrickshawman._cdlrickshawman_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlrickshawman._cdlrickshawman_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlrickshawman._cdlrickshawman_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlrisefall3methods._cdlrisefall3methods_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlrisefall3methods._cdlrisefall3methods_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlrisefall3methods._cdlrisefall3methods_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlseparatinglines._cdlseparatinglines_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlseparatinglines._cdlseparatinglines_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlseparatinglines._cdlseparatinglines_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlshootingstar._cdlshootingstar_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlshootingstar._cdlshootingstar_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlshootingstar._cdlshootingstar_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlshortline._cdlshortline_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlshortline._cdlshortline_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlshortline._cdlshortline_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlspinningtop._cdlspinningtop_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlspinningtop._cdlspinningtop_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlspinningtop._cdlspinningtop_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlstalledpattern._cdlstalledpattern_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlstalledpattern._cdlstalledpattern_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlstalledpattern._cdlstalledpattern_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlsticksandwich._cdlsticksandwich_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlsticksandwich._cdlsticksandwich_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlsticksandwich._cdlsticksandwich_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdltakuri._cdltakuri_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64, float64)": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64, float64)": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdltakuri._cdltakuri_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdltakuri._cdltakuri_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdltasukigap._cdltasukigap_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdltasukigap._cdltasukigap_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdltasukigap._cdltasukigap_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlthrusting._cdlthrusting_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlthrusting._cdlthrusting_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlthrusting._cdlthrusting_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdltristar._cdltristar_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdltristar._cdltristar_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdltristar._cdltristar_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlunique3river._cdlunique3river_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlunique3river._cdlunique3river_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlunique3river._cdlunique3river_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlupsidegap2crows._cdlupsidegap2crows_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64, float64)": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64, float64)": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64, float64)": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64, float64)": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64, float64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64, float64)": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64, float64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64, float64)": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_cdlupsidegap2crows._cdlupsidegap2crows_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlupsidegap2crows._cdlupsidegap2crows_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_cdlxsidegap3methods._cdlxsidegap3methods_bar": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64)": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64)": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlxsidegap3methods._cdlxsidegap3methods_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cdlxsidegap3methods._cdlxsidegap3methods_run": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int32[::1], none, none)": (
+            "float32",
+        ),
+        "(float32[::1], float32[::1], float32[::1], float32[::1], none, int64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int32[::1], none, none)": (
+            "float32", "float32-strided"
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], none, int64[::1], int32[::1])": (
+            "float32-strided",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int32[::1], none, none)": (
+            "float64",
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], none, int64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int32[::1], none, none)": (
+            "float64", "float64-strided"
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], none, int64[::1], int32[::1])": (
+            "float64-strided",
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int32[::1], none, none)": ("int32",),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], none, int64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int32[::1], none, none)": (
+            "int32", "int32-strided"
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], none, int64[::1], int32[::1])": (
+            "int32-strided",
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int32[::1], none, none)": ("int64",),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], none, int64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int32[::1], none, none)": (
+            "int64", "int64-strided"
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], none, int64[::1], int32[::1])": (
+            "int64-strided",
+        ),
+    },
+    "numbatalib._func.ta_ceil._ceil_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cmo._cmo_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_correl._correl_kernel": {
+        "(float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cos._cos_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_cosh._cosh_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_div._div_kernel": {
+        "(float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_dx._dx_kernel": {
+        "(float32[::1], float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ema._ema_block_kernel": {
+        "(float64[::1], int64, int64, float64, float64[::1])": ("float64",),
+    },
+    "numbatalib._func.ta_ema._ema_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ALL,
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ema._ema_shift_kernel": {
+        "(int64, int64, float64, float64, float64[::1])": ("float64",),
+    },
+    "numbatalib._func.ta_ema._ema_step": {
+        "(float64, float32, float64)": ("float32", "float32-strided"),
+        "(float64, float64, float64)": ALL,
+        "(float64, int32, float64)": ("int32", "int32-strided"),
+        "(float64, int64, float64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_exp._exp_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_floor._floor_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ht_dcperiod._ht_dcperiod_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ht_dcphase._ht_dcphase_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ht_phasor._ht_phasor_kernel": {
+        "(float32[::1], float64[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ht_sine._ht_sine_kernel": {
+        "(float32[::1], float64[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ht_trendline._ht_trendline_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ht_trendmode._ht_trendmode_kernel": {
+        "(float32[::1], int32[::1])": ("float32",),
+        "(float32[:], int32[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int32[::1])": ("float64",),
+        "(float64[:], int32[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1])": ("int32",),
+        "(int32[:], int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int32[::1])": ("int64",),
+        "(int64[:], int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_imi._imi_kernel": {
+        "(float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_kama._kama_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ALL,
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_kama._kama_step": {
+        "(float64, float64, float64, float64)": ALL,
+    },
+    "numbatalib._func.ta_linearreg._linearreg_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_linearreg_angle._linearreg_angle_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_linearreg_intercept._linearreg_intercept_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_linearreg_slope._linearreg_slope_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ln._ln_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_log10._log10_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_macd._ema_seeded_from_idx0_kernel": {
+        "(float32[::1], int64, int64, float64, float64[::1])": ("float32",),
+        "(float32[:], int64, int64, float64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, int64, float64, float64[::1])": ("float64",),
+        "(float64[:], int64, int64, float64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, int64, float64, float64[::1])": ("int32",),
+        "(int32[:], int64, int64, float64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, int64, float64, float64[::1])": ("int64",),
+        "(int64[:], int64, int64, float64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_macd._macd_kernel": {
+        "(float32[::1], int64, int64, int64, float64[::1], float64[::1], float64[::1])": (
+            "float32",
+        ),
+        "(float32[:], int64, int64, int64, float64[::1], float64[::1], float64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], int64, int64, int64, float64[::1], float64[::1], float64[::1])": (
+            "float64",
+        ),
+        "(float64[:], int64, int64, int64, float64[::1], float64[::1], float64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int64, int64, int64, float64[::1], float64[::1], float64[::1])": ("int32",),
+        "(int32[:], int64, int64, int64, float64[::1], float64[::1], float64[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64, int64, int64, float64[::1], float64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64, int64, int64, float64[::1], float64[::1], float64[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_macd._macd_periods": {
+        "(int64, int64)": ALL,
+    },
+    "numbatalib._func.ta_mama._mama_kernel": {
+        "(float32[::1], float64, float64, float64[::1], float64[::1])": ("float32",),
+        "(float32[:], float64, float64, float64[::1], float64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64, float64, float64[::1], float64[::1])": ALL,
+        "(float64[:], float64, float64, float64[::1], float64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], float64, float64, float64[::1], float64[::1])": ("int32",),
+        "(int32[:], float64, float64, float64[::1], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64, float64, float64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64, float64, float64[::1], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_max._max_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ALL,
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_maxindex._maxindex_kernel": {
+        "(float32[::1], int64, int32[::1])": ("float32",),
+        "(float32[:], int64, int32[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, int32[::1])": ("float64",),
+        "(float64[:], int64, int32[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, int32[::1])": ("int32",),
+        "(int32[:], int64, int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, int32[::1])": ("int64",),
+        "(int64[:], int64, int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_medprice._medprice_kernel": {
+        "(float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_mfi._mfi_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, float64[::1], float64[::1], float64[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, float64[::1], float64[::1], float64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, float64[::1], float64[::1], float64[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, float64[::1], float64[::1], float64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, float64[::1], float64[::1], float64[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, float64[::1], float64[::1], float64[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, float64[::1], float64[::1], float64[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, float64[::1], float64[::1], float64[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_midpoint._midpoint_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_midprice._midprice_kernel": {
+        "(float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_min._min_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ALL,
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_minindex._minindex_kernel": {
+        "(float32[::1], int64, int32[::1])": ("float32",),
+        "(float32[:], int64, int32[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, int32[::1])": ("float64",),
+        "(float64[:], int64, int32[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, int32[::1])": ("int32",),
+        "(int32[:], int64, int32[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, int32[::1])": ("int64",),
+        "(int64[:], int64, int32[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_minus_di._minus_di_kernel": {
+        "(float32[::1], float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_minus_dm._minus_dm_kernel": {
+        "(float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_mom._mom_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_mult._mult_kernel": {
+        "(float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_natr._natr_kernel": {
+        "(float32[::1], float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_obv._obv_block_kernel": {
+        "(float64[::1], float64[::1], int64, int64, float64[::1])": ("float64",),
+    },
+    "numbatalib._func.ta_obv._obv_kernel": {
+        "(float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_plus_di._plus_di_kernel": {
+        "(float32[::1], float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_plus_dm._plus_dm_kernel": {
+        "(float32[::1], float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ppo._ppo_kernel": {
+        "(float64[::1], float64[::1], float64[::1])": ALL,
+    },
+    "numbatalib._func.ta_roc._roc_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_rocp._rocp_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_rocr._rocr_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_rocr100._rocr100_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_rsi._rsi_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_rsi._rsi_step": {
+        "(float64, float64, float32, int64)": ("float32", "float32-strided"),
+        "(float64, float64, float64, int64)": ALL,
+        "(float64, float64, int64, int64)": ("int64", "int32", "int64-strided", "int32-strided"),
+    },
+    "numbatalib._func.ta_rsi._rsi_value": {
+        "(float64, float64)": ALL,
+    },
+    "numbatalib._func.ta_sar._sar_kernel": {
+        "(float32[::1], float32[::1], float64, float64, float64[::1])": ("float32",),
+        "(float32[:], float32[:], float64, float64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64, float64, float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64, float64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], float64, float64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], float64, float64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], float64, float64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], float64, float64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_sarext._sarext_kernel": {
+        "(float32[::1], float32[::1], float64, float64, float64, float64, float64, float64, float64, float64, float64[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float64, float64, float64, float64, float64, float64, float64, float64, float64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64, float64, float64, float64, float64, float64, float64, float64, float64[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64, float64, float64, float64, float64, float64, float64, float64, float64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], float64, float64, float64, float64, float64, float64, float64, float64, float64[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], float64, float64, float64, float64, float64, float64, float64, float64, float64[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], float64, float64, float64, float64, float64, float64, float64, float64, float64[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], float64, float64, float64, float64, float64, float64, float64, float64, float64[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_sin._sin_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_sinh._sinh_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_sma._sma_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ALL,
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_sqrt._sqrt_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_stddev._stddev_kernel": {
+        "(float32[::1], int64, float64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_stoch._stoch_k_kernel": {
+        "(float32[::1], float64[::1], float64[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1], float64[::1], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1], float64[::1], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1], float64[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1], float64[::1], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1], float64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1], float64[::1], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_stochf._stoch_k_kernel": {
+        "(float32[::1], float64[::1], float64[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1], float64[::1], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1], float64[::1], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1], float64[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1], float64[::1], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1], float64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1], float64[::1], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_stochrsi._stoch_k_kernel": {
+        "(float64[::1], float64[::1], float64[::1], float64[::1])": ALL,
+    },
+    "numbatalib._func.ta_sub._sub_kernel": {
+        "(float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_sum._sum_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_t3._t3_coefficients": {
+        "(float64,)": ALL,
+    },
+    "numbatalib._func.ta_t3._t3_kernel": {
+        "(float32[::1], int64, float64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64, float64[::1])": ALL,
+        "(float64[:], int64, float64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_tan._tan_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_tanh._tanh_kernel": {
+        "(float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], float64[::1])": ("int32",),
+        "(int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], float64[::1])": ("int64",),
+        "(int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_trange._trange_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_trix._trix_roc_kernel": {
+        "(float64[::1], int64, float64[::1])": ALL,
+    },
+    "numbatalib._func.ta_tsf._tsf_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_typprice._typprice_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_ultosc._ultosc_kernel": {
+        "(float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], int64, int64, int64, float64[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], int64, int64, int64, float64[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], int64, int64, int64, float64[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], int64, int64, int64, float64[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._func.ta_ultosc._ultosc_terms": {
+        "(float32[::1], float32[::1], float32[::1], int64)": ("float32",),
+        "(float32[:], float32[:], float32[:], int64)": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], int64)": ("float64",),
+        "(float64[:], float64[:], float64[:], int64)": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], int64)": ("int32",),
+        "(int32[:], int32[:], int32[:], int64)": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], int64)": ("int64",),
+        "(int64[:], int64[:], int64[:], int64)": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_var._var_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ("float64",),
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_wclprice._wclprice_kernel": {
+        "(float32[::1], float32[::1], float32[::1], float64[::1])": ("float32",),
+        "(float32[:], float32[:], float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[:], float64[:], float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int32[::1], int32[::1], float64[::1])": ("int32",),
+        "(int32[:], int32[:], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64[::1], int64[::1], float64[::1])": ("int64",),
+        "(int64[:], int64[:], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_willr._willr_kernel": {
+        "(float64[::1], float64[::1], float32[::1], float64[::1])": ("float32",),
+        "(float64[::1], float64[::1], float32[:], float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], float64[::1], float64[::1], float64[::1])": ("float64",),
+        "(float64[::1], float64[::1], float64[:], float64[::1])": ("float64", "float64-strided"),
+        "(float64[::1], float64[::1], int32[::1], float64[::1])": ("int32",),
+        "(float64[::1], float64[::1], int32[:], float64[::1])": ("int32", "int32-strided"),
+        "(float64[::1], float64[::1], int64[::1], float64[::1])": ("int64",),
+        "(float64[::1], float64[::1], int64[:], float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._func.ta_wma._wma_kernel": {
+        "(float32[::1], int64, float64[::1])": ("float32",),
+        "(float32[:], int64, float64[::1])": ("float32", "float32-strided"),
+        "(float64[::1], int64, float64[::1])": ALL,
+        "(float64[:], int64, float64[::1])": ("float64", "float64-strided"),
+        "(int32[::1], int64, float64[::1])": ("int32",),
+        "(int32[:], int64, float64[::1])": ("int32", "int32-strided"),
+        "(int64[::1], int64, float64[::1])": ("int64",),
+        "(int64[:], int64, float64[::1])": ("int64", "int64-strided"),
+    },
+    "numbatalib._generated.batch_kernels._acos_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._ad_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], float64[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], float64[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._add_2d": {
+        "(float32[::1, :], float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._adosc_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int64, int64, float64[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int64, int64, float64[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int64, int64, float64[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int64, int64, float64[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._adx_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._adxr_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._aroon_2d": {
+        "(float32[::1, :], float32[::1, :], int64, float64[:, ::1], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], int64, float64[:, ::1], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int64, float64[:, ::1], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64, float64[:, ::1], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._aroonosc_2d": {
+        "(float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._asin_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._atan_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._atr_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._avgdev_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._avgprice_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], float64[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], float64[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._beta_2d": {
+        "(float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._bop_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], float64[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], float64[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdl2crows_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdl3blackcrows_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdl3inside_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdl3linestrike_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdl3outside_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdl3starsinsouth_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdl3whitesoldiers_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlabandonedbaby_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], float64, int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], float64, int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], float64, int32[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], float64, int32[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._cdladvanceblock_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlbelthold_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlbreakaway_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlclosingmarubozu_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlconcealbabyswall_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlcounterattack_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdldarkcloudcover_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], float64, int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], float64, int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], float64, int32[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], float64, int32[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._cdldoji_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdldojistar_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdldragonflydoji_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlengulfing_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdleveningdojistar_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], float64, int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], float64, int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], float64, int32[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], float64, int32[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._cdleveningstar_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], float64, int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], float64, int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], float64, int32[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], float64, int32[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._cdlgapsidesidewhite_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlgravestonedoji_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlhammer_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlhangingman_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlharami_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlharamicross_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlhighwave_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlhikkake_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlhikkakemod_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlhomingpigeon_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlidentical3crows_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlinneck_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlinvertedhammer_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlkicking_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlkickingbylength_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlladderbottom_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdllongleggeddoji_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdllongline_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlmarubozu_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlmatchinglow_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlmathold_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], float64, int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], float64, int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], float64, int32[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], float64, int32[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._cdlmorningdojistar_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], float64, int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], float64, int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], float64, int32[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], float64, int32[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._cdlmorningstar_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], float64, int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], float64, int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], float64, int32[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], float64, int32[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._cdlonneck_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlpiercing_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlrickshawman_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlrisefall3methods_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlseparatinglines_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlshootingstar_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlshortline_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlspinningtop_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlstalledpattern_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlsticksandwich_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdltakuri_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdltasukigap_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlthrusting_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdltristar_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlunique3river_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlupsidegap2crows_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cdlxsidegap3methods_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._ceil_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cmo_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._correl_2d": {
+        "(float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cos_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._cosh_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._div_2d": {
+        "(float32[::1, :], float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._dx_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._ema_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._exp_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._floor_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._ht_dcperiod_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._ht_dcphase_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._ht_phasor_2d": {
+        "(float32[::1, :], float64[:, ::1], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._ht_sine_2d": {
+        "(float32[::1, :], float64[:, ::1], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._ht_trendline_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._ht_trendmode_2d": {
+        "(float32[::1, :], int32[:, ::1])": ("float32",),
+        "(float64[::1, :], int32[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._imi_2d": {
+        "(float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._kama_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._linearreg_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._linearreg_angle_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._linearreg_intercept_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._linearreg_slope_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._ln_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._log10_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._macd_2d": {
+        "(float32[::1, :], int64, int64, int64, float64[:, ::1], float64[:, ::1], float64[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], int64, int64, int64, float64[:, ::1], float64[:, ::1], float64[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int64, int64, int64, float64[:, ::1], float64[:, ::1], float64[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64, int64, int64, float64[:, ::1], float64[:, ::1], float64[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._macdfix_2d": {
+        "(float32[::1, :], int64, float64[:, ::1], float64[:, ::1], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1], float64[:, ::1], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1], float64[:, ::1], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1], float64[:, ::1], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._mama_2d": {
+        "(float32[::1, :], float64, float64, float64[:, ::1], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64, float64, float64[:, ::1], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64, float64, float64[:, ::1], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64, float64, float64[:, ::1], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._max_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._maxindex_2d": {
+        "(float32[::1, :], int64, int32[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, int32[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._medprice_2d": {
+        "(float32[::1, :], float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._mfi_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float32[::1, :], int64, float64[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[::1, :], int64, float64[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int32[::1, :], int64, float64[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64[::1, :], int64, float64[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._midpoint_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._midprice_2d": {
+        "(float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._min_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._minindex_2d": {
+        "(float32[::1, :], int64, int32[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, int32[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._minmax_2d": {
+        "(float32[::1, :], int64, float64[:, ::1], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._minmaxindex_2d": {
+        "(float32[::1, :], int64, int32[:, ::1], int32[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, int32[:, ::1], int32[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, int32[:, ::1], int32[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, int32[:, ::1], int32[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._minus_di_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._minus_dm_2d": {
+        "(float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._mom_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._mult_2d": {
+        "(float32[::1, :], float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._natr_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._obv_2d": {
+        "(float32[::1, :], float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._plus_di_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._plus_dm_2d": {
+        "(float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._roc_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._rocp_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._rocr100_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._rocr_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._rsi_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._sar_2d": {
+        "(float32[::1, :], float32[::1, :], float64, float64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64, float64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], float64, float64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], float64, float64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._sarext_2d": {
+        "(float32[::1, :], float32[::1, :], float64, float64, float64, float64, float64, float64, float64, float64, float64[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64, float64, float64, float64, float64, float64, float64, float64, float64[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], float64, float64, float64, float64, float64, float64, float64, float64, float64[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], float64, float64, float64, float64, float64, float64, float64, float64, float64[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._sin_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._sinh_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._sma_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._sqrt_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._stddev_2d": {
+        "(float32[::1, :], int64, float64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._sub_2d": {
+        "(float32[::1, :], float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._sum_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._t3_2d": {
+        "(float32[::1, :], int64, float64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._tan_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._tanh_2d": {
+        "(float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._trange_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._tsf_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._typprice_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._ultosc_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], int64, int64, int64, float64[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], int64, int64, int64, float64[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int64, int64, int64, float64[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64, int64, int64, float64[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._generated.batch_kernels._var_2d": {
+        "(float32[::1, :], int64, float64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._wclprice_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._willr_2d": {
+        "(float32[::1, :], float32[::1, :], float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], float64[::1, :], float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int32[::1, :], int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64[::1, :], int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.batch_kernels._wma_2d": {
+        "(float32[::1, :], int64, float64[:, ::1])": ("float32",),
+        "(float64[::1, :], int64, float64[:, ::1])": ("float64",),
+        "(int32[::1, :], int64, float64[:, ::1])": ("int32",),
+        "(int64[::1, :], int64, float64[:, ::1])": ("int64",),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdl2crows_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdl3blackcrows_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdl3inside_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdl3linestrike_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdl3outside_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdl3starsinsouth_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdl3whitesoldiers_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlabandonedbaby_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdladvanceblock_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlbelthold_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlbreakaway_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlclosingmarubozu_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlconcealbabyswall_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlcounterattack_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdldarkcloudcover_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdldoji_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdldojistar_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdldragonflydoji_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlengulfing_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdleveningdojistar_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdleveningstar_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlgapsidesidewhite_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlgravestonedoji_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlhammer_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlhangingman_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlharami_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlharamicross_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlhighwave_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlhikkake_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlhikkakemod_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlhomingpigeon_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlidentical3crows_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlinneck_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlinvertedhammer_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlkicking_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlkickingbylength_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlladderbottom_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdllongleggeddoji_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdllongline_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlmarubozu_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlmatchinglow_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlmathold_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlmorningdojistar_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlmorningstar_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlonneck_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlpiercing_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlrickshawman_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlrisefall3methods_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlseparatinglines_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlshootingstar_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlshortline_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlspinningtop_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlstalledpattern_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlsticksandwich_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdltakuri_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdltasukigap_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlthrusting_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdltristar_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlunique3river_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlupsidegap2crows_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._cdlxsidegap3methods_block": {
+        "(float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._generated.cdl_scan_patterns._pattern_block": {
+        "(int64, float32[::1], float32[::1], float32[::1], float32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32",
+        ),
+        "(int64, float32[:], float32[:], float32[:], float32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(int64, float64[::1], float64[::1], float64[::1], float64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64",
+        ),
+        "(int64, float64[:], float64[:], float64[:], float64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int64, int32[::1], int32[::1], int32[::1], int32[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32",
+        ),
+        "(int64, int32[:], int32[:], int32[:], int32[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64, int64[::1], int64[::1], int64[::1], int64[::1], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64",
+        ),
+        "(int64, int64[:], int64[:], int64[:], int64[:], int64, int64, int64, float64[:, ::1], float64, int64[::1], int8[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._ht._hilbert_step": {
+        "(float64, int64, float64, float64[::1], float64[:, :, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1])": (
+            ALL
+        ),
+    },
+    "numbatalib._ht._ht_all_2d": {
+        "(float32[::1, :], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int32[:, ::1])": (
+            "float32",
+        ),
+        "(float64[::1, :], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int32[:, ::1])": (
+            "float64",
+        ),
+        "(int32[::1, :], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int32[:, ::1])": (
+            "int32",
+        ),
+        "(int64[::1, :], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], float64[:, ::1], int32[:, ::1])": (
+            "int64",
+        ),
+    },
+    "numbatalib._ht._ht_all_kernel": {
+        "(float32[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": (
+            "float32",
+        ),
+        "(float32[:], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": (
+            "float32", "float32-strided"
+        ),
+        "(float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": (
+            "float64",
+        ),
+        "(float64[:], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": (
+            "float64", "float64-strided"
+        ),
+        "(int32[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": (
+            "int32",
+        ),
+        "(int32[:], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": (
+            "int32", "int32-strided"
+        ),
+        "(int64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": (
+            "int64",
+        ),
+        "(int64[:], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], float64[::1], int32[::1])": (
+            "int64", "int64-strided"
+        ),
+    },
+    "numbatalib._stream._atr_update": {
+        "(float64[::1], int64[::1], int64, float64, float64, float64)": ("float64",),
+    },
+    "numbatalib._stream._atr_update_batch": {
+        "(float64[:, ::1], int64[:, ::1], int64, float64[::1], float64[::1], float64[::1], bool[::1], float64[::1])": (
+            "float64",
+        ),
+    },
+    "numbatalib._stream._ema_update": {
+        "(float64[::1], int64[::1], int64, float64)": ("float64",),
+    },
+    "numbatalib._stream._ema_update_batch": {
+        "(float64[:, ::1], int64[:, ::1], int64, float64[::1], bool[::1], float64[::1])": (
+            "float64",
+        ),
+    },
+    "numbatalib._stream._kama_update": {
+        "(float64[::1], int64[::1], float64[::1], float64)": ("float64",),
+    },
+    "numbatalib._stream._macd_update": {
+        "(float64[::1], int64[::1], int64, int64, int64, float64)": ("float64",),
+    },
+    "numbatalib._stream._macd_update_batch": {
+        "(float64[:, ::1], int64[:, ::1], int64, int64, int64, float64[::1], bool[::1], float64[::1], float64[::1], float64[::1])": (
+            "float64",
+        ),
+    },
+    "numbatalib._stream._rsi_update": {
+        "(float64[::1], int64[::1], int64, float64)": ("float64",),
+    },
+    "numbatalib._stream._rsi_update_batch": {
+        "(float64[:, ::1], int64[:, ::1], int64, float64[::1], bool[::1], float64[::1])": (
+            "float64",
+        ),
+    },
+    "numbatalib._stream._sma_update": {
+        "(float64[::1], int64[::1], float64[::1], float64)": ("float64",),
+    },
+    "numbatalib._stream._stddev_update": {
+        "(float64[::1], int64[::1], float64[::1], float64, float64)": ("float64",),
+    },
+    "numbatalib._stream._t3_update": {
+        "(float64[::1], int64[::1], int64, float64, float64)": ("float64",),
+    },
+    "numbatalib._stream._wma_update": {
+        "(float64[::1], int64[::1], float64[::1], float64)": ("float64",),
+    },
+    "numbatalib._sweep._ema_sweep": {
+        "(float32[::1], int64[::1], float64[:, ::1])": ("float32",),
+        "(float32[:], int64[::1], float64[:, ::1])": ("float32-strided",),
+        "(float64[::1], int64[::1], float64[:, ::1])": ("float64",),
+        "(float64[:], int64[::1], float64[:, ::1])": ("float64-strided",),
+        "(int32[::1], int64[::1], float64[:, ::1])": ("int32",),
+        "(int32[:], int64[::1], float64[:, ::1])": ("int32-strided",),
+        "(int64[::1], int64[::1], float64[:, ::1])": ("int64",),
+        "(int64[:], int64[::1], float64[:, ::1])": ("int64-strided",),
+    },
+    "numbatalib._sweep._max_sweep": {
+        "(float32[::1], int64[::1], float64[:, ::1])": ("float32",),
+        "(float32[:], int64[::1], float64[:, ::1])": ("float32-strided",),
+        "(float64[::1], int64[::1], float64[:, ::1])": ("float64",),
+        "(float64[:], int64[::1], float64[:, ::1])": ("float64-strided",),
+        "(int32[::1], int64[::1], float64[:, ::1])": ("int32",),
+        "(int32[:], int64[::1], float64[:, ::1])": ("int32-strided",),
+        "(int64[::1], int64[::1], float64[:, ::1])": ("int64",),
+        "(int64[:], int64[::1], float64[:, ::1])": ("int64-strided",),
+    },
+    "numbatalib._sweep._min_sweep": {
+        "(float32[::1], int64[::1], float64[:, ::1])": ("float32",),
+        "(float32[:], int64[::1], float64[:, ::1])": ("float32-strided",),
+        "(float64[::1], int64[::1], float64[:, ::1])": ("float64",),
+        "(float64[:], int64[::1], float64[:, ::1])": ("float64-strided",),
+        "(int32[::1], int64[::1], float64[:, ::1])": ("int32",),
+        "(int32[:], int64[::1], float64[:, ::1])": ("int32-strided",),
+        "(int64[::1], int64[::1], float64[:, ::1])": ("int64",),
+        "(int64[:], int64[::1], float64[:, ::1])": ("int64-strided",),
+    },
+    "numbatalib._sweep._rsi_sweep": {
+        "(float32[::1], int64[::1], float64[:, ::1])": ("float32",),
+        "(float32[:], int64[::1], float64[:, ::1])": ("float32-strided",),
+        "(float64[::1], int64[::1], float64[:, ::1])": ("float64",),
+        "(float64[:], int64[::1], float64[:, ::1])": ("float64-strided",),
+        "(int32[::1], int64[::1], float64[:, ::1])": ("int32",),
+        "(int32[:], int64[::1], float64[:, ::1])": ("int32-strided",),
+        "(int64[::1], int64[::1], float64[:, ::1])": ("int64",),
+        "(int64[:], int64[::1], float64[:, ::1])": ("int64-strided",),
+    },
+    "numbatalib._sweep._sma_sweep": {
+        "(float32[::1], int64[::1], float64[:, ::1])": ("float32",),
+        "(float32[:], int64[::1], float64[:, ::1])": ("float32-strided",),
+        "(float64[::1], int64[::1], float64[:, ::1])": ("float64",),
+        "(float64[:], int64[::1], float64[:, ::1])": ("float64-strided",),
+        "(int32[::1], int64[::1], float64[:, ::1])": ("int32",),
+        "(int32[:], int64[::1], float64[:, ::1])": ("int32-strided",),
+        "(int64[::1], int64[::1], float64[:, ::1])": ("int64",),
+        "(int64[:], int64[::1], float64[:, ::1])": ("int64-strided",),
+    },
+    "numbatalib._sweep._stddev_sweep": {
+        "(float32[::1], int64[::1], float64, float64[:, ::1])": ("float32",),
+        "(float32[:], int64[::1], float64, float64[:, ::1])": ("float32-strided",),
+        "(float64[::1], int64[::1], float64, float64[:, ::1])": ("float64",),
+        "(float64[:], int64[::1], float64, float64[:, ::1])": ("float64-strided",),
+        "(int32[::1], int64[::1], float64, float64[:, ::1])": ("int32",),
+        "(int32[:], int64[::1], float64, float64[:, ::1])": ("int32-strided",),
+        "(int64[::1], int64[::1], float64, float64[:, ::1])": ("int64",),
+        "(int64[:], int64[::1], float64, float64[:, ::1])": ("int64-strided",),
+    },
+    "numbatalib.compat.talib._metastock._ema_metastock_kernel": {
+        "(float64[::1], int64, float64[::1])": ("float64",),
+    },
+}
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+"""
+All Hilbert-transform cycle indicators from one traversal of the series.
+
+    dcperiod, dcphase, inphase, quadrature, sine, leadsine, trendline, trendmode = (
+        numbatalib.HT_ALL(close)
+    )
+
+HT_DCPERIOD, HT_DCPHASE, HT_PHASOR, HT_SINE, HT_TRENDLINE and HT_TRENDMODE
+each run the same pipeline: a 4-bar WMA price smoother, then the Hilbert
+detrender, Q1, jI and jQ filters and the period smoothing. TA-Lib starts that
+pipeline at a different bar depending on the function's lookback: bar 12 for
+HT_DCPERIOD and HT_PHASOR (lookback 32), bar 37 for the others (lookback 63).
+`HT_ALL` shares the smoother and runs the pipeline twice, once per starting
+bar, so every output is bit-identical to its individual function.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+from numbatalib._batch import apply_2d_kernel
+from numbatalib._core._validation import (
+    as_1d_float,
+    float_dtype,
+    is_2d,
+    nan_like,
+    split_outputs,
+)
+
+_OUTPUTS = (
+    "dcperiod",
+    "dcphase",
+    "inphase",
+    "quadrature",
+    "sine",
+    "leadsine",
+    "trendline",
+    "trendmode",
+)
+
+# Slots of the scalar pipeline state.
+_PERIOD = 0
+_SMOOTH_PERIOD = 1
+_PREV_I2 = 2
+_PREV_Q2 = 3
+_RE = 4
+_IM = 5
+_HILBERT_IDX = 6
+
+# Hilbert filters, first index of the filter state arrays.
+_DETRENDER = 0
+_Q1 = 1
+_JI = 2
+_JQ = 3
+
+
+@njit(cache=True, nogil=True)
+def _hilbert_filter(
+    value: float,
+    kind: int,
+    parity: int,
+    idx: int,
+    adjusted_prev_period: float,
+    hist: np.ndarray,
+    prev: np.ndarray,
+    prev_input: np.ndarray,
+) -> float:
+    """One DO_HILBERT_EVEN/ODD step, in the operation order of the HT_* kernels."""
+    hilbert_temp = 0.0962 * value
+    x = -hist[kind, parity, idx]
+    hist[kind, parity, idx] = hilbert_temp
+    x += hilbert_temp
+    x -= prev[kind, parity]
+    prev[kind, parity] = 0.5769 * prev_input[kind, parity]
+    x += prev[kind, parity]
+    prev_input[kind, parity] = value
+    x *= adjusted_prev_period
+    return x
+
+
+@njit(cache=True, nogil=True)
+def _hilbert_step(
+    smoothed_value: float,
+    today: int,
+    rad2deg: float,
+    state: np.ndarray,
+    hist: np.ndarray,
+    prev: np.ndarray,
+    prev_input: np.ndarray,
+    i1: np.ndarray,
+) -> tuple[float, float]:
+    """
+    Advance the pipeline by bar `today` and return its (inphase, quadrature).
+
+    `hist` is the (filter, parity, 3) ring of the Hilbert filters, `prev` and
+    `prev_input` their (filter, parity) feedback terms, and `i1` the
+    (lag 2 / lag 3, parity) history of the detrender.
+    """
+    adjusted_prev_period = (0.075 * state[_PERIOD]) + 0.54
+    parity = today % 2
+    other = 1 - parity
+    idx = int(state[_HILBERT_IDX])
+
+    detrender = _hilbert_filter(
+        smoothed_value, _DETRENDER, parity, idx, adjusted_prev_period, hist, prev, prev_input
+    )
+    q1 = _hilbert_filter(detrender, _Q1, parity, idx, adjusted_prev_period, hist, prev, prev_input)
+    inphase = i1[1, parity]
+    ji = _hilbert_filter(inphase, _JI, parity, idx, adjusted_prev_period, hist, prev, prev_input)
+    jq = _hilbert_filter(q1, _JQ, parity, idx, adjusted_prev_period, hist, prev, prev_input)
+    if parity == 0:
+        state[_HILBERT_IDX] = 0.0 if idx == 2 else idx + 1.0
+
+    q2 = (0.2 * (q1 + ji)) + (0.8 * state[_PREV_Q2])
+    i2 = (0.2 * (inphase - jq)) + (0.8 * state[_PREV_I2])
+    i1[1, other] = i1[0, other]
+    i1[0, other] = detrender
+
+    prev_i2 = state[_PREV_I2]
+    prev_q2 = state[_PREV_Q2]
+    re = (0.2 * ((i2 * prev_i2) + (q2 * prev_q2))) + (0.8 * state[_RE])
+    im = (0.2 * ((i2 * prev_q2) - (q2 * prev_i2))) + (0.8 * state[_IM])
+    state[_RE] = re
+    state[_IM] = im
+    state[_PREV_Q2] = q2
+    state[_PREV_I2] = i2
+
+    temp_real = state[_PERIOD]
+    period = temp_real
+    if (im != 0.0) and (re != 0.0):
+        period = 360.0 / (math.atan(im / re) * rad2deg)
+
+    temp_real2 = 1.5 * temp_real
+    if period > temp_real2:
+        period = temp_real2
+    temp_real2 = 0.67 * temp_real
+    if period < temp_real2:
+        period = temp_real2
+    if period < 6.0:
+        period = 6.0
+    elif period > 50.0:
+        period = 50.0
+    period = (0.2 * period) + (0.8 * temp_real)
+    state[_PERIOD] = period
+    state[_SMOOTH_PERIOD] = (0.33 * period) + (0.67 * state[_SMOOTH_PERIOD])
+    return inphase, q1
+
+
+@njit(cache=True, nogil=True)
+def _ht_all_kernel(
+    real: np.ndarray,
+    out_dcperiod: np.ndarray,
+    out_dcphase: np.ndarray,
+    out_inphase: np.ndarray,
+    out_quadrature: np.ndarray,
+    out_sine: np.ndarray,
+    out_leadsine: np.ndarray,
+    out_trendline: np.ndarray,
+    out_trendmode: np.ndarray,
+) -> None:
+    n = real.shape[0]
+    if n <= 32:
+        return
+
+    atan1 = math.atan(1.0)
+    rad2deg = 45.0 / atan1  # 180/pi
+    deg2rad = 1.0 / rad2deg
+    const_deg2rad_by_360 = atan1 * 8.0  # 2*pi
+
+    # Price smoother (4-period WMA), shared by both pipelines.
+    trailing_wma_idx = 0
+    today = 0
+    temp_real = np.float64(real[today])
+    today += 1
+    period_wma_sub = temp_real
+    period_wma_sum = temp_real
+    temp_real = np.float64(real[today])
+    today += 1
+    period_wma_sub += temp_real
+    period_wma_sum += temp_real * 2.0
+    temp_real = np.float64(real[today])
+    today += 1
+    period_wma_sub += temp_real
+    period_wma_sum += temp_real * 3.0
+    trailing_wma_value = 0.0
+
+    # Pipeline A (lookback 32) starts at bar 12, pipeline B (lookback 63) at bar 37.
+    state_a = np.zeros(7, dtype=np.float64)
+    hist_a = np.zeros((4, 2, 3), dtype=np.float64)
+    prev_a = np.zeros((4, 2), dtype=np.float64)
+    prev_input_a = np.zeros((4, 2), dtype=np.float64)
+    i1_a = np.zeros((2, 2), dtype=np.float64)
+    start_a = 12
+    state_b = np.zeros(7, dtype=np.float64)
+    hist_b = np.zeros((4, 2, 3), dtype=np.float64)
+    prev_b = np.zeros((4, 2), dtype=np.float64)
+    prev_input_b = np.zeros((4, 2), dtype=np.float64)
+    i1_b = np.zeros((2, 2), dtype=np.float64)
+    start_b = 37
+
+    # Pipeline B: smoothed prices, dominant cycle phase, trendline and trend mode.
+    smooth_price = np.zeros(50, dtype=np.float64)
+    smooth_price_idx = 0
+    max_smooth_idx = 49
+    dc_phase = 0.0
+    prev_dc_phase = 0.0
+    sine = 0.0
+    lead_sine = 0.0
+    prev_sine = 0.0
+    prev_lead_sine = 0.0
+    i_trend1 = 0.0
+    i_trend2 = 0.0
+    i_trend3 = 0.0
+    days_in_trend = 0
+
+    while today < n:
+        today_value = np.float64(real[today])
+        period_wma_sub += today_value
+        period_wma_sub -= trailing_wma_value
+        period_wma_sum += today_value * 4.0
+        trailing_wma_value = np.float64(real[trailing_wma_idx])
+        trailing_wma_idx += 1
+        smoothed_value = period_wma_sum * 0.1
+        period_wma_sum -= period_wma_sub
+
+        if today >= start_a:
+            inphase, quadrature = _hilbert_step(
+                smoothed_value, today, rad2deg, state_a, hist_a, prev_a, prev_input_a, i1_a
+            )
+            if today >= 32:
+                out_dcperiod[today] = state_a[_SMOOTH_PERIOD]
+                out_inphase[today] = inphase
+                out_quadrature[today] = quadrature
+
+        if today < start_b:
+            today += 1
+            continue
+
+        smooth_price[smooth_price_idx] = smoothed_value
+        _hilbert_step(smoothed_value, today, rad2deg, state_b, hist_b, prev_b, prev_input_b, i1_b)
+        smooth_period = state_b[_SMOOTH_PERIOD]
+
+        # Dominant cycle phase (DFT of smoothPrice).
+        prev_dc_phase = dc_phase
+        dc_period = smooth_period + 0.5
+        dc_period_int = int(dc_period)
+        real_part = 0.0
+        imag_part = 0.0
+
+        idx = smooth_price_idx
+        for i in range(dc_period_int):
+            ang = (float(i) * const_deg2rad_by_360) / float(dc_period_int)
+            x = smooth_price[idx]
+            real_part += math.sin(ang) * x
+            imag_part += math.cos(ang) * x
+            if idx == 0:
+                idx = max_smooth_idx
+            else:
+                idx -= 1
+
+        abs_im = math.fabs(imag_part)
+        if abs_im > 0.0:
+            dc_phase = math.atan(real_part / imag_part) * rad2deg
+        elif abs_im <= 0.01:
+            if real_part < 0.0:
+                dc_phase -= 90.0
+            elif real_part > 0.0:
+                dc_phase += 90.0
+        dc_phase += 90.0
+
+        # Compensate for one bar lag of the WMA.
+        dc_phase += 360.0 / smooth_period
+        if imag_part < 0.0:
+            dc_phase += 180.0
+        if dc_phase > 315.0:
+            dc_phase -= 360.0
+
+        prev_sine = sine
+        prev_lead_sine = lead_sine
+        sine = math.sin(dc_phase * deg2rad)
+        lead_sine = math.sin((dc_phase + 45.0) * deg2rad)
+
+        # Trendline.
+        idx = today
+        temp_real = 0.0
+        for _ in range(dc_period_int):
+            temp_real += real[idx]
+            idx -= 1
+        if dc_period_int > 0:
+            temp_real = temp_real / float(dc_period_int)
+
+        trendline = (4.0 * temp_real + 3.0 * i_trend1 + 2.0 * i_trend2 + i_trend3) / 10.0
+        i_trend3 = i_trend2
+        i_trend2 = i_trend1
+        i_trend1 = temp_real
+
+        # Trend mode.
+        trend = 1
+        if ((sine > lead_sine) and (prev_sine <= prev_lead_sine)) or (
+            (sine < lead_sine) and (prev_sine >= prev_lead_sine)
+        ):
+            days_in_trend = 0
+            trend = 0
+
+        days_in_trend += 1
+
+        if float(days_in_trend) < (0.5 * smooth_period):
+            trend = 0
+
+        temp_real = dc_phase - prev_dc_phase
+        if (smooth_period != 0.0) and (
+            (temp_real > (0.67 * 360.0 / smooth_period))
+            and (temp_real < (1.5 * 360.0 / smooth_period))
+        ):
+            trend = 0
+
+        temp_real = smooth_price[smooth_price_idx]
+        if (trendline != 0.0) and (math.fabs((temp_real - trendline) / trendline) >= 0.015):
+            trend = 1
+
+        if today >= 63:
+            out_dcphase[today] = dc_phase
+            out_sine[today] = sine
+            out_leadsine[today] = lead_sine
+            out_trendline[today] = trendline
+            out_trendmode[today] = trend
+
+        smooth_price_idx += 1
+        if smooth_price_idx > max_smooth_idx:
+            smooth_price_idx = 0
+        today += 1
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ht_all_2d(real, out0, out1, out2, out3, out4, out5, out6, out7):
+    for j in prange(real.shape[0]):
+        _ht_all_kernel(
+            real[j], out0[j], out1[j], out2[j], out3[j], out4[j], out5[j], out6[j], out7[j]
+        )
+
+
+def HT_ALL(real, *, axis: int = 0, out=None, output_dtype=None):
+    """
+    Hilbert Transform - all cycle indicators in one pass
+
+    Returns (dcperiod, dcphase, inphase, quadrature, sine, leadsine,
+    trendline, trendmode), each bit-identical to the output of HT_DCPERIOD,
+    HT_DCPHASE, HT_PHASOR, HT_SINE, HT_TRENDLINE and HT_TRENDMODE. trendmode
+    is an int32 array; the others follow `output_dtype`. `out` is an optional
+    tuple of the eight output arrays.
+    """
+    outs = split_outputs(out, len(_OUTPUTS))
+    real_dtype = float_dtype(output_dtype)
+    dtypes = [real_dtype] * (len(_OUTPUTS) - 1) + [np.dtype(np.int32)]
+
+    if is_2d(real):
+        return apply_2d_kernel(_ht_all_2d, (real,), (), dtypes, axis, outs)
+
+    real_arr = as_1d_float(real)
+    results = [nan_like(real_arr, dtype=dt, out=buf) for dt, buf in zip(dtypes, outs)]
+    _ht_all_kernel(real_arr, *results)
+    return tuple(results)
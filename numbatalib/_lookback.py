@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+"""
+Lookback (number of leading bars without output) of every function.
+
+Mirrors TA-Lib's `TA_<NAME>_Lookback` with the default compatibility mode,
+i.e. the length of the NaN prefix produced by the functions in
+`numbatalib/_func`. Unstable periods (`TA_SetUnstablePeriod`) are passed as a
+mapping from the TA-Lib unstable-function name to a bar count and propagate
+into composite functions the same way they do in TA-Lib (e.g. the EMA
+unstable period counts twice in DEMA and MACD).
+"""
+
+import inspect
+from functools import lru_cache
+from typing import Any, Callable, Mapping
+
+from numbatalib._core._params import param_specs, validate_params
+from numbatalib._func.ta_ma import _ma_lookback
+from numbatalib._registry import get_function
+
+
+# Candlestick patterns do not depend on parameters; values follow TA-Lib's
+# default candle settings (averaging periods plus the bars in the pattern).
+_CDL_LOOKBACKS: dict[str, int] = {
+    "CDL2CROWS": 12,
+    "CDL3BLACKCROWS": 13,
+    "CDL3INSIDE": 12,
+    "CDL3LINESTRIKE": 8,
+    "CDL3OUTSIDE": 3,
+    "CDL3STARSINSOUTH": 12,
+    "CDL3WHITESOLDIERS": 12,
+    "CDLABANDONEDBABY": 12,
+    "CDLADVANCEBLOCK": 12,
+    "CDLBELTHOLD": 10,
+    "CDLBREAKAWAY": 14,
+    "CDLCLOSINGMARUBOZU": 10,
+    "CDLCONCEALBABYSWALL": 13,
+    "CDLCOUNTERATTACK": 11,
+    "CDLDARKCLOUDCOVER": 11,
+    "CDLDOJI": 10,
+    "CDLDOJISTAR": 11,
+    "CDLDRAGONFLYDOJI": 10,
+    "CDLENGULFING": 2,
+    "CDLEVENINGDOJISTAR": 12,
+    "CDLEVENINGSTAR": 12,
+    "CDLGAPSIDESIDEWHITE": 7,
+    "CDLGRAVESTONEDOJI": 10,
+    "CDLHAMMER": 11,
+    "CDLHANGINGMAN": 11,
+    "CDLHARAMI": 11,
+    "CDLHARAMICROSS": 11,
+    "CDLHIGHWAVE": 10,
+    "CDLHIKKAKE": 5,
+    "CDLHIKKAKEMOD": 10,
+    "CDLHOMINGPIGEON": 11,
+    "CDLIDENTICAL3CROWS": 12,
+    "CDLINNECK": 11,
+    "CDLINVERTEDHAMMER": 11,
+    "CDLKICKING": 11,
+    "CDLKICKINGBYLENGTH": 11,
+    "CDLLADDERBOTTOM": 14,
+    "CDLLONGLEGGEDDOJI": 10,
+    "CDLLONGLINE": 10,
+    "CDLMARUBOZU": 10,
+    "CDLMATCHINGLOW": 6,
+    "CDLMATHOLD": 14,
+    "CDLMORNINGDOJISTAR": 12,
+    "CDLMORNINGSTAR": 12,
+    "CDLONNECK": 11,
+    "CDLPIERCING": 11,
+    "CDLRICKSHAWMAN": 10,
+    "CDLRISEFALL3METHODS": 14,
+    "CDLSEPARATINGLINES": 11,
+    "CDLSHOOTINGSTAR": 11,
+    "CDLSHORTLINE": 10,
+    "CDLSPINNINGTOP": 10,
+    "CDLSTALLEDPATTERN": 12,
+    "CDLSTICKSANDWICH": 7,
+    "CDLTAKURI": 10,
+    "CDLTASUKIGAP": 7,
+    "CDLTHRUSTING": 11,
+    "CDLTRISTAR": 12,
+    "CDLUNIQUE3RIVER": 12,
+    "CDLUPSIDEGAP2CROWS": 12,
+    "CDLXSIDEGAP3METHODS": 2,
+}
+
+_ZERO_LOOKBACK = (
+    "ACOS",
+    "AD",
+    "ADD",
+    "ASIN",
+    "ATAN",
+    "AVGPRICE",
+    "BOP",
+    "CEIL",
+    "COS",
+    "COSH",
+    "DIV",
+    "EXP",
+    "FLOOR",
+    "LN",
+    "LOG10",
+    "MEDPRICE",
+    "MULT",
+    "OBV",
+    "SIN",
+    "SINH",
+    "SQRT",
+    "SUB",
+    "TAN",
+    "TANH",
+    "TYPPRICE",
+    "WCLPRICE",
+)
+
+# Functions whose lookback is `timeperiod - 1`.
+_WINDOW_LOOKBACK = (
+    "ACCBANDS",
+    "AVGDEV",
+    "CCI",
+    "CORREL",
+    "LINEARREG",
+    "LINEARREG_ANGLE",
+    "LINEARREG_INTERCEPT",
+    "LINEARREG_SLOPE",
+    "MAX",
+    "MAXINDEX",
+    "MIDPOINT",
+    "MIDPRICE",
+    "MIN",
+    "MININDEX",
+    "MINMAX",
+    "MINMAXINDEX",
+    "SMA",
+    "STDDEV",
+    "SUM",
+    "TRIMA",
+    "TSF",
+    "VAR",
+    "WILLR",
+    "WMA",
+)
+
+# Functions whose lookback is `timeperiod`.
+_PERIOD_LOOKBACK = (
+    "AROON",
+    "AROONOSC",
+    "ATR",
+    "BETA",
+    "MOM",
+    "ROC",
+    "ROCP",
+    "ROCR",
+    "ROCR100",
+)
+
+
+Unstable = Mapping[str, int]
+
+_NO_UNSTABLE: Unstable = {}
+
+
+def _const(value: int, unstable_name: str | None = None) -> Callable[..., int]:
+    if unstable_name is None:
+        return lambda u, *_params: value
+    return lambda u, *_params: value + u.get(unstable_name, 0)
+
+
+def _window(u: Unstable, timeperiod: int, *_params: Any) -> int:
+    return timeperiod - 1
+
+
+def _period(u: Unstable, timeperiod: int, *_params: Any) -> int:
+    return timeperiod
+
+
+def _unstable_window(unstable_name: str) -> Callable[..., int]:
+    return lambda u, timeperiod, *_params: timeperiod - 1 + u.get(unstable_name, 0)
+
+
+def _unstable_period(unstable_name: str) -> Callable[..., int]:
+    return lambda u, timeperiod, *_params: timeperiod + u.get(unstable_name, 0)
+
+
+def _ema_lookback(u: Unstable, timeperiod: int) -> int:
+    return timeperiod - 1 + u.get("EMA", 0)
+
+
+def _ma_lookback_unstable(u: Unstable, timeperiod: int, matype: int) -> int:
+    lb = _ma_lookback(timeperiod, matype)
+    if timeperiod <= 1:
+        return lb
+    if matype in (1, 3, 4):  # EMA/DEMA/TEMA chain 1/2/3 EMAs
+        return lb + (matype - 1 or 1) * u.get("EMA", 0)
+    extra = {6: "KAMA", 7: "MAMA", 8: "T3"}.get(matype)
+    return lb + (u.get(extra, 0) if extra is not None else 0)
+
+
+def _dm_lookback(unstable_name: str) -> Callable[..., int]:
+    return lambda u, timeperiod: (
+        timeperiod - 1 + u.get(unstable_name, 0) if timeperiod > 1 else 1
+    )
+
+
+def _di_lookback(unstable_name: str) -> Callable[..., int]:
+    return lambda u, timeperiod: timeperiod + u.get(unstable_name, 0) if timeperiod > 1 else 1
+
+
+def _adx_lookback(u: Unstable, timeperiod: int) -> int:
+    return (2 * timeperiod) - 1 + u.get("ADX", 0)
+
+
+def _macd_lookback(u: Unstable, fastperiod: int, slowperiod: int, signalperiod: int) -> int:
+    # TA-Lib uses the fixed 12/26 periods when fast/slow are 0 (MACDFIX).
+    slow = max(fastperiod, slowperiod) or 26
+    return _ema_lookback(u, slow) + _ema_lookback(u, signalperiod)
+
+
+def _macdext_lookback(
+    u: Unstable,
+    fastperiod: int,
+    fastmatype: int,
+    slowperiod: int,
+    slowmatype: int,
+    signalperiod: int,
+    signalmatype: int,
+) -> int:
+    largest = max(
+        _ma_lookback_unstable(u, fastperiod, fastmatype),
+        _ma_lookback_unstable(u, slowperiod, slowmatype),
+    )
+    return largest + _ma_lookback_unstable(u, signalperiod, signalmatype)
+
+
+def _stochf_lookback(u: Unstable, fastk_period: int, fastd_period: int, fastd_matype: int) -> int:
+    return (fastk_period - 1) + _ma_lookback_unstable(u, fastd_period, fastd_matype)
+
+
+def _stoch_lookback(
+    u: Unstable,
+    fastk_period: int,
+    slowk_period: int,
+    slowk_matype: int,
+    slowd_period: int,
+    slowd_matype: int,
+) -> int:
+    return (
+        (fastk_period - 1)
+        + _ma_lookback_unstable(u, slowk_period, slowk_matype)
+        + _ma_lookback_unstable(u, slowd_period, slowd_matype)
+    )
+
+
+def _apo_lookback(u: Unstable, fastperiod: int, slowperiod: int, matype: int) -> int:
+    return _ma_lookback_unstable(u, max(fastperiod, slowperiod), matype)
+
+
+_LOOKBACKS: dict[str, Callable[..., int]] = {
+    **{name: _const(0) for name in _ZERO_LOOKBACK},
+    **{name: _const(lb) for name, lb in _CDL_LOOKBACKS.items()},
+    **{name: _window for name in _WINDOW_LOOKBACK},
+    **{name: _period for name in _PERIOD_LOOKBACK},
+    **{name: _unstable_period(name) for name in ("ATR", "CMO", "KAMA", "MFI", "NATR", "RSI")},
+    "ADOSC": lambda u, fastperiod, slowperiod: _ema_lookback(u, max(fastperiod, slowperiod)),
+    "ADX": _adx_lookback,
+    "ADXR": lambda u, timeperiod: timeperiod + _adx_lookback(u, timeperiod) - 1,
+    "APO": _apo_lookback,
+    "BBANDS": lambda u, timeperiod, nbdevup, nbdevdn, matype: _ma_lookback_unstable(
+        u, timeperiod, matype
+    ),
+    "DEMA": lambda u, timeperiod: 2 * _ema_lookback(u, timeperiod),
+    "DX": lambda u, timeperiod: timeperiod + u.get("DX", 0) if timeperiod > 1 else 2,
+    "EMA": _ema_lookback,
+    "HT_DCPERIOD": _const(32, "HT_DCPERIOD"),
+    "HT_DCPHASE": _const(63, "HT_DCPHASE"),
+    "HT_PHASOR": _const(32, "HT_PHASOR"),
+    "HT_SINE": _const(63, "HT_SINE"),
+    "HT_TRENDLINE": _const(63, "HT_TRENDLINE"),
+    "HT_TRENDMODE": _const(63, "HT_TRENDMODE"),
+    "IMI": _unstable_window("IMI"),
+    "MA": _ma_lookback_unstable,
+    "MACD": _macd_lookback,
+    "MACDEXT": _macdext_lookback,
+    "MACDFIX": lambda u, signalperiod: _macd_lookback(u, 0, 0, signalperiod),
+    "MAMA": _const(32, "MAMA"),
+    "MAVP": lambda u, minperiod, maxperiod, matype: _ma_lookback_unstable(u, maxperiod, matype),
+    "MINUS_DI": _di_lookback("MINUS_DI"),
+    "MINUS_DM": _dm_lookback("MINUS_DM"),
+    "PLUS_DI": _di_lookback("PLUS_DI"),
+    "PLUS_DM": _dm_lookback("PLUS_DM"),
+    "PPO": _apo_lookback,
+    "SAR": _const(1),
+    "SAREXT": _const(1),
+    "STOCH": _stoch_lookback,
+    "STOCHF": _stochf_lookback,
+    "STOCHRSI": lambda u, timeperiod, fastk_period, fastd_period, fastd_matype: (
+        timeperiod + u.get("RSI", 0) + _stochf_lookback(u, fastk_period, fastd_period, fastd_matype)
+    ),
+    "T3": lambda u, timeperiod, vfactor: 6 * (timeperiod - 1) + u.get("T3", 0),
+    "TEMA": lambda u, timeperiod: 3 * _ema_lookback(u, timeperiod),
+    "TRANGE": _const(1),
+    "TRIX": lambda u, timeperiod: 3 * _ema_lookback(u, timeperiod) + 1,
+    "ULTOSC": lambda u, timeperiod1, timeperiod2, timeperiod3: max(
+        timeperiod1, timeperiod2, timeperiod3
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _defaults(func_name: str) -> dict[str, Any]:
+    fn = get_function(func_name)
+    sig = inspect.signature(fn)
+    return {spec.name: sig.parameters[spec.name].default for spec in param_specs(func_name)}
+
+
+def resolve_params(func_name: str, params: dict[str, Any]) -> tuple[Any, ...]:
+    """Validated optional parameters of `func_name` in signature order (defaults filled in)."""
+    defaults = _defaults(func_name)
+    unknown = set(params) - set(defaults)
+    if unknown:
+        raise ValueError(f"{func_name} has no parameter {sorted(unknown)[0]}")
+    merged = {**defaults, **params}
+    return validate_params(func_name, tuple(merged[name] for name in defaults))
+
+
+def lookback(func_name: str, unstable_periods: Unstable | None = None, **params: Any) -> int:
+    """
+    Number of leading bars `func_name` needs before its first output.
+
+    `unstable_periods` maps TA-Lib unstable-function names (``"EMA"``,
+    ``"RSI"``, ``"ADX"``, ...) to extra warm-up bars, as set with
+    `TA_SetUnstablePeriod`; unlisted names count as 0.
+    """
+    if func_name not in _LOOKBACKS:
+        raise ValueError(f"unknown function: {func_name}")
+    u = _NO_UNSTABLE if unstable_periods is None else unstable_periods
+    if any(int(v) < 0 for v in u.values()):
+        raise ValueError("unstable periods must be >= 0")
+    return int(_LOOKBACKS[func_name](u, *resolve_params(func_name, params)))
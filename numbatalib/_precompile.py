@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+"""
+Eager compilation of explicitly declared kernel signatures.
+
+Kernels are `@njit` dispatchers that specialize lazily on the first call
+with new argument types, which puts the compilation inside the first live
+request. `numbatalib/_generated/kernel_signatures.py` declares the explicit
+signature of every kernel specialization per profile (input dtype, and
+contiguous or strided 1-D inputs). `precompile()` compiles those
+signatures up front, or loads them from Numba's on-disk cache:
+
+    numbatalib.precompile("float64", "float32")
+
+Setting `NUMBATALIB_PRECOMPILE=float64,float32` does the same when
+`numbatalib` is imported. Signatures outside the requested profiles
+(e.g. `output_dtype=np.float32`) still compile lazily.
+"""
+
+import importlib
+from typing import Any
+
+
+def _dispatcher(kernel: str) -> Any:
+    module, name = kernel.rsplit(".", 1)
+    return getattr(importlib.import_module(module), name)
+
+
+def precompile(*profiles: str) -> int:
+    """
+    Compile every kernel for the declared signatures of `profiles`.
+
+    Profiles are `"float64"`, `"float32"`, `"int64"`, `"int32"` and their
+    `"-strided"` variants (non-contiguous 1-D inputs); the default is
+    `"float64"`. Returns the number of signatures compiled or loaded.
+    """
+    from numbatalib._generated.kernel_signatures import PROFILES, SIGNATURES
+
+    wanted = set(profiles or ("float64",))
+    unknown = sorted(wanted - set(PROFILES))
+    if unknown:
+        raise ValueError(f"unknown precompile profile: {unknown[0]}")
+
+    n = 0
+    for kernel, signatures in SIGNATURES.items():
+        sigs = [sig for sig, used_by in signatures.items() if wanted.intersection(used_by)]
+        if not sigs:
+            continue
+        dispatcher = _dispatcher(kernel)
+        for sig in sigs:
+            dispatcher.compile(sig)
+            n += 1
+    return n
@@ -48,33 +48,43 @@ def _load_meta() -> dict[str, FunctionMeta]:
     return out
 
 
-@lru_cache(maxsize=1)
-def _discover_impl_modules() -> dict[str, str]:
+def _scan_impl_modules() -> dict[str, str]:
     """
-    Discover implemented functions by scanning `numbatalib/_func/ta_*.py`.
+    Scan `numbatalib/_func/ta_*.py` for implemented functions.
 
     Convention:
       - file name: ta_<lowercase function name>.py (underscores preserved)
       - function defined inside module: <UPPERCASE_FUNCTION_NAME>
+
+    Used by `tools/generate_func_index.py`; at runtime the registry reads the
+    generated index instead of listing the directory.
     """
     func_dir = _package_root() / "_func"
     mapping: dict[str, str] = {}
-    for path in func_dir.glob("ta_*.py"):
-        if path.name == "__init__.py":
-            continue
+    for path in sorted(func_dir.glob("ta_*.py")):
         func_name = path.stem[len("ta_") :].upper()
         mapping[func_name] = f"numbatalib._func.{path.stem}"
     return mapping
 
 
+def _discover_impl_modules() -> dict[str, str]:
+    """Implemented function name -> module, from `numbatalib/_generated/func_index.py`."""
+    from numbatalib._generated.func_index import FUNC_MODULES
+
+    return FUNC_MODULES
+
+
 def available_functions() -> list[str]:
     return sorted(_load_meta().keys())
 
 
+@lru_cache(maxsize=1)
+def _implemented() -> tuple[str, ...]:
+    return tuple(sorted(set(_load_meta()).intersection(_discover_impl_modules())))
+
+
 def implemented_functions() -> list[str]:
-    all_funcs = set(_load_meta().keys())
-    implemented = set(_discover_impl_modules().keys())
-    return sorted(all_funcs.intersection(implemented))
+    return list(_implemented())
 
 
 def _load_module(dotted: str) -> ModuleType:
@@ -92,6 +102,10 @@ def _make_stub(name: str) -> Callable[..., Any]:
     return _stub
 
 
+# Resolved functions by name, so repeated lookups are a single dict hit.
+_FUNCTIONS: dict[str, Callable[..., Any]] = {}
+
+
 def get_function(name: str) -> Callable[..., Any] | None:
     """
     Return a Python-callable indicator function by name (e.g. "SMA").
@@ -99,6 +113,10 @@ def get_function(name: str) -> Callable[..., Any] | None:
     If the name matches a known TA-Lib function but is not implemented yet,
     returns a stub that raises NotImplementedError.
     """
+    fn = _FUNCTIONS.get(name)
+    if fn is not None:
+        return fn
+
     meta = _load_meta()
     if name not in meta:
         return None
@@ -112,5 +130,6 @@ def get_function(name: str) -> Callable[..., Any] | None:
     fn = getattr(mod, name, None)
     if fn is None:
         raise RuntimeError(f"Module {module_name} does not define {name}")
+    _FUNCTIONS[name] = fn
     return fn
 
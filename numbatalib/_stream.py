@@ -0,0 +1,906 @@
+from __future__ import annotations
+
+"""
+Incremental (streaming) indicator state.
+
+Each stream object keeps the running state of the matching batch kernel in
+`numbatalib/_func/ta_*.py` and advances it by one bar per `update()` call, so
+the per-tick cost is O(1) instead of recomputing the whole series. Feeding a
+series bar by bar yields exactly the values of the batch function (same
+accumulation order, same seeds); outputs inside the lookback window are NaN.
+
+    s = create_stream("SMA", timeperiod=20)
+    for x in ticks:
+        value = s.update(x)
+
+For many symbols ticking together, `create_batch_stream` keeps the same state
+as struct-of-arrays (one row per symbol) and advances every symbol with a
+single kernel call per tick:
+
+    b = create_batch_stream("EMA", n_symbols=8000, timeperiod=20)
+    values = b.update(last_prices, mask=traded)
+"""
+
+import math
+from typing import Any
+
+import numpy as np
+from numba import njit
+
+from numbatalib._core._validation import Range, validate_float_param, validate_int_param
+from numbatalib._func._dmi_shared import _true_range
+from numbatalib._func.ta_atr import _atr_step
+from numbatalib._func.ta_ema import _ema_step
+from numbatalib._func.ta_kama import _kama_step
+from numbatalib._func.ta_ma import _validate_matype
+from numbatalib._func.ta_macd import _macd_periods
+from numbatalib._func.ta_rsi import _rsi_step, _rsi_value
+from numbatalib._func.ta_stddev import TA_REAL_MAX, TA_REAL_MIN
+from numbatalib._func.ta_t3 import _t3_coefficients
+
+
+# Update kernels.
+#
+# Every kernel takes a float64 `state` vector and an int64 `istate` vector
+# (istate[0] is the number of bars consumed so far) plus, for windowed
+# indicators, a ring buffer holding the last `timeperiod` inputs.
+
+
+@njit(cache=True, nogil=True)
+def _sma_update(state: np.ndarray, istate: np.ndarray, buf: np.ndarray, value: float) -> float:
+    timeperiod = buf.shape[0]
+    i = istate[0]
+    istate[0] = i + 1
+    buf[i % timeperiod] = value
+
+    # state[0]: period_total
+    state[0] += value
+    if i < timeperiod - 1:
+        return np.nan
+
+    temp_real = state[0]
+    state[0] -= buf[(i + 1) % timeperiod]
+    return temp_real / timeperiod
+
+
+@njit(cache=True, nogil=True)
+def _ema_update(state: np.ndarray, istate: np.ndarray, timeperiod: int, value: float) -> float:
+    i = istate[0]
+    istate[0] = i + 1
+
+    # state[0]: seed sum during warm-up, then the previous EMA.
+    if i < timeperiod:
+        state[0] += value
+        if i < timeperiod - 1:
+            return np.nan
+        state[0] = state[0] / timeperiod
+        return state[0]
+
+    state[0] = _ema_step(state[0], value, 2.0 / (timeperiod + 1.0))
+    return state[0]
+
+
+@njit(cache=True, nogil=True)
+def _wma_update(state: np.ndarray, istate: np.ndarray, buf: np.ndarray, value: float) -> float:
+    timeperiod = buf.shape[0]
+    i = istate[0]
+    istate[0] = i + 1
+    buf[i % timeperiod] = value
+
+    # state[0]: period_sum, state[1]: period_sub, state[2]: trailing_value
+    if i < timeperiod - 1:
+        state[1] += value
+        state[0] += value * (i + 1.0)
+        return np.nan
+
+    state[1] += value
+    state[1] -= state[2]
+    state[0] += value * timeperiod
+    state[2] = buf[(i + 1) % timeperiod]
+
+    out = state[0] / ((timeperiod * (timeperiod + 1)) / 2.0)
+    state[0] -= state[1]
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rsi_update(state: np.ndarray, istate: np.ndarray, timeperiod: int, value: float) -> float:
+    i = istate[0]
+    istate[0] = i + 1
+
+    # state[0]: prev_value, state[1]: prev_gain, state[2]: prev_loss
+    if i == 0:
+        state[0] = value
+        return np.nan
+
+    diff = value - state[0]
+    state[0] = value
+
+    if i <= timeperiod:
+        if diff < 0.0:
+            state[2] -= diff
+        else:
+            state[1] += diff
+        if i < timeperiod:
+            return np.nan
+        state[2] /= timeperiod
+        state[1] /= timeperiod
+        return _rsi_value(state[1], state[2])
+
+    state[1], state[2] = _rsi_step(state[1], state[2], diff, timeperiod)
+    return _rsi_value(state[1], state[2])
+
+
+@njit(cache=True, nogil=True)
+def _atr_update(
+    state: np.ndarray,
+    istate: np.ndarray,
+    timeperiod: int,
+    high: float,
+    low: float,
+    close: float,
+) -> float:
+    i = istate[0]
+    istate[0] = i + 1
+
+    # state[0]: prev_close, state[1]: TR sum during warm-up, then the previous ATR.
+    if i == 0:
+        state[0] = close
+        return np.nan
+
+    tr = _true_range(high, low, state[0])
+    state[0] = close
+
+    if i <= timeperiod:
+        state[1] += tr
+        if i < timeperiod:
+            return np.nan
+        state[1] = state[1] / timeperiod
+        return state[1]
+
+    state[1] = _atr_step(state[1], tr, timeperiod)
+    return state[1]
+
+
+@njit(cache=True, nogil=True)
+def _stddev_update(
+    state: np.ndarray, istate: np.ndarray, buf: np.ndarray, nbdev: float, value: float
+) -> float:
+    timeperiod = buf.shape[0]
+    i = istate[0]
+    istate[0] = i + 1
+    buf[i % timeperiod] = value
+
+    # state[0]: sum1, state[1]: sum2
+    state[0] += value
+    state[1] += value * value
+    if i < timeperiod - 1:
+        return np.nan
+
+    mean1 = state[0] / timeperiod
+    mean2 = state[1] / timeperiod
+
+    temp = buf[(i + 1) % timeperiod]
+    state[0] -= temp
+    state[1] -= temp * temp
+
+    var = mean2 - mean1 * mean1
+    if var > 0.0:
+        if nbdev != 1.0:
+            return math.sqrt(var) * nbdev
+        return math.sqrt(var)
+    return 0.0
+
+
+@njit(cache=True, nogil=True)
+def _macd_update(
+    state: np.ndarray,
+    istate: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int,
+    value: float,
+) -> tuple[float, float, float]:
+    i = istate[0]
+    istate[0] = i + 1
+
+    fp, sp, k_fast, k_slow = _macd_periods(fast_period, slow_period)
+    sigp = signal_period
+    ema_start = sp - 1
+
+    # state[0]/state[1]: fast/slow seed sums during warm-up, then the EMAs.
+    # state[2]: signal seed sum during warm-up, then the signal EMA.
+    if i <= ema_start:
+        state[1] += value
+        if i >= sp - fp:
+            state[0] += value
+        if i < ema_start:
+            return np.nan, np.nan, np.nan
+        state[0] = state[0] / fp
+        state[1] = state[1] / sp
+    else:
+        state[0] = _ema_step(state[0], value, k_fast)
+        state[1] = _ema_step(state[1], value, k_slow)
+
+    macd_val = state[0] - state[1]
+    if sigp == 1:
+        return macd_val, macd_val, 0.0
+
+    t = i - ema_start
+    lookback_signal = sigp - 1
+    if t <= lookback_signal:
+        state[2] += macd_val
+        if t < lookback_signal:
+            return np.nan, np.nan, np.nan
+        state[2] = state[2] / sigp
+    else:
+        state[2] = _ema_step(state[2], macd_val, 2.0 / (sigp + 1.0))
+
+    sig_val = state[2]
+    return macd_val, sig_val, macd_val - sig_val
+
+
+@njit(cache=True, nogil=True)
+def _kama_update(state: np.ndarray, istate: np.ndarray, buf: np.ndarray, value: float) -> float:
+    timeperiod = buf.shape[0] - 1
+    i = istate[0]
+    istate[0] = i + 1
+    buf[i % (timeperiod + 1)] = value
+
+    # state[0]: sum_roc1, state[1]: previous input, state[2]: trailing_value,
+    # state[3]: previous KAMA. buf holds the last `timeperiod + 1` inputs.
+    prev = state[1]
+    state[1] = value
+    if i == 0:
+        return np.nan
+
+    # Oldest input of the window, `timeperiod` bars back.
+    first = buf[(i + 1) % (timeperiod + 1)]
+    if i <= timeperiod:
+        state[0] += math.fabs(prev - value)
+        if i < timeperiod:
+            return np.nan
+        state[3] = prev
+    else:
+        state[0] -= math.fabs(state[2] - first)
+        state[0] += math.fabs(value - prev)
+    state[2] = first
+
+    state[3] = _kama_step(state[3], value, value - first, state[0])
+    return state[3]
+
+
+@njit(cache=True, nogil=True)
+def _t3_update(
+    state: np.ndarray, istate: np.ndarray, timeperiod: int, vfactor: float, value: float
+) -> float:
+    i = istate[0]
+    istate[0] = i + 1
+    lb = timeperiod - 1
+    k = 2.0 / (timeperiod + 1.0)
+    one_minus_k = 1.0 - k
+
+    # state[0]: seed sum of the stage being warmed up, state[1:7]: e1..e6.
+    # Stage s seeds e_s with the mean of e_{s-1} over `timeperiod` bars and
+    # ends at bar s * (timeperiod - 1); all six run from bar 6 * (timeperiod - 1).
+    e = state[1:]
+    if i <= lb:
+        state[0] += value
+        if i == lb:
+            e[0] = state[0] / timeperiod
+            state[0] = e[0]
+        return np.nan
+
+    stage = min((i - 1) // lb + 1, 7)
+    e[0] = (k * value) + (one_minus_k * e[0])
+    for j in range(1, stage - 1):
+        e[j] = (k * e[j - 1]) + (one_minus_k * e[j])
+    if stage < 7:
+        state[0] += e[stage - 2]
+        if i < stage * lb:
+            return np.nan
+        e[stage - 1] = state[0] / timeperiod
+        state[0] = e[stage - 1]
+        if stage < 6:
+            return np.nan
+
+    c1, c2, c3, c4 = _t3_coefficients(vfactor)
+    return c1 * e[5] + c2 * e[4] + c3 * e[3] + c4 * e[2]
+
+
+# Batch update kernels: advance every symbol's row of a struct-of-arrays state
+# with the single-symbol kernels above. An empty `mask` means "all symbols";
+# symbols masked out keep their state and get NaN outputs for this tick.
+
+
+@njit(cache=True, nogil=True)
+def _ema_update_batch(
+    state: np.ndarray,
+    istate: np.ndarray,
+    timeperiod: int,
+    values: np.ndarray,
+    mask: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    use_mask = mask.shape[0] != 0
+    for j in range(values.shape[0]):
+        if use_mask and not mask[j]:
+            out[j] = np.nan
+            continue
+        out[j] = _ema_update(state[j], istate[j], timeperiod, values[j])
+
+
+@njit(cache=True, nogil=True)
+def _rsi_update_batch(
+    state: np.ndarray,
+    istate: np.ndarray,
+    timeperiod: int,
+    values: np.ndarray,
+    mask: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    use_mask = mask.shape[0] != 0
+    for j in range(values.shape[0]):
+        if use_mask and not mask[j]:
+            out[j] = np.nan
+            continue
+        out[j] = _rsi_update(state[j], istate[j], timeperiod, values[j])
+
+
+@njit(cache=True, nogil=True)
+def _atr_update_batch(
+    state: np.ndarray,
+    istate: np.ndarray,
+    timeperiod: int,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    mask: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    use_mask = mask.shape[0] != 0
+    for j in range(close.shape[0]):
+        if use_mask and not mask[j]:
+            out[j] = np.nan
+            continue
+        out[j] = _atr_update(state[j], istate[j], timeperiod, high[j], low[j], close[j])
+
+
+@njit(cache=True, nogil=True)
+def _macd_update_batch(
+    state: np.ndarray,
+    istate: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int,
+    values: np.ndarray,
+    mask: np.ndarray,
+    out_macd: np.ndarray,
+    out_signal: np.ndarray,
+    out_hist: np.ndarray,
+) -> None:
+    use_mask = mask.shape[0] != 0
+    for j in range(values.shape[0]):
+        if use_mask and not mask[j]:
+            out_macd[j] = np.nan
+            out_signal[j] = np.nan
+            out_hist[j] = np.nan
+            continue
+        out_macd[j], out_signal[j], out_hist[j] = _macd_update(
+            state[j], istate[j], fast_period, slow_period, signal_period, values[j]
+        )
+
+
+class Stream:
+    """
+    Base class for incremental indicator state.
+
+    Subclasses define `update(*values)`, which consumes one bar and returns
+    the indicator value(s) for that bar, and `lookback`, the number of leading
+    bars for which the output is NaN.
+    """
+
+    outputs: tuple[str, ...] = ("real",)
+
+    def __init__(self, n_state: int, buf_len: int = 0) -> None:
+        self._n_state = n_state
+        self._buf_len = buf_len
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all consumed bars."""
+        self._state = np.zeros(self._n_state, dtype=np.float64)
+        self._istate = np.zeros(1, dtype=np.int64)
+        self._buf = np.zeros(self._buf_len, dtype=np.float64)
+
+    @property
+    def count(self) -> int:
+        """Number of bars consumed so far."""
+        return int(self._istate[0])
+
+    @property
+    def lookback(self) -> int:
+        raise NotImplementedError
+
+    @property
+    def ready(self) -> bool:
+        """True once the outputs are no longer NaN."""
+        return self.count > self.lookback
+
+    def update(self, *values: Any) -> Any:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} count={self.count}>"
+
+
+class SMAStream(Stream):
+    def __init__(self, timeperiod: int = 30) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        super().__init__(1, self.timeperiod)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod - 1
+
+    def update(self, real: float) -> float:
+        return _sma_update(self._state, self._istate, self._buf, float(real))
+
+
+class EMAStream(Stream):
+    def __init__(self, timeperiod: int = 30) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        super().__init__(1)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod - 1
+
+    def update(self, real: float) -> float:
+        return _ema_update(self._state, self._istate, self.timeperiod, float(real))
+
+
+class WMAStream(Stream):
+    def __init__(self, timeperiod: int = 30) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        super().__init__(3, self.timeperiod)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod - 1
+
+    def update(self, real: float) -> float:
+        return _wma_update(self._state, self._istate, self._buf, float(real))
+
+
+class RSIStream(Stream):
+    def __init__(self, timeperiod: int = 14) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        super().__init__(3)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod
+
+    def update(self, real: float) -> float:
+        return _rsi_update(self._state, self._istate, self.timeperiod, float(real))
+
+
+class ATRStream(Stream):
+    def __init__(self, timeperiod: int = 14) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=1, max=100000))
+        super().__init__(2)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod
+
+    def update(self, high: float, low: float, close: float) -> float:
+        return _atr_update(
+            self._state, self._istate, self.timeperiod, float(high), float(low), float(close)
+        )
+
+
+class STDDEVStream(Stream):
+    def __init__(self, timeperiod: int = 5, nbdev: float = 1.0) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        self.nbdev = validate_float_param("nbdev", nbdev, Range(min=TA_REAL_MIN, max=TA_REAL_MAX))
+        super().__init__(2, self.timeperiod)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod - 1
+
+    def update(self, real: float) -> float:
+        return _stddev_update(self._state, self._istate, self._buf, self.nbdev, float(real))
+
+
+class MACDStream(Stream):
+    outputs = ("macd", "macdsignal", "macdhist")
+
+    def __init__(self, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9) -> None:
+        self.fastperiod = validate_int_param("fastperiod", fastperiod, Range(min=2, max=100000))
+        self.slowperiod = validate_int_param("slowperiod", slowperiod, Range(min=2, max=100000))
+        self.signalperiod = validate_int_param(
+            "signalperiod", signalperiod, Range(min=1, max=100000)
+        )
+        super().__init__(3)
+
+    @property
+    def lookback(self) -> int:
+        slowest = max(self.fastperiod, self.slowperiod)
+        return (slowest - 1) + (self.signalperiod - 1)
+
+    def update(self, real: float) -> tuple[float, float, float]:
+        return _macd_update(
+            self._state,
+            self._istate,
+            self.fastperiod,
+            self.slowperiod,
+            self.signalperiod,
+            float(real),
+        )
+
+
+class _CascadeStream(Stream):
+    """
+    Streams chained like the batch function: each stage consumes the valid
+    outputs of the previous one.
+    """
+
+    def __init__(self, stages: list[Stream]) -> None:
+        self._stages = stages
+        super().__init__(0)
+
+    def reset(self) -> None:
+        super().reset()
+        for stage in self._stages:
+            stage.reset()
+
+    @property
+    def count(self) -> int:
+        return self._stages[0].count
+
+    @property
+    def lookback(self) -> int:
+        return sum(stage.lookback for stage in self._stages)
+
+    def _cascade(self, real: float) -> list[float] | None:
+        """Advance the stages; their current values, or None during warm-up."""
+        values = []
+        for stage in self._stages:
+            real = stage.update(real)
+            if not stage.ready:
+                return None
+            values.append(real)
+        return values
+
+
+class DEMAStream(_CascadeStream):
+    def __init__(self, timeperiod: int = 30) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        super().__init__([EMAStream(self.timeperiod) for _ in range(2)])
+
+    def update(self, real: float) -> float:
+        values = self._cascade(float(real))
+        if values is None:
+            return np.nan
+        ema1, ema2 = values
+        return (2.0 * ema1) - ema2
+
+
+class TEMAStream(_CascadeStream):
+    def __init__(self, timeperiod: int = 30) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        super().__init__([EMAStream(self.timeperiod) for _ in range(3)])
+
+    def update(self, real: float) -> float:
+        values = self._cascade(float(real))
+        if values is None:
+            return np.nan
+        ema1, ema2, ema3 = values
+        return (3.0 * ema1) - (3.0 * ema2) + ema3
+
+
+class TRIMAStream(_CascadeStream):
+    def __init__(self, timeperiod: int = 30) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        # SMA over the first half of the window, then over the second half.
+        p1 = (self.timeperiod + 1) // 2
+        p2 = self.timeperiod - p1 + 1
+        stages = [SMAStream(p2)] if p1 == 1 else [SMAStream(p1), SMAStream(p2)]
+        super().__init__(stages)
+
+    def update(self, real: float) -> float:
+        values = self._cascade(float(real))
+        return np.nan if values is None else values[-1]
+
+
+class KAMAStream(Stream):
+    def __init__(self, timeperiod: int = 30) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        super().__init__(4, self.timeperiod + 1)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod
+
+    def update(self, real: float) -> float:
+        return _kama_update(self._state, self._istate, self._buf, float(real))
+
+
+class T3Stream(Stream):
+    def __init__(self, timeperiod: int = 5, vfactor: float = 0.7) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        self.vfactor = validate_float_param("vfactor", vfactor, Range(min=0.0, max=1.0))
+        super().__init__(7)
+
+    @property
+    def lookback(self) -> int:
+        return 6 * (self.timeperiod - 1)
+
+    def update(self, real: float) -> float:
+        return _t3_update(self._state, self._istate, self.timeperiod, self.vfactor, float(real))
+
+
+# Middle band per matype; T3 uses the default vfactor of 0.7, like MA.
+_BBANDS_MIDDLE: dict[int, type[Stream]] = {
+    0: SMAStream,
+    1: EMAStream,
+    2: WMAStream,
+    3: DEMAStream,
+    4: TEMAStream,
+    5: TRIMAStream,
+    6: KAMAStream,
+    8: T3Stream,
+}
+
+
+class BBANDSStream(Stream):
+    outputs = ("upperband", "middleband", "lowerband")
+
+    def __init__(
+        self,
+        timeperiod: int = 5,
+        nbdevup: float = 2.0,
+        nbdevdn: float = 2.0,
+        matype: int = 0,
+    ) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        self.nbdevup = validate_float_param(
+            "nbdevup", nbdevup, Range(min=TA_REAL_MIN, max=TA_REAL_MAX)
+        )
+        self.nbdevdn = validate_float_param(
+            "nbdevdn", nbdevdn, Range(min=TA_REAL_MIN, max=TA_REAL_MAX)
+        )
+        self.matype = _validate_matype(matype)
+        if self.matype not in _BBANDS_MIDDLE:
+            raise ValueError(f"BBANDS streams do not support matype {self.matype} (MAMA)")
+        self._middle = _BBANDS_MIDDLE[self.matype](timeperiod=self.timeperiod)
+        self._std = STDDEVStream(timeperiod=self.timeperiod, nbdev=1.0)
+        super().__init__(0)
+
+    def reset(self) -> None:
+        super().reset()
+        self._middle.reset()
+        self._std.reset()
+
+    @property
+    def count(self) -> int:
+        return self._std.count
+
+    @property
+    def lookback(self) -> int:
+        return self._middle.lookback
+
+    def update(self, real: float) -> tuple[float, float, float]:
+        middle = self._middle.update(real)
+        std = self._std.update(real)
+        return middle + (self.nbdevup * std), middle, middle - (self.nbdevdn * std)
+
+
+_NO_MASK = np.zeros(0, dtype=np.bool_)
+
+
+class BatchStream:
+    """
+    Base class for multi-symbol incremental state.
+
+    State lives in C-contiguous arrays shaped `(n_symbols, ...)`; `update()`
+    takes one value per symbol (plus an optional boolean `mask` of symbols
+    that traded this tick) and returns one output per symbol.
+    """
+
+    outputs: tuple[str, ...] = ("real",)
+    n_state: int = 1
+
+    def __init__(self, n_symbols: int) -> None:
+        self.n_symbols = validate_int_param("n_symbols", n_symbols, Range(min=1))
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all consumed bars for every symbol."""
+        self._state = np.zeros((self.n_symbols, self.n_state), dtype=np.float64)
+        self._istate = np.zeros((self.n_symbols, 1), dtype=np.int64)
+
+    @property
+    def count(self) -> np.ndarray:
+        """Number of bars consumed so far, per symbol."""
+        return self._istate[:, 0].copy()
+
+    @property
+    def lookback(self) -> int:
+        raise NotImplementedError
+
+    def _vector(self, x: Any) -> np.ndarray:
+        arr = np.ascontiguousarray(x, dtype=np.float64)
+        if arr.shape != (self.n_symbols,):
+            raise ValueError(f"expected an array of shape ({self.n_symbols},)")
+        return arr
+
+    def _mask(self, mask: Any) -> np.ndarray:
+        if mask is None:
+            return _NO_MASK
+        arr = np.ascontiguousarray(mask, dtype=np.bool_)
+        if arr.shape != (self.n_symbols,):
+            raise ValueError(f"mask must have shape ({self.n_symbols},)")
+        return arr
+
+    def update(self, *values: Any, mask: Any = None) -> Any:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} n_symbols={self.n_symbols}>"
+
+
+class EMABatchStream(BatchStream):
+    def __init__(self, n_symbols: int, timeperiod: int = 30) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        super().__init__(n_symbols)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod - 1
+
+    def update(self, real: Any, mask: Any = None) -> np.ndarray:
+        out = np.empty(self.n_symbols, dtype=np.float64)
+        _ema_update_batch(
+            self._state, self._istate, self.timeperiod, self._vector(real), self._mask(mask), out
+        )
+        return out
+
+
+class RSIBatchStream(BatchStream):
+    n_state = 3
+
+    def __init__(self, n_symbols: int, timeperiod: int = 14) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=2, max=100000))
+        super().__init__(n_symbols)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod
+
+    def update(self, real: Any, mask: Any = None) -> np.ndarray:
+        out = np.empty(self.n_symbols, dtype=np.float64)
+        _rsi_update_batch(
+            self._state, self._istate, self.timeperiod, self._vector(real), self._mask(mask), out
+        )
+        return out
+
+
+class ATRBatchStream(BatchStream):
+    n_state = 2
+
+    def __init__(self, n_symbols: int, timeperiod: int = 14) -> None:
+        self.timeperiod = validate_int_param("timeperiod", timeperiod, Range(min=1, max=100000))
+        super().__init__(n_symbols)
+
+    @property
+    def lookback(self) -> int:
+        return self.timeperiod
+
+    def update(self, high: Any, low: Any, close: Any, mask: Any = None) -> np.ndarray:
+        out = np.empty(self.n_symbols, dtype=np.float64)
+        _atr_update_batch(
+            self._state,
+            self._istate,
+            self.timeperiod,
+            self._vector(high),
+            self._vector(low),
+            self._vector(close),
+            self._mask(mask),
+            out,
+        )
+        return out
+
+
+class MACDBatchStream(BatchStream):
+    outputs = ("macd", "macdsignal", "macdhist")
+    n_state = 3
+
+    def __init__(
+        self,
+        n_symbols: int,
+        fastperiod: int = 12,
+        slowperiod: int = 26,
+        signalperiod: int = 9,
+    ) -> None:
+        self.fastperiod = validate_int_param("fastperiod", fastperiod, Range(min=2, max=100000))
+        self.slowperiod = validate_int_param("slowperiod", slowperiod, Range(min=2, max=100000))
+        self.signalperiod = validate_int_param(
+            "signalperiod", signalperiod, Range(min=1, max=100000)
+        )
+        super().__init__(n_symbols)
+
+    @property
+    def lookback(self) -> int:
+        slowest = max(self.fastperiod, self.slowperiod)
+        return (slowest - 1) + (self.signalperiod - 1)
+
+    def update(self, real: Any, mask: Any = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        out_macd = np.empty(self.n_symbols, dtype=np.float64)
+        out_signal = np.empty(self.n_symbols, dtype=np.float64)
+        out_hist = np.empty(self.n_symbols, dtype=np.float64)
+        _macd_update_batch(
+            self._state,
+            self._istate,
+            self.fastperiod,
+            self.slowperiod,
+            self.signalperiod,
+            self._vector(real),
+            self._mask(mask),
+            out_macd,
+            out_signal,
+            out_hist,
+        )
+        return out_macd, out_signal, out_hist
+
+
+STREAMS: dict[str, type[Stream]] = {
+    "ATR": ATRStream,
+    "BBANDS": BBANDSStream,
+    "DEMA": DEMAStream,
+    "EMA": EMAStream,
+    "KAMA": KAMAStream,
+    "MACD": MACDStream,
+    "RSI": RSIStream,
+    "SMA": SMAStream,
+    "STDDEV": STDDEVStream,
+    "T3": T3Stream,
+    "TEMA": TEMAStream,
+    "TRIMA": TRIMAStream,
+    "WMA": WMAStream,
+}
+
+
+def create_stream(name: str, **params: Any) -> Stream:
+    """
+    Create an incremental stream for the TA-Lib function `name` (e.g. "SMA").
+
+    Raises KeyError if no streaming implementation exists for `name`.
+    """
+    cls = STREAMS.get(name.upper())
+    if cls is None:
+        raise KeyError(name)
+    return cls(**params)
+
+
+BATCH_STREAMS: dict[str, type[BatchStream]] = {
+    "ATR": ATRBatchStream,
+    "EMA": EMABatchStream,
+    "MACD": MACDBatchStream,
+    "RSI": RSIBatchStream,
+}
+
+
+def create_batch_stream(name: str, n_symbols: int, **params: Any) -> BatchStream:
+    """
+    Create a multi-symbol stream for the TA-Lib function `name` (e.g. "EMA").
+
+    Raises KeyError if no batch streaming implementation exists for `name`.
+    """
+    cls = BATCH_STREAMS.get(name.upper())
+    if cls is None:
+        raise KeyError(name)
+    return cls(n_symbols, **params)
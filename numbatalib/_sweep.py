@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+"""
+Parameter sweeps: one indicator evaluated for many parameter values.
+
+    numbatalib.sweep("SMA", real, timeperiod=range(2, 251))  # (249, n) matrix
+
+SMA, EMA, RSI, STDDEV, MAX and MIN sweeping `timeperiod` run in dedicated
+kernels: the input is walked once per block of bars while the running state
+of a group of periods stays hot in registers, and groups run in parallel.
+Each row matches the single-period function exactly (same accumulation order
+as `_sma_kernel`, `_ema_kernel`, ...), including for float32, int64/int32 and
+strided inputs, which are read in place like in the single-period functions.
+Any other function/parameter is swept by calling the function once per value.
+"""
+
+import inspect
+import math
+from typing import Any
+
+import numpy as np
+from numba import njit, prange
+
+from numbatalib._core._params import param_specs, validate_params
+from numbatalib._core._validation import as_1d_float
+from numbatalib._func.ta_ema import _ema_step
+from numbatalib._func.ta_max import _max_kernel
+from numbatalib._func.ta_min import _min_kernel
+from numbatalib._func.ta_rsi import _rsi_step, _rsi_value
+from numbatalib._registry import get_function
+
+
+_BLOCK = 1024  # bars per block (8 KiB of input, stays in L1)
+_GROUP = 8  # periods advanced together per block
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _sma_sweep(real: np.ndarray, periods: np.ndarray, out: np.ndarray) -> None:
+    n = real.shape[0]
+    n_periods = periods.shape[0]
+    for g in prange((n_periods + _GROUP - 1) // _GROUP):
+        p0 = g * _GROUP
+        p1 = min(n_periods, p0 + _GROUP)
+        total = np.zeros(p1 - p0)
+        for b0 in range(0, n, _BLOCK):
+            b1 = min(n, b0 + _BLOCK)
+            for p in range(p0, p1):
+                tp = periods[p]
+                if tp > n:
+                    continue
+                s = total[p - p0]
+                for i in range(b0, b1):
+                    s += real[i]
+                    if i >= tp - 1:
+                        out[p, i] = s / tp
+                        s -= real[i - tp + 1]
+                total[p - p0] = s
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _stddev_sweep(real: np.ndarray, periods: np.ndarray, nbdev: float, out: np.ndarray) -> None:
+    n = real.shape[0]
+    n_periods = periods.shape[0]
+    for g in prange((n_periods + _GROUP - 1) // _GROUP):
+        p0 = g * _GROUP
+        p1 = min(n_periods, p0 + _GROUP)
+        sums1 = np.zeros(p1 - p0)
+        sums2 = np.zeros(p1 - p0)
+        for b0 in range(0, n, _BLOCK):
+            b1 = min(n, b0 + _BLOCK)
+            for p in range(p0, p1):
+                tp = periods[p]
+                if tp > n:
+                    continue
+                sum1 = sums1[p - p0]
+                sum2 = sums2[p - p0]
+                for i in range(b0, b1):
+                    temp = np.float64(real[i])
+                    sum1 += temp
+                    sum2 += temp * temp
+                    if i < tp - 1:
+                        continue
+                    mean1 = sum1 / tp
+                    mean2 = sum2 / tp
+                    temp = np.float64(real[i - tp + 1])
+                    sum1 -= temp
+                    sum2 -= temp * temp
+                    var = mean2 - mean1 * mean1
+                    if var > 0.0:
+                        if nbdev != 1.0:
+                            out[p, i] = math.sqrt(var) * nbdev
+                        else:
+                            out[p, i] = math.sqrt(var)
+                    else:
+                        out[p, i] = 0.0
+                sums1[p - p0] = sum1
+                sums2[p - p0] = sum2
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _ema_sweep(real: np.ndarray, periods: np.ndarray, out: np.ndarray) -> None:
+    n = real.shape[0]
+    n_periods = periods.shape[0]
+    for g in prange((n_periods + _GROUP - 1) // _GROUP):
+        p0 = g * _GROUP
+        p1 = min(n_periods, p0 + _GROUP)
+        state = np.zeros(p1 - p0)
+        for b0 in range(0, n, _BLOCK):
+            b1 = min(n, b0 + _BLOCK)
+            for p in range(p0, p1):
+                tp = periods[p]
+                if tp > n:
+                    continue
+                k = 2.0 / (tp + 1.0)
+                prev = state[p - p0]
+                for i in range(b0, b1):
+                    if i < tp:
+                        # Seed: simple MA of the first `timeperiod` values.
+                        prev += real[i]
+                        if i == tp - 1:
+                            prev = prev / tp
+                            out[p, i] = prev
+                    else:
+                        prev = _ema_step(prev, real[i], k)
+                        out[p, i] = prev
+                state[p - p0] = prev
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _rsi_sweep(real: np.ndarray, periods: np.ndarray, out: np.ndarray) -> None:
+    n = real.shape[0]
+    n_periods = periods.shape[0]
+    for g in prange((n_periods + _GROUP - 1) // _GROUP):
+        p0 = g * _GROUP
+        p1 = min(n_periods, p0 + _GROUP)
+        gains = np.zeros(p1 - p0)
+        losses = np.zeros(p1 - p0)
+        for b0 in range(0, n, _BLOCK):
+            b1 = min(n, b0 + _BLOCK)
+            for p in range(p0, p1):
+                tp = periods[p]
+                if n <= tp:
+                    continue
+                prev_gain = gains[p - p0]
+                prev_loss = losses[p - p0]
+                for i in range(max(b0, 1), b1):
+                    diff = real[i] - real[i - 1]
+                    if i <= tp:
+                        if diff < 0.0:
+                            prev_loss -= diff
+                        else:
+                            prev_gain += diff
+                        if i == tp:
+                            prev_loss /= tp
+                            prev_gain /= tp
+                            out[p, i] = _rsi_value(prev_gain, prev_loss)
+                    else:
+                        prev_gain, prev_loss = _rsi_step(prev_gain, prev_loss, diff, tp)
+                        out[p, i] = _rsi_value(prev_gain, prev_loss)
+                gains[p - p0] = prev_gain
+                losses[p - p0] = prev_loss
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _max_sweep(real: np.ndarray, periods: np.ndarray, out: np.ndarray) -> None:
+    for p in prange(periods.shape[0]):
+        _max_kernel(real, periods[p], out[p])
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _min_sweep(real: np.ndarray, periods: np.ndarray, out: np.ndarray) -> None:
+    for p in prange(periods.shape[0]):
+        _min_kernel(real, periods[p], out[p])
+
+
+_TIMEPERIOD_SWEEPS = {
+    "SMA": _sma_sweep,
+    "EMA": _ema_sweep,
+    "RSI": _rsi_sweep,
+    "STDDEV": _stddev_sweep,
+    "MAX": _max_sweep,
+    "MIN": _min_sweep,
+}
+
+
+def _is_scalar(value: Any) -> bool:
+    return np.ndim(value) == 0
+
+
+def sweep(func_name: str, *inputs: Any, **params: Any) -> Any:
+    """
+    Evaluate `func_name` once per value of a single swept parameter.
+
+    Exactly one keyword in `params` must be a sequence (e.g. `range(2, 251)`);
+    the others are scalars. Returns a `(n_values, n)` array whose row `k` equals
+    `func(*inputs, **{swept: values[k], ...})`, or a tuple of such arrays for
+    multi-output functions.
+    """
+    fn = get_function(func_name)
+    if fn is None:
+        raise ValueError(f"unknown function: {func_name}")
+
+    swept = [name for name, value in params.items() if not _is_scalar(value)]
+    if len(swept) != 1:
+        raise ValueError("exactly one parameter must be a sequence of values")
+    swept_name = swept[0]
+    values = list(params[swept_name])
+    if not values:
+        raise ValueError(f"{swept_name} must not be empty")
+
+    specs = param_specs(func_name)
+    names = [spec.name for spec in specs]
+    if swept_name not in names:
+        raise ValueError(f"{func_name} has no parameter {swept_name}")
+    unknown = set(params) - set(names)
+    if unknown:
+        raise ValueError(f"{func_name} has no parameter {sorted(unknown)[0]}")
+
+    # Validate every combination up front so bad values fail before any work.
+    sig = inspect.signature(fn)
+    defaults = {name: sig.parameters[name].default for name in names}
+    rows = []
+    for v in values:
+        kw = {**defaults, **params, swept_name: v}
+        checked = validate_params(func_name, tuple(kw[name] for name in names))
+        rows.append(dict(zip(names, checked)))
+
+    kernel = _TIMEPERIOD_SWEEPS.get(func_name)
+    if kernel is not None and swept_name == "timeperiod":
+        if len(inputs) != 1:
+            raise TypeError(f"{func_name} takes exactly one input")
+        real = as_1d_float(inputs[0])
+        periods = np.array([row["timeperiod"] for row in rows], dtype=np.int64)
+        out = np.full((periods.shape[0], real.shape[0]), np.nan, dtype=np.float64)
+        if func_name == "STDDEV":
+            kernel(real, periods, rows[0]["nbdev"], out)
+        else:
+            kernel(real, periods, out)
+        return out
+
+    results = [fn(*inputs, **row) for row in rows]
+    if isinstance(results[0], tuple):
+        return tuple(np.stack(col) for col in zip(*results))
+    return np.stack(results)
+
+
+__all__ = ["sweep"]
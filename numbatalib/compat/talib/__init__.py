@@ -1,26 +1,32 @@
 from __future__ import annotations
 
 import atexit
+import sys
 from functools import wraps
+from importlib.util import find_spec
 from itertools import chain
+from typing import Any
 
-# Optional pandas/polars Series support (mirrors talib's behavior).
-try:  # pragma: no cover
-    from polars import Series as _pl_Series
-except Exception:  # pragma: no cover
-    _pl_Series = None
+# Optional pandas/polars Series support (mirrors talib's behavior). The libraries are
+# not imported here: a Series argument implies its library is already in `sys.modules`.
+_HAS_SERIES_LIBS = any(find_spec(name) is not None for name in ("pandas", "polars"))
 
-try:  # pragma: no cover
-    from pandas import Series as _pd_Series
-except Exception:  # pragma: no cover
-    _pd_Series = None
 
+def _series_types() -> tuple[Any, Any]:
+    pl = sys.modules.get("polars")
+    pd = sys.modules.get("pandas")
+    return (
+        getattr(pl, "Series", None) if pl is not None else None,
+        getattr(pd, "Series", None) if pd is not None else None,
+    )
 
-if _pl_Series is not None or _pd_Series is not None:  # pragma: no cover
+
+if _HAS_SERIES_LIBS:  # pragma: no cover
 
     def _wrapper(func):
         @wraps(func)
         def wrapper(*args, **kwds):
+            _pl_Series, _pd_Series = _series_types()
             if _pl_Series is not None:
                 use_pl = any(isinstance(arg, _pl_Series) for arg in args) or any(
                     isinstance(v, _pl_Series) for v in kwds.values()
@@ -108,20 +114,29 @@ _ta_initialize()
 atexit.register(_ta_shutdown)
 
 
-# Wrap functions for pandas/polars support (mirrors talib).
 from . import _ta_lib as _func_mod  # noqa: E402
+from . import stream as stream  # noqa: E402
 
-for _func_name in __TA_FUNCTION_NAMES__:
-    _wrapped = _wrapper(getattr(_func_mod, _func_name))
-    setattr(_func_mod, _func_name, _wrapped)
-    globals()[_func_name] = _wrapped
 
-from . import stream as stream  # noqa: E402
+def __getattr__(name: str) -> Any:
+    # `SMA`, `stream_SMA` and `SMA_Lookback` are built on first access and then bound
+    # here; functions are wrapped for pandas/polars support (mirrors talib).
+    func_name = _func_mod._wrapper_func_name(name)
+    if func_name is None:
+        raise AttributeError(name)
+    if name == func_name:
+        value = _wrapper(getattr(_func_mod, name))
+        setattr(_func_mod, name, value)
+    elif name.startswith("stream_"):
+        value = getattr(stream, func_name)
+    else:
+        value = getattr(_func_mod, name)
+    globals()[name] = value
+    return value
+
 
-for _func_name in __TA_FUNCTION_NAMES__:
-    _wrapped = _wrapper(getattr(stream, _func_name))
-    setattr(stream, _func_name, _wrapped)
-    globals()[f"stream_{_func_name}"] = _wrapped
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
 
 __version__ = "0.4.32"
@@ -186,5 +201,6 @@ __all__ = (
     ["get_functions", "get_function_groups"]
     + list(__TA_FUNCTION_NAMES__)
     + [f"stream_{name}" for name in __TA_FUNCTION_NAMES__]
+    + [f"{name}_Lookback" for name in __TA_FUNCTION_NAMES__]
 )
 
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+"""Numba kernels for the Metastock compatibility mode of the TA-Lib shim."""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def _ema_metastock_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
+    n = real.shape[0]
+    if timeperiod > n:
+        return
+
+    k = 2.0 / (timeperiod + 1.0)
+    start_idx = timeperiod - 1
+
+    prev = real[0]
+    for i in range(1, start_idx + 1):
+        prev = ((real[i] - prev) * k) + prev
+
+    out[start_idx] = prev
+    for i in range(start_idx + 1, n):
+        prev = ((real[i] - prev) * k) + prev
+        out[i] = prev
@@ -5,7 +5,6 @@ from collections import OrderedDict
 from typing import Any, Callable
 
 import numpy as np
-from numba import njit
 
 import numbatalib
 from numbatalib._registry import _load_meta
@@ -64,6 +63,7 @@ TA_OUTPUT_FLAGS = {
 
 
 __TA_FUNCTION_NAMES__ = tuple(numbatalib.implemented_functions())
+_FUNCTION_NAMES = frozenset(__TA_FUNCTION_NAMES__)
 
 _META = _load_meta()
 
@@ -133,7 +133,12 @@ def _raise_bad_param(func_name: str) -> None:
     raise Exception(f"TA_{func_name} function failed with error code 2: Bad Parameter (TA_BAD_PARAM)")
 
 
+_FLOAT64 = np.dtype(np.float64)
+
+
 def _as_1d_f64(x: Any) -> np.ndarray:
+    if type(x) is np.ndarray and x.dtype is _FLOAT64 and x.ndim == 1 and x.flags.c_contiguous:
+        return x
     arr = np.asarray(x, dtype=np.float64)
     if arr.ndim != 1:
         raise Exception("input array has wrong dimensions")
@@ -162,7 +167,8 @@ def _default_kwargs(func_name: str) -> dict[str, Any]:
     sig = inspect.signature(fn)
     out: dict[str, Any] = {}
     for p in sig.parameters.values():
-        if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
+        # Keyword-only arguments (e.g. `axis`) are numbatalib extensions, not TA-Lib parameters.
+        if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD, p.KEYWORD_ONLY):
             continue
         if p.default is inspect._empty:
             continue
@@ -170,7 +176,15 @@ def _default_kwargs(func_name: str) -> dict[str, Any]:
     return out
 
 
-_DEFAULT_KWARGS: dict[str, dict[str, Any]] = {name: _default_kwargs(name) for name in __TA_FUNCTION_NAMES__}
+# Filled per function on first use: resolving the defaults imports its module.
+_DEFAULT_KWARGS: dict[str, dict[str, Any]] = {}
+
+
+def _defaults(func_name: str) -> dict[str, Any]:
+    defaults = _DEFAULT_KWARGS.get(func_name)
+    if defaults is None:
+        defaults = _DEFAULT_KWARGS[func_name] = _default_kwargs(func_name)
+    return defaults
 
 
 def _coerce_and_clean_params(func_name: str, params: dict[str, Any]) -> dict[str, Any]:
@@ -203,26 +217,9 @@ def _coerce_and_clean_params(func_name: str, params: dict[str, Any]) -> dict[str
     return out
 
 
-@njit(cache=True)
-def _ema_metastock_kernel(real: np.ndarray, timeperiod: int, out: np.ndarray) -> None:
-    n = real.shape[0]
-    if timeperiod > n:
-        return
-
-    k = 2.0 / (timeperiod + 1.0)
-    start_idx = timeperiod - 1
-
-    prev = real[0]
-    for i in range(1, start_idx + 1):
-        prev = ((real[i] - prev) * k) + prev
-
-    out[start_idx] = prev
-    for i in range(start_idx + 1, n):
-        prev = ((real[i] - prev) * k) + prev
-        out[i] = prev
-
-
 def _ema_metastock(real: np.ndarray, timeperiod: int) -> np.ndarray:
+    from numbatalib.compat.talib._metastock import _ema_metastock_kernel
+
     out = np.full(real.shape[0], np.nan, dtype=np.float64)
     _ema_metastock_kernel(real, int(timeperiod), out)
     return out
@@ -314,7 +311,7 @@ def _apply_unstable(result: Any, unstable: int) -> Any:
 def _call_func(func_name: str, raw_inputs: list[Any], raw_params: dict[str, Any]) -> Any:
     inputs = _normalize_inputs(raw_inputs)
 
-    defaults = _DEFAULT_KWARGS.get(func_name, {})
+    defaults = _defaults(func_name)
     params = dict(defaults)
     params.update(raw_params)
 
@@ -356,6 +353,25 @@ def _call_func(func_name: str, raw_inputs: list[Any], raw_params: dict[str, Any]
     return result
 
 
+# Metastock mode emits RSI/CMO one bar earlier (seeded from the first delta).
+_METASTOCK_EARLY = {"CMO", "RSI", "STOCHRSI"}
+
+
+def _call_lookback(func_name: str, raw_params: dict[str, Any]) -> int:
+    from numbatalib._lookback import lookback
+
+    params = dict(_defaults(func_name))
+    params.update(raw_params)
+    kwargs = _coerce_and_clean_params(func_name, params)
+    try:
+        lb = lookback(func_name, unstable_periods=_unstable, **kwargs)
+    except ValueError:
+        _raise_bad_param(func_name)
+    if _compatibility == 1 and func_name in _METASTOCK_EARLY:
+        lb -= 1
+    return lb
+
+
 def _stream_result(result: Any) -> Any:
     if isinstance(result, tuple):
         return tuple(np.asarray(x)[-1].item() for x in result)
@@ -366,6 +382,75 @@ def _call_stream(func_name: str, raw_inputs: list[Any], raw_params: dict[str, An
     return _stream_result(_call_func(func_name, raw_inputs, raw_params))
 
 
+class _UnstableStream:
+    """Mask the first `lookback + unstable` outputs of a stream, like `_apply_unstable`."""
+
+    def __init__(self, stream: Any, unstable: int) -> None:
+        self._stream = stream
+        self._cutoff = stream.lookback + unstable
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+    def update(self, *values: Any, **kwargs: Any) -> Any:
+        result = self._stream.update(*values, **kwargs)
+        count = self._stream.count
+        if isinstance(count, np.ndarray):
+            # Batch stream: mask per symbol.
+            unstable_rows = count <= self._cutoff
+            for out in result if isinstance(result, tuple) else (result,):
+                out[unstable_rows] = np.nan
+            return result
+        if count > self._cutoff:
+            return result
+        if isinstance(result, tuple):
+            return tuple(float("nan") for _ in result)
+        return float("nan")
+
+
+def _stream_kwargs(func_name: str, raw_params: dict[str, Any]) -> dict[str, Any]:
+    params = dict(_defaults(func_name))
+    params.update(raw_params)
+    kwargs = _coerce_and_clean_params(func_name, params)
+
+    if (func_name == "EMA" and _compatibility != 0) or (
+        func_name == "RSI" and _compatibility == 1
+    ):
+        raise NotImplementedError(
+            f"{func_name} streams do not support the Metastock compatibility mode"
+        )
+    return kwargs
+
+
+def _with_unstable(func_name: str, stream: Any) -> Any:
+    unstable = _unstable.get(func_name, 0) if func_name in _UNSTABLE_FUNCS else 0
+    if unstable > 0:
+        return _UnstableStream(stream, unstable)
+    return stream
+
+
+def _create_stream(func_name: str, **raw_params: Any) -> Any:
+    from numbatalib._stream import create_stream
+
+    kwargs = _stream_kwargs(func_name, raw_params)
+    try:
+        stream = create_stream(func_name, **kwargs)
+    except ValueError:
+        _raise_bad_param(func_name)
+    return _with_unstable(func_name, stream)
+
+
+def _create_batch_stream(func_name: str, n_symbols: int, **raw_params: Any) -> Any:
+    from numbatalib._stream import create_batch_stream
+
+    kwargs = _stream_kwargs(func_name, raw_params)
+    try:
+        stream = create_batch_stream(func_name, n_symbols, **kwargs)
+    except ValueError:
+        _raise_bad_param(func_name)
+    return _with_unstable(func_name, stream)
+
+
 def _display_name_for(func_name: str) -> str:
     fn = getattr(numbatalib, func_name)
     doc = (fn.__doc__ or "").strip()
@@ -450,7 +535,7 @@ class Function:
         self._meta = _META[name]
 
         self.__input_price_series_names = _abstract_input_names(name)
-        self.parameters = OrderedDict(_DEFAULT_KWARGS.get(name, {}))
+        self.parameters = OrderedDict(_defaults(name))
         self.output_names = _abstract_output_names(name)
         self.info = {
             "name": name,
@@ -467,6 +552,10 @@ class Function:
     def input_names(self):
         return self.__input_price_series_names
 
+    @property
+    def lookback(self) -> int:
+        return _call_lookback(self.__name, dict(self.parameters))
+
     def get_input_names(self):
         return self.__input_price_series_names.copy()
 
@@ -531,45 +620,141 @@ class Function:
         return docs
 
 
-def _generate_wrappers() -> None:
-    g = globals()
-    for func_name in __TA_FUNCTION_NAMES__:
-        meta = _META[func_name]
-
-        in_params = [
-            n[len("in") :].lower() if n.startswith("in") else n.lower() for n in meta.inputs
-        ]
-        opt_params: list[tuple[str, str]] = []
-        for opt in meta.opt_inputs:
-            kw = _optin_to_kw(opt["name"])
-            c_type = opt.get("c_type", "")
-            if c_type == "double":
-                default = "TA_REAL_DEFAULT"
-            elif c_type == "TA_MAType":
-                default = "0"
-            else:
-                default = "TA_INTEGER_DEFAULT"
-            opt_params.append((kw, default))
+# Functions whose results `_call_func` post-processes in Metastock mode.
+_METASTOCK_FUNCS = {"CMO", "EMA", "RSI"}
 
-        sig_parts = list(in_params) + [f"{k}={d}" for k, d in opt_params]
-        sig = ", ".join(sig_parts)
 
-        call_inputs = ", ".join(in_params)
-        call_kwargs = ", ".join(f"'{k}': {k}" for k, _ in opt_params)
-        call_kwargs = "{" + call_kwargs + "}" if call_kwargs else "{}"
+def _to_int(v: Any) -> int:
+    if not isinstance(v, (int, float, np.number, bool)):
+        raise TypeError("an integer is required")
+    return int(v)
 
-        src = (
-            f"def {func_name}({sig}):\n"
-            f"    return _call_func('{func_name}', [{call_inputs}], {call_kwargs})\n"
-        )
-        exec(src, g, g)
 
-        s_src = (
-            f"def stream_{func_name}({sig}):\n"
-            f"    return _call_stream('{func_name}', [{call_inputs}], {call_kwargs})\n"
-        )
-        exec(s_src, g, g)
+def _to_real(v: Any) -> float:
+    if not isinstance(v, (int, float, np.number, bool)):
+        raise TypeError(f"must be real number, not {type(v).__name__}")
+    return float(v)
+
+
+def _call_plan_source(
+    func_name: str,
+    in_params: list[str],
+    opt_params: list[tuple[str, str]],
+    sig: str,
+    call_inputs: str,
+    call_kwargs: str,
+) -> str:
+    """
+    Source of `_make_plan(fn)`, returning the `NAME` and `stream_NAME` wrappers.
+
+    The wrappers do what `_call_func` does for this one function, unrolled:
+    inputs are converted, TA-Lib's default sentinels are replaced by the
+    function's defaults and `fn` is called with positional arguments. Only
+    when an unstable period or the Metastock mode applies do they fall back
+    to `_call_func`.
+    """
+    meta = _META[func_name]
+    defaults = _defaults(func_name)
+    slow = []
+    if func_name in _METASTOCK_FUNCS:
+        slow.append("_compatibility")
+    if func_name in _UNSTABLE_FUNCS:
+        slow.append(f"_unstable['{func_name}']")
+
+    body = []
+    if slow:
+        fallback = f"_call_func('{func_name}', [{call_inputs}], {call_kwargs})"
+        body += [f"if {' or '.join(slow)}:", f"    return WRAP({fallback})"]
+    body += [f"{x} = _as_1d_f64({x})" for x in in_params]
+    if len(in_params) > 1:
+        first = in_params[0]
+        mismatch = " or ".join(f"{x}.shape[0] != {first}.shape[0]" for x in in_params[1:])
+        body += [f"if {mismatch}:", "    raise Exception('input array lengths are different')"]
+    for opt, (kw, _) in zip(meta.opt_inputs, opt_params):
+        if opt.get("c_type", "") == "double":
+            body += [
+                f"if type({kw}) is not float:",
+                f"    {kw} = _to_real({kw})",
+                f"if {kw} == TA_REAL_DEFAULT:",
+                f"    {kw} = {defaults[kw]!r}",
+            ]
+        else:
+            body += [
+                f"if type({kw}) is not int:",
+                f"    {kw} = _to_int({kw})",
+                f"if {kw} == TA_INTEGER_DEFAULT:",
+                f"    {kw} = {defaults[kw]!r}",
+            ]
+    args = ", ".join(in_params + [kw for kw, _ in opt_params])
+    body += [
+        "try:",
+        f"    return WRAP(fn({args}))",
+        "except ValueError:",
+        f"    _raise_bad_param('{func_name}')",
+    ]
 
+    lines = ["def _make_plan(fn):"]
+    for name, wrap in ((func_name, ""), (f"stream_{func_name}", "_stream_result")):
+        lines.append(f"    def {name}({sig}):")
+        lines += [f"        {line.replace('WRAP', wrap)}" for line in body]
+        lines.append("")
+    lines.append(f"    return {func_name}, stream_{func_name}")
+    return "\n".join(lines) + "\n"
 
-_generate_wrappers()
 
+def _generate_wrappers(func_name: str) -> None:
+    g = globals()
+    meta = _META[func_name]
+
+    in_params = [n[len("in") :].lower() if n.startswith("in") else n.lower() for n in meta.inputs]
+    opt_params: list[tuple[str, str]] = []
+    for opt in meta.opt_inputs:
+        kw = _optin_to_kw(opt["name"])
+        c_type = opt.get("c_type", "")
+        if c_type == "double":
+            default = "TA_REAL_DEFAULT"
+        elif c_type == "TA_MAType":
+            default = "0"
+        else:
+            default = "TA_INTEGER_DEFAULT"
+        opt_params.append((kw, default))
+
+    sig_parts = list(in_params) + [f"{k}={d}" for k, d in opt_params]
+    sig = ", ".join(sig_parts)
+
+    call_inputs = ", ".join(in_params)
+    call_kwargs = ", ".join(f"'{k}': {k}" for k, _ in opt_params)
+    call_kwargs = "{" + call_kwargs + "}" if call_kwargs else "{}"
+
+    plan = _call_plan_source(func_name, in_params, opt_params, sig, call_inputs, call_kwargs)
+    ns: dict[str, Any] = {}
+    exec(plan, g, ns)
+    g[func_name], g[f"stream_{func_name}"] = ns["_make_plan"](getattr(numbatalib, func_name))
+
+    defaults = dict(opt_params)
+    lb_params = [_optin_to_kw(arg["name"]) for arg in meta.lookback_args]
+    lb_sig = ", ".join(f"{k}={defaults[k]}" for k in lb_params)
+    lb_kwargs = "{" + ", ".join(f"'{k}': {k}" for k in lb_params) + "}"
+    lb_src = (
+        f"def {func_name}_Lookback({lb_sig}):\n"
+        f"    return _call_lookback('{func_name}', {lb_kwargs})\n"
+    )
+    exec(lb_src, g, g)
+
+
+def _wrapper_func_name(name: str) -> str | None:
+    """Function name behind a wrapper name (`SMA`, `stream_SMA`, `SMA_Lookback`)."""
+    if name.startswith("stream_"):
+        name = name[len("stream_") :]
+    elif name.endswith("_Lookback"):
+        name = name[: -len("_Lookback")]
+    return name if name in _FUNCTION_NAMES else None
+
+
+def __getattr__(name: str) -> Any:
+    # Wrappers are generated on first access, so importing the shim stays cheap.
+    func_name = _wrapper_func_name(name)
+    if func_name is None:
+        raise AttributeError(name)
+    _generate_wrappers(func_name)
+    return globals()[name]
@@ -1,24 +1,32 @@
 from __future__ import annotations
 
-import numbatalib.compat.talib._ta_lib as _ta_lib
-from ._ta_lib import Function as _Function, __TA_FUNCTION_NAMES__, _get_defaults_and_docs
+from typing import Any
+
+import numbatalib.compat.talib as _talib
+from ._ta_lib import Function as _Function, __TA_FUNCTION_NAMES__, _FUNCTION_NAMES
+from ._ta_lib import _get_defaults_and_docs
 
 # backwards compat for libraries expecting these symbols from talib.abstract
 from ._ta_lib import TA_FUNC_FLAGS, TA_INPUT_FLAGS, TA_OUTPUT_FLAGS
 
-_func_obj_mapping = {func_name: getattr(_ta_lib, func_name) for func_name in __TA_FUNCTION_NAMES__}
-
 
 def Function(function_name, *args, **kwargs):
     func_name = function_name.upper()
-    if func_name not in _func_obj_mapping:
+    if func_name not in _FUNCTION_NAMES:
         raise Exception(f"{func_name} not supported by TA-LIB.")
-    return _Function(func_name, _func_obj_mapping[func_name], *args, **kwargs)
+    return _Function(func_name, getattr(_talib, func_name), *args, **kwargs)
 
 
-for _func_name in __TA_FUNCTION_NAMES__:
-    globals()[_func_name] = Function(_func_name)
+def __getattr__(name: str) -> Any:
+    # `abstract.SMA` is created on first access.
+    if name not in _FUNCTION_NAMES:
+        raise AttributeError(name)
+    fn = globals()[name] = Function(name)
+    return fn
 
 
-__all__ = ["Function", "_get_defaults_and_docs"] + list(__TA_FUNCTION_NAMES__)
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _FUNCTION_NAMES)
 
+
+__all__ = ["Function", "_get_defaults_and_docs"] + list(__TA_FUNCTION_NAMES__)
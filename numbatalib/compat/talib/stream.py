@@ -1,9 +1,32 @@
 from __future__ import annotations
 
+from functools import partial
+from typing import Any
+
 import numbatalib.compat.talib._ta_lib as _ta_lib
-from ._ta_lib import __TA_FUNCTION_NAMES__
+from ._ta_lib import __TA_FUNCTION_NAMES__, _FUNCTION_NAMES
+
+
+def __getattr__(name: str) -> Any:
+    # Built on first access, like the functions of `numbatalib.compat.talib`.
+    if name not in _FUNCTION_NAMES:
+        raise AttributeError(name)
+    from numbatalib._stream import BATCH_STREAMS as _BATCH_STREAMS, STREAMS as _STREAMS
+    from numbatalib.compat.talib import _wrapper
+
+    fn = getattr(_ta_lib, f"stream_{name}")
+    if name in _STREAMS:
+        # Stateful O(1)-per-tick variant, e.g. `stream.SMA.create(timeperiod=20).update(x)`.
+        fn.create = partial(_ta_lib._create_stream, name)
+    if name in _BATCH_STREAMS:
+        # Multi-symbol variant, e.g. `stream.EMA.create_batch(8000, timeperiod=20)`.
+        fn.create_batch = partial(_ta_lib._create_batch_stream, name)
+    fn = globals()[name] = _wrapper(fn)
+    return fn
+
 
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _FUNCTION_NAMES)
 
-for _func_name in __TA_FUNCTION_NAMES__:
-    globals()[_func_name] = getattr(_ta_lib, f"stream_{_func_name}")
 
+__all__ = list(__TA_FUNCTION_NAMES__)
@@ -0,0 +1,702 @@
+from __future__ import annotations
+
+"""
+Per-symbol evaluation on a thread pool or a process pool.
+
+Every kernel is compiled with `nogil=True`, so threads evaluating different
+symbols run their kernels concurrently; only the thin Python wrapper around
+each kernel holds the GIL:
+
+    rsi = numbatalib.parallel.map("RSI", closes, {"timeperiod": 14}, workers=8)
+
+The outputs of all symbols are allocated up front, one block per output,
+and each call writes into its slice of the block through `out=`.
+
+Symbols are 1-D series. 2-D panels already run in parallel through the
+`prange` batch kernels, and Numba's default threading layer does not
+support launching those from several threads at once.
+
+For workloads that need processes, `ProcessPool` evaluates panels held in
+`multiprocessing.shared_memory`. Workers are started and warmed up once and
+each computes a shard of the symbols into a shared output block; only names
+and shapes are pickled:
+
+    with numbatalib.parallel.ProcessPool(workers=8, functions=["ATR"]) as pool:
+        high, low, close = (pool.share(x) for x in (highs, lows, closes))
+        atr = pool.map("ATR", (high, low, close), {"timeperiod": 14, "axis": 1})
+
+`chunked` splits one long series into chunks overlapped by the function's
+lookback and evaluates them on threads, and `scan` computes the cumulative
+OBV, AD and ADOSC as a parallel prefix sum:
+
+    mx = numbatalib.parallel.chunked("MAX", close, {"timeperiod": 50}, workers=8)
+    obv = numbatalib.parallel.scan("OBV", (close, volume), workers=8)
+
+Within `ema_scan()`, EMA (and DEMA, TEMA, TRIX) on very long series runs
+as a block-parallel affine scan:
+
+    with numbatalib.parallel.ema_scan(workers=8):
+        tema = numbatalib.TEMA(close, 50)
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
+
+from numbatalib._batch import _normalize_axis, output_dtypes
+from numbatalib._core._validation import check_no_overlap, float_dtype, split_outputs
+from numbatalib._registry import _load_meta, get_function
+
+# Chunks per worker: enough to balance symbols of different lengths, few
+# enough to keep the scheduling cost per symbol small.
+_CHUNKS_PER_WORKER = 4
+
+
+def _resolve(func: str | Callable[..., Any]) -> tuple[str, Callable[..., Any]]:
+    name = func.upper() if isinstance(func, str) else getattr(func, "__name__", "")
+    fn = get_function(name)
+    if fn is None or not (isinstance(func, str) or fn is func):
+        raise ValueError(f"unknown function: {func!r}")
+    return name, fn
+
+
+def _symbol_inputs(item: Any, n_inputs: int) -> tuple[Any, ...]:
+    args = (item,) if n_inputs == 1 else tuple(item)
+    if len(args) != n_inputs:
+        raise ValueError(f"expected {n_inputs} inputs per symbol")
+    if np.ndim(args[0]) != 1:
+        raise ValueError("inputs must be 1-D per symbol")
+    return args
+
+
+def _output_blocks(func_name: str, lengths: list[int], output_dtype: Any) -> list[list[np.ndarray]]:
+    """Per output, one view per symbol into a single preallocated block."""
+    offsets = np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+    views = []
+    for dtype in output_dtypes(func_name, output_dtype):
+        block = np.empty(int(offsets[-1]), dtype=dtype)
+        views.append([block[offsets[j] : offsets[j + 1]] for j in range(len(lengths))])
+    return views
+
+
+def _chunks(n: int, n_chunks: int) -> list[range]:
+    bounds = np.linspace(0, n, n_chunks + 1).astype(int)
+    return [range(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def _n_workers(workers: int | None) -> int:
+    n_workers = (os.cpu_count() or 1) if workers is None else int(workers)
+    if n_workers < 1:
+        raise ValueError("workers must be >= 1")
+    return n_workers
+
+
+def _run_tasks(run: Callable[[Any], None], items: Sequence[Any], n_workers: int) -> None:
+    if n_workers == 1 or len(items) <= 1:
+        for item in items:
+            run(item)
+    else:
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            for future in [pool.submit(run, item) for item in items]:
+                future.result()
+
+
+def map(
+    func: str | Callable[..., Any],
+    inputs: Iterable[Any],
+    params: Mapping[str, Any] | None = None,
+    workers: int | None = None,
+) -> list[Any]:
+    """
+    Evaluate `func` for every symbol of `inputs` on `workers` threads.
+
+    `func` is a function name or a numbatalib function. Each item of `inputs`
+    is one symbol: a 1-D array for single-input functions, or a sequence of
+    1-D arrays (e.g. `(high, low, close)`) otherwise. Symbols may differ in
+    length. `params` are keyword parameters shared by all symbols. `workers`
+    defaults to the number of CPUs.
+
+    Returns one result per symbol, in order, as `func` would return it.
+    """
+    func_name, fn = _resolve(func)
+    kwargs = dict(params or {})
+    if "out" in kwargs:
+        raise ValueError("out is allocated by parallel.map")
+    n_workers = _n_workers(workers)
+
+    n_inputs = len(_load_meta()[func_name].inputs)
+    symbols = [_symbol_inputs(item, n_inputs) for item in inputs]
+    lengths = [len(args[0]) for args in symbols]
+    outputs = _output_blocks(func_name, lengths, kwargs.get("output_dtype"))
+    results: list[Any] = [None] * len(symbols)
+
+    def run(chunk: range) -> None:
+        for j in chunk:
+            out = outputs[0][j] if len(outputs) == 1 else tuple(o[j] for o in outputs)
+            results[j] = fn(*symbols[j], out=out, **kwargs)
+
+    _run_tasks(run, _chunks(len(symbols), n_workers * _CHUNKS_PER_WORKER), n_workers)
+    return results
+
+
+# Functions whose output at bar i only depends on bars [i - lookback, i], and
+# whose kernels compute each window from its own bars: chunks extended by the
+# lookback reproduce the serial output bit for bit.
+_WINDOW_EXACT = {
+    "ACOS",
+    "ADD",
+    "AROON",
+    "AROONOSC",
+    "ASIN",
+    "ATAN",
+    "AVGDEV",
+    "AVGPRICE",
+    "BOP",
+    "CEIL",
+    "COS",
+    "COSH",
+    "DIV",
+    "EXP",
+    "FLOOR",
+    "IMI",
+    "LINEARREG",
+    "LINEARREG_ANGLE",
+    "LINEARREG_INTERCEPT",
+    "LINEARREG_SLOPE",
+    "LN",
+    "LOG10",
+    "MAX",
+    "MEDPRICE",
+    "MIDPOINT",
+    "MIDPRICE",
+    "MIN",
+    "MINMAX",
+    "MOM",
+    "MULT",
+    "ROC",
+    "ROCP",
+    "ROCR",
+    "ROCR100",
+    "SIN",
+    "SINH",
+    "SQRT",
+    "SUB",
+    "TAN",
+    "TANH",
+    "TRANGE",
+    "TSF",
+    "TYPPRICE",
+    "WCLPRICE",
+    "WILLR",
+}
+
+# Window-bounded functions whose kernels keep running sums across windows (as
+# TA-Lib does). Each chunk sums its first window afresh, so the outputs only
+# match the serial ones up to the rounding drift of those sums.
+_WINDOW_RUNNING_SUM = {
+    "BETA",
+    "CCI",
+    "CORREL",
+    "MFI",
+    "SMA",
+    "STDDEV",
+    "SUM",
+    "TRIMA",
+    "ULTOSC",
+    "VAR",
+    "WMA",
+}
+
+# Smallest chunk worth a task, in bars.
+_MIN_CHUNK = 1 << 16
+
+
+def _series_inputs(func_name: str, inputs: Any) -> list[np.ndarray]:
+    from numbatalib._core._validation import as_1d_float
+
+    n_inputs = len(_load_meta()[func_name].inputs)
+    arrays = [as_1d_float(x) for x in ([inputs] if n_inputs == 1 else inputs)]
+    if len(arrays) != n_inputs:
+        raise ValueError(f"expected {n_inputs} inputs")
+    n = arrays[0].shape[0]
+    if any(a.shape[0] != n for a in arrays[1:]):
+        raise ValueError("inputs must have the same length")
+    return arrays
+
+
+def _chunk_size(n: int, n_workers: int, chunk_size: int | None) -> int:
+    if chunk_size is None:
+        return max(_MIN_CHUNK, -(-n // (n_workers * _CHUNKS_PER_WORKER)))
+    size = int(chunk_size)
+    if size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    return size
+
+
+def chunked(
+    func: str | Callable[..., Any],
+    inputs: Any,
+    params: Mapping[str, Any] | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> Any:
+    """
+    Evaluate `func` over one long series in parallel chunks.
+
+    The series is split into chunks of `chunk_size` bars (by default about
+    four per worker, at least 65536), each extended backwards by the
+    function's lookback as a halo. Chunks run on `workers` threads with the
+    regular kernels and are stitched into one output. `inputs` and `params`
+    are as for `func` itself: a 1-D array, or a sequence of them for
+    multi-input functions.
+
+    Only window-bounded functions are supported. For most of them (MAX, MIN,
+    LINEARREG, MOM, WILLR, price transforms, ...) the result is bit-identical
+    to the serial call. SMA, SUM, STDDEV, VAR, WMA, TRIMA, CORREL, BETA, CCI,
+    MFI and ULTOSC carry running sums, which drift by rounding along the
+    series; their chunked outputs differ from the serial ones by that drift.
+    """
+    from numbatalib._lookback import lookback
+
+    func_name, fn = _resolve(func)
+    if func_name not in _WINDOW_EXACT and func_name not in _WINDOW_RUNNING_SUM:
+        raise ValueError(f"{func_name} is not window-bounded")
+    kwargs = dict(params or {})
+    if "out" in kwargs:
+        raise ValueError("out is allocated by parallel.chunked")
+    n_workers = _n_workers(workers)
+    arrays = _series_inputs(func_name, inputs)
+    n = arrays[0].shape[0]
+
+    halo = lookback(func_name, **{k: v for k, v in kwargs.items() if k != "output_dtype"})
+    size = _chunk_size(n, n_workers, chunk_size)
+    if size >= n:
+        return fn(*arrays, **kwargs)
+
+    dtypes = output_dtypes(func_name, kwargs.get("output_dtype"))
+    outs = [np.empty(n, dtype=dtype) for dtype in dtypes]
+
+    def run(start: int) -> None:
+        begin = max(0, start - halo)
+        stop = min(n, start + size)
+        res = fn(*(a[begin:stop] for a in arrays), **kwargs)
+        for out, r in zip(outs, res if isinstance(res, tuple) else (res,)):
+            out[start:stop] = r[start - begin :]
+
+    _run_tasks(run, range(0, n, size), n_workers)
+    return outs[0] if len(outs) == 1 else tuple(outs)
+
+
+def _prefix_scan(
+    block: Callable[[int, int, np.ndarray], None], n: int, size: int, n_workers: int
+) -> np.ndarray:
+    """
+    Running sum of `n` bars in blocks of `size`: `block(begin, end, acc)`
+    writes the running sum of bars [begin, end) restarted at zero into
+    `acc[begin:end]`, then each block is shifted by the total of the blocks
+    before it.
+    """
+    acc = np.empty(n, dtype=np.float64)
+    starts = list(range(0, n, size))
+    _run_tasks(lambda start: block(start, min(n, start + size), acc), starts, n_workers)
+    offsets = np.cumsum(acc[[min(n, start + size) - 1 for start in starts]])
+
+    def shift(k: int) -> None:
+        acc[starts[k] : min(n, starts[k] + size)] += offsets[k - 1]
+
+    _run_tasks(shift, range(1, len(starts)), n_workers)
+    return acc
+
+
+def scan(
+    func: str | Callable[..., Any],
+    inputs: Any,
+    params: Mapping[str, Any] | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> np.ndarray:
+    """
+    Evaluate the cumulative OBV, AD or ADOSC over one long series with a
+    parallel prefix sum.
+
+    The series is split into chunks (sized as for `chunked`) whose running
+    sums are computed on `workers` threads, each restarted at zero, then
+    shifted by the totals of the chunks before them. For ADOSC the A/D line
+    is scanned this way and its two EMAs run serially over it. `inputs` and
+    `params` are as for `func` itself.
+
+    Only the order of the additions changes. OBV with integer volumes is
+    exact while the totals stay below 2**53. Otherwise each bar differs from
+    the serial result by rounding, bounded by a few ulps of the sum of the
+    absolute increments up to that bar.
+    """
+    from numbatalib._core._validation import check_int_param, nan_like
+    from numbatalib._func.ta_ad import _ad_kernel
+    from numbatalib._func.ta_adosc import _adosc_from_ad_kernel
+    from numbatalib._func.ta_obv import _obv_block_kernel
+
+    func_name, fn = _resolve(func)
+    if func_name not in ("AD", "ADOSC", "OBV"):
+        raise ValueError(f"{func_name} is not a cumulative function")
+    kwargs = dict(params or {})
+    if "out" in kwargs:
+        raise ValueError("out is allocated by parallel.scan")
+    dtype = float_dtype(kwargs.pop("output_dtype", None))
+    if func_name == "ADOSC":
+        fast = check_int_param("fastperiod", kwargs.pop("fastperiod", 3), 2, 100000)
+        slow = check_int_param("slowperiod", kwargs.pop("slowperiod", 10), 2, 100000)
+    if kwargs:
+        raise ValueError(f"unexpected parameters for {func_name}: {sorted(kwargs)}")
+    n_workers = _n_workers(workers)
+    arrays = _series_inputs(func_name, inputs)
+    n = arrays[0].shape[0]
+
+    size = _chunk_size(n, n_workers, chunk_size)
+    if size >= n:
+        return fn(*arrays, **dict(params or {}))
+
+    if func_name == "OBV":
+        real, volume = arrays
+        result = _prefix_scan(
+            lambda begin, end, acc: _obv_block_kernel(real, volume, begin, end, acc),
+            n,
+            size,
+            n_workers,
+        )
+        return result if dtype == np.float64 else result.astype(dtype)
+
+    high, low, close, volume = arrays
+    ad = _prefix_scan(
+        lambda begin, end, acc: _ad_kernel(
+            high[begin:end], low[begin:end], close[begin:end], volume[begin:end], acc[begin:end]
+        ),
+        n,
+        size,
+        n_workers,
+    )
+    if func_name == "AD":
+        return ad if dtype == np.float64 else ad.astype(dtype)
+    out = nan_like(ad, dtype=dtype)
+    _adosc_from_ad_kernel(ad, fast, slow, out)
+    return out
+
+# Default series length from which `ema_scan()` evaluates EMA in parallel.
+_MIN_PARALLEL_EMA = 10_000_000
+
+
+def _ema_affine_scan(
+    real: np.ndarray, timeperiod: int, out: np.ndarray, workers: int, chunk_size: int | None
+) -> None:
+    """
+    `_ema_kernel` as a block-parallel affine scan.
+
+    e[i] = k * x[i] + (1 - k) * e[i - 1] composes affinely: the first chunk
+    runs the serial kernel; every later chunk runs the recurrence from a zero
+    state on its own thread; the state entering each chunk is then carried
+    forward serially, one multiply-add per chunk; and each chunk adds that
+    state decayed by (1 - k)**m to its m-th bar, until the term underflows.
+    """
+    from numbatalib._func.ta_ema import _ema_block_kernel, _ema_kernel, _ema_shift_kernel
+
+    n = real.shape[0]
+    if timeperiod > n:
+        return
+    size = max(_chunk_size(n, workers, chunk_size), timeperiod)
+    acc = out if out.dtype == np.float64 else np.empty(n, dtype=np.float64)
+    k = 2.0 / (timeperiod + 1.0)
+    decay = 1.0 - k
+    starts = list(range(size, n, size))
+
+    def block(start: int) -> None:
+        if start == 0:
+            _ema_kernel(real[:size], timeperiod, acc[:size])
+        else:
+            _ema_block_kernel(real, start, min(n, start + size), k, acc)
+
+    _run_tasks(block, [0] + starts, workers)
+    carries = [float(acc[size - 1])]
+    for start in starts[:-1]:
+        end = start + size
+        carries.append(float(acc[end - 1]) + carries[-1] * decay**size)
+
+    def shift(j: int) -> None:
+        start = starts[j]
+        _ema_shift_kernel(start, min(n, start + size), decay, carries[j], acc)
+
+    _run_tasks(shift, range(len(starts)), workers)
+    if acc is not out:
+        out[timeperiod - 1 :] = acc[timeperiod - 1 :]
+
+
+@contextmanager
+def ema_scan(
+    workers: int | None = None, min_size: int = _MIN_PARALLEL_EMA, chunk_size: int | None = None
+) -> Iterator[None]:
+    """
+    Evaluate EMA as a parallel affine scan on series of at least `min_size` bars.
+
+    Applies to EMA and to what is built on it in Python: DEMA, TEMA, TRIX and
+    MA(matype=1), called from the calling thread (or asyncio task) within the
+    block; other threads, including worker pools started inside it, keep the
+    serial kernel. MACD, T3 and ADOSC keep their fused serial kernels.
+    Shorter series, and 2-D inputs (already parallel over series), use the
+    serial kernel.
+
+    The serial kernel evaluates ((x - e) * k) + e bar by bar; the scan adds
+    the state entering each chunk separately, decayed by (1 - k)**m. Results
+    differ from the serial ones by rounding of the order of the recurrence's
+    own accumulated error: a few ulps of max|x| times `timeperiod` at worst,
+    typically a few ulps.
+    """
+    from numbatalib._func import ta_ema
+
+    if chunk_size is not None and int(chunk_size) < 1:
+        raise ValueError("chunk_size must be >= 1")
+    token = ta_ema._parallel.set((_n_workers(workers), int(min_size), chunk_size))
+    try:
+        yield
+    finally:
+        ta_ema._parallel.reset(token)
+
+
+# (shared memory name, shape, dtype string): an array as passed to a worker.
+_ArraySpec = tuple[str, tuple[int, ...], str]
+
+
+@dataclass
+class SharedPanel:
+    """
+    An array in a shared memory block, created by `ProcessPool.share` or
+    returned by `ProcessPool.map(..., shared=True)`.
+
+    The pool that created the panel owns the block. `array` is valid until
+    `release()` or the pool's `close()` unmaps and frees it. Copy data that
+    must outlive the pool, and drop every view of `array` before then.
+    """
+
+    shm: SharedMemory
+    array: np.ndarray
+
+    @classmethod
+    def create(cls, shape: tuple[int, ...], dtype: Any) -> SharedPanel:
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        shm = SharedMemory(create=True, size=size)
+        return cls(shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+    @property
+    def spec(self) -> _ArraySpec:
+        return (self.shm.name, self.array.shape, self.array.dtype.str)
+
+    def release(self) -> None:
+        """Free the shared memory early; the panel must not be used afterwards."""
+        if self.shm is None:
+            return
+        self.array = None
+        self.shm.close()
+        self.shm.unlink()
+        self.shm = None
+
+
+def _init_worker(functions: Sequence[str]) -> None:
+    import numba
+
+    from numbatalib.warmup import _calls
+
+    # One Numba thread per process: the pool already uses every core.
+    numba.set_num_threads(1)
+    f64 = np.dtype(np.float64)
+    for _, call in _calls(list(functions), [f64], [False], [f64], extras=False):
+        call()
+
+
+def _compute_shard(
+    func_name: str,
+    inputs: list[_ArraySpec],
+    outputs: list[_ArraySpec],
+    kwargs: dict[str, Any],
+    shard: tuple[slice, ...],
+    handles: list[SharedMemory],
+) -> None:
+    def attach(spec: _ArraySpec) -> np.ndarray:
+        name, shape, dtype = spec
+        handles.append(SharedMemory(name=name))
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=handles[-1].buf)[shard]
+
+    args = [attach(spec) for spec in inputs]
+    outs = [attach(spec) for spec in outputs]
+    out = outs[0] if len(outs) == 1 else tuple(outs)
+    get_function(func_name)(*args, out=out, **kwargs)
+
+
+def _run_shard(task: tuple[Any, ...]) -> None:
+    handles: list[SharedMemory] = []
+    try:
+        _compute_shard(*task, handles)
+    finally:
+        for shm in handles:
+            try:
+                shm.close()
+            except BufferError:
+                # Still referenced by a traceback; unmapped when that is freed.
+                pass
+
+
+class ProcessPool:
+    """
+    Process pool evaluating registered functions over shared-memory panels.
+
+    `workers` processes (default: the number of CPUs) are started up front
+    with `start_method`, and each compiles or loads the kernels of
+    `functions` before taking work. Use as a context manager, or call
+    `close()`, which also frees every `SharedPanel` the pool handed out.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        functions: Iterable[str] = (),
+        start_method: str = "spawn",
+    ) -> None:
+        self.workers = _n_workers(workers)
+        names = [_resolve(f)[0] for f in functions]
+        ctx = multiprocessing.get_context(start_method)
+        self._pool = ctx.Pool(self.workers, initializer=_init_worker, initargs=(names,))
+        self._shared: list[SharedPanel] = []
+
+    def share(self, x: Any) -> SharedPanel:
+        """Copy `x` into shared memory once, for use in several `map` calls."""
+        arr = np.asarray(x)
+        panel = SharedPanel.create(arr.shape, arr.dtype)
+        panel.array[...] = arr
+        self._shared.append(panel)
+        return panel
+
+    def map(
+        self,
+        func: str | Callable[..., Any],
+        inputs: Any,
+        params: Mapping[str, Any] | None = None,
+        *,
+        out: Any = None,
+        shared: bool = False,
+    ) -> Any:
+        """
+        Evaluate `func` over 2-D panels, sharded by symbol across the workers.
+
+        `inputs` is a panel, or a sequence of panels for multi-input
+        functions; panels are arrays or `SharedPanel`s. Arrays are copied into
+        shared memory for this call only. `params` are keyword parameters,
+        including `axis` (the time axis, 0 by default) and `output_dtype`.
+
+        Workers write the outputs into shared memory blocks. By default each
+        block is copied into a new array and freed, so the result briefly
+        takes twice its size; for large panels avoid the copy with either
+        option:
+
+        - `shared=True` returns the blocks as `SharedPanel`s owned by the
+          pool (see `SharedPanel` for their lifetime);
+        - `out` gives the output panels (a tuple for multi-output functions).
+          `SharedPanel`s, e.g. from an earlier `shared=True` call, are
+          written in place; arrays receive one copy of the result.
+
+        Returns what `func` returns for the 2-D inputs, or the `out` /
+        `SharedPanel` outputs.
+        """
+        func_name, _ = _resolve(func)
+        kwargs = dict(params or {})
+        if "out" in kwargs:
+            raise ValueError("pass out to ProcessPool.map, not in params")
+        if shared and out is not None:
+            raise ValueError("shared=True returns new panels; it cannot be combined with out")
+        n_inputs = len(_load_meta()[func_name].inputs)
+        items = [inputs] if n_inputs == 1 else list(inputs)
+        if len(items) != n_inputs:
+            raise ValueError(f"expected {n_inputs} input panels")
+
+        temporary: list[SharedPanel] = []
+        created: list[SharedPanel] = []
+        try:
+            panels = []
+            for x in items:
+                if not isinstance(x, SharedPanel):
+                    arr = np.asarray(x)
+                    x = SharedPanel.create(arr.shape, arr.dtype)
+                    x.array[...] = arr
+                    temporary.append(x)
+                panels.append(x)
+            shape = panels[0].array.shape
+            if len(shape) != 2 or any(p.array.shape != shape for p in panels):
+                raise ValueError("inputs must be 2-D panels of the same shape")
+
+            dtypes = output_dtypes(func_name, kwargs.get("output_dtype"))
+            given = (out,) if len(dtypes) == 1 else split_outputs(out, len(dtypes))
+            outputs = []
+            for dtype, buf in zip(dtypes, given):
+                if buf is not None:
+                    arr = buf.array if isinstance(buf, SharedPanel) else buf
+                    if not isinstance(arr, np.ndarray):
+                        raise ValueError("out must be numpy arrays or SharedPanels")
+                    if arr.shape != shape:
+                        raise ValueError(f"out must have shape {shape}")
+                    if arr.dtype != dtype:
+                        raise ValueError(f"out must have dtype {dtype.name}")
+                    if not arr.flags.writeable:
+                        raise ValueError("out must be writeable")
+                    check_no_overlap(arr, [p.array for p in panels])
+                if isinstance(buf, SharedPanel):
+                    outputs.append(buf)
+                    continue
+                panel = SharedPanel.create(shape, dtype)
+                created.append(panel)
+                outputs.append(panel)
+
+            symbol_axis = 1 - _normalize_axis(kwargs.get("axis", 0))
+            tasks = []
+            for chunk in _chunks(shape[symbol_axis], self.workers * _CHUNKS_PER_WORKER):
+                shard = (slice(None),) * symbol_axis + (slice(chunk.start, chunk.stop),)
+                tasks.append(
+                    (
+                        func_name,
+                        [p.spec for p in panels],
+                        [o.spec for o in outputs],
+                        kwargs,
+                        shard,
+                    )
+                )
+            self._pool.map(_run_shard, tasks)
+            if shared:
+                # Handed to the caller: freed by `release()` or `close()`.
+                self._shared += created
+                created = []
+                results = outputs
+            else:
+                results = []
+                for buf, panel in zip(given, outputs):
+                    if isinstance(buf, np.ndarray):
+                        buf[...] = panel.array
+                    results.append(buf if buf is not None else panel.array.copy())
+        finally:
+            for panel in temporary + created:
+                panel.release()
+        return results[0] if len(results) == 1 else tuple(results)
+
+    def close(self) -> None:
+        """Stop the workers and free the panels created by `share`."""
+        self._pool.close()
+        self._pool.join()
+        for panel in self._shared:
+            panel.release()
+        self._shared.clear()
+
+    def __enter__(self) -> ProcessPool:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
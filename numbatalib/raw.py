@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+"""
+Raw, TA-Lib C-style range API.
+
+    import numbatalib.raw as raw
+
+    beg, nb, out = raw.SMA(start_idx, end_idx, real, timeperiod=20)
+
+Every function takes `(start_idx, end_idx, *inputs, **params)` and returns
+`(out_beg_idx, out_nb_element, *outputs)` with compact outputs (no NaN
+prefix), like `TA_<NAME>(startIdx, endIdx, ...)`: `outputs[k][i]` is the
+value at bar `out_beg_idx + i`.
+
+Only `inputs[start_idx - lookback : end_idx + 1]` is read, so asking for the
+last 500 bars of a long series costs the warm-up plus 500 bars. As in
+TA-Lib, recursive indicators (EMA, RSI, ...) are seeded at
+`start_idx - lookback`, so their values can differ from the full-series
+result at the same bar.
+"""
+
+from typing import Any, Callable
+
+import numpy as np
+
+from numbatalib._core._params import output_dtype
+from numbatalib._lookback import lookback
+from numbatalib._registry import _load_meta, get_function, implemented_functions
+
+
+def call(
+    func_name: str, start_idx: int, end_idx: int, inputs: tuple[Any, ...], params: dict[str, Any]
+) -> tuple[Any, ...]:
+    """Evaluate `func_name` over `[start_idx, end_idx]`; see the module docstring."""
+    fn = get_function(func_name)
+    if fn is None:
+        raise ValueError(f"unknown function: {func_name}")
+
+    start = int(start_idx)
+    end = int(end_idx)
+    if start < 0:
+        raise ValueError("start_idx out of range")
+    if end < 0 or end < start:
+        raise ValueError("end_idx out of range")
+
+    arrays = [np.asarray(x) for x in inputs]
+    if any(a.ndim != 1 for a in arrays):
+        raise ValueError("input must be 1-D")
+    n = arrays[0].shape[0]
+    if any(a.shape[0] != n for a in arrays[1:]):
+        raise ValueError("inputs must have the same length")
+    if end >= n:
+        raise ValueError("end_idx out of range")
+
+    lb = lookback(func_name, **params)
+    beg = max(start, lb)
+    if beg > end:
+        empty = tuple(np.empty(0, dtype=output_dtype(o)) for o in _load_meta()[func_name].outputs)
+        return (0, 0, *empty)
+
+    res = fn(*(a[beg - lb : end + 1] for a in arrays), **params)
+    outs = res if isinstance(res, tuple) else (res,)
+    return (beg, end - beg + 1, *(o[lb:] for o in outs))
+
+
+def _make(func_name: str) -> Callable[..., tuple[Any, ...]]:
+    def raw_func(start_idx: int, end_idx: int, *inputs: Any, **params: Any) -> tuple[Any, ...]:
+        return call(func_name, start_idx, end_idx, inputs, params)
+
+    raw_func.__name__ = func_name
+    raw_func.__qualname__ = func_name
+    raw_func.__doc__ = f"TA_{func_name}: raw range API (see `numbatalib.raw`)."
+    return raw_func
+
+
+def __getattr__(name: str) -> Callable[..., tuple[Any, ...]]:
+    if name not in implemented_functions():
+        raise AttributeError(name)
+    fn = _make(name)
+    globals()[name] = fn
+    return fn
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(implemented_functions()))
+
+
+__all__ = ["call"]
@@ -13,11 +13,13 @@ It is equivalent to:
 """
 
 from .compat import talib as _talib
-from .compat.talib import *  # noqa: F403
 
 
-def __getattr__(name: str):  # pragma: no cover
-    return getattr(_talib, name)
+def __getattr__(name: str):
+    # Resolved names are bound here so later lookups skip this hook.
+    value = getattr(_talib, name)
+    globals()[name] = value
+    return value
 
 
 def __dir__():  # pragma: no cover
@@ -25,4 +27,3 @@ def __dir__():  # pragma: no cover
 
 
 __all__ = list(getattr(_talib, "__all__", []))
-
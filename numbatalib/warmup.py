@@ -0,0 +1,383 @@
+from __future__ import annotations
+
+"""
+Ahead-of-time JIT warm-up.
+
+    python -m numbatalib.warmup --cache-dir /opt/numba-cache --dtypes float64,float32
+
+Every implemented function is called on synthetic data, once per input
+dtype, input layout and output dtype. Functions with a moving-average type
+are called once per MA type. The 2-D batch kernels, streams and parameter
+sweeps are run too. Each kernel specialization therefore compiles once and
+is written to Numba's on-disk cache.
+
+`--cache-dir` sets `NUMBA_CACHE_DIR` before any kernel module is imported.
+Processes that start with the same `NUMBA_CACHE_DIR`, and the package
+installed at the same path, load the compiled kernels instead of recompiling
+them. This lets a cache be baked into a read-only image. Numba keys cache
+entries by source path and file stamp, so the package must be installed at
+the same path and left unchanged.
+
+The report lists the self compile time of every kernel signature, excluding
+nested compilations of the kernels it calls, and counts signatures loaded
+from the cache.
+"""
+
+import argparse
+import csv
+import inspect
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+
+from numbatalib._core._params import input_to_arg, output_dtype, param_specs
+from numbatalib._core._validation import _KERNEL_DTYPES
+from numbatalib._registry import _load_meta, get_function, implemented_functions
+
+# Bars per synthetic series: longer than every default lookback.
+_N = 256
+
+
+@dataclass(frozen=True)
+class CompileRecord:
+    kernel: str  # "<module>.<function>"
+    signature: str
+    seconds: float  # self compile time; 0.0 when loaded from the cache
+    cached: bool
+
+
+def set_cache_dir(path: str | os.PathLike[str]) -> Path:
+    """
+    Direct Numba's kernel cache to `path`, which is created if missing.
+
+    Must run before any numbatalib kernel module is imported: each Numba
+    dispatcher picks its cache location when its module is imported.
+    """
+    if any(name.startswith("numbatalib._func.") for name in sys.modules):
+        raise RuntimeError("the cache directory must be set before any kernel is imported")
+    cache_dir = Path(path).resolve()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    os.environ["NUMBA_CACHE_DIR"] = str(cache_dir)
+    config = sys.modules.get("numba.core.config")
+    if config is not None:
+        config.CACHE_DIR = str(cache_dir)
+    return cache_dir
+
+
+def _series(dtype: np.dtype, strided: bool) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    close = 100.0 + np.cumsum(rng.standard_normal(_N))
+    series = {
+        "open": close + 0.25,
+        "high": close + 1.0,
+        "low": close - 1.0,
+        "close": close,
+        "volume": 1000.0 + 100.0 * rng.random(_N),
+        "periods": rng.integers(2, 30, _N).astype(np.float64),
+    }
+    out = {}
+    for name, x in series.items():
+        x = x.astype(dtype)
+        # Every other element of a twice-as-long buffer: a non-contiguous view.
+        out[name] = np.repeat(x, 2)[::2] if strided else x
+    return out
+
+
+def _inputs(func_name: str, series: dict[str, np.ndarray]) -> list[np.ndarray]:
+    names = _load_meta()[func_name].inputs
+    return [series.get(input_to_arg(name), series["close"]) for name in names]
+
+
+def _param_variants(func_name: str) -> list[dict[str, Any]]:
+    variants: list[dict[str, Any]] = [{}]
+    for spec in param_specs(func_name):
+        if spec.kind == "matype":
+            variants += [{spec.name: matype} for matype in range(1, 9)]
+    return variants
+
+
+# One-pass bundles outside the TA-Lib function list: (input series, the
+# functions they compute). A bundle is warmed up with any of its functions.
+_BUNDLES: dict[str, tuple[list[str], tuple[str, ...]]] = {
+    "DMI": (
+        ["high", "low", "close"],
+        ("ADX", "ADXR", "ATR", "DX", "MINUS_DI", "MINUS_DM", "PLUS_DI", "PLUS_DM"),
+    ),
+    "HT_ALL": (
+        ["close"],
+        ("HT_DCPERIOD", "HT_DCPHASE", "HT_PHASOR", "HT_SINE", "HT_TRENDLINE", "HT_TRENDMODE"),
+    ),
+}
+
+
+def _bundles(functions: list[str]) -> list[tuple[str, list[str]]]:
+    """(name, input series) of the bundles `functions` use, CDL_SCAN included."""
+    out = [
+        (name, names)
+        for name, (names, parts) in _BUNDLES.items()
+        if any(f in parts for f in functions)
+    ]
+    if any(f.startswith("CDL") for f in functions):
+        out.append(("CDL_SCAN", ["open", "high", "low", "close"]))
+    return out
+
+
+def _accepts_output_dtype(func_name: str, fn: Any) -> bool:
+    # Functions with only pattern/index outputs take integer `output_dtype`s.
+    outputs = _load_meta()[func_name].outputs
+    if all(output_dtype(name) == np.int32 for name in outputs):
+        return False
+    return "output_dtype" in inspect.signature(fn).parameters
+
+
+def _calls(
+    functions: list[str],
+    dtypes: list[np.dtype],
+    layouts: list[bool],
+    output_dtypes: list[np.dtype],
+    extras: bool = True,
+) -> Iterator[tuple[str, Any]]:
+    """
+    (function name, thunk) for every call of the warm-up.
+
+    `layouts` holds `strided` flags; 2-D panels are only built for contiguous
+    inputs. The one-pass bundles (HT_ALL, DMI, CDL_SCAN) run with the
+    functions they compute, every CDL function also with `sparse=True`, and
+    the `timeperiod` sweeps on every dtype and layout. `extras` adds the
+    streams, Metastock EMA and the parallel scans (`parallel.scan`,
+    `parallel.ema_scan`), which always run on float64.
+    """
+    import numbatalib
+    from numbatalib._sweep import _TIMEPERIOD_SWEEPS, sweep
+
+    for dtype in dtypes:
+        for layout in layouts:
+            series = _series(dtype, layout)
+            for func_name in functions:
+                fn = get_function(func_name)
+                inputs = _inputs(func_name, series)
+                for params in _param_variants(func_name):
+                    for out_dtype in output_dtypes:
+                        kw = dict(params)
+                        if out_dtype != np.float64:
+                            if not _accepts_output_dtype(func_name, fn):
+                                continue
+                            kw["output_dtype"] = out_dtype
+                        yield func_name, lambda fn=fn, inputs=inputs, kw=kw: fn(*inputs, **kw)
+                        if not layout:
+                            panels = [np.stack([x, x[::-1]], axis=1) for x in inputs]
+                            yield func_name, lambda fn=fn, p=panels, kw=kw: fn(*p, **kw)
+                if func_name.startswith("CDL"):
+                    yield func_name, lambda fn=fn, inputs=inputs: fn(*inputs, sparse=True)
+                if func_name in _TIMEPERIOD_SWEEPS:
+                    real = series["close"]
+                    yield func_name, lambda f=func_name, x=real: sweep(f, x, timeperiod=[2, 3])
+            for name, names in _bundles(functions):
+                fn = getattr(numbatalib, name)
+                inputs = [series[x] for x in names]
+                panels = [np.stack([x, x[::-1]], axis=1) for x in inputs]
+                for out_dtype in output_dtypes if name != "CDL_SCAN" else [np.float64]:
+                    kw = {} if out_dtype == np.float64 else {"output_dtype": out_dtype}
+                    yield name, lambda fn=fn, inputs=inputs, kw=kw: fn(*inputs, **kw)
+                    if not layout:
+                        yield name, lambda fn=fn, p=panels, kw=kw: fn(*p, **kw)
+
+    if not extras:
+        return
+
+    from numbatalib import parallel
+    from numbatalib._stream import BATCH_STREAMS, STREAMS, create_batch_stream, create_stream
+
+    series = _series(np.dtype(np.float64), False)
+    for func_name in functions:
+        n_inputs = len(_load_meta()[func_name].inputs)
+        if func_name in STREAMS:
+            values = [float(x[0]) for x in _inputs(func_name, series)]
+            yield func_name, lambda f=func_name, v=values: create_stream(f).update(*v)
+        if func_name in BATCH_STREAMS:
+            vectors = [np.full(4, 100.0)] * n_inputs
+            yield func_name, lambda f=func_name, v=vectors: create_batch_stream(f, 4).update(*v)
+        if func_name == "EMA":
+            from numbatalib.compat.talib._ta_lib import _ema_metastock
+
+            yield func_name, lambda x=series["close"]: _ema_metastock(x, 10)
+            yield func_name, lambda x=series["close"]: _ema_scan(x)
+        if func_name in ("AD", "ADOSC", "OBV"):
+            inputs = _inputs(func_name, series)
+            yield func_name, lambda f=func_name, v=inputs: parallel.scan(
+                f, v, workers=2, chunk_size=_N // 4
+            )
+
+
+def _ema_scan(real: np.ndarray) -> None:
+    from numbatalib import parallel
+
+    with parallel.ema_scan(workers=2, min_size=0, chunk_size=_N // 4):
+        get_function("EMA")(real)
+
+
+def _dispatchers() -> Iterator[Any]:
+    from numba.core.dispatcher import Dispatcher
+
+    seen: set[int] = set()
+    for name, module in list(sys.modules.items()):
+        if not name.startswith("numbatalib") or module is None:
+            continue
+        for obj in vars(module).values():
+            if isinstance(obj, Dispatcher) and id(obj) not in seen:
+                seen.add(id(obj))
+                yield obj
+
+
+def _kernel_name(dispatcher: Any) -> str:
+    return f"{dispatcher.py_func.__module__}.{dispatcher.py_func.__qualname__}"
+
+
+def _format_signature(args: Iterable[Any]) -> str:
+    return "(" + ", ".join(str(a) for a in args) + ")"
+
+
+def _compile_listener() -> Any:
+    from numba.core import event
+
+    class _CompileTimer(event.Listener):
+        """Self time of each `numba:compile` event, minus nested compilations."""
+
+        def __init__(self) -> None:
+            self.records: list[CompileRecord] = []
+            self._stack: list[list[float]] = []
+
+        def on_start(self, ev: Any) -> None:
+            self._stack.append([time.perf_counter(), 0.0])
+
+        def on_end(self, ev: Any) -> None:
+            start, nested = self._stack.pop()
+            elapsed = time.perf_counter() - start
+            if self._stack:
+                self._stack[-1][1] += elapsed
+            self.records.append(
+                CompileRecord(
+                    kernel=_kernel_name(ev.data["dispatcher"]),
+                    signature=_format_signature(ev.data["args"]),
+                    seconds=elapsed - nested,
+                    cached=False,
+                )
+            )
+
+    return _CompileTimer()
+
+
+def warmup(
+    functions: Iterable[str] | None = None,
+    dtypes: Iterable[Any] = ("float64",),
+    strided: bool = False,
+    output_dtypes: Iterable[Any] = ("float64",),
+) -> list[CompileRecord]:
+    """
+    Compile every kernel specialization the given configuration uses.
+
+    `dtypes` are input dtypes (float64, float32, int64, int32). `strided` also
+    compiles the non-contiguous 1-D input variants. `output_dtypes` are
+    float64 and/or float32. Returns one record per kernel signature that was
+    compiled or loaded from the cache.
+    """
+    from numba.core import event
+
+    names = implemented_functions() if functions is None else [f.upper() for f in functions]
+    unknown = sorted(set(names) - set(implemented_functions()))
+    if unknown:
+        raise ValueError(f"unknown function: {unknown[0]}")
+    in_dtypes = [np.dtype(d) for d in dtypes]
+    for d in in_dtypes:
+        if d not in _KERNEL_DTYPES:
+            raise ValueError(f"unsupported input dtype: {d}")
+    out_dtypes = [np.dtype(d) for d in output_dtypes]
+    for d in out_dtypes:
+        if d not in (np.float64, np.float32):
+            raise ValueError("output_dtypes must be float32 or float64")
+
+    hits_before = {
+        (id(d), sig): hits for d in _dispatchers() for sig, hits in d.stats.cache_hits.items()
+    }
+    layouts = [False, True] if strided else [False]
+    listener = _compile_listener()
+    with event.install_listener("numba:compile", listener):
+        for func_name, call in _calls(names, in_dtypes, layouts, out_dtypes):
+            try:
+                call()
+            except Exception as e:
+                raise RuntimeError(f"warm-up of {func_name} failed") from e
+
+    records = list(listener.records)
+    for d in _dispatchers():
+        for sig, hits in d.stats.cache_hits.items():
+            if hits > hits_before.get((id(d), sig), 0):
+                records.append(CompileRecord(_kernel_name(d), _format_signature(sig), 0.0, True))
+    return records
+
+
+def _split(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m numbatalib.warmup",
+        description="Compile numbatalib's Numba kernels ahead of time into the on-disk cache.",
+    )
+    parser.add_argument(
+        "--cache-dir", help="Numba cache directory (sets NUMBA_CACHE_DIR for this process)."
+    )
+    parser.add_argument("--functions", help="Comma-separated function names (default: all).")
+    parser.add_argument(
+        "--dtypes", default="float64", help="Comma-separated input dtypes (default: float64)."
+    )
+    parser.add_argument(
+        "--strided", action="store_true", help="Also compile non-contiguous 1-D input variants."
+    )
+    parser.add_argument(
+        "--output-dtypes",
+        default="float64",
+        help="Comma-separated output dtypes (default: float64).",
+    )
+    parser.add_argument("--report", help="Write every compile record to this CSV file.")
+    parser.add_argument("--top", type=int, default=20, help="Slowest kernels to print.")
+    args = parser.parse_args(argv)
+
+    if args.cache_dir:
+        print(f"Numba cache: {set_cache_dir(args.cache_dir)}")
+
+    t0 = time.perf_counter()
+    records = warmup(
+        functions=_split(args.functions) if args.functions else None,
+        dtypes=_split(args.dtypes),
+        strided=args.strided,
+        output_dtypes=_split(args.output_dtypes),
+    )
+    wall = time.perf_counter() - t0
+
+    compiled = sorted((r for r in records if not r.cached), key=lambda r: -r.seconds)
+    n_cached = sum(r.cached for r in records)
+    print(
+        f"Compiled {len(compiled)} kernel signatures in {sum(r.seconds for r in compiled):.2f}s, "
+        f"loaded {n_cached} from the cache (wall {wall:.2f}s)."
+    )
+    for r in compiled[: args.top]:
+        print(f"{r.seconds * 1e3:9.1f} ms  {r.kernel}{r.signature}")
+
+    if args.report:
+        with open(args.report, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["kernel", "signature", "seconds", "cached"])
+            for r in compiled + [r for r in records if r.cached]:
+                writer.writerow([r.kernel, r.signature, f"{r.seconds:.6f}", int(r.cached)])
+        print(f"Wrote {args.report}")
+
+
+if __name__ == "__main__":
+    main()
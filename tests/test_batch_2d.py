@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+from tools.parity_harness import make_inputs, make_parity_case
+
+
+def _as_tuple(x):
+    return x if isinstance(x, tuple) else (x,)
+
+
+@pytest.mark.parametrize("func_name", numbatalib.implemented_functions())
+@pytest.mark.parametrize("axis", [0, 1])
+def test_2d_matches_per_series(func_name: str, axis: int) -> None:
+    n = 256
+    kwargs = make_parity_case(func_name, n=n, seed=1).kwargs
+    series = [make_inputs(func_name, n=n, seed=seed) for seed in (1, 2, 3, 4)]
+    fn = getattr(numbatalib, func_name)
+
+    panels = [np.stack(cols, axis=1 - axis) for cols in zip(*series)]
+    got = _as_tuple(fn(*panels, **kwargs, axis=axis))
+
+    for j, inputs in enumerate(series):
+        expected = _as_tuple(fn(*inputs, **kwargs))
+        assert len(got) == len(expected)
+        for g, e in zip(got, expected):
+            assert g.shape == panels[0].shape
+            assert g.dtype == e.dtype
+            col = g[:, j] if axis == 0 else g[j]
+            np.testing.assert_array_equal(col, e)
+
+
+def test_2d_accepts_fortran_and_strided_inputs() -> None:
+    rng = np.random.default_rng(0)
+    panel = np.asfortranarray(rng.normal(size=(300, 5)).cumsum(axis=0))
+    got = numbatalib.SMA(panel[::2], timeperiod=10)
+    for j in range(panel.shape[1]):
+        np.testing.assert_array_equal(got[:, j], numbatalib.SMA(panel[::2, j], timeperiod=10))
+
+
+def test_2d_validation() -> None:
+    panel = np.zeros((50, 3))
+    with pytest.raises(ValueError):
+        numbatalib.SMA(panel, timeperiod=1)
+    with pytest.raises(ValueError):
+        numbatalib.SMA(panel, axis=2)
+    with pytest.raises(ValueError):
+        numbatalib.ATR(panel, panel, np.zeros((50, 2)))
+
+
+def test_2d_out_buffers_are_written_in_place() -> None:
+    rng = np.random.default_rng(1)
+    panel = rng.normal(size=(200, 4)).cumsum(axis=0)
+    out = np.empty_like(panel)
+    res = numbatalib.EMA(panel, timeperiod=10, out=out)
+    assert res is out
+    np.testing.assert_array_equal(out, numbatalib.EMA(panel, timeperiod=10))
+
+    bufs = tuple(np.empty_like(panel) for _ in range(3))
+    res = numbatalib.BBANDS(panel, timeperiod=10, out=bufs)
+    assert all(a is b for a, b in zip(res, bufs))
+    for a, b in zip(res, numbatalib.BBANDS(panel, timeperiod=10)):
+        np.testing.assert_array_equal(a, b)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+
+PATTERNS = [name for name in numbatalib.implemented_functions() if name.startswith("CDL")]
+
+
+def _ohlc(n: int, seed: int = 5, rounded: bool = False):
+    rng = np.random.default_rng(seed)
+    close = 100.0 + rng.normal(size=n).cumsum()
+    open_ = close + rng.normal(scale=0.5, size=n)
+    high = np.maximum(open_, close) + rng.random(n)
+    low = np.minimum(open_, close) - rng.random(n)
+    if rounded:
+        # Whole-number prices give equal opens/closes, dojis and flat shadows.
+        open_, high, low, close = (np.round(x) for x in (open_, high, low, close))
+    else:
+        open_[::7] = close[::7]
+    return open_, high, low, close
+
+
+@pytest.mark.parametrize("n", [0, 1, 5, 11, 12, 13, 14, 15, 600, 9000])
+@pytest.mark.parametrize("rounded", [False, True])
+def test_cdl_scan_matches_each_pattern(n: int, rounded: bool) -> None:
+    ohlc = _ohlc(n, rounded=rounded)
+    got = numbatalib.CDL_SCAN(*ohlc)
+    assert got.dtype == np.int8
+    assert got.shape == (n, len(PATTERNS)) == (n, 61)
+    for p, name in enumerate(PATTERNS):
+        expected = numbatalib.get_function(name)(*ohlc) // 100
+        np.testing.assert_array_equal(got[:, p], expected, err_msg=name)
+
+
+def test_cdl_scan_subset_penetration_and_dtypes() -> None:
+    ohlc = _ohlc(800, rounded=True)
+    names = ["cdlmorningstar", "CDLHIKKAKE", "CDLDOJI", "CDLMATHOLD"]
+    got = numbatalib.CDL_SCAN(*ohlc, patterns=names, penetration=0.1)
+    assert got.shape == (800, 4)
+    np.testing.assert_array_equal(got[:, 0], numbatalib.CDLMORNINGSTAR(*ohlc, 0.1) // 100)
+    np.testing.assert_array_equal(got[:, 1], numbatalib.CDLHIKKAKE(*ohlc) // 100)
+    np.testing.assert_array_equal(got[:, 2], numbatalib.CDLDOJI(*ohlc) // 100)
+    np.testing.assert_array_equal(got[:, 3], numbatalib.CDLMATHOLD(*ohlc, 0.1) // 100)
+
+    single = numbatalib.CDL_SCAN(*ohlc, patterns="CDLENGULFING")
+    np.testing.assert_array_equal(single[:, 0], numbatalib.CDLENGULFING(*ohlc) // 100)
+
+    for make in (lambda x: x.astype(np.float32), lambda x: x.astype(np.int64)):
+        converted = [make(x) for x in ohlc]
+        np.testing.assert_array_equal(
+            numbatalib.CDL_SCAN(*converted, patterns=names),
+            numbatalib.CDL_SCAN(*(np.asarray(x, dtype=np.float64) for x in converted), patterns=names),
+        )
+
+
+def test_cdl_scan_2d_and_errors() -> None:
+    series = [_ohlc(400, seed=s) for s in range(3)]
+    panel = [np.stack([s[k] for s in series], axis=1) for k in range(4)]
+    got = numbatalib.CDL_SCAN(*panel)
+    assert got.shape == (400, 3, 61)
+    for j, ohlc in enumerate(series):
+        np.testing.assert_array_equal(got[:, j], numbatalib.CDL_SCAN(*ohlc))
+    got_t = numbatalib.CDL_SCAN(*(x.T for x in panel), patterns=PATTERNS[:5], axis=1)
+    np.testing.assert_array_equal(got_t, got[:, :, :5].transpose(1, 0, 2))
+
+    ohlc = series[0]
+    with pytest.raises(ValueError, match="unknown candlestick pattern"):
+        numbatalib.CDL_SCAN(*ohlc, patterns=["SMA"])
+    with pytest.raises(ValueError, match="must not be empty"):
+        numbatalib.CDL_SCAN(*ohlc, patterns=[])
+    with pytest.raises(ValueError, match="same length"):
+        numbatalib.CDL_SCAN(ohlc[0], ohlc[1][:-1], ohlc[2], ohlc[3])
+
+
+def test_generated_pattern_kernels_are_current() -> None:
+    # Run `python tools/generate_cdl_scan.py` after changing a `_bar` function
+    # or the `_<NAME>_TOTALS`/`_<NAME>_SETUP` next to it.
+    from numbatalib._generated.cdl_scan_patterns import CDL_PATTERNS
+    from tools.generate_cdl_scan import OUT_PATH, generate
+
+    assert OUT_PATH.read_text(encoding="utf-8") == generate()
+    assert list(CDL_PATTERNS) == PATTERNS
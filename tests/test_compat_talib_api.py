@@ -13,7 +13,7 @@ abstract_ref = pytest.importorskip("talib.abstract")
 def _reset_globals():
     talib_ref.set_compatibility(0)
     talib_nb.set_compatibility(0)
-    for fn in ["EMA", "RSI", "CMO"]:
+    for fn in ["ADX", "ATR", "CMO", "DX", "EMA", "RSI"]:
         try:
             talib_ref.set_unstable_period(fn, 0)
         except KeyError:
@@ -136,3 +136,44 @@ def test_unstable_period_masks_leading_outputs_like_talib() -> None:
         talib_ref.get_unstable_period("SMA")
     with pytest.raises(KeyError):
         talib_nb.get_unstable_period("SMA")
+
+
+def test_lookback_functions_match_talib_with_unstable_periods() -> None:
+    import numbatalib.compat.talib.abstract as abstract_nb
+
+    for fn, period in [("ADX", 3), ("ATR", 4), ("CMO", 2), ("DX", 5), ("EMA", 6)]:
+        talib_ref.set_unstable_period(fn, period)
+        talib_nb.set_unstable_period(fn, period)
+
+    cases = [
+        ("EMA", {"timeperiod": 10}),
+        ("DEMA", {"timeperiod": 10}),
+        ("TRIX", {"timeperiod": 7}),
+        ("MACD", {}),
+        ("ADOSC", {"fastperiod": 4, "slowperiod": 12}),
+        ("BBANDS", {"timeperiod": 9, "matype": 4}),
+        ("ADXR", {"timeperiod": 6}),
+        ("ATR", {}),
+        ("CMO", {"timeperiod": 9}),
+        ("DX", {}),
+        ("SMA", {"timeperiod": 9}),
+        ("CDLHAMMER", {}),
+    ]
+    for name, params in cases:
+        f = abstract_ref.Function(name)
+        f.set_parameters(params)
+        assert getattr(talib_nb, f"{name}_Lookback")(**params) == f.lookback, name
+
+        g = abstract_nb.Function(name)
+        g.set_parameters(params)
+        assert g.lookback == f.lookback, name
+
+    # Metastock mode: RSI/CMO emit one value earlier.
+    talib_ref.set_compatibility(1)
+    talib_nb.set_compatibility(1)
+    for name in ["RSI", "CMO"]:
+        assert getattr(talib_nb, f"{name}_Lookback")() == abstract_ref.Function(name).lookback
+
+    with pytest.raises(Exception, match="TA_BAD_PARAM"):
+        talib_nb.SMA_Lookback(timeperiod=1)
+
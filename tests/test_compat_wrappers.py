@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib.compat.talib as talib_nb
+
+
+def test_generated_wrappers_match_generic_call_path() -> None:
+    from numbatalib.compat.talib import _ta_lib
+
+    rng = np.random.default_rng(3)
+    close = 100.0 + np.cumsum(rng.standard_normal(120))
+    series = {"inHigh": close + 1.0, "inLow": close - 1.0, "inVolume": close * 10.0}
+
+    for name in talib_nb.get_functions():
+        meta = _ta_lib._META[name]
+        inputs = [series.get(i, close) for i in meta.inputs]
+        # Integer-valued parameters given as numpy scalars and floats, plus the sentinels.
+        defaults = _ta_lib._defaults(name)
+        for params in (
+            {},
+            {k: np.int64(v) if isinstance(v, int) else float(v) for k, v in defaults.items()},
+            {
+                _ta_lib._optin_to_kw(o["name"]): (
+                    talib_nb.TA_REAL_DEFAULT
+                    if o.get("c_type") == "double"
+                    else talib_nb.TA_INTEGER_DEFAULT
+                )
+                for o in meta.opt_inputs
+                if o.get("c_type") != "TA_MAType"
+            },
+        ):
+            got = getattr(talib_nb, name)(*inputs, **params)
+            expected = _ta_lib._call_func(name, inputs, params)
+            got = got if isinstance(got, tuple) else (got,)
+            expected = expected if isinstance(expected, tuple) else (expected,)
+            for g, e in zip(got, expected, strict=True):
+                np.testing.assert_array_equal(g, e, err_msg=name)
+
+    with pytest.raises(TypeError, match="an integer is required"):
+        talib_nb.SMA(close, timeperiod="5")
+    with pytest.raises(TypeError, match="must be real number, not str"):
+        talib_nb.BBANDS(close, nbdevup="2")
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+
+
+def _bars(n: int, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    close = 100.0 + rng.normal(size=n).cumsum()
+    high, low = close + rng.random(n), close - rng.random(n)
+    if n > 12:
+        # Flat bars give zero true ranges and exercise the zero-denominator paths.
+        high[5:9] = low[5:9] = close[5:9] = close[5]
+    return high, low, close
+
+
+def _individual(high, low, close, timeperiod: int, **kwargs) -> list[np.ndarray]:
+    hlc = (high, low, close)
+    return [
+        numbatalib.ADX(*hlc, timeperiod, **kwargs),
+        numbatalib.ADXR(*hlc, timeperiod, **kwargs),
+        numbatalib.DX(*hlc, timeperiod, **kwargs),
+        numbatalib.PLUS_DI(*hlc, timeperiod, **kwargs),
+        numbatalib.MINUS_DI(*hlc, timeperiod, **kwargs),
+        numbatalib.PLUS_DM(high, low, timeperiod, **kwargs),
+        numbatalib.MINUS_DM(high, low, timeperiod, **kwargs),
+        numbatalib.ATR(*hlc, timeperiod, **kwargs),
+    ]
+
+
+@pytest.mark.parametrize("n", [0, 1, 3, 13, 14, 15, 27, 28, 40, 41, 42, 800])
+@pytest.mark.parametrize("timeperiod", [2, 3, 14])
+@pytest.mark.parametrize(
+    "make", [lambda x: x, lambda x: x.astype(np.float32), lambda x: np.round(x).astype(np.int64)]
+)
+def test_dmi_is_bit_identical_to_each_function(n: int, timeperiod: int, make) -> None:
+    high, low, close = (make(x) for x in _bars(n))
+    got = numbatalib.DMI(high, low, close, timeperiod)
+    expected = _individual(high, low, close, timeperiod)
+    assert len(got) == len(expected) == 8
+    for g, e in zip(got, expected):
+        np.testing.assert_array_equal(g, e)
+
+
+def test_dmi_2d_out_and_errors() -> None:
+    rng = np.random.default_rng(8)
+    close = 100.0 + rng.normal(size=(300, 3)).cumsum(axis=0)
+    high, low = close + 1.0, close - rng.random((300, 3))
+    for g, e in zip(numbatalib.DMI(high, low, close), _individual(high, low, close, 14)):
+        np.testing.assert_array_equal(g, e)
+    hlc_t = (high.T, low.T, close.T)
+    for g, e in zip(numbatalib.DMI(*hlc_t, 9, axis=1), _individual(*hlc_t, 9, axis=1)):
+        np.testing.assert_array_equal(g, e)
+
+    out = tuple(np.empty(300, dtype=np.float32) for _ in range(8))
+    got = numbatalib.DMI(high[:, 0], low[:, 0], close[:, 0], out=out, output_dtype=np.float32)
+    assert all(g is o for g, o in zip(got, out))
+    expected = _individual(high[:, 0], low[:, 0], close[:, 0], 14, output_dtype=np.float32)
+    for g, e in zip(got, expected):
+        np.testing.assert_array_equal(g, e)
+
+    with pytest.raises(ValueError, match="timeperiod out of range"):
+        numbatalib.DMI(high[:, 0], low[:, 0], close[:, 0], timeperiod=1)
+    with pytest.raises(ValueError, match="same length"):
+        numbatalib.DMI(high[:, 0], low[:-1, 0], close[:, 0])
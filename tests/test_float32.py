@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+from numbatalib._core._validation import as_1d_float
+from tools.parity_harness import make_parity_case
+
+
+def _as_tuple(x):
+    return x if isinstance(x, tuple) else (x,)
+
+
+# Functions whose TA_S_<NAME> reads every input into a double before using it,
+# so float32 inputs give the float64 result of the same (upcast) values.
+_PROMOTING = ["SMA", "EMA", "RSI", "ATR", "ADX", "BBANDS", "MACD", "STDDEV", "HT_SINE", "SIN"]
+
+
+@pytest.mark.parametrize("func_name", _PROMOTING)
+def test_float32_inputs_accumulate_in_float64(func_name: str) -> None:
+    case = make_parity_case(func_name, n=500, seed=3)
+    inputs32 = [x.astype(np.float32) for x in case.inputs]
+    fn = getattr(numbatalib, func_name)
+
+    got = _as_tuple(fn(*inputs32, **case.kwargs))
+    expected = _as_tuple(fn(*(x.astype(np.float64) for x in inputs32), **case.kwargs))
+    for g, e in zip(got, expected):
+        assert g.dtype == np.float64
+        np.testing.assert_array_equal(g, e)
+
+
+@pytest.mark.parametrize("func_name", ["SMA", "RSI", "BBANDS", "MACDEXT", "MINMAX", "ADD"])
+def test_output_dtype_float32_rounds_the_float64_result(func_name: str) -> None:
+    case = make_parity_case(func_name, n=500, seed=4)
+    fn = getattr(numbatalib, func_name)
+
+    expected = _as_tuple(fn(*case.inputs, **case.kwargs))
+    got = _as_tuple(fn(*case.inputs, **case.kwargs, output_dtype=np.float32))
+    for g, e in zip(got, expected):
+        assert g.dtype == np.float32
+        np.testing.assert_array_equal(g, e.astype(np.float32))
+
+    panels = [np.stack([x, x[::-1]], axis=1).astype(np.float32) for x in case.inputs]
+    got_2d = _as_tuple(fn(*panels, **case.kwargs, output_dtype="float32"))
+    expected_1d = _as_tuple(fn(*(p[:, 0] for p in panels), **case.kwargs, output_dtype="float32"))
+    for g, e in zip(got_2d, expected_1d):
+        assert g.dtype == np.float32
+        np.testing.assert_array_equal(g[:, 0], e)
+
+
+def test_float32_inputs_are_not_copied() -> None:
+    x = np.linspace(1.0, 2.0, 100, dtype=np.float32)
+    assert as_1d_float(x) is x
+    assert as_1d_float(x.astype(np.float64)).dtype == np.float64
+    assert as_1d_float(np.arange(3, dtype=np.int16)).dtype == np.float64
+
+
+def test_output_dtype_validation_and_out_buffers() -> None:
+    x = np.linspace(1.0, 2.0, 100, dtype=np.float32)
+    out = np.empty(100, dtype=np.float32)
+    res = numbatalib.EMA(x, timeperiod=10, out=out, output_dtype=np.float32)
+    assert res is out
+
+    with pytest.raises(ValueError):
+        numbatalib.EMA(x, timeperiod=10, out=out)
+    with pytest.raises(ValueError):
+        numbatalib.EMA(x, timeperiod=10, output_dtype=np.int32)
+    with pytest.raises(ValueError):
+        numbatalib.EMA(x, timeperiod=10, output_dtype="not-a-dtype")
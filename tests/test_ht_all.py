@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+
+
+def _individual(real, **kwargs) -> list[np.ndarray]:
+    return [
+        numbatalib.HT_DCPERIOD(real, **kwargs),
+        numbatalib.HT_DCPHASE(real, **kwargs),
+        *numbatalib.HT_PHASOR(real, **kwargs),
+        *numbatalib.HT_SINE(real, **kwargs),
+        numbatalib.HT_TRENDLINE(real, **kwargs),
+        numbatalib.HT_TRENDMODE(real, **{k: v for k, v in kwargs.items() if k != "output_dtype"}),
+    ]
+
+
+@pytest.mark.parametrize("n", [0, 20, 33, 50, 63, 64, 1500])
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda x: x,
+        lambda x: x.astype(np.float32),
+        lambda x: np.round(x * 10).astype(np.int64),
+        lambda x: np.repeat(x, 2)[::2],
+    ],
+)
+def test_ht_all_is_bit_identical_to_each_function(n: int, make) -> None:
+    real = make(100.0 + np.random.default_rng(n).normal(size=n).cumsum())
+    got = numbatalib.HT_ALL(real)
+    expected = _individual(real)
+    assert len(got) == len(expected) == 8
+    for g, e in zip(got, expected):
+        assert g.dtype == e.dtype
+        np.testing.assert_array_equal(g, e)
+
+
+def test_ht_all_2d_out_and_output_dtype() -> None:
+    real = 100.0 + np.random.default_rng(1).normal(size=(300, 4)).cumsum(axis=0)
+    for g, e in zip(numbatalib.HT_ALL(real), _individual(real)):
+        np.testing.assert_array_equal(g, e)
+    for g, e in zip(numbatalib.HT_ALL(real.T, axis=1), _individual(real.T, axis=1)):
+        np.testing.assert_array_equal(g, e)
+
+    out = tuple(np.empty(300, dtype=np.float32) for _ in range(7)) + (np.empty(300, np.int32),)
+    got = numbatalib.HT_ALL(real[:, 0], out=out, output_dtype=np.float32)
+    assert all(g is o for g, o in zip(got, out))
+    for g, e in zip(got, _individual(real[:, 0], output_dtype=np.float32)):
+        np.testing.assert_array_equal(g, e)
+    with pytest.raises(ValueError, match="tuple of 8"):
+        numbatalib.HT_ALL(real[:, 0], out=out[:6])
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+from numbatalib import parallel
+
+PATTERNS = [name for name in numbatalib.implemented_functions() if name.startswith("CDL")]
+WIDE = {"CDLHIKKAKE", "CDLHIKKAKEMOD"}
+
+
+def _ohlc(n: int, seed: int = 11):
+    rng = np.random.default_rng(seed)
+    close = np.round(100.0 + rng.normal(size=n).cumsum())
+    open_ = np.round(close + rng.normal(scale=0.5, size=n))
+    high = np.maximum(open_, close) + np.round(rng.random(n))
+    low = np.minimum(open_, close) - np.round(rng.random(n))
+    return open_, high, low, close
+
+
+@pytest.mark.parametrize("name", PATTERNS)
+def test_narrow_pattern_outputs_match_int32(name: str) -> None:
+    ohlc = _ohlc(700)
+    fn = numbatalib.get_function(name)
+    expected = fn(*ohlc)
+    assert expected.dtype == np.int32
+    for dtype in (np.int16,) if name in WIDE else (np.int8, np.int16):
+        got = fn(*ohlc, output_dtype=dtype)
+        assert got.dtype == dtype
+        np.testing.assert_array_equal(got, expected, err_msg=name)
+
+        idx, val = fn(*ohlc, sparse=True, output_dtype=dtype)
+        assert val.dtype == dtype
+        np.testing.assert_array_equal(idx, np.flatnonzero(expected))
+        np.testing.assert_array_equal(val, expected[idx])
+
+
+def test_index_outputs_int64() -> None:
+    x = np.random.default_rng(3).normal(size=500).cumsum()
+    for name in ("MAXINDEX", "MININDEX"):
+        fn = numbatalib.get_function(name)
+        got = fn(x, timeperiod=20, output_dtype=np.int64)
+        assert got.dtype == np.int64
+        np.testing.assert_array_equal(got, fn(x, timeperiod=20))
+    lo, hi = numbatalib.MINMAXINDEX(x, timeperiod=20, output_dtype="int64")
+    assert lo.dtype == hi.dtype == np.int64
+    np.testing.assert_array_equal(lo, numbatalib.MININDEX(x, timeperiod=20))
+    np.testing.assert_array_equal(hi, numbatalib.MAXINDEX(x, timeperiod=20))
+
+    mode = numbatalib.HT_TRENDMODE(x, output_dtype=np.int8)
+    assert mode.dtype == np.int8
+    np.testing.assert_array_equal(mode, numbatalib.HT_TRENDMODE(x))
+
+
+def test_2d_out_and_parallel() -> None:
+    series = [_ohlc(300, seed=s) for s in range(3)]
+    panel = [np.stack([s[k] for s in series], axis=1) for k in range(4)]
+    got = numbatalib.CDLENGULFING(*panel, output_dtype=np.int8)
+    assert got.dtype == np.int8
+    for j, ohlc in enumerate(series):
+        np.testing.assert_array_equal(got[:, j], numbatalib.CDLENGULFING(*ohlc))
+
+    x = panel[3]
+    idx = numbatalib.MAXINDEX(x, timeperiod=10, output_dtype=np.int64)
+    assert idx.dtype == np.int64
+    np.testing.assert_array_equal(idx, numbatalib.MAXINDEX(x, timeperiod=10))
+
+    buf = np.empty(300, dtype=np.int8)
+    assert numbatalib.CDLDOJI(*series[0], out=buf, output_dtype=np.int8) is buf
+    np.testing.assert_array_equal(buf, numbatalib.CDLDOJI(*series[0]))
+    with pytest.raises(ValueError):
+        numbatalib.CDLDOJI(*series[0], out=buf)
+
+    results = parallel.map("CDLHAMMER", series, params={"output_dtype": np.int8}, workers=2)
+    for res, ohlc in zip(results, series):
+        assert res.dtype == np.int8
+        np.testing.assert_array_equal(res, numbatalib.CDLHAMMER(*ohlc))
+
+
+def test_invalid_int_output_dtype() -> None:
+    ohlc = _ohlc(50)
+    x = ohlc[3]
+    with pytest.raises(ValueError, match="output_dtype of CDLHIKKAKE must be one of int16, int32"):
+        numbatalib.CDLHIKKAKE(*ohlc, output_dtype=np.int8)
+    with pytest.raises(ValueError, match="output_dtype of MAXINDEX"):
+        numbatalib.MAXINDEX(x, output_dtype=np.int16)
+    with pytest.raises(ValueError, match="output_dtype of MINMAXINDEX"):
+        numbatalib.MINMAXINDEX(x, output_dtype=np.int8)
+    with pytest.raises(ValueError, match="output_dtype of CDLDOJI"):
+        numbatalib.CDLDOJI(*ohlc, output_dtype=np.float32)
+    with pytest.raises(ValueError, match="output_dtype of CDLDOJI"):
+        numbatalib.CDLDOJI(*ohlc, output_dtype="not a dtype")
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _loaded_after(stmt: str) -> dict[str, object]:
+    code = (
+        f"import json, sys\n{stmt}\n"
+        "print(json.dumps({'func_modules': sorted(m for m in sys.modules "
+        "if m.startswith('numbatalib._func.')), 'numba': 'numba' in sys.modules}))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(proc.stdout)
+
+
+def test_importing_the_talib_shim_does_not_load_kernels() -> None:
+    loaded = _loaded_after("import numbatalib.talib, numbatalib.compat.talib.abstract")
+    assert loaded == {"func_modules": [], "numba": False}
+
+
+def test_talib_functions_are_built_per_function() -> None:
+    loaded = _loaded_after(
+        "import numbatalib.talib as talib\n"
+        "from numbatalib.compat.talib import abstract\n"
+        "talib.SMA(list(range(10)), 3); talib.SMA_Lookback(5); abstract.SMA.lookback"
+    )
+    # `ta_ma` holds the MA lookback table used by `lookback()`.
+    assert loaded["func_modules"] == ["numbatalib._func.ta_ma", "numbatalib._func.ta_sma"]
+
+
+def test_lazy_names_are_listed() -> None:
+    import numbatalib.talib as talib
+    from numbatalib.compat.talib import abstract, stream
+
+    for name in ("SMA", "stream_SMA", "SMA_Lookback", "get_functions"):
+        assert name in dir(talib)
+    assert "MACD" in dir(abstract)
+    assert "MACD" in dir(stream)
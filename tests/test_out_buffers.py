@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+from tools.parity_harness import make_parity_case
+
+
+def _as_tuple(x):
+    return x if isinstance(x, tuple) else (x,)
+
+
+@pytest.mark.parametrize("func_name", numbatalib.implemented_functions())
+def test_out_matches_fresh_allocation(func_name: str) -> None:
+    case = make_parity_case(func_name, n=300, seed=3)
+    fn = getattr(numbatalib, func_name)
+    expected = _as_tuple(fn(*case.inputs, **case.kwargs))
+
+    # Stale contents must not leak into the result.
+    bufs = tuple(np.full(e.shape, 7, dtype=e.dtype) for e in expected)
+    out = bufs if len(bufs) > 1 else bufs[0]
+    got = _as_tuple(fn(*case.inputs, **case.kwargs, out=out))
+
+    for g, b, e in zip(got, bufs, expected):
+        assert g is b
+        np.testing.assert_array_equal(g, e)
+
+
+def test_out_validation() -> None:
+    x = np.linspace(1.0, 2.0, 50)
+    with pytest.raises(ValueError, match="shape"):
+        numbatalib.SMA(x, out=np.empty(49))
+    with pytest.raises(ValueError, match="dtype"):
+        numbatalib.SMA(x, out=np.empty(50, dtype=np.float32))
+    with pytest.raises(ValueError, match="dtype"):
+        numbatalib.CDLDOJI(x, x, x, x, out=np.empty(50))
+    with pytest.raises(ValueError, match="tuple"):
+        numbatalib.MACD(x, out=np.empty(50))
+    ro = np.empty(50)
+    ro.flags.writeable = False
+    with pytest.raises(ValueError, match="writeable"):
+        numbatalib.SMA(x, out=ro)
+
+
+def test_out_accepts_strided_views() -> None:
+    x = np.random.default_rng(0).normal(size=100).cumsum()
+    grid = np.zeros((100, 2))
+    numbatalib.SMA(x, timeperiod=5, out=grid[:, 1])
+    np.testing.assert_array_equal(grid[:, 1], numbatalib.SMA(x, timeperiod=5))
+    assert not grid[:, 0].any()
+
+
+def test_out_aliasing_an_input_is_rejected() -> None:
+    y = np.arange(20.0)
+    with pytest.raises(ValueError, match="share memory"):
+        numbatalib.SMA(y, 5, out=y)
+    h, l, c = y + 1.0, y - 1.0, y.copy()
+    with pytest.raises(ValueError, match="share memory"):
+        numbatalib.ATR(h, l, c, 5, out=c)
+    with pytest.raises(ValueError, match="share memory"):
+        numbatalib.MACD(y, out=(np.empty(20), y, np.empty(20)))
+    np.testing.assert_array_equal(y, np.arange(20.0))
+    np.testing.assert_array_equal(c, np.arange(20.0))
+
+    # Columns of one block do not overlap.
+    block = np.zeros((20, 2))
+    block[:, 0] = y
+    numbatalib.SMA(block[:, 0], 5, out=block[:, 1])
+    np.testing.assert_array_equal(block[:, 1], numbatalib.SMA(y, 5))
+
+
+def test_2d_out_aliasing_an_input_is_rejected() -> None:
+    x = np.random.default_rng(0).normal(size=(60, 3)).cumsum(axis=0) + 100.0
+    for axis, panel in ((0, x.copy()), (1, np.ascontiguousarray(x.T))):
+        before = panel.copy()
+        with pytest.raises(ValueError, match="share memory"):
+            numbatalib.SMA(panel, 5, axis=axis, out=panel)
+        # Bundle kernels go through `apply_2d_kernel`.
+        with pytest.raises(ValueError, match="share memory"):
+            numbatalib.DMI(panel, panel - 1.0, panel, axis=axis, out=(panel,) + (None,) * 7)
+        np.testing.assert_array_equal(panel, before)
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import numbatalib
+from numbatalib._generated.func_index import FUNC_MODULES
+
+
+def _as_tuple(x):
+    return x if isinstance(x, tuple) else (x,)
+
+
+def _symbols(lengths):
+    rng = np.random.default_rng(11)
+    return [100.0 + np.cumsum(rng.standard_normal(n)) for n in lengths]
+
+
+def test_every_kernel_releases_the_gil() -> None:
+    for module in FUNC_MODULES.values():
+        importlib.import_module(module)
+    importlib.import_module("numbatalib._generated.batch_kernels")
+    importlib.import_module("numbatalib._sweep")
+    importlib.import_module("numbatalib._stream")
+    importlib.import_module("numbatalib.compat.talib._metastock")
+
+    from numbatalib.warmup import _dispatchers, _kernel_name
+
+    dispatchers = list(_dispatchers())
+    assert len(dispatchers) > 300
+    for d in dispatchers:
+        assert d.targetoptions.get("nogil"), _kernel_name(d)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+@pytest.mark.parametrize(
+    ("func", "params"),
+    [("RSI", {"timeperiod": 9}), ("MACD", {}), ("BBANDS", {"matype": 1}), ("ATR", {})],
+)
+def test_map_matches_per_symbol_calls(func: str, params: dict, workers: int) -> None:
+    closes = _symbols([120, 7, 300, 0, 64, 250])
+    n_inputs = len(numbatalib._registry._load_meta()[func].inputs)
+    symbols = [(c + 1.0, c - 1.0, c) if n_inputs == 3 else c for c in closes]
+
+    got = numbatalib.parallel.map(func, symbols, params, workers=workers)
+    assert len(got) == len(symbols)
+    fn = getattr(numbatalib, func)
+    for item, result in zip(symbols, got):
+        args = item if isinstance(item, tuple) else (item,)
+        for g, e in zip(_as_tuple(result), _as_tuple(fn(*args, **params)), strict=True):
+            np.testing.assert_array_equal(g, e)
+
+
+def test_map_preallocates_one_block_per_output() -> None:
+    closes = _symbols([50, 80, 30])
+    results = numbatalib.parallel.map(
+        numbatalib.MACD, closes, {"output_dtype": np.float32}, workers=2
+    )
+    for k in range(3):
+        assert {id(r[k].base) for r in results} == {id(results[0][k].base)}
+        assert results[0][k].dtype == np.float32
+
+    patterns = numbatalib.parallel.map("CDLDOJI", [(c, c + 1, c - 1, c) for c in closes])
+    assert all(p.dtype == np.int32 for p in patterns)
+
+
+def test_map_errors() -> None:
+    closes = _symbols([40])
+    with pytest.raises(ValueError, match="unknown function"):
+        numbatalib.parallel.map("NOPE", closes)
+    with pytest.raises(ValueError, match="unknown function"):
+        numbatalib.parallel.map(np.mean, closes)
+    with pytest.raises(ValueError, match="expected 3 inputs per symbol"):
+        numbatalib.parallel.map("ATR", [(closes[0], closes[0])])
+    with pytest.raises(ValueError, match="1-D per symbol"):
+        numbatalib.parallel.map("SMA", [np.ones((10, 2))])
+    with pytest.raises(ValueError, match="workers"):
+        numbatalib.parallel.map("SMA", closes, workers=0)
+    with pytest.raises(ValueError, match="out is allocated"):
+        numbatalib.parallel.map("SMA", closes, {"out": None})
+    with pytest.raises(ValueError, match="timeperiod out of range"):
+        numbatalib.parallel.map("SMA", closes, {"timeperiod": 1}, workers=2)
+
+
+def test_process_pool_matches_panel_calls() -> None:
+    rng = np.random.default_rng(5)
+    close = 100.0 + np.cumsum(rng.standard_normal((9, 150)), axis=1)
+    high, low = close + 1.0, close - 1.0
+
+    with numbatalib.parallel.ProcessPool(workers=2, functions=["ATR"]) as pool:
+        shared = [pool.share(x) for x in (high, low, close)]
+        got = pool.map("ATR", shared, {"timeperiod": 10, "axis": 1})
+        np.testing.assert_array_equal(got, numbatalib.ATR(high, low, close, 10, axis=1))
+
+        # Time along axis 0, plain arrays, several outputs.
+        got = pool.map(numbatalib.MACD, close.T, {"output_dtype": np.float32})
+        expected = numbatalib.MACD(close.T, output_dtype=np.float32)
+        for g, e in zip(got, expected, strict=True):
+            np.testing.assert_array_equal(g, e)
+
+        with pytest.raises(ValueError, match="timeperiod out of range"):
+            pool.map("SMA", close, {"timeperiod": 1, "axis": 1})
+        with pytest.raises(ValueError, match="expected 3 input panels"):
+            pool.map("ATR", (high, low))
+        with pytest.raises(ValueError, match="2-D panels"):
+            pool.map("SMA", close[0])
+    assert all(panel.shm is None for panel in shared)
+
+
+def test_process_pool_results_stay_in_shared_memory() -> None:
+    rng = np.random.default_rng(6)
+    close = 100.0 + np.cumsum(rng.standard_normal((8, 120)), axis=1)
+    expected = numbatalib.MACD(close, axis=1)
+
+    with numbatalib.parallel.ProcessPool(workers=2, functions=["MACD", "SMA"]) as pool:
+        panels = pool.map("MACD", close, {"axis": 1}, shared=True)
+        assert all(isinstance(p, numbatalib.parallel.SharedPanel) for p in panels)
+        for p, e in zip(panels, expected, strict=True):
+            np.testing.assert_array_equal(p.array, e)
+
+        # Shared panels are written in place; arrays receive one copy.
+        bufs = (panels[0], np.empty_like(close), None)
+        got = pool.map("MACD", close * 2.0, {"axis": 1}, out=bufs)
+        assert got[0] is panels[0] and got[1] is bufs[1]
+        for g, e in zip(got, numbatalib.MACD(close * 2.0, axis=1), strict=True):
+            np.testing.assert_array_equal(g.array if g is panels[0] else g, e)
+
+        with pytest.raises(ValueError, match="shape"):
+            pool.map("SMA", close, {"axis": 1}, out=np.empty((8, 119)))
+        with pytest.raises(ValueError, match="cannot be combined"):
+            pool.map("SMA", close, {"axis": 1}, out=np.empty_like(close), shared=True)
+        with pytest.raises(ValueError, match="share memory"):
+            pool.map("SMA", panels[1], {"axis": 1}, out=panels[1])
+    assert all(p.shm is None for p in panels)
+
+
+@pytest.mark.parametrize(
+    ("func", "params"),
+    [
+        ("MAX", {"timeperiod": 20}),
+        ("MIN", {}),
+        ("MINMAX", {"timeperiod": 7}),
+        ("WILLR", {}),
+        ("AROON", {"timeperiod": 10}),
+        ("LINEARREG", {"timeperiod": 9}),
+        ("ADD", {}),
+    ],
+)
+def test_chunked_window_functions_are_bit_identical(func: str, params: dict) -> None:
+    close = _symbols([5000])[0]
+    n_inputs = len(numbatalib._registry._load_meta()[func].inputs)
+    args = (close + 1.0, close - 1.0, close)[:n_inputs] if n_inputs > 1 else (close,)
+    inputs = args if n_inputs > 1 else close
+    expected = _as_tuple(getattr(numbatalib, func)(*args, **params))
+    for workers in (1, 3):
+        got = numbatalib.parallel.chunked(func, inputs, params, workers=workers, chunk_size=333)
+        for g, e in zip(_as_tuple(got), expected, strict=True):
+            np.testing.assert_array_equal(g, e)
+
+
+@pytest.mark.parametrize("func", ["SMA", "STDDEV", "SUM", "CORREL"])
+def test_chunked_running_sums_match_to_rounding(func: str) -> None:
+    close, other = _symbols([5000, 5000])
+    inputs = (close, other) if func == "CORREL" else close
+    expected = getattr(numbatalib, func)(*_as_tuple(inputs), timeperiod=12)
+    got = numbatalib.parallel.chunked(func, inputs, {"timeperiod": 12}, workers=2, chunk_size=500)
+    np.testing.assert_array_equal(np.isnan(got), np.isnan(expected))
+    np.testing.assert_allclose(got, expected, rtol=1e-9, atol=1e-7)
+
+
+def test_chunked_errors() -> None:
+    close = _symbols([100])[0]
+    with pytest.raises(ValueError, match="not window-bounded"):
+        numbatalib.parallel.chunked("EMA", close)
+    with pytest.raises(ValueError, match="chunk_size"):
+        numbatalib.parallel.chunked("SMA", close, chunk_size=0)
+    with pytest.raises(ValueError, match="same length"):
+        numbatalib.parallel.chunked("CORREL", (close, close[:-1]), chunk_size=10)
+    # A single chunk is the serial call.
+    np.testing.assert_array_equal(numbatalib.parallel.chunked("SMA", close), numbatalib.SMA(close))
+
+
+def _ohlcv(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.standard_normal(n))
+    high, low = close + rng.random(n), close - rng.random(n)
+    return high, low, close, rng.uniform(1e3, 1e6, n)
+
+
+def test_scan_obv_with_integer_volumes_is_exact() -> None:
+    _, _, close, volume = _ohlcv(5000, 2)
+    volume = np.round(volume)
+    expected = numbatalib.OBV(close, volume)
+    for workers, chunk_size in ((1, 1), (3, 333), (2, 4999)):
+        got = numbatalib.parallel.scan(
+            "OBV", (close, volume), workers=workers, chunk_size=chunk_size
+        )
+        np.testing.assert_array_equal(got, expected)
+
+
+@pytest.mark.parametrize(
+    ("func", "params"),
+    [("OBV", {}), ("AD", {}), ("ADOSC", {}), ("ADOSC", {"fastperiod": 7, "slowperiod": 4})],
+)
+def test_scan_matches_serial_to_rounding(func: str, params: dict) -> None:
+    high, low, close, volume = _ohlcv(5000, 3)
+    inputs = (close, volume) if func == "OBV" else (high, low, close, volume)
+    expected = getattr(numbatalib, func)(*inputs, **params)
+    got = numbatalib.parallel.scan(func, inputs, params, workers=3, chunk_size=333)
+    np.testing.assert_array_equal(np.isnan(got), np.isnan(expected))
+    # A few ulps of the sum of the absolute increments so far.
+    tolerance = 8 * np.finfo(np.float64).eps * np.cumsum(volume)
+    assert np.all(np.abs(got - expected)[~np.isnan(got)] <= tolerance[~np.isnan(got)])
+
+
+def test_adosc_from_ad_line_is_bit_identical() -> None:
+    from numbatalib._func.ta_adosc import _adosc_from_ad_kernel
+
+    high, low, close, volume = _ohlcv(500, 4)
+    out = np.full(500, np.nan)
+    _adosc_from_ad_kernel(numbatalib.AD(high, low, close, volume), 5, 12, out)
+    np.testing.assert_array_equal(out, numbatalib.ADOSC(high, low, close, volume, 5, 12))
+
+
+def test_scan_errors() -> None:
+    high, low, close, volume = _ohlcv(100, 5)
+    with pytest.raises(ValueError, match="not a cumulative function"):
+        numbatalib.parallel.scan("SMA", close)
+    with pytest.raises(ValueError, match="slowperiod out of range"):
+        numbatalib.parallel.scan("ADOSC", (high, low, close, volume), {"slowperiod": 1})
+    with pytest.raises(ValueError, match="unexpected parameters"):
+        numbatalib.parallel.scan("OBV", (close, volume), {"timeperiod": 5})
+    with pytest.raises(ValueError, match="same length"):
+        numbatalib.parallel.scan("OBV", (close, volume[:-1]), chunk_size=10)
+    got = numbatalib.parallel.scan(
+        "AD", (high, low, close, volume), {"output_dtype": np.float32}, chunk_size=10
+    )
+    assert got.dtype == np.float32
+
+
+@pytest.mark.parametrize(
+    ("func", "params"),
+    [
+        ("EMA", {"timeperiod": 9}),
+        ("EMA", {"timeperiod": 400}),
+        ("DEMA", {"timeperiod": 20}),
+        ("TEMA", {}),
+        ("MA", {"timeperiod": 15, "matype": 1}),
+    ],
+)
+def test_ema_scan_matches_serial_to_rounding(func: str, params: dict) -> None:
+    close = 1000.0 + _symbols([6000])[0]
+    expected = getattr(numbatalib, func)(close, **params)
+    with numbatalib.parallel.ema_scan(workers=3, min_size=0, chunk_size=450):
+        got = getattr(numbatalib, func)(close, **params)
+    np.testing.assert_array_equal(np.isnan(got), np.isnan(expected))
+    timeperiod = params.get("timeperiod", 30)
+    tolerance = 16 * np.finfo(np.float64).eps * timeperiod * np.max(np.abs(close))
+    assert np.nanmax(np.abs(got - expected)) <= tolerance
+
+
+def test_ema_scan_threshold_dtypes_and_state() -> None:
+    from numbatalib._func import ta_ema
+
+    close = 1000.0 + _symbols([3000])[0]
+    expected = numbatalib.EMA(close, 10)
+    trix = numbatalib.TRIX(close, 12)
+    with numbatalib.parallel.ema_scan(min_size=3001, chunk_size=100):
+        np.testing.assert_array_equal(numbatalib.EMA(close, 10), expected)
+    with numbatalib.parallel.ema_scan(min_size=3000, chunk_size=100):
+        got = numbatalib.EMA(close, 10, output_dtype=np.float32)
+        assert got.dtype == np.float32
+        np.testing.assert_allclose(got, expected.astype(np.float32), rtol=1e-6)
+        np.testing.assert_allclose(numbatalib.TRIX(close, 12), trix, rtol=1e-9, atol=1e-12)
+        with pytest.raises(ValueError, match="chunk_size"):
+            with numbatalib.parallel.ema_scan(chunk_size=0):
+                pass
+        assert ta_ema._parallel.get() is not None
+        # Other threads keep the serial kernel.
+        with ThreadPoolExecutor(1) as pool:
+            assert pool.submit(ta_ema._parallel.get).result() is None
+    assert ta_ema._parallel.get() is None
+
+
+@pytest.mark.parametrize(
+    ("func", "bad", "at"),
+    [
+        ("EMA", np.nan, 3),
+        ("EMA", np.nan, 5000),
+        ("EMA", np.inf, 5000),
+        ("EMA", -np.inf, 1999),
+        ("DEMA", np.nan, 7000),
+        ("TRIX", np.inf, 12),
+    ],
+)
+def test_ema_scan_propagates_nan_and_inf(func: str, bad: float, at: int) -> None:
+    close = 1000.0 + _symbols([20000])[0]
+    close[at] = bad
+    with np.errstate(invalid="ignore"):
+        expected = getattr(numbatalib, func)(close, 20)
+        with numbatalib.parallel.ema_scan(workers=4, min_size=0, chunk_size=1000):
+            got = getattr(numbatalib, func)(close, 20)
+    np.testing.assert_array_equal(np.isnan(got), np.isnan(expected))
+    np.testing.assert_array_equal(np.isinf(got), np.isinf(expected))
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import numba
+import numpy as np
+import pytest
+from numba.core import sigutils
+from numba.core.dispatcher import Dispatcher
+
+import numbatalib
+from numbatalib._generated.kernel_signatures import PROFILES, SIGNATURES
+from numbatalib._precompile import _dispatcher
+
+
+def test_declared_signatures_resolve_and_parse() -> None:
+    for kernel, signatures in SIGNATURES.items():
+        assert isinstance(_dispatcher(kernel), Dispatcher), kernel
+        for sig, profiles in signatures.items():
+            sigutils.normalize_signature(sig)
+            assert set(profiles) <= set(PROFILES)
+
+
+@pytest.mark.parametrize(
+    "profile, make",
+    [
+        ("float64", lambda x: x),
+        ("float32", lambda x: x.astype(np.float32)),
+        ("int64", lambda x: x.astype(np.int64)),
+        ("float64-strided", lambda x: np.repeat(x, 2)[::2]),
+    ],
+)
+def test_declared_signatures_cover_calls(profile: str, make) -> None:
+    from numbatalib._func.ta_ema import _ema_kernel
+    from numbatalib._func.ta_macd import _macd_kernel
+    from numbatalib._func.ta_sma import _sma_kernel
+
+    x = make(100.0 + np.cumsum(np.random.default_rng(0).standard_normal(200)))
+    numbatalib.SMA(x)
+    numbatalib.EMA(x)
+    numbatalib.MACD(x)
+
+    from numbatalib.warmup import _kernel_name
+    from tools.generate_kernel_signatures import _signature_str, _type_str
+
+    # The specialization compiled for `x` (with float64 outputs; other tests
+    # compile `output_dtype=np.float32` variants too) must be declared.
+    prefix = f"({_type_str(numba.typeof(x))},"
+    for kernel in (_sma_kernel, _ema_kernel, _macd_kernel):
+        declared = {
+            sig for sig, profiles in SIGNATURES[_kernel_name(kernel)].items() if profile in profiles
+        }
+        # Literal-typed specializations compiled inside callers have no declaration.
+        used = {_signature_str(args) for args in kernel.signatures} - {None}
+        used = {sig for sig in used if sig.startswith(prefix) and sig.endswith("float64[::1])")}
+        assert used and used <= declared
+
+
+def test_precompile_rejects_unknown_profiles() -> None:
+    with pytest.raises(ValueError):
+        numbatalib.precompile("float16")
+
+
+def test_every_kernel_has_declared_signatures() -> None:
+    import importlib
+    import pkgutil
+
+    from numbatalib.warmup import _dispatchers, _kernel_name
+
+    for info in pkgutil.walk_packages(numbatalib.__path__, "numbatalib."):
+        importlib.import_module(info.name)
+    # Only ever called with constant candle settings or filter kinds, so they
+    # are compiled for literal types inside their callers and need no declaration.
+    literal_only = {
+        "numbatalib._func._candles.candle_average",
+        "numbatalib._func._candles.candle_range",
+        "numbatalib._ht._hilbert_filter",
+    }
+    missing = sorted(
+        name
+        for name in map(_kernel_name, _dispatchers())
+        if name not in SIGNATURES and name not in literal_only
+    )
+    assert not missing, missing
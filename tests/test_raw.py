@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+import numbatalib.raw as raw
+from numbatalib._lookback import lookback
+from tools.parity_harness import make_parity_case
+
+
+def _as_tuple(x):
+    return x if isinstance(x, tuple) else (x,)
+
+
+@pytest.mark.parametrize("func_name", numbatalib.implemented_functions())
+def test_raw_full_range_is_compact_pythonic_output(func_name: str) -> None:
+    case = make_parity_case(func_name, n=400, seed=2)
+    n = case.inputs[0].shape[0]
+    lb = lookback(func_name, **case.kwargs)
+    expected = _as_tuple(getattr(numbatalib, func_name)(*case.inputs, **case.kwargs))
+
+    beg, nb, *outs = getattr(raw, func_name)(0, n - 1, *case.inputs, **case.kwargs)
+    assert (beg, nb) == ((lb, n - lb) if lb < n else (0, 0))
+    for got, exp in zip(outs, expected):
+        assert got.shape == (nb,)
+        assert got.dtype == exp.dtype
+        np.testing.assert_array_equal(got, exp[beg : beg + nb])
+
+
+@pytest.mark.parametrize("func_name", ["SMA", "EMA", "RSI", "ATR", "MACD", "OBV", "CDLHAMMER"])
+def test_raw_only_reads_the_range_plus_warmup(func_name: str) -> None:
+    case = make_parity_case(func_name, n=2000, seed=4)
+    lb = lookback(func_name, **case.kwargs)
+    start, end = 1500, 1899
+
+    poisoned = [x.copy() for x in case.inputs]
+    for x in poisoned:
+        x[: start - lb] = np.nan
+        x[end + 1 :] = np.nan
+
+    fn = getattr(raw, func_name)
+    beg, nb, *outs = fn(start, end, *poisoned, **case.kwargs)
+    assert (beg, nb) == (start, end - start + 1)
+
+    # TA-Lib semantics: the range is evaluated as if the series began at start - lookback.
+    window = [x[start - lb : end + 1] for x in case.inputs]
+    expected = _as_tuple(getattr(numbatalib, func_name)(*window, **case.kwargs))
+    for got, exp in zip(outs, expected):
+        np.testing.assert_array_equal(got, exp[lb:])
+
+
+def test_raw_windowed_function_matches_full_series() -> None:
+    x = np.random.default_rng(0).normal(size=1000).cumsum()
+    beg, nb, out = raw.MAX(900, 999, x, timeperiod=20)
+    assert (beg, nb) == (900, 100)
+    np.testing.assert_array_equal(out, numbatalib.MAX(x, timeperiod=20)[900:])
+
+    # Running sums restart at start_idx - lookback, so only rounding differs.
+    _, _, out = raw.SMA(900, 999, x, timeperiod=20)
+    np.testing.assert_allclose(out, numbatalib.SMA(x, timeperiod=20)[900:], rtol=1e-12)
+
+
+def test_raw_empty_and_invalid_ranges() -> None:
+    x = np.linspace(1.0, 2.0, 50)
+    beg, nb, out = raw.SMA(0, 10, x, timeperiod=20)
+    assert (beg, nb, out.shape) == (0, 0, (0,))
+    beg, nb, out = raw.CDLDOJI(0, 3, x, x, x, x)
+    assert (beg, nb, out.dtype) == (0, 0, np.int32)
+
+    with pytest.raises(ValueError):
+        raw.SMA(-1, 10, x)
+    with pytest.raises(ValueError):
+        raw.SMA(10, 5, x)
+    with pytest.raises(ValueError):
+        raw.SMA(0, 50, x)
+    with pytest.raises(ValueError):
+        raw.SMA(0, 49, x, timeperiod=1)
+    with pytest.raises(AttributeError):
+        raw.NOT_A_FUNCTION
+
+
+def test_lookback_matches_talib() -> None:
+    abstract = pytest.importorskip("talib.abstract")
+    import talib
+
+    for func_name in numbatalib.implemented_functions():
+        if not hasattr(talib, func_name):
+            continue
+        assert lookback(func_name) == abstract.Function(func_name).lookback, func_name
+
+    f = abstract.Function("MACDEXT")
+    params = dict(fastperiod=7, fastmatype=3, slowperiod=19, slowmatype=8, signalperiod=5, signalmatype=6)
+    f.set_parameters(params)
+    assert lookback("MACDEXT", **params) == f.lookback
+
+
+def test_lookback_unstable_periods_propagate_like_talib() -> None:
+    u = {"EMA": 5, "RSI": 3, "KAMA": 2}
+    assert lookback("EMA", unstable_periods=u, timeperiod=10) == 14
+    assert lookback("DEMA", unstable_periods=u, timeperiod=10) == 28
+    assert lookback("MACD", unstable_periods=u) == 25 + 8 + 10
+    assert lookback("STOCHRSI", unstable_periods=u, fastd_matype=1) == 14 + 3 + 4 + 2 + 5
+    assert lookback("MA", unstable_periods=u, timeperiod=10, matype=6) == 12
+    assert lookback("MA", unstable_periods=u, timeperiod=1, matype=1) == 0
+    assert numbatalib.lookback("SMA", unstable_periods=u, timeperiod=10) == 9
+    with pytest.raises(ValueError):
+        lookback("EMA", unstable_periods={"EMA": -1})
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import numbatalib
+from numbatalib._registry import _discover_impl_modules, _scan_impl_modules
+
+
+def test_func_index_is_up_to_date() -> None:
+    # Run `python tools/generate_func_index.py` after adding or removing a module.
+    assert _discover_impl_modules() == _scan_impl_modules()
+
+
+def test_resolved_functions_are_bound_as_module_globals() -> None:
+    fn = numbatalib.SMA
+    assert vars(numbatalib)["SMA"] is fn
+    assert numbatalib.get_function("SMA") is fn
+    assert numbatalib.lookback is vars(numbatalib)["lookback"]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+
+PATTERNS = [name for name in numbatalib.implemented_functions() if name.startswith("CDL")]
+
+
+def _ohlc(n: int, seed: int = 11):
+    rng = np.random.default_rng(seed)
+    close = np.round(100.0 + rng.normal(size=n).cumsum())
+    open_ = np.round(close + rng.normal(size=n))
+    high = np.maximum(open_, close) + np.round(2.0 * rng.random(n))
+    low = np.minimum(open_, close) - np.round(2.0 * rng.random(n))
+    return open_, high, low, close
+
+
+@pytest.mark.parametrize("n", [0, 5, 14, 3000])
+def test_sparse_events_match_dense_output(n: int) -> None:
+    ohlc = _ohlc(n)
+    for name in PATTERNS:
+        fn = numbatalib.get_function(name)
+        dense = fn(*ohlc)
+        indices, values = fn(*ohlc, sparse=True)
+        assert indices.dtype == np.int64 and values.dtype == np.int32
+        np.testing.assert_array_equal(indices, np.flatnonzero(dense), err_msg=name)
+        np.testing.assert_array_equal(values, dense[indices], err_msg=name)
+
+
+def test_sparse_events_beyond_the_initial_buffer() -> None:
+    # Engulfing fires on well over 1 bar in 16 here, so the events are
+    # counted first and the kernel is run again to fill them.
+    n = 40_000
+    close = np.tile([10.0, 12.0], n // 2)
+    open_ = np.tile([11.5, 9.5], n // 2)
+    high, low = np.maximum(open_, close) + 1.0, np.minimum(open_, close) - 1.0
+    dense = numbatalib.CDLENGULFING(open_, high, low, close)
+    indices, values = numbatalib.CDLENGULFING(open_, high, low, close, sparse=True)
+    assert indices.shape[0] > n // 16
+    np.testing.assert_array_equal(indices, np.flatnonzero(dense))
+    np.testing.assert_array_equal(values, dense[indices])
+
+
+def test_sparse_penetration_and_dtypes() -> None:
+    ohlc = _ohlc(800)
+    dense = numbatalib.CDLMORNINGSTAR(*ohlc, penetration=0.1)
+    indices, values = numbatalib.CDLMORNINGSTAR(*ohlc, penetration=0.1, sparse=True)
+    np.testing.assert_array_equal(indices, np.flatnonzero(dense))
+    np.testing.assert_array_equal(values, dense[indices])
+
+    for dtype in (np.float32, np.int64):
+        converted = [x.astype(dtype) for x in ohlc]
+        dense = numbatalib.CDLHIKKAKE(*converted)
+        indices, values = numbatalib.CDLHIKKAKE(*converted, sparse=True)
+        np.testing.assert_array_equal(indices, np.flatnonzero(dense))
+        np.testing.assert_array_equal(values, dense[indices])
+
+
+def test_sparse_errors() -> None:
+    ohlc = _ohlc(50)
+    with pytest.raises(ValueError, match="1-D"):
+        numbatalib.CDLDOJI(*(np.stack([x, x], axis=1) for x in ohlc), sparse=True)
+    with pytest.raises(ValueError, match="out is not supported"):
+        numbatalib.CDLDOJI(*ohlc, out=np.empty(50, dtype=np.int32), sparse=True)
+    with pytest.raises(ValueError, match="same length"):
+        numbatalib.CDLDOJI(ohlc[0][:-1], *ohlc[1:], sparse=True)
+    with pytest.raises(ValueError, match="penetration"):
+        numbatalib.CDLMATHOLD(*ohlc, penetration=-1.0, sparse=True)
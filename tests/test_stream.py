@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+import numbatalib.compat.talib as talib_nb
+from numbatalib._stream import create_batch_stream, create_stream
+from tools.parity_harness import make_inputs
+
+
+def _feed(stream, inputs: list[np.ndarray]):
+    rows = [stream.update(*bar) for bar in zip(*inputs)]
+    if isinstance(rows[0], tuple):
+        return tuple(np.array(col) for col in zip(*rows))
+    return np.array(rows)
+
+
+@pytest.mark.parametrize(
+    "func_name, kwargs",
+    [
+        ("SMA", {"timeperiod": 20}),
+        ("EMA", {"timeperiod": 20}),
+        ("WMA", {"timeperiod": 20}),
+        ("RSI", {"timeperiod": 14}),
+        ("ATR", {"timeperiod": 14}),
+        ("ATR", {"timeperiod": 1}),
+        ("STDDEV", {"timeperiod": 10, "nbdev": 1.5}),
+        ("MACD", {"fastperiod": 12, "slowperiod": 26, "signalperiod": 9}),
+        ("MACD", {"fastperiod": 26, "slowperiod": 12, "signalperiod": 1}),
+        ("DEMA", {"timeperiod": 20}),
+        ("TEMA", {"timeperiod": 10}),
+        ("TRIMA", {"timeperiod": 20}),
+        ("TRIMA", {"timeperiod": 9}),
+        ("TRIMA", {"timeperiod": 2}),
+        ("KAMA", {"timeperiod": 10}),
+        ("T3", {"timeperiod": 5, "vfactor": 0.7}),
+        ("T3", {"timeperiod": 2, "vfactor": 0.3}),
+        ("BBANDS", {"timeperiod": 20, "nbdevup": 2.0, "nbdevdn": 1.5, "matype": 0}),
+        ("BBANDS", {"timeperiod": 20, "matype": 1}),
+        ("BBANDS", {"timeperiod": 20, "matype": 2}),
+        ("BBANDS", {"timeperiod": 20, "matype": 3}),
+        ("BBANDS", {"timeperiod": 10, "matype": 4}),
+        ("BBANDS", {"timeperiod": 10, "matype": 5}),
+        ("BBANDS", {"timeperiod": 10, "matype": 6}),
+        ("BBANDS", {"timeperiod": 5, "matype": 8}),
+    ],
+)
+def test_stream_matches_batch_exactly(func_name: str, kwargs: dict) -> None:
+    inputs = make_inputs(func_name, n=500, seed=7)
+    expected = getattr(numbatalib, func_name)(*inputs, **kwargs)
+
+    stream = create_stream(func_name, **kwargs)
+    got = _feed(stream, inputs)
+
+    exp_t = expected if isinstance(expected, tuple) else (expected,)
+    got_t = got if isinstance(got, tuple) else (got,)
+    for a, b in zip(got_t, exp_t):
+        np.testing.assert_array_equal(a, b)
+    assert stream.count == 500
+    assert int(np.flatnonzero(~np.isnan(got_t[0]))[0]) == stream.lookback
+
+
+def test_stream_reset_and_short_series() -> None:
+    stream = create_stream("SMA", timeperiod=5)
+    assert all(np.isnan(stream.update(x)) for x in range(4))
+    assert not stream.ready
+    assert stream.update(4.0) == 2.0
+    stream.reset()
+    assert stream.count == 0
+    assert np.isnan(stream.update(1.0))
+
+    with pytest.raises(ValueError):
+        create_stream("SMA", timeperiod=1)
+    with pytest.raises(KeyError):
+        create_stream("CDLDOJI")
+    # MAMA has no incremental kernel.
+    with pytest.raises(ValueError, match="matype 7"):
+        create_stream("BBANDS", matype=7)
+
+
+def test_compat_stream_create() -> None:
+    x = np.random.default_rng(3).normal(size=300).cumsum()
+
+    s = talib_nb.stream.SMA.create(timeperiod=20)
+    got = np.array([s.update(v) for v in x])
+    np.testing.assert_array_equal(got, talib_nb.SMA(x, timeperiod=20))
+    assert got[-1] == talib_nb.stream.SMA(x, timeperiod=20)
+
+    talib_nb.set_unstable_period("EMA", 5)
+    try:
+        s = talib_nb.stream.EMA.create(timeperiod=10)
+        got = np.array([s.update(v) for v in x])
+        np.testing.assert_array_equal(got, talib_nb.EMA(x, timeperiod=10))
+    finally:
+        talib_nb.set_unstable_period("EMA", 0)
+
+    with pytest.raises(Exception, match="Bad Parameter"):
+        talib_nb.stream.SMA.create(timeperiod=1)
+    assert not hasattr(talib_nb.stream.CDLDOJI, "create")
+
+
+@pytest.mark.parametrize(
+    "func_name, kwargs",
+    [
+        ("EMA", {"timeperiod": 10}),
+        ("RSI", {"timeperiod": 14}),
+        ("ATR", {"timeperiod": 14}),
+        ("MACD", {"fastperiod": 5, "slowperiod": 13, "signalperiod": 4}),
+    ],
+)
+def test_batch_stream_matches_per_symbol_batch(func_name: str, kwargs: dict) -> None:
+    n_symbols, n = 6, 200
+    panels = [make_inputs(func_name, n=n, seed=s) for s in range(n_symbols)]
+    # Symbol 0 skips every third bar; its state must only see the traded bars.
+    traded = np.ones((n, n_symbols), dtype=bool)
+    traded[::3, 0] = False
+
+    stream = create_batch_stream(func_name, n_symbols=n_symbols, **kwargs)
+    rows = []
+    for t in range(n):
+        tick = [np.array([p[k][t] for p in panels]) for k in range(len(panels[0]))]
+        res = stream.update(*tick, mask=traded[t])
+        rows.append(res if isinstance(res, tuple) else (res,))
+
+    for j, inputs in enumerate(panels):
+        sel = traded[:, j]
+        expected = getattr(numbatalib, func_name)(*(x[sel] for x in inputs), **kwargs)
+        exp_t = expected if isinstance(expected, tuple) else (expected,)
+        for k, exp in enumerate(exp_t):
+            got = np.array([rows[t][k][j] for t in range(n)])
+            assert np.isnan(got[~sel]).all()
+            np.testing.assert_array_equal(got[sel], exp)
+    np.testing.assert_array_equal(stream.count, traded.sum(axis=0))
+
+
+def test_batch_stream_validation() -> None:
+    stream = create_batch_stream("EMA", n_symbols=3, timeperiod=2)
+    with pytest.raises(ValueError):
+        stream.update(np.zeros(2))
+    with pytest.raises(ValueError):
+        stream.update(np.zeros(3), mask=np.ones(2, dtype=bool))
+    with pytest.raises(KeyError):
+        create_batch_stream("SMA", n_symbols=3)
+
+    b = talib_nb.stream.RSI.create_batch(4, timeperiod=5)
+    assert b.update(np.arange(4.0)).shape == (4,)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+
+
+def _real(n: int = 3000, seed: int = 5) -> np.ndarray:
+    return 100.0 + np.random.default_rng(seed).normal(size=n).cumsum()
+
+
+@pytest.mark.parametrize("func_name", ["SMA", "EMA", "RSI", "STDDEV", "MAX", "MIN"])
+def test_sweep_matches_single_period_exactly(func_name: str) -> None:
+    real = _real()
+    periods = list(range(2, 251)) + [2999, 3000, 3001]
+    fn = getattr(numbatalib, func_name)
+
+    got = numbatalib.sweep(func_name, real, timeperiod=periods)
+    assert got.shape == (len(periods), real.shape[0])
+    for row, tp in zip(got, periods):
+        np.testing.assert_array_equal(row, fn(real, timeperiod=tp))
+
+
+def test_sweep_stddev_nbdev_and_fallback_params() -> None:
+    real = _real(500)
+    got = numbatalib.sweep("STDDEV", real, timeperiod=range(2, 40), nbdev=1.5)
+    for row, tp in zip(got, range(2, 40)):
+        np.testing.assert_array_equal(row, numbatalib.STDDEV(real, timeperiod=tp, nbdev=1.5))
+
+    upper, middle, lower = numbatalib.sweep("BBANDS", real, timeperiod=20, nbdevup=[1.0, 2.0, 3.0])
+    for k, up in enumerate([1.0, 2.0, 3.0]):
+        ref = numbatalib.BBANDS(real, timeperiod=20, nbdevup=up)
+        np.testing.assert_array_equal(upper[k], ref[0])
+        np.testing.assert_array_equal(lower[k], ref[2])
+
+
+def test_sweep_validation() -> None:
+    real = _real(100)
+    with pytest.raises(ValueError):
+        numbatalib.sweep("SMA", real, timeperiod=[5, 1])
+    with pytest.raises(ValueError):
+        numbatalib.sweep("SMA", real, timeperiod=20)
+    with pytest.raises(ValueError):
+        numbatalib.sweep("SMA", real, window=range(2, 5))
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda x: x.astype(np.float32),
+        lambda x: np.round(x * 100).astype(np.int64),
+        lambda x: np.round(x * 100).astype(np.int32),
+        lambda x: np.repeat(x, 2)[::2],
+    ],
+)
+@pytest.mark.parametrize("func_name", ["SMA", "EMA", "RSI", "STDDEV", "MAX", "MIN"])
+def test_sweep_reads_inputs_in_place(func_name: str, make) -> None:
+    real = make(_real(400))
+    fn = getattr(numbatalib, func_name)
+    numbatalib.reset_input_copies()
+    got = numbatalib.sweep(func_name, real, timeperiod=[2, 14, 30])
+    assert numbatalib.input_copies() == {"dtype": 0}
+    for row, tp in zip(got, [2, 14, 30]):
+        np.testing.assert_array_equal(row, fn(real, timeperiod=tp))
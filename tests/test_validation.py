@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import ast
+import importlib
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import numbatalib
+from numbatalib._core._params import MATYPE_RANGE, param_specs
+from numbatalib._core._validation import check_float_param, check_int_param
+from tools.parity_harness import make_parity_case
+
+FUNC_DIR = Path(numbatalib.__file__).parent / "_func"
+
+
+def _as_tuple(x):
+    return x if isinstance(x, tuple) else (x,)
+
+
+def _checked_bounds() -> list[tuple[str, str, str, object, object]]:
+    """(file, function, parameter, min, max) of every `check_*_param` call in a wrapper."""
+    implemented = set(numbatalib.implemented_functions())
+    rows = []
+    for path in sorted(FUNC_DIR.glob("ta_*.py")):
+        module = importlib.import_module(f"numbatalib._func.{path.stem}")
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for func in tree.body:
+            if not isinstance(func, ast.FunctionDef) or func.name not in implemented:
+                continue
+            for node in ast.walk(func):
+                if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)):
+                    continue
+                if node.func.id not in ("check_int_param", "check_float_param"):
+                    continue
+                name, _, lo, hi = node.args
+                bounds = [eval(ast.unparse(b), vars(module)) for b in (lo, hi)]
+                rows.append((path.name, func.name, name.value, *bounds))
+    return rows
+
+
+def test_wrapper_bounds_match_func_meta() -> None:
+    rows = _checked_bounds()
+    assert len(rows) > 90
+    for filename, func_name, param, lo, hi in rows:
+        specs = {s.name: s.allowed for s in param_specs(func_name)}
+        assert param in specs, (filename, param)
+        assert (lo, hi) == (specs[param].min, specs[param].max), (filename, param)
+
+
+def test_check_param_errors() -> None:
+    assert check_int_param("timeperiod", np.int64(5), 2, 10) == 5
+    assert check_int_param("timeperiod", 7.9, 2, 10) == 7
+    assert check_float_param("nbdev", 2, -1.0, 3.0) == 2.0
+    with pytest.raises(ValueError, match="timeperiod out of range"):
+        check_int_param("timeperiod", 1, 2, 10)
+    with pytest.raises(ValueError, match="timeperiod must be an int"):
+        check_int_param("timeperiod", "five", 2, 10)
+    with pytest.raises(ValueError, match="nbdev must be a float"):
+        check_float_param("nbdev", None, -1.0, 3.0)
+    with pytest.raises(ValueError, match="matype out of range"):
+        numbatalib.MA(np.arange(40.0), matype=MATYPE_RANGE.max + 1)
+
+
+@pytest.mark.parametrize("func_name", ["SMA", "MACD", "BBANDS", "STOCH", "ATR", "CDLDOJI"])
+def test_trusted_inputs_give_the_same_results(func_name: str) -> None:
+    case = make_parity_case(func_name, n=120, seed=4)
+    fn = getattr(numbatalib, func_name)
+    expected = _as_tuple(fn(*case.inputs, **case.kwargs))
+    with numbatalib.trusted_inputs():
+        got = _as_tuple(fn(*case.inputs, **case.kwargs))
+    for g, e in zip(got, expected):
+        np.testing.assert_array_equal(g, e)
+
+
+def test_trusted_inputs_skip_checks_and_restore() -> None:
+    with pytest.raises(RuntimeError):
+        with numbatalib.trusted_inputs():
+            assert check_int_param("timeperiod", 1, 2, 10) == 1
+            raise RuntimeError
+    with pytest.raises(ValueError, match="out of range"):
+        check_int_param("timeperiod", 1, 2, 10)
+
+
+def test_trusted_inputs_are_scoped_to_the_calling_thread() -> None:
+    entered, done = threading.Event(), threading.Event()
+
+    def trusted() -> None:
+        with numbatalib.trusted_inputs():
+            entered.set()
+            done.wait(5)
+
+    thread = threading.Thread(target=trusted)
+    thread.start()
+    try:
+        assert entered.wait(5)
+        with pytest.raises(ValueError, match="out of range"):
+            check_int_param("timeperiod", 1, 2, 10)
+    finally:
+        done.set()
+        thread.join()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import csv
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import numbatalib
+from numbatalib.warmup import set_cache_dir, warmup
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run(cache_dir: Path, report: Path) -> list[dict[str, str]]:
+    subprocess.run(
+        [sys.executable, "-m", "numbatalib.warmup", "--cache-dir", str(cache_dir)]
+        + ["--functions", "ADD", "--dtypes", "float64,float32", "--report", str(report)],
+        cwd=REPO_ROOT,
+        check=True,
+        capture_output=True,
+    )
+    with report.open(newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def test_warmup_fills_the_cache_dir_and_reports_each_kernel(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    first = _run(cache_dir, tmp_path / "first.csv")
+    kernels = {(r["kernel"], r["signature"]) for r in first if r["cached"] == "0"}
+    f32 = "array(float32, 1d, C)"
+    assert ("numbatalib._func.ta_add._add_kernel", f"({f32}, {f32}, array(float64, 1d, C))") in kernels
+    assert any(k.startswith("numbatalib._generated.batch_kernels._add_2d") for k, _ in kernels)
+    assert any(cache_dir.rglob("*.nbi"))
+
+    second = _run(cache_dir, tmp_path / "second.csv")
+    assert second and all(r["cached"] == "1" for r in second)
+
+
+def test_warmup_validation() -> None:
+    with pytest.raises(ValueError):
+        warmup(functions=["NOT_A_FUNCTION"])
+    with pytest.raises(ValueError):
+        warmup(functions=["ADD"], dtypes=["int8"])
+    numbatalib.get_function("SMA")  # imports a kernel module
+    with pytest.raises(RuntimeError):
+        set_cache_dir("/tmp/unused")
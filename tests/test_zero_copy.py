@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import numbatalib
+from tools.parity_harness import make_parity_case
+
+
+def _as_tuple(x):
+    return x if isinstance(x, tuple) else (x,)
+
+
+@pytest.mark.parametrize("func_name", ["SMA", "EMA", "RSI", "ATR", "ADX", "MACD", "BBANDS", "OBV"])
+def test_strided_and_integer_inputs_are_read_in_place(func_name: str) -> None:
+    case = make_parity_case(func_name, n=400, seed=9)
+    fn = getattr(numbatalib, func_name)
+    ticks = [np.round(x * 100).astype(np.int64) for x in case.inputs]
+    expected = _as_tuple(fn(*(t.astype(np.float64) for t in ticks), **case.kwargs))
+
+    # Columns of a row-major block are strided views.
+    block = np.stack(ticks, axis=1)
+    columns = [block[:, k] for k in range(block.shape[1])]
+
+    numbatalib.reset_input_copies()
+    for inputs in (ticks, columns, [c.astype(np.float64) for c in columns]):
+        got = _as_tuple(fn(*inputs, **case.kwargs))
+        for g, e in zip(got, expected):
+            np.testing.assert_array_equal(g, e)
+    assert numbatalib.input_copies() == {"dtype": 0}
+
+
+def test_forced_copies_are_counted() -> None:
+    x = np.linspace(1.0, 2.0, 100)
+    numbatalib.reset_input_copies()
+    numbatalib.SMA(x.astype(np.float16), timeperiod=5)
+    numbatalib.SMA(x.astype(">f8"), timeperiod=5)
+    numbatalib.SMA(np.stack([x, x], axis=1).astype(np.float16), timeperiod=5)
+    assert numbatalib.input_copies() == {"dtype": 3}
+
+    numbatalib.reset_input_copies()
+    assert numbatalib.input_copies() == {"dtype": 0}
+
+
+@pytest.mark.parametrize("func_name", ["SMA", "RSI", "ATR", "MACD", "BBANDS", "CDLHAMMER"])
+def test_2d_panels_are_read_in_place(func_name: str) -> None:
+    case = make_parity_case(func_name, n=300, seed=9)
+    fn = getattr(numbatalib, func_name)
+    # C-order (n_bars, n_series) panels along the default axis=0, their
+    # (n_series, n_bars) transposes along axis=1, and strided sub-panels.
+    panels = [np.stack([x, x[::-1], 2.0 * x], axis=1) for x in case.inputs]
+    variants = [
+        (panels, 0),
+        ([np.ascontiguousarray(p.T) for p in panels], 1),
+        ([np.repeat(p, 2, axis=1)[:, ::2] for p in panels], 0),
+    ]
+
+    numbatalib.reset_input_copies()
+    for inputs, axis in variants:
+        got = _as_tuple(fn(*inputs, **case.kwargs, axis=axis))
+        for k in range(3):
+            expected = _as_tuple(fn(*(p[:, k] for p in panels), **case.kwargs))
+            for g, e in zip(got, expected):
+                np.testing.assert_array_equal(g[:, k] if axis == 0 else g[k], e)
+    assert numbatalib.input_copies() == {"dtype": 0}
+
+
+def test_div_by_zero_follows_ieee_for_integer_inputs() -> None:
+    got = numbatalib.DIV(np.array([1, 0, -1]), np.array([0, 0, 0]))
+    np.testing.assert_array_equal(got, np.array([np.inf, np.nan, -np.inf]))
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.int64])
+def test_imi_of_flat_bars_is_nan(dtype) -> None:
+    # TA-Lib divides 0 by 0 when no bar moved (open == close throughout).
+    flat = np.full(30, 5, dtype=dtype)
+    got = numbatalib.IMI(flat, flat, timeperiod=14)
+    assert np.isnan(got).all()
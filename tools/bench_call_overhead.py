@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+"""
+Per-call overhead of the function wrappers on small arrays, in nanoseconds.
+
+The validation primitives every wrapper runs are timed on their own, then
+each function is timed with default validation and inside
+`numbatalib.trusted_inputs()`, which skips the checks:
+
+    python tools/bench_call_overhead.py --n 50,500
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+_FUNCS = ["SMA", "EMA", "RSI", "MACD", "BBANDS", "ATR", "STOCH", "CDLDOJI"]
+
+
+def _per_call_ns(fn, number: int, repeat: int) -> float:
+    fn()
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e9
+
+
+def main() -> None:
+    import numbatalib
+    from numbatalib._core._params import input_to_arg
+    from numbatalib._core._validation import (
+        as_1d_float,
+        check_float_param,
+        check_int_param,
+        float_dtype,
+        is_2d,
+        nan_like,
+    )
+    from numbatalib._registry import _load_meta
+
+    parser = argparse.ArgumentParser(description="Per-call wrapper overhead benchmark.")
+    parser.add_argument("--funcs", default=",".join(_FUNCS), help="Comma-separated functions.")
+    parser.add_argument("--n", default="50,500", help="Comma-separated series lengths.")
+    parser.add_argument("--number", type=int, default=20000, help="Calls per timing.")
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of-N timings.")
+    args = parser.parse_args()
+    funcs = [f.strip().upper() for f in args.funcs.split(",") if f.strip()]
+
+    x = np.random.default_rng(0).standard_normal(50)
+    primitives = {
+        "is_2d": lambda: is_2d(x),
+        "as_1d_float": lambda: as_1d_float(x),
+        "check_int_param": lambda: check_int_param("timeperiod", 30, 2, 100000),
+        "check_float_param": lambda: check_float_param("nbdev", 2.0, -3e37, 3e37),
+        "float_dtype": lambda: float_dtype(None),
+        "nan_like (n=50)": lambda: nan_like(x),
+    }
+    for label, call in primitives.items():
+        print(f"{label:<22}{_per_call_ns(call, args.number, args.repeat):>10.0f} ns")
+    print()
+
+    meta = _load_meta()
+    print(f"{'function':<10}{'n':>6}{'checked':>12}{'trusted':>12}   (ns/call)")
+    for n in (int(v) for v in args.n.split(",")):
+        rng = np.random.default_rng(0)
+        close = 100.0 + np.cumsum(rng.standard_normal(n))
+        series = {"open": close + 0.25, "high": close + 1.0, "low": close - 1.0, "close": close}
+        for name in funcs:
+            fn = getattr(numbatalib, name)
+            inputs = [series.get(input_to_arg(i), close) for i in meta[name].inputs]
+            checked = _per_call_ns(lambda: fn(*inputs), args.number, args.repeat)
+            with numbatalib.trusted_inputs():
+                trusted = _per_call_ns(lambda: fn(*inputs), args.number, args.repeat)
+            print(f"{name:<10}{n:>6}{checked:>12.0f}{trusted:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+"""
+Per-call overhead of the TA-Lib shim on small arrays.
+
+For each function and series length, the best-of-`--repeat` time per call is
+reported for the installed `talib` (when available), the shim's generated
+wrapper, the generic `_call_func` path it replaces, and numbatalib called
+directly:
+
+    python tools/bench_compat_overhead.py --n 50,500
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+_FUNCS = ["SMA", "EMA", "RSI", "MACD", "BBANDS", "ATR", "STOCH"]
+
+
+def _per_call_us(fn, number: int, repeat: int) -> float:
+    fn()
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+def main() -> None:
+    import numbatalib
+    import numbatalib.talib as shim
+    from numbatalib._core._params import input_to_arg
+    from numbatalib._registry import _load_meta
+    from numbatalib.compat.talib._ta_lib import _call_func
+
+    try:
+        import talib
+    except ImportError:
+        talib = None
+
+    parser = argparse.ArgumentParser(description="TA-Lib shim per-call overhead benchmark.")
+    parser.add_argument("--funcs", default=",".join(_FUNCS), help="Comma-separated functions.")
+    parser.add_argument("--n", default="50,500", help="Comma-separated series lengths.")
+    parser.add_argument("--number", type=int, default=2000, help="Calls per timing.")
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of-N timings.")
+    args = parser.parse_args()
+    funcs = [f.strip().upper() for f in args.funcs.split(",") if f.strip()]
+
+    meta = _load_meta()
+    columns = ["talib", "shim", "_call_func", "direct"]
+    print(f"{'function':<10}{'n':>6}" + "".join(f"{c:>13}" for c in columns) + "   (us/call)")
+    for n in (int(v) for v in args.n.split(",")):
+        rng = np.random.default_rng(0)
+        close = 100.0 + np.cumsum(rng.standard_normal(n))
+        series = {"high": close + 1.0, "low": close - 1.0, "close": close}
+        for name in funcs:
+            inputs = [series.get(input_to_arg(i), close) for i in meta[name].inputs]
+            calls = {
+                "talib": (lambda f=getattr(talib, name): f(*inputs)) if talib else None,
+                "shim": lambda f=getattr(shim, name): f(*inputs),
+                "_call_func": lambda: _call_func(name, inputs, {}),
+                "direct": lambda f=getattr(numbatalib, name): f(*inputs),
+            }
+            cells = []
+            for label in columns:
+                call = calls[label]
+                if call is None:
+                    cells.append(f"{'-':>13}")
+                else:
+                    cells.append(f"{_per_call_us(call, args.number, args.repeat):>13.2f}")
+            print(f"{name:<10}{n:>6}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+"""
+First-call latency with lazy compilation vs `NUMBATALIB_PRECOMPILE`.
+
+Each mode runs in a fresh interpreter: `import numbatalib` is timed (it
+includes the eager compilation when precompiling), then the first and the
+second call of each function:
+
+    python tools/bench_first_call.py            # Numba's existing on-disk cache
+    python tools/bench_first_call.py --cold     # empty cache: full compilation
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+_FUNCS = ["SMA", "EMA", "RSI", "MACD", "BBANDS", "ATR", "STOCH", "ADX"]
+
+_CHILD = """
+import json, time
+t0 = time.perf_counter()
+import numpy as np
+import numbatalib
+import_sec = time.perf_counter() - t0
+
+rng = np.random.default_rng(0)
+close = 100.0 + np.cumsum(rng.standard_normal({n}))
+series = {{"high": close + 1.0, "low": close - 1.0, "close": close, "real": close}}
+meta = numbatalib._registry._load_meta()
+rows = {{}}
+for name in {funcs!r}:
+    fn = getattr(numbatalib, name)
+    inputs = [series.get(i[2:].lower(), close) for i in meta[name].inputs]
+    t0 = time.perf_counter()
+    fn(*inputs)
+    first = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fn(*inputs)
+    rows[name] = (first, time.perf_counter() - t0)
+print(json.dumps({{"import": import_sec, "calls": rows}}))
+"""
+
+
+def run(precompile: str | None, cache_dir: str | None, funcs: list[str], n: int) -> dict:
+    env = dict(os.environ)
+    env.pop("NUMBATALIB_PRECOMPILE", None)
+    if precompile:
+        env["NUMBATALIB_PRECOMPILE"] = precompile
+    if cache_dir:
+        env["NUMBA_CACHE_DIR"] = cache_dir
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(n=n, funcs=funcs)],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="First-call latency benchmark.")
+    parser.add_argument("--cold", action="store_true", help="Start each mode with an empty cache.")
+    parser.add_argument("--profiles", default="float64", help="NUMBATALIB_PRECOMPILE value.")
+    parser.add_argument("--funcs", default=",".join(_FUNCS), help="Comma-separated functions.")
+    parser.add_argument("--n", type=int, default=10000, help="Series length.")
+    args = parser.parse_args()
+    funcs = [f.strip().upper() for f in args.funcs.split(",") if f.strip()]
+
+    results = {}
+    for label, profiles in (("lazy", None), (f"precompile={args.profiles}", args.profiles)):
+        if args.cold:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                results[label] = run(profiles, cache_dir, funcs, args.n)
+        else:
+            results[label] = run(profiles, None, funcs, args.n)
+
+    labels = list(results)
+    print(f"{'':<10}" + "".join(f"{label:>34}" for label in labels))
+    print(f"{'import':<10}" + "".join(f"{results[l]['import'] * 1e3:>31.1f} ms" for l in labels))
+    for name in funcs:
+        cells = []
+        for label in labels:
+            first, second = results[label]["calls"][name]
+            cells.append(f"{first * 1e3:>17.2f} ms (then {second * 1e3:6.3f})")
+        print(f"{name:<10}" + "".join(f"{c:>34}" for c in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+"""
+Import-time benchmark for the package and its TA-Lib shim.
+
+Each statement runs in a fresh interpreter and the best of `--repeat` runs is
+reported, together with the number of `numbatalib._func` modules loaded and
+whether numba was imported:
+
+    python tools/bench_import.py
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# label -> (setup statement, timed statement)
+_CASES: dict[str, tuple[str, str]] = {
+    "import numbatalib": ("", "import numbatalib"),
+    "import numbatalib.talib": ("", "import numbatalib.talib"),
+    "import numbatalib.talib.abstract": ("", "import numbatalib.compat.talib.abstract"),
+    "first talib.SMA call": (
+        "import numpy as np; import numbatalib.talib as talib; x = np.arange(100.0)",
+        "talib.SMA(x)",
+    ),
+    "import talib (reference)": ("", "import talib"),
+}
+
+_CHILD = """
+import json, sys, time
+{setup}
+t0 = time.perf_counter()
+{stmt}
+sec = time.perf_counter() - t0
+print(json.dumps({{
+    "sec": sec,
+    "func_modules": sum(m.startswith("numbatalib._func.") for m in sys.modules),
+    "numba": "numba" in sys.modules,
+}}))
+"""
+
+
+def measure(setup: str, stmt: str, repeat: int) -> dict[str, float | int | bool] | None:
+    best: dict[str, float | int | bool] | None = None
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", _CHILD.format(setup=setup, stmt=stmt)],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            return None
+        row = json.loads(proc.stdout.strip().splitlines()[-1])
+        if best is None or row["sec"] < best["sec"]:
+            best = row
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cold import time in fresh interpreters.")
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of-N repeats.")
+    args = parser.parse_args()
+
+    for label, (setup, stmt) in _CASES.items():
+        row = measure(setup, stmt, args.repeat)
+        if row is None:
+            print(f"{label:<34} unavailable")
+            continue
+        print(
+            f"{label:<34} {row['sec'] * 1e3:8.1f} ms  "
+            f"func modules {row['func_modules']:>3}  numba {'yes' if row['numba'] else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+"""
+Thread and process scaling of `numbatalib.parallel`.
+
+Evaluates each function for `--symbols` series of `--n` bars with 1 to N
+worker threads (`parallel.map`) and reports the throughput and the speedup
+over one worker. A plain loop over the symbols (fresh output arrays per
+call) is the baseline. `--processes` also times `parallel.ProcessPool` on
+panels already placed in shared memory. `--chunked N`, `--scan N` and
+`--ema-scan N` time `parallel.chunked`, `parallel.scan` and EMA-based
+functions within `parallel.ema_scan()` on one series of N bars against the
+serial call:
+
+    python tools/bench_parallel.py --symbols 2000 --n 2000 --workers 1,2,4,8 --processes
+    python tools/bench_parallel.py --chunked 100000000 --funcs SMA,MAX,STDDEV,CORREL
+    python tools/bench_parallel.py --scan 100000000 --funcs OBV,AD,ADOSC
+    python tools/bench_parallel.py --ema-scan 100000000 --funcs EMA,DEMA,TEMA,TRIX
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+_FUNCS = ["RSI", "MACD", "ATR", "BBANDS"]
+
+
+def _default_workers() -> str:
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return ",".join(map(str, counts))
+
+
+def _best(fn, repeat: int) -> float:
+    fn()
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def bench_series(
+    method: str, funcs: list[str], n: int, worker_counts: list[int], repeat: int
+) -> None:
+    import numbatalib
+    from numbatalib._core._params import input_to_arg
+    from numbatalib._registry import _load_meta
+
+    rng = np.random.default_rng(0)
+    x = 100.0 + np.cumsum(rng.standard_normal(n))
+    series = {
+        "high": x + 1.0,
+        "low": x - 1.0,
+        "real1": 100.0 + np.cumsum(rng.standard_normal(n)),
+        "volume": rng.uniform(1e3, 1e6, n),
+    }
+    if method == "ema_scan":
+
+        def run(name, inputs, workers):
+            with numbatalib.parallel.ema_scan(workers=workers, min_size=0):
+                getattr(numbatalib, name)(inputs)
+
+    else:
+        run = getattr(numbatalib.parallel, method)
+
+    print(f"{os.cpu_count()} CPUs, one series of {n} bars, parallel.{method}")
+    print(f"{'function':<10}{'workers':>10}{'Mbars/s':>14}{'speedup':>10}")
+    for name in funcs:
+        args = [series.get(input_to_arg(i), x) for i in _load_meta()[name].inputs]
+        inputs = args if len(args) > 1 else x
+        fn = getattr(numbatalib, name)
+        base = _best(lambda: fn(*args), repeat)
+        print(f"{name:<10}{'serial':>10}{n / base / 1e6:>14.1f}{'':>10}")
+        for workers in worker_counts:
+            sec = _best(lambda: run(name, inputs, workers=workers), repeat)
+            print(f"{'':<10}{workers:>10}{n / sec / 1e6:>14.1f}{base / sec:>9.2f}x")
+
+
+def main() -> None:
+    import numbatalib
+    from numbatalib._core._params import input_to_arg
+    from numbatalib._registry import _load_meta
+
+    parser = argparse.ArgumentParser(description="Thread scaling of numbatalib.parallel.map.")
+    parser.add_argument("--funcs", default=",".join(_FUNCS), help="Comma-separated functions.")
+    parser.add_argument("--symbols", type=int, default=2000, help="Number of series.")
+    parser.add_argument("--n", type=int, default=2000, help="Bars per series.")
+    parser.add_argument("--workers", default=_default_workers(), help="Comma-separated counts.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timings.")
+    parser.add_argument("--processes", action="store_true", help="Also time ProcessPool.")
+    parser.add_argument("--chunked", type=int, help="Time parallel.chunked on N bars instead.")
+    parser.add_argument("--scan", type=int, help="Time parallel.scan on N bars instead.")
+    parser.add_argument("--ema-scan", type=int, help="Time parallel.ema_scan on N bars instead.")
+    args = parser.parse_args()
+    funcs = [f.strip().upper() for f in args.funcs.split(",") if f.strip()]
+    worker_counts = [int(w) for w in args.workers.split(",")]
+
+    for method in ("chunked", "scan", "ema_scan"):
+        if getattr(args, method):
+            bench_series(method, funcs, getattr(args, method), worker_counts, args.repeat)
+            return
+
+    rng = np.random.default_rng(0)
+    closes = 100.0 + np.cumsum(rng.standard_normal((args.symbols, args.n)), axis=1)
+    series = {"high": closes + 1.0, "low": closes - 1.0, "close": closes}
+    meta = _load_meta()
+
+    print(f"{os.cpu_count()} CPUs, {args.symbols} symbols x {args.n} bars")
+    print(f"{'function':<10}{'workers':>10}{'symbols/s':>14}{'speedup':>10}")
+    for name in funcs:
+        names = [input_to_arg(i) for i in meta[name].inputs]
+        columns = [series.get(i, closes) for i in names]
+        rows = [tuple(c[j] for c in columns) for j in range(args.symbols)]
+        symbols = [row[0] for row in rows] if len(columns) == 1 else rows
+        fn = getattr(numbatalib, name)
+        sec = _best(lambda: [fn(*row) for row in rows], args.repeat)
+        print(f"{name:<10}{'loop':>10}{args.symbols / sec:>14.0f}{'':>10}")
+
+        base = None
+        for workers in worker_counts:
+            sec = _best(
+                lambda: numbatalib.parallel.map(name, symbols, workers=workers), args.repeat
+            )
+            base = base or sec
+            print(f"{'':<10}{workers:>10}{args.symbols / sec:>14.0f}{base / sec:>9.2f}x")
+
+    if not args.processes:
+        return
+    print()
+    print(f"{'function':<10}{'processes':>10}{'symbols/s':>14}{'speedup':>10}")
+    bases: dict[str, float] = {}
+    for workers in worker_counts:
+        with numbatalib.parallel.ProcessPool(workers=workers, functions=funcs) as pool:
+            shared = {k: pool.share(v) for k, v in series.items()}
+            for name in funcs:
+                panels = [shared.get(input_to_arg(i), shared["close"]) for i in meta[name].inputs]
+                inputs = panels[0] if len(panels) == 1 else panels
+                sec = _best(lambda: pool.map(name, inputs, {"axis": 1}), args.repeat)
+                base = bases.setdefault(name, sec)
+                speedup = f"{base / sec:>9.2f}x"
+                print(f"{name:<10}{workers:>10}{args.symbols / sec:>14.0f}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+"""
+Generate `numbatalib/_generated/batch_kernels.py`.
+
+For every function whose 1-D kernel follows the convention
+
+    _<name>_kernel(*inputs, *params, *outputs)
+
+emit a `parallel=True` kernel that runs it over the rows of 2-D inputs with
+`prange`. Kernels with a different calling convention are listed in
+`_CUSTOM`; functions composed from other public functions in Python are left
+out and evaluated per series by `numbatalib._batch`.
+"""
+
+import argparse
+import importlib
+import inspect
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from numbatalib._core._params import input_to_arg, param_specs  # noqa: E402
+from numbatalib._registry import _scan_impl_modules, _load_meta  # noqa: E402
+
+
+OUT_PATH = REPO_ROOT / "numbatalib" / "_generated" / "batch_kernels.py"
+
+# name -> (imports as (module, kernel), body lines using `j` as the row index)
+_CUSTOM: dict[str, tuple[list[tuple[str, str]], list[str]]] = {
+    # `nbdev` is validated but ignored by TA-Lib's VAR.
+    "VAR": (
+        [("ta_var", "_var_kernel")],
+        ["_var_kernel(real[j], timeperiod, out0[j])"],
+    ),
+    "MACDFIX": (
+        [("ta_macd", "_macd_kernel")],
+        ["_macd_kernel(real[j], 0, 0, signalperiod, out0[j], out1[j], out2[j])"],
+    ),
+    "MINMAX": (
+        [("ta_min", "_min_kernel"), ("ta_max", "_max_kernel")],
+        [
+            "_min_kernel(real[j], timeperiod, out0[j])",
+            "_max_kernel(real[j], timeperiod, out1[j])",
+        ],
+    ),
+    "MINMAXINDEX": (
+        [("ta_minindex", "_minindex_kernel"), ("ta_maxindex", "_maxindex_kernel")],
+        [
+            "_minindex_kernel(real[j], timeperiod, out0[j])",
+            "_maxindex_kernel(real[j], timeperiod, out1[j])",
+        ],
+    ),
+    "MFI": (
+        [("ta_mfi", "_mfi_kernel")],
+        [
+            "pos_buf = np.zeros(timeperiod, dtype=np.float64)",
+            "neg_buf = np.zeros(timeperiod, dtype=np.float64)",
+            "_mfi_kernel(high[j], low[j], close[j], volume[j], timeperiod, pos_buf, neg_buf, out0[j])",
+        ],
+    ),
+    "WILLR": (
+        [("ta_max", "_max_kernel"), ("ta_min", "_min_kernel"), ("ta_willr", "_willr_kernel")],
+        [
+            "highest = np.full(high.shape[1], np.nan)",
+            "lowest = np.full(high.shape[1], np.nan)",
+            "_max_kernel(high[j], timeperiod, highest)",
+            "_min_kernel(low[j], timeperiod, lowest)",
+            "_willr_kernel(highest, lowest, close[j], out0[j])",
+        ],
+    ),
+    "ADXR": (
+        [("ta_adx", "_adx_kernel"), ("ta_adxr", "_adxr_kernel")],
+        [
+            "adx = np.full(high.shape[1], np.nan)",
+            "_adx_kernel(high[j], low[j], close[j], timeperiod, adx)",
+            "start = (3 * timeperiod) - 2",
+            "if start < high.shape[1]:",
+            "    _adxr_kernel(adx, timeperiod - 1, start, out0[j])",
+        ],
+    ),
+}
+
+
+def _signature(func_name: str) -> tuple[list[str], list[str], list[str]]:
+    meta = _load_meta()[func_name]
+    inputs = [input_to_arg(x) for x in meta.inputs]
+    params = [spec.name for spec in param_specs(func_name)]
+    outputs = [f"out{i}" for i in range(len(meta.outputs))]
+    return inputs, params, outputs
+
+
+def _conventional(func_name: str, module: str) -> tuple[list[tuple[str, str]], list[str]] | None:
+    mod = importlib.import_module(module)
+    kernel_name = f"_{func_name.lower()}_kernel"
+    kernel = getattr(mod, kernel_name, None)
+    if kernel is None:
+        return None
+
+    inputs, params, outputs = _signature(func_name)
+    n_args = len(inspect.signature(kernel.py_func).parameters)
+    if n_args != len(inputs) + len(params) + len(outputs):
+        return None
+
+    args = [f"{x}[j]" for x in inputs] + params + [f"{o}[j]" for o in outputs]
+    return [(module.rsplit(".", 1)[1], kernel_name)], [f"{kernel_name}({', '.join(args)})"]
+
+
+def generate() -> tuple[str, list[str]]:
+    modules = _scan_impl_modules()
+    specs: dict[str, tuple[list[tuple[str, str]], list[str]]] = {}
+    skipped: list[str] = []
+    for func_name in sorted(modules):
+        spec = _CUSTOM.get(func_name) or _conventional(func_name, modules[func_name])
+        if spec is None:
+            skipped.append(func_name)
+            continue
+        specs[func_name] = spec
+
+    imports: dict[str, set[str]] = {}
+    for imps, _ in specs.values():
+        for module, kernel in imps:
+            imports.setdefault(module, set()).add(kernel)
+
+    lines = [
+        "from __future__ import annotations",
+        "",
+        "# Generated by `python tools/generate_batch_kernels.py`; do not edit by hand.",
+        "#",
+        "# Each `_<name>_2d` kernel evaluates the 1-D kernel of <NAME> over the rows",
+        "# of `(n_series, n_bars)` arrays, in any memory layout, in parallel.",
+        "",
+        "import numpy as np",
+        "from numba import njit, prange",
+        "",
+    ]
+    for module in sorted(imports):
+        names = ", ".join(sorted(imports[module]))
+        lines.append(f"from numbatalib._func.{module} import {names}")
+    lines.append("")
+
+    for func_name, (_, body) in specs.items():
+        inputs, params, outputs = _signature(func_name)
+        args = ", ".join(inputs + params + outputs)
+        lines += [
+            "",
+            "@njit(parallel=True, cache=True, nogil=True)",
+            f"def _{func_name.lower()}_2d({args}):",
+            f"    for j in prange({inputs[0]}.shape[0]):",
+        ]
+        lines += [f"        {line}" for line in body]
+        lines.append("")
+
+    lines += ["", "BATCH_KERNELS = {"]
+    lines += [f'    "{func_name}": _{func_name.lower()}_2d,' for func_name in specs]
+    lines += ["}", ""]
+    return "\n".join(lines), skipped
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate prange 2-D batch kernels.")
+    parser.add_argument("--check", action="store_true", help="Fail if the file is out of date.")
+    args = parser.parse_args()
+
+    src, skipped = generate()
+    if args.check:
+        if OUT_PATH.read_text(encoding="utf-8") != src:
+            raise SystemExit(f"{OUT_PATH} is out of date")
+    else:
+        OUT_PATH.write_text(src, encoding="utf-8")
+        print(f"Wrote {OUT_PATH}")
+    print("Evaluated per series (no single kernel):", ", ".join(skipped))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+"""
+Generate `numbatalib/_generated/cdl_scan_patterns.py`.
+
+`CDL_SCAN` evaluates every candlestick pattern with the pattern's own per-bar
+test `_cdl<name>_bar(open_, high, low, close, i, *totals[, penetration][,
+state])`. For each pattern this emits a kernel that runs the test over a
+block of bars with the running totals gathered by `CDL_SCAN`, and the
+pattern's entry in `CDL_PATTERNS`: its setup bars (`_<NAME>_SETUP`, 0 when
+the module defines none) and its running totals (`_<NAME>_TOTALS`, none when
+the module defines none).
+"""
+
+import argparse
+import importlib
+import inspect
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from numbatalib._registry import _scan_impl_modules  # noqa: E402
+
+
+OUT_PATH = REPO_ROOT / "numbatalib" / "_generated" / "cdl_scan_patterns.py"
+
+_BLOCK_ARGS = "open_, high, low, close, base, lo, hi, t, penetration, state, out"
+
+
+def _pattern(func_name: str, module: str) -> tuple[list[str], list[str], str]:
+    """(names imported from the module, `_bar` call lines, table entry)."""
+    mod = importlib.import_module(module)
+    bar = f"_{func_name.lower()}_bar"
+    totals_name = f"_{func_name}_TOTALS"
+    setup_name = f"_{func_name}_SETUP"
+    imports = [bar]
+
+    params = list(inspect.signature(getattr(mod, bar).py_func).parameters)
+    if params[:5] != ["open_", "high", "low", "close", "i"]:
+        raise SystemExit(f"{module}.{bar} does not start with (open_, high, low, close, i)")
+    extra = params[5:]
+    if extra and extra[-1] == "state":
+        extra.pop()
+    if extra and extra[-1] == "penetration":
+        extra.pop()
+
+    totals = getattr(mod, totals_name, ())
+    if len(totals) != len(extra):
+        raise SystemExit(
+            f"{module}.{bar} takes {len(extra)} totals, {totals_name} lists {len(totals)}"
+        )
+    if totals:
+        imports.append(totals_name)
+    setup = "0"
+    if hasattr(mod, setup_name):
+        imports.append(setup_name)
+        setup = setup_name
+
+    args = ["open_", "high", "low", "close", "i"] + [f"t[{m}, j]" for m in range(len(totals))]
+    args += params[5 + len(totals) :]
+    entry = f'"{func_name}": ({setup}, {totals_name if totals else "()"}),'
+    order = sorted(imports, key=lambda name: (not name.isupper(), name))
+    call = _wrap_call("            ", bar, args)
+    if len(call) == 1 and len(f"        out[j] = {call[0].lstrip()} // 100") <= 100:
+        return order, [f"        out[j] = {call[0].lstrip()} // 100"], entry
+    return order, ["        out[j] = (", *call, "            // 100", "        )"], entry
+
+
+def _wrap_call(indent: str, head: str, args: list[str]) -> list[str]:
+    """`head(*args)` at `indent`, split over lines as black would."""
+    joined = ", ".join(args)
+    if len(f"{indent}{head}({joined})") <= 100:
+        return [f"{indent}{head}({joined})"]
+    if len(f"{indent}    {joined}") <= 100:
+        return [f"{indent}{head}(", f"{indent}    {joined}", f"{indent})"]
+    return [f"{indent}{head}(", *(f"{indent}    {a}," for a in args), f"{indent})"]
+
+
+def generate() -> str:
+    modules = _scan_impl_modules()
+    names = sorted(name for name in modules if name.startswith("CDL"))
+    patterns = {name: _pattern(name, modules[name]) for name in names}
+
+    lines = [
+        "from __future__ import annotations",
+        "",
+        "# Generated by `python tools/generate_cdl_scan.py`; do not edit by hand.",
+        "#",
+        "# `CDL_PATTERNS` maps every candlestick pattern to (setup bars, running",
+        "# totals) for `numbatalib._cdl_scan`; `_pattern_block` evaluates pattern",
+        "# `code` (its position in `CDL_PATTERNS`) over bars `lo:hi` of a block",
+        "# starting at bar `base`.",
+        "",
+        "from numba import njit",
+        "",
+    ]
+    for name, (imports, _, _) in patterns.items():
+        line = f"from {modules[name]} import {', '.join(imports)}"
+        if len(line) > 100:
+            names_ = "".join(f"    {x},\n" for x in imports)
+            line = f"from {modules[name]} import (\n{names_})"
+        lines.append(line)
+    lines.append("")
+
+    for name, (_, call, _) in patterns.items():
+        lines += [
+            "",
+            "@njit(cache=True, nogil=True)",
+            f"def _{name.lower()}_block({_BLOCK_ARGS}):",
+            "    for i in range(lo, hi):",
+            "        j = i - base",
+        ]
+        lines += call
+        lines.append("")
+
+    lines += [
+        "",
+        "@njit(cache=True, nogil=True)",
+        f"def _pattern_block(code, {_BLOCK_ARGS}):",
+    ]
+    for code, name in enumerate(patterns):
+        keyword = "if" if code == 0 else "elif"
+        lines.append(f"    {keyword} code == {code}:")
+        lines += _wrap_call("        ", f"_{name.lower()}_block", _BLOCK_ARGS.split(", "))
+    lines += ["", "", "CDL_PATTERNS = {"]
+    lines += [f"    {entry}" for _, _, entry in patterns.values()]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the CDL_SCAN pattern kernels.")
+    parser.add_argument("--check", action="store_true", help="Fail if the file is out of date.")
+    args = parser.parse_args()
+
+    src = generate()
+    if args.check:
+        if OUT_PATH.read_text(encoding="utf-8") != src:
+            raise SystemExit(f"{OUT_PATH} is out of date")
+    else:
+        OUT_PATH.write_text(src, encoding="utf-8")
+        print(f"Wrote {OUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
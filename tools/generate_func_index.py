@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+"""
+Generate `numbatalib/_generated/func_index.py`.
+
+The registry resolves `numbatalib.<NAME>` through this static
+name -> module map instead of listing `numbatalib/_func` at import time.
+Regenerate it whenever a `ta_*.py` module is added or removed.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from numbatalib._registry import _scan_impl_modules  # noqa: E402
+
+
+OUT_PATH = REPO_ROOT / "numbatalib" / "_generated" / "func_index.py"
+
+
+def generate() -> str:
+    modules = _scan_impl_modules()
+    lines = [
+        "from __future__ import annotations",
+        "",
+        "# Generated by `python tools/generate_func_index.py`; do not edit by hand.",
+        "",
+        "FUNC_MODULES: dict[str, str] = {",
+    ]
+    lines += [f'    "{name}": "{module}",' for name, module in sorted(modules.items())]
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the implemented-function index.")
+    parser.add_argument("--check", action="store_true", help="Fail if the file is out of date.")
+    args = parser.parse_args()
+
+    src = generate()
+    if args.check:
+        if not OUT_PATH.exists() or OUT_PATH.read_text(encoding="utf-8") != src:
+            raise SystemExit(f"{OUT_PATH} is out of date")
+    else:
+        OUT_PATH.write_text(src, encoding="utf-8")
+        print(f"Wrote {OUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+"""
+Generate `numbatalib/_generated/kernel_signatures.py`.
+
+Each profile (an input dtype, contiguous or strided) is run through the
+warm-up driver of `numbatalib.warmup` in a fresh interpreter with an empty
+Numba cache. Every signature the kernels were compiled for, including
+kernels only called from other kernels, is then recorded as an explicit
+Numba signature string. `numbatalib.precompile()` compiles them eagerly.
+
+This compiles every kernel once per profile, so a full run takes a while.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+OUT_PATH = REPO_ROOT / "numbatalib" / "_generated" / "kernel_signatures.py"
+
+# profile -> (input dtype, strided 1-D inputs)
+PROFILES: dict[str, tuple[str, bool]] = {
+    "float64": ("float64", False),
+    "float32": ("float32", False),
+    "int64": ("int64", False),
+    "int32": ("int32", False),
+    "float64-strided": ("float64", True),
+    "float32-strided": ("float32", True),
+    "int64-strided": ("int64", True),
+    "int32-strided": ("int32", True),
+}
+
+
+def _type_str(t) -> str | None:
+    from numba.core import types
+
+    if isinstance(t, types.Array):
+        if not t.mutable:
+            return None
+        dims = [":"] * t.ndim
+        if t.layout == "C":
+            dims[-1] = "::1"
+        elif t.layout == "F":
+            dims[0] = "::1"
+        return f"{t.dtype}[{', '.join(dims)}]"
+    if isinstance(t, types.Literal):
+        return None
+    return str(t)
+
+
+def _signature_str(args) -> str | None:
+    """
+    Explicit signature for `args`, or None if it cannot be written down.
+
+    Kernels called from other kernels with constant arguments are compiled
+    for literal types (`Literal[int](0)`). Those specializations only exist
+    inside their callers and need no declaration.
+    """
+    from numba.core import sigutils
+
+    parts = [_type_str(a) for a in args]
+    if None in parts:
+        return None
+    sig = f"({parts[0]},)" if len(parts) == 1 else "(" + ", ".join(parts) + ")"
+    try:
+        if sigutils.normalize_signature(sig)[0] == tuple(args):
+            return sig
+    except Exception:
+        pass
+    return None
+
+
+def _record_profile(profile: str) -> dict[str, list[str]]:
+    """Run one profile in this process; kernel -> signatures."""
+    import numpy as np
+
+    from numbatalib._registry import implemented_functions
+    from numbatalib.warmup import _calls, _dispatchers, _kernel_name
+
+    dtype, strided = PROFILES[profile]
+    for _, call in _calls(
+        implemented_functions(),
+        [np.dtype(dtype)],
+        [strided],
+        [np.dtype(np.float64)],
+        extras=(profile == "float64"),
+    ):
+        call()
+
+    out: dict[str, list[str]] = {}
+    for d in _dispatchers():
+        sigs = sorted({s for s in map(_signature_str, d.signatures) if s is not None})
+        if sigs:
+            out[_kernel_name(d)] = sigs
+    return out
+
+
+def _run_profile(profile: str) -> dict[str, list[str]]:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, NUMBA_CACHE_DIR=cache_dir)
+        env.pop("NUMBATALIB_PRECOMPILE", None)
+        proc = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "--profile", profile],
+            cwd=REPO_ROOT,
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+    return json.loads(proc.stdout)
+
+
+def _collect() -> dict[str, dict[str, list[str]]]:
+    merged: dict[str, dict[str, list[str]]] = {}
+    for profile in PROFILES:
+        print(f"[profile] {profile}", file=sys.stderr)
+        for kernel, sigs in _run_profile(profile).items():
+            for sig in sigs:
+                merged.setdefault(kernel, {}).setdefault(sig, []).append(profile)
+    return merged
+
+
+def _render(merged: dict[str, dict[str, list[str]]]) -> str:
+    lines = [
+        "from __future__ import annotations",
+        "",
+        "# Generated by `python tools/generate_kernel_signatures.py`; do not edit by hand.",
+        "",
+        "PROFILES = (",
+        *(f'    "{p}",' for p in PROFILES),
+        ")",
+        "ALL = PROFILES",
+        "",
+        "# kernel -> explicit Numba signature -> profiles that compile it",
+        "SIGNATURES: dict[str, dict[str, tuple[str, ...]]] = {",
+    ]
+    for kernel in sorted(merged):
+        lines.append(f'    "{kernel}": {{')
+        for sig in sorted(merged[kernel]):
+            used_by = list(merged[kernel][sig])
+            if used_by == list(PROFILES):
+                profiles = "ALL"
+            else:
+                names = [f'"{p}"' for p in used_by]
+                profiles = f"({names[0]},)" if len(names) == 1 else f"({', '.join(names)})"
+            entry = f'        "{sig}": {profiles},'
+            if len(entry) > 100:
+                lines += [f'        "{sig}": (', f"            {profiles.strip('()')}", "        ),"]
+            else:
+                lines.append(entry)
+        lines.append("    },")
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def generate() -> str:
+    return _render(_collect())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate explicit kernel signatures.")
+    parser.add_argument("--check", action="store_true", help="Fail if the file is out of date.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile:
+        print(json.dumps(_record_profile(args.profile)))
+        return
+
+    src = generate()
+    if args.check:
+        if not OUT_PATH.exists() or OUT_PATH.read_text(encoding="utf-8") != src:
+            raise SystemExit(f"{OUT_PATH} is out of date")
+    else:
+        OUT_PATH.write_text(src, encoding="utf-8")
+        print(f"Wrote {OUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import argparse
 import json
+import subprocess
+import sys
 from pathlib import Path
 
 
@@ -42,7 +44,7 @@ def main() -> None:
     parser.add_argument(
         "--direct",
         action="store_true",
-        help="Write directly into numbatalib/_func (will be picked up as implemented immediately).",
+        help="Write directly into numbatalib/_func and regenerate the function index.",
     )
     args = parser.parse_args()
 
@@ -81,7 +83,11 @@ def main() -> None:
         encoding="utf-8",
     )
     print(f"Created {module_path}")
-    if not args.direct:
+    if args.direct:
+        subprocess.run(
+            [sys.executable, str(REPO_ROOT / "tools" / "generate_func_index.py")], check=True
+        )
+    else:
         print(
             "When implemented and passing parity checks, move it to "
             f"{(REPO_ROOT / 'numbatalib' / '_func')}"